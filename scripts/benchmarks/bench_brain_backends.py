@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+LOCAL MODEL BACKEND BENCHMARK (CPU)
+
+Latency and throughput of FinBERT and DeBERTa on each inference backend
+(src/brain/backends.py), with agreement against the eager model:
+
+  torch       PyTorch eager
+  onnx        ONNX Runtime fp32
+  onnx-int8   ONNX Runtime, dynamic int8 quantization
+
+Single headline latency (p50/p99, batch 1) and throughput at --batch, over the
+fixed parity corpus (tests/data/parity_headlines.txt). The first ONNX run
+exports / quantizes into --cache-dir.
+
+USAGE:
+    python3 scripts/benchmarks/bench_brain_backends.py [--model finbert deberta] [--backend torch onnx onnx-int8]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, ROOT)
+from src.brain.backends import BACKENDS, SequenceClassifier, agreement, load_model
+from src.brain.sentiment import SentimentEngine
+from src.brain.zero_shot import ZeroShotScorer
+from src.utils.stats import RollingStats
+
+MODELS = {"finbert": "ProsusAI/finbert", "deberta": "MoritzLaurer/DeBERTa-v3-base-mnli-fever-anli"}
+
+
+def _classifier(model: str, backend: str, cache_dir: str):
+    """Callable headlines -> [{"label", "score"}] (top label) for one model on one backend."""
+    loaded = load_model(MODELS[model], backend, {"cache_dir": cache_dir})
+    if model == "finbert":
+        return SequenceClassifier(*loaded)
+    scorer = ZeroShotScorer(*loaded, SentimentEngine.DEBERTA_LABELS)
+
+    def classify(texts, batch_size=None):
+        batch_size = batch_size or len(texts)
+        results = [r for i in range(0, len(texts), batch_size) for r in scorer(texts[i:i + batch_size])]
+        return [{"label": r["labels"][0], "score": r["scores"][0]} for r in results]
+    return classify
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Torch vs ONNX Runtime fp32 / int8 for the local council models")
+    parser.add_argument("--model", nargs="+", choices=sorted(MODELS), default=sorted(MODELS))
+    parser.add_argument("--backend", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--batch", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--cache-dir", default=os.path.join(ROOT, "data", "onnx"))
+    args = parser.parse_args()
+
+    with open(os.path.join(ROOT, "tests", "data", "parity_headlines.txt")) as f:
+        headlines = [line.strip() for line in f if line.strip()]
+
+    print(f"{len(headlines)} headlines, {args.rounds} rounds, throughput batch {args.batch}\n")
+    print(f"{'Model':<8} | {'Backend':<10} | {'p50 ms':>7} | {'p99 ms':>7} | {'Items/s':>8} | {'Agree':>6} | {'Max diff':>8}")
+    print("-" * 72)
+    for model in args.model:
+        reference = None
+        for backend in args.backend:
+            classify = _classifier(model, backend, args.cache_dir)
+            classify(headlines[:args.batch], batch_size=args.batch) # Warm-up
+
+            latency = RollingStats(window=len(headlines) * args.rounds)
+            for _ in range(args.rounds):
+                for text in headlines:
+                    started = time.perf_counter()
+                    classify([text])
+                    latency.add((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            for _ in range(args.rounds):
+                outputs = classify(headlines, batch_size=args.batch)
+            throughput = len(headlines) * args.rounds / (time.perf_counter() - started)
+
+            reference = reference or (outputs if backend == "torch" else None)
+            report = agreement(reference, outputs) if reference else None
+            s = latency.summary()
+            agree = f"{report['label_agreement']:.0%}" if report else "-"
+            diff = f"{report['max_score_diff']:.1e}" if report else "-"
+            print(f"{model:<8} | {backend:<10} | {s['p50']:>7.1f} | {s['p99']:>7.1f} | {throughput:>8.1f} | {agree:>6} | {diff:>8}")
+
+
+if __name__ == "__main__":
+    main()
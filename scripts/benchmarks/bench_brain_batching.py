@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+LOCAL MODEL MICRO-BATCHING BENCHMARK
+
+Throughput / latency of FinBERT and DeBERTa under N concurrent headlines,
+comparing:
+
+  per-item  one pipeline call per headline in the default thread executor
+            (the old SentimentEngine path)
+  batched   MicroBatcher (src/brain/batching.py): collect for --max-wait-ms
+            or up to --max-batch, sort by length, one forward pass
+
+Needs transformers + torch and the model weights (downloaded on first run).
+
+USAGE:
+    python3 scripts/benchmarks/bench_brain_batching.py [--model finbert|deberta] [--concurrency 1 4 16 32]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from src.brain.batching import MicroBatcher
+from src.brain.sentiment import SentimentEngine
+from src.utils.stats import RollingStats
+
+HEADLINES = [
+    "Fed holds rates steady",
+    "SEC approves spot bitcoin ETF applications from eleven issuers",
+    "Bitcoin slides 8% as exchange outflows accelerate",
+    "Treasury yields jump after hotter-than-expected CPI print",
+    "Binance faces fresh DOJ probe over sanctions compliance",
+    "Nonfarm payrolls beat forecasts; unemployment rate falls to 3.6%",
+    "Ethereum developers delay upgrade after testnet bug",
+    "Stablecoin issuer discloses reserves shortfall, shares of partner bank tumble in after-hours trading",
+    "ECB signals two more hikes as core inflation proves sticky",
+    "Crypto lender files for Chapter 11 bankruptcy protection",
+    "BlackRock raises bitcoin ETF fee waiver threshold",
+    "White House announces new tariffs on semiconductor imports, citing national security concerns",
+]
+
+MODELS = {
+    "finbert": ("sentiment-analysis", "ProsusAI/finbert"),
+    "deberta": ("zero-shot-classification", "MoritzLaurer/DeBERTa-v3-base-mnli-fever-anli"),
+}
+
+
+def _engine(model: str) -> SentimentEngine:
+    """A bare SentimentEngine carrying just the one pipeline (no Groq, no singleton init)."""
+    from transformers import pipeline
+    engine = object.__new__(SentimentEngine)
+    task, name = MODELS[model]
+    setattr(engine, f"{model}_pipe", pipeline(task, model=name, device=-1))
+    return engine
+
+
+async def _load(submit, concurrency: int, items: int) -> dict:
+    """`concurrency` callers each scoring headlines back to back until `items` are done."""
+    latency = RollingStats(window=items)
+    counter = iter(range(items))
+
+    async def caller():
+        for i in counter:
+            started = time.perf_counter()
+            await submit(HEADLINES[i % len(HEADLINES)])
+            latency.add((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {"throughput": items / elapsed, **latency.summary()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-item vs micro-batched local model inference")
+    parser.add_argument("--model", choices=sorted(MODELS), default="finbert")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 32])
+    parser.add_argument("--items", type=int, default=256)
+    parser.add_argument("--max-batch", type=int, default=16)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    engine = _engine(args.model)
+    single = engine._analyze_finbert if args.model == "finbert" else engine._analyze_deberta
+    batch = engine._analyze_finbert_batch if args.model == "finbert" else engine._analyze_deberta_batch
+    single(HEADLINES[0]) # Warm-up (lazy init, allocator)
+
+    async def per_item(text):
+        return await asyncio.get_running_loop().run_in_executor(None, single, text)
+
+    print(f"{args.model}: {args.items} headlines per run, batch cap {args.max_batch}, window {args.max_wait_ms:g} ms\n")
+    print(f"{'Mode':<9} | {'Conc':>4} | {'Items/s':>8} | {'p50 ms':>8} | {'p99 ms':>8} | {'Mean batch':>10}")
+    print("-" * 64)
+    for concurrency in args.concurrency:
+        r = asyncio.run(_load(per_item, concurrency, args.items))
+        print(f"{'per-item':<9} | {concurrency:>4} | {r['throughput']:>8.1f} | {r['p50']:>8.1f} | {r['p99']:>8.1f} | {'1.0':>10}")
+
+        async def batched():
+            batcher = MicroBatcher(batch, args.model, max_batch=args.max_batch, max_wait_ms=args.max_wait_ms)
+            try:
+                return await _load(batcher.submit, concurrency, args.items), batcher.stats()
+            finally:
+                batcher.close()
+
+        r, stats = asyncio.run(batched())
+        print(f"{'batched':<9} | {concurrency:>4} | {r['throughput']:>8.1f} | {r['p50']:>8.1f} | {r['p99']:>8.1f} | "
+              f"{stats['batch_size']['mean']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+FEED PARSING BENCHMARK
+
+Per-poll parse cost of the feeds in config/sources/fast_rss.json, comparing:
+
+  before: feedparser.parse over the whole document on every 200 response
+  after:  IncrementalFeedParser in its three steady-state situations
+            - cold:      first poll, every entry is new
+            - one new:   one entry prepended since the last poll (stops at the first known GUID)
+            - unchanged: same entries, new <lastBuildDate> (head fingerprint skip)
+
+Feeds are fetched once (needs network) and cached under data/bench_feeds/;
+use --offline to reuse the cache. Unreachable feeds are replaced by a
+synthetic 50-item feed so the script always produces numbers.
+
+USAGE:
+    python3 scripts/benchmarks/bench_feed_parser.py [--repeat 50] [--offline]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from src.ingestion.feed_parser import IncrementalFeedParser, LXML_AVAILABLE
+
+try:
+    import feedparser
+    FEEDPARSER_AVAILABLE = True
+except ImportError:
+    FEEDPARSER_AVAILABLE = False
+
+CACHE_DIR = "data/bench_feeds"
+_FIRST_ITEM_RE = re.compile(rb"<(item|entry)[\s>].*?</\1>", re.S)
+
+
+def _synthetic_feed(n: int = 50) -> bytes:
+    items = "".join(
+        f"<item><title>Synthetic headline {i} about rates and inflation</title>"
+        f"<link>https://bench.local/{i}</link><guid>bench-{i}</guid>"
+        f"<pubDate>Mon, 02 Nov 2026 12:00:00 GMT</pubDate>"
+        f"<description>{'Lorem ipsum dolor sit amet. ' * 20}</description></item>"
+        for i in range(n, 0, -1)
+    )
+    return (f'<?xml version="1.0"?><rss version="2.0"><channel><title>Synthetic</title>'
+            f"<lastBuildDate>Mon, 02 Nov 2026 12:00:00 GMT</lastBuildDate>{items}</channel></rss>").encode()
+
+
+def load_feeds(offline: bool):
+    with open("config/sources/fast_rss.json", "r") as f:
+        urls = json.load(f)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    feeds = {}
+    for url in urls:
+        path = os.path.join(CACHE_DIR, hashlib.md5(url.encode()).hexdigest() + ".xml")
+        body = None
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                body = f.read()
+        elif not offline:
+            try:
+                req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0 (HedgemonyBench)"})
+                with urllib.request.urlopen(req, timeout=10) as resp:
+                    body = resp.read()
+                with open(path, "wb") as f:
+                    f.write(body)
+            except Exception as e:
+                print(f"  ! {url}: {e} (using synthetic feed)")
+        feeds[url] = body if body and _FIRST_ITEM_RE.search(body) else _synthetic_feed()
+    return feeds
+
+
+def _variants(body: bytes):
+    """(cold, one_new, unchanged) bodies for the incremental parser."""
+    first = _FIRST_ITEM_RE.search(body)
+    entry = first.group(0)
+    new_entry = re.sub(rb"<(guid|id|link)([^>]*)>([^<]*)</\1>", rb"<\1\2>\3#bench-new</\1>", entry)
+    new_entry = new_entry.replace(b'href="', b'href="bench-new:')
+    one_new = body[:first.start()] + new_entry + body[first.start():]
+    unchanged = re.sub(rb"<lastBuildDate>[^<]*</lastBuildDate>",
+                       b"<lastBuildDate>Tue, 03 Nov 2026 00:00:00 GMT</lastBuildDate>", body)
+    return body, one_new, unchanged
+
+
+def _time(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Feed parse cost per poll")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--offline", action="store_true", help="Only use cached feeds")
+    args = parser.parse_args()
+
+    print(f"Incremental parser backend: {'lxml' if LXML_AVAILABLE else 'xml.etree'}")
+    feeds = load_feeds(args.offline)
+
+    header = f"{'feed':<48} {'KiB':>6} {'feedparser':>11} {'cold':>8} {'one new':>8} {'unchanged':>10}"
+    print(header)
+    print("-" * len(header))
+    for url, body in feeds.items():
+        cold, one_new, unchanged = _variants(body)
+
+        full = f"{_time(lambda: feedparser.parse(body), args.repeat):.2f}ms" if FEEDPARSER_AVAILABLE else "-"
+        cold_ms = _time(lambda: IncrementalFeedParser().parse(url, cold), args.repeat)
+
+        primed_new = IncrementalFeedParser()
+        primed_new.parse(url, cold)
+        state = primed_new._state[url]
+        known, known_set, head = list(state.known), set(state.known_set), state.head
+
+        def _one_new():
+            # Reset to "just saw the cold body" so every repetition sees exactly one new entry
+            state.known.clear()
+            state.known.extend(known)
+            state.known_set.clear()
+            state.known_set.update(known_set)
+            state.head = head
+            primed_new.parse(url, one_new)
+
+        primed_same = IncrementalFeedParser()
+        primed_same.parse(url, cold)
+
+        new_ms = _time(_one_new, args.repeat)
+        same_ms = _time(lambda: primed_same.parse(url, unchanged), args.repeat)
+
+        name = url if len(url) <= 48 else url[:45] + "..."
+        print(f"{name:<48} {len(body) / 1024:>6.1f} {full:>11} {cold_ms:>6.2f}ms {new_ms:>6.2f}ms {same_ms:>8.3f}ms")
+
+    if not FEEDPARSER_AVAILABLE:
+        print("\n(feedparser not installed: baseline column skipped)")
+
+
+if __name__ == "__main__":
+    main()
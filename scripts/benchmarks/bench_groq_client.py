@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+GROQ CLIENT BENCHMARK (mock OpenAI-compatible server)
+
+A burst of --items headlines (a --dup-ratio share of them repeated, like the
+same story from several sources) sent concurrently to the mock chat server
+(src/utils/mock_openai.py), which answers after --latency-ms and refuses with
+429 beyond --server-rpm. Compared:
+
+  naive    one request per item, no limiter, no coalescing, no retries
+           (the old GroqAnalyzer path)
+  client   GroqClient (src/brain/groq_client.py) at the given plan limits,
+           with coalescing, 429 back-off, the --timeout deadline and
+           optional hedging (--hedge-after-ms)
+
+No network, no API key.
+
+USAGE:
+    python3 scripts/benchmarks/bench_groq_client.py [--items 60] [--server-rpm 30] [--hedge-after-ms 400]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from bench_brain_batching import HEADLINES
+from src.brain.groq_client import GroqClient
+from src.utils.mock_openai import MockOpenAIServer
+from src.utils.stats import RollingStats
+
+
+async def _burst(client: GroqClient, texts) -> dict:
+    latency = RollingStats(window=len(texts))
+    failed = 0
+
+    async def one(text):
+        nonlocal failed
+        started = time.perf_counter()
+        try:
+            await client.complete([{"role": "user", "content": f"News: {text}"}])
+            latency.add((time.perf_counter() - started) * 1000)
+        except Exception:
+            failed += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(text) for text in texts))
+    return {"wall_s": time.perf_counter() - started, "failed": failed, "latency": latency.summary()}
+
+
+async def _run(args):
+    rng = random.Random(7)
+    unique = int(args.items * (1 - args.dup_ratio)) or 1
+    texts = [f"{HEADLINES[i % len(HEADLINES)]} #{i}" for i in range(unique)]
+    texts += [rng.choice(texts) for _ in range(args.items - unique)]
+    rng.shuffle(texts)
+
+    modes = {
+        "naive": dict(rpm=10 ** 6, tpm=10 ** 9, max_concurrency=10 ** 6, max_retries=0, coalesce=False, timeout=60.0),
+        "client": dict(rpm=args.rpm, tpm=args.tpm, max_concurrency=args.max_concurrency, max_retries=args.max_retries,
+                       hedge_after_ms=args.hedge_after_ms, timeout=args.timeout),
+    }
+    print(f"{args.items} items ({unique} unique), server {args.latency_ms:.0f}+/-{args.jitter_ms:.0f}ms, "
+          f"429 beyond {args.server_rpm} rpm\n")
+    print(f"{'Mode':<7} | {'OK':>4} | {'Failed':>6} | {'HTTP':>5} | {'429s':>5} | {'Coalesced':>9} | "
+          f"{'p50 ms':>7} | {'p99 ms':>7} | {'Wall s':>6}")
+    print("-" * 84)
+    for mode, options in modes.items():
+        server = MockOpenAIServer(latency_ms=args.latency_ms, latency_jitter_ms=args.jitter_ms, rpm=args.server_rpm,
+                                  retry_after_s=args.retry_after)
+        await server.start()
+        client = GroqClient("bench", base_url=server.base_url, **options)
+        try:
+            r = await _burst(client, texts)
+        finally:
+            await client.close()
+            await server.stop()
+        s = client.stats()
+        print(f"{mode:<7} | {args.items - r['failed']:>4} | {r['failed']:>6} | {s['http_requests']:>5} | "
+              f"{server.stats['rate_limited']:>5} | {s['coalesced']:>9} | {r['latency']['p50']:>7.0f} | "
+              f"{r['latency']['p99']:>7.0f} | {r['wall_s']:>6.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Naive Groq calls vs GroqClient against a rate-limited mock server")
+    parser.add_argument("--items", type=int, default=60)
+    parser.add_argument("--dup-ratio", type=float, default=0.3, help="share of items repeating another item")
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--jitter-ms", type=float, default=200.0)
+    parser.add_argument("--server-rpm", type=int, default=30, help="mock server: 429 beyond this")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--rpm", type=float, default=30, help="client limiter: requests per minute")
+    parser.add_argument("--tpm", type=float, default=12000)
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument("--max-retries", type=int, default=2)
+    parser.add_argument("--hedge-after-ms", type=float, default=None)
+    parser.add_argument("--timeout", type=float, default=8.0)
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+INGESTION BENCHMARK (synthetic sources, no network)
+
+Starts the local synthetic news server (src/utils/synthetic_news.py) in its own
+process, points a StreamManager at it (direct Tier-1 targets, RSS/Atom feeds
+and the CryptoPanic-shaped API) and runs it for --duration seconds.
+
+Reports:
+  - detection delay (publish -> callback) p50/p95/p99 per ingester kind, from
+    the publish time the server embeds in every item link; back-catalogue
+    items published before the run are not counted;
+  - server-side requests/s, 304 ratio and injected errors;
+  - ingestion CPU (process time of this process) per feed per minute.
+
+USAGE:
+    python3 scripts/benchmarks/bench_ingestion.py [--feeds 200] [--direct 10] [--duration 60]
+    python3 scripts/benchmarks/bench_ingestion.py --latency-ms 80 --error-rate 0.05 --json report.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from src.ingestion.stream_manager import StreamManager
+from src.utils.stats import RollingStats
+from src.utils.synthetic_news import SyntheticNewsServer, published_at
+
+
+def _serve(conn, options: dict):
+    """Server process: report (base_url, feed URLs, API URL), then serve until killed."""
+    server = SyntheticNewsServer(**options)
+
+    async def serve():
+        await server.start()
+        conn.send((server.base_url, server.feed_urls(), server.api_url))
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+async def _server_stats(base_url: str) -> dict:
+    import aiohttp
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{base_url}/__stats") as resp:
+            return await resp.json()
+
+
+def _build_config(args, feed_urls, api_url, targets_file) -> dict:
+    direct = [{"name": f"synthetic-{i}", "url": url, "type": "rss", "priority": 1, "poll_interval": args.direct_interval}
+              for i, url in enumerate(feed_urls[:args.direct])]
+    with open(targets_file, "w") as f:
+        json.dump(direct, f)
+    return {
+        "rss_sources": feed_urls[args.direct:],
+        "rss_poll_interval": args.rss_interval,
+        "rss_timeout": 5,
+        "rss_report_interval": 3600,
+        "direct_targets_file": targets_file,
+        "direct": {"state_path": None, "min_interval": min(1.0, args.direct_interval), "host_spacing": 0.0,
+                   "report_interval": 3600},
+        "cryptopanic": {"enabled": args.api, "api_key": "bench", "interval": args.api_interval, "base_url": api_url},
+        "state": {"path": None},
+        "http": {"report_interval": 3600},
+    }
+
+
+async def _run(args, feed_urls, api_url, base_url) -> dict:
+    started = time.time()
+    delays = {}
+    counts = {}
+
+    async def on_item(item):
+        kind = item.source_id.split(":", 1)[0]
+        counts[kind] = counts.get(kind, 0) + 1
+        published = published_at(item.url)
+        if published is not None and published >= started:
+            delays.setdefault(kind, RollingStats(window=1_000_000)).add((time.time() - published) * 1000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = StreamManager(_build_config(args, feed_urls, api_url, os.path.join(tmp, "direct_targets.json")))
+        manager.set_callback(on_item)
+        before = await _server_stats(base_url)
+        cpu_start = time.process_time()
+        await manager.start()
+        await asyncio.sleep(args.duration)
+        cpu_s = time.process_time() - cpu_start
+        after = await _server_stats(base_url)
+        await manager.stop()
+
+    requests = after["requests"] - before["requests"]
+    elapsed = after["elapsed_s"] - before["elapsed_s"]
+    feeds = len(feed_urls) + (1 if args.api else 0)
+    return {
+        "feeds": feeds,
+        "duration_s": args.duration,
+        "items": counts,
+        "detection_delay_ms": {kind: stats.summary() for kind, stats in sorted(delays.items())},
+        "requests": requests,
+        "requests_per_s": round(requests / elapsed, 2) if elapsed else 0.0,
+        "not_modified_ratio": round((after["not_modified"] - before["not_modified"]) / requests, 3) if requests else 0.0,
+        "errors": after["errors"] - before["errors"],
+        "cpu_s": round(cpu_s, 3),
+        "cpu_ms_per_feed_min": round(cpu_s * 1000 / feeds / (args.duration / 60), 3),
+    }
+
+
+def _print(report: dict):
+    print(f"\n{report['feeds']} feeds for {report['duration_s']:g}s: "
+          f"{report['requests_per_s']:.1f} req/s, {report['not_modified_ratio']:.0%} 304, "
+          f"{report['errors']} injected errors")
+    print(f"CPU: {report['cpu_s']:.2f}s total, {report['cpu_ms_per_feed_min']:.2f} ms per feed per minute")
+    print(f"{'Kind':<12} | {'Items':>6} | {'Delay p50':>10} | {'p95':>10} | {'p99':>10}")
+    print("-" * 60)
+    for kind, count in sorted(report["items"].items()):
+        d = report["detection_delay_ms"].get(kind)
+        if d:
+            print(f"{kind:<12} | {count:>6} | {d['p50']:>8.0f}ms | {d['p95']:>8.0f}ms | {d['p99']:>8.0f}ms")
+        else:
+            print(f"{kind:<12} | {count:>6} | {'-':>10} | {'-':>10} | {'-':>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingestion benchmark against the synthetic news server")
+    parser.add_argument("--feeds", type=int, default=200, help="synthetic RSS/Atom feeds (direct targets included)")
+    parser.add_argument("--direct", type=int, default=10, help="how many of them the direct hunter polls")
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--rate-per-min", type=float, default=1.0, help="items per feed per minute")
+    parser.add_argument("--etag-ratio", type=float, default=0.8)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=10.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rss-interval", type=float, default=15.0)
+    parser.add_argument("--direct-interval", type=float, default=2.0)
+    parser.add_argument("--api-interval", type=float, default=10.0)
+    parser.add_argument("--no-api", dest="api", action="store_false", help="leave the CryptoPanic ingester off")
+    parser.add_argument("--json", default=None, help="also write the report here")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    options = {"feeds": args.feeds, "rate_per_min": args.rate_per_min, "etag_ratio": args.etag_ratio,
+               "latency_ms": args.latency_ms, "latency_jitter_ms": args.latency_jitter_ms,
+               "error_rate": args.error_rate}
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    server = multiprocessing.Process(target=_serve, args=(sender, options), daemon=True)
+    server.start()
+    try:
+        base_url, feed_urls, api_url = receiver.recv()
+        print(f"Synthetic server at {base_url}: {len(feed_urls)} feeds, running {args.duration:g}s...")
+        report = asyncio.run(_run(args, feed_urls, api_url, base_url))
+    finally:
+        server.terminate()
+        server.join()
+
+    _print(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+IPC HAND-OFF LATENCY BENCHMARK
+
+Measures queue-to-handler latency between the ingestion worker process and the
+engine loop, comparing:
+
+  before: multiprocessing.Queue drained by `while not empty(): get_nowait()`
+          followed by `asyncio.sleep(0.1)` (the old HedgemonyEngine.start loop)
+  after:  NewsChannel (Pipe registered with the asyncio loop)
+
+USAGE:
+    python3 scripts/benchmarks/bench_ipc_latency.py [--items 300] [--gap-ms 7]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import multiprocessing.queues
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from src.ingestion.base import NewsItem
+from src.ingestion.channel import NewsChannel
+from src.utils.stats import RollingStats
+
+
+def _producer(sink, n_items: int, gap_ms: float):
+    """Worker-side stand-in: publishes items with a monotonic `queued` stamp."""
+    rng = random.Random(42)
+    for i in range(n_items):
+        # Randomised gaps so arrivals don't phase-lock with the 100 ms poll
+        time.sleep(rng.uniform(0, 2 * gap_ms) / 1000.0)
+        item = NewsItem(
+            source_id="bench:ipc",
+            title=f"Synthetic headline {i}",
+            url=f"http://bench.local/{i}",
+            published_at=datetime.now(),
+            content="",
+            stamps={"queued": time.monotonic()},
+        )
+        sink.put(item)
+    if isinstance(sink, multiprocessing.queues.Queue):
+        sink.put(None)
+    else:
+        sink.flush()
+
+
+async def _consume_legacy(queue) -> RollingStats:
+    stats = RollingStats(window=100000)
+    while True:
+        try:
+            while not queue.empty():
+                item = queue.get_nowait()
+                if item is None:
+                    return stats
+                stats.add((time.monotonic() - item.stamps["queued"]) * 1000)
+        except Exception:
+            pass
+        await asyncio.sleep(0.1)
+
+
+async def _consume_channel(channel: NewsChannel, n_items: int) -> RollingStats:
+    stats = RollingStats(window=100000)
+    channel.attach()
+    try:
+        for _ in range(n_items):
+            item = await channel.get()
+            stats.add((time.monotonic() - item.stamps["queued"]) * 1000)
+    finally:
+        channel.detach()
+    return stats
+
+
+def _run(mode: str, n_items: int, gap_ms: float) -> RollingStats:
+    sink = multiprocessing.Queue() if mode == "before" else NewsChannel()
+    proc = multiprocessing.Process(target=_producer, args=(sink, n_items, gap_ms))
+    proc.start()
+    consumer = _consume_legacy(sink) if mode == "before" else _consume_channel(sink, n_items)
+    stats = asyncio.run(consumer)
+    proc.join()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker -> engine hand-off latency")
+    parser.add_argument("--items", type=int, default=300)
+    parser.add_argument("--gap-ms", type=float, default=7.0, help="mean gap between publishes")
+    args = parser.parse_args()
+
+    multiprocessing.set_start_method("spawn", force=True)
+
+    print(f"{'MODE':<8} | {'N':>5} | {'p50 ms':>8} | {'p99 ms':>8} | {'max ms':>8}")
+    print("-" * 50)
+    for mode in ("before", "after"):
+        s = _run(mode, args.items, args.gap_ms).summary()
+        print(f"{mode:<8} | {s['count']:>5} | {s['p50']:>8.3f} | {s['p99']:>8.3f} | {s['max']:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+NEWSITEM WIRE CODEC MICRO-BENCHMARK
+
+Per-item encode / decode cost and frame size for the worker -> engine hand-off:
+
+  pickle   the old path: pickled NewsItem with raw_data=dict(feedparser entry)
+  struct   wire.py stdlib codec (fixed header + length-prefixed strings)
+  msgpack  wire.py msgpack codec (skipped when msgpack is not installed)
+
+The sample item is a realistic RSS entry (HTML summary, FeedParserDict
+details, struct_time) parsed by feedparser when it is installed.
+
+USAGE:
+    python3 scripts/benchmarks/bench_wire_codec.py [--items 20000] [--summary-kb 4]
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from src.ingestion.base import NewsItem
+from src.ingestion.wire import MSGPACK_AVAILABLE, decode, encode
+
+
+def _sample_entry(summary_kb: int) -> dict:
+    summary = "<p>" + ("The Commission today approved the listing of spot bitcoin exchange-traded products. " * 13 * summary_kb) + "</p>"
+    rss = f"""<?xml version="1.0"?><rss version="2.0"><channel><title>SEC Press Releases</title>
+      <item><title>SEC Approves Spot Bitcoin ETPs</title><link>https://www.sec.gov/news/press-release/2026-1</link>
+      <guid>https://www.sec.gov/news/press-release/2026-1</guid><pubDate>Mon, 02 Nov 2026 13:30:00 GMT</pubDate>
+      <author>press@sec.gov</author><category>Crypto</category><description><![CDATA[{summary}]]></description></item>
+    </channel></rss>"""
+    try:
+        import feedparser
+        return dict(feedparser.parse(rss).entries[0])
+    except ImportError:
+        return {"id": "https://www.sec.gov/news/press-release/2026-1", "link": "https://www.sec.gov/news/press-release/2026-1",
+                "title": "SEC Approves Spot Bitcoin ETPs", "summary": summary, "published": "Mon, 02 Nov 2026 13:30:00 GMT",
+                "published_parsed": time.gmtime(), "tags": [{"term": "Crypto"}], "author": "press@sec.gov"}
+
+
+def _sample_item(summary_kb: int) -> NewsItem:
+    entry = _sample_entry(summary_kb)
+    return NewsItem(
+        source_id="direct:SEC Press Releases",
+        title=entry["title"],
+        url=entry["link"],
+        published_at=datetime.now(timezone.utc),
+        content=entry.get("summary", ""),
+        author="SEC Press Releases",
+        ingested_at=datetime.now(),
+        raw_data=entry,
+        priority=1,
+        stamps={"fetch_start": 1.0, "fetched": 1.1, "parsed": 1.2, "queued": 1.3},
+    )
+
+
+def _time_per_item(fn, arg, n: int) -> float:
+    """Mean microseconds per call."""
+    started = time.perf_counter()
+    for _ in range(n):
+        fn(arg)
+    return (time.perf_counter() - started) / n * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NewsItem wire codec micro-benchmark")
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--summary-kb", type=int, default=4, help="approximate HTML summary size")
+    args = parser.parse_args()
+
+    item = _sample_item(args.summary_kb)
+    codecs = {
+        "pickle": (lambda i: pickle.dumps(i, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+        "struct": (lambda i: encode(i, "struct"), decode),
+    }
+    if MSGPACK_AVAILABLE:
+        codecs["msgpack"] = (lambda i: encode(i, "msgpack"), decode)
+    else:
+        print("msgpack not installed: skipping msgpack codec")
+
+    print(f"{'CODEC':<8} | {'bytes':>7} | {'encode us':>10} | {'decode us':>10} | {'total us':>9}")
+    print("-" * 56)
+    for name, (enc, dec) in codecs.items():
+        frame = enc(item)
+        encode_us = _time_per_item(enc, item, args.items)
+        decode_us = _time_per_item(dec, frame, args.items)
+        print(f"{name:<8} | {len(frame):>7} | {encode_us:>10.2f} | {decode_us:>10.2f} | {encode_us + decode_us:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+ZERO-SHOT SCORING BENCHMARK (DeBERTa agent)
+
+CPU time per headline and agreement for the DeBERTa zero-shot agent:
+
+  pipeline     HF zero-shot-classification pipeline (one NLI pass per label)
+  single-pass  ZeroShotScorer (src/brain/zero_shot.py): cached hypotheses,
+               all label pairs of --batch headlines in one forward pass
+
+Needs transformers + torch and the model weights (downloaded on first run).
+
+USAGE:
+    python3 scripts/benchmarks/bench_zero_shot.py [--rounds 5] [--batch 1]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from bench_brain_batching import HEADLINES, MODELS
+from src.brain.sentiment import SentimentEngine
+from src.brain.zero_shot import ZeroShotScorer
+
+
+def _timed(fn, batches, rounds: int):
+    cpu, wall = time.process_time(), time.perf_counter()
+    for _ in range(rounds):
+        results = [r for batch in batches for r in fn(batch)]
+    n = rounds * sum(map(len, batches))
+    return results, (time.process_time() - cpu) * 1000 / n, (time.perf_counter() - wall) * 1000 / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HF zero-shot pipeline vs single-pass scorer")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--batch", type=int, default=1, help="headlines per call")
+    args = parser.parse_args()
+
+    from transformers import pipeline
+    task, name = MODELS["deberta"]
+    pipe = pipeline(task, model=name, device=-1)
+    scorer = ZeroShotScorer.from_pipeline(pipe, SentimentEngine.DEBERTA_LABELS)
+    labels = SentimentEngine.DEBERTA_LABELS
+    batches = [HEADLINES[i:i + args.batch] for i in range(0, len(HEADLINES), args.batch)]
+
+    def run_pipeline(batch):
+        out = pipe(batch, labels)
+        return [out] if isinstance(out, dict) else out
+
+    run_pipeline(batches[0]) # Warm-up
+    scorer(batches[0])
+    expected, pipe_cpu, pipe_wall = _timed(run_pipeline, batches, args.rounds)
+    actual, scorer_cpu, scorer_wall = _timed(scorer, batches, args.rounds)
+
+    same_label = sum(a["labels"][0] == e["labels"][0] for a, e in zip(actual, expected))
+    max_diff = max(abs(a["scores"][a["labels"].index(l)] - e["scores"][e["labels"].index(l)])
+                   for a, e in zip(actual, expected) for l in labels)
+
+    print(f"{len(HEADLINES)} headlines x {args.rounds} rounds, {args.batch} per call\n")
+    print(f"{'Scorer':<12} | {'CPU ms/item':>11} | {'Wall ms/item':>12}")
+    print("-" * 42)
+    print(f"{'pipeline':<12} | {pipe_cpu:>11.1f} | {pipe_wall:>12.1f}")
+    print(f"{'single-pass':<12} | {scorer_cpu:>11.1f} | {scorer_wall:>12.1f}")
+    print(f"\nTop label agreement {same_label}/{len(expected)}, max |score diff| {max_diff:.2e}, "
+          f"CPU {pipe_cpu / scorer_cpu:.1f}x less")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+COUNCIL CASCADE REPORT
+
+What the cost-aware cascade (`brain.cascade`, src/brain/council.py) would have
+done on a replay corpus, against the full Council of Three:
+
+  1. every item goes through the full council once (all three agents, Groq
+     included), recording each agent's vote and latency;
+  2. the cascade policy is replayed offline on those votes, for each
+     --min-impact (keyword gate) given.
+
+Per policy: agent invocation rates, Groq calls and agent time saved, latency
+per item (local models in parallel, then Groq if asked), and agreement with
+the full council on the label and on the trade decision (non-neutral with
+confidence >= brain.confidence_threshold).
+
+The corpus is a recorded session (`ingestion.record`) or a text file with one
+headline per line. Groq is called for real (GROQ_API_KEY).
+
+USAGE:
+    python3 scripts/benchmarks/cascade_report.py data/recordings/20261102-083000 [--limit 500]
+    python3 scripts/benchmarks/cascade_report.py tests/data/parity_headlines.txt --min-impact 1 5 10 --latency-budget-ms 1500
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+
+import yaml
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from src.brain.council import CascadePolicy, tally_votes
+from src.brain.impact import ImpactScorer
+from src.brain.sentiment import SentimentEngine
+from src.ingestion.recorder import read_recording
+
+
+def _corpus(source: str, limit):
+    if os.path.isdir(source):
+        texts = (item.title + " " + item.content for _, item in read_recording(source))
+    else:
+        with open(source) as f:
+            texts = (line.strip() for line in f if line.strip())
+    return list(itertools.islice(texts, limit))
+
+
+async def _full_council(brain: SentimentEngine, texts):
+    """Votes and agent latencies of the full council for every item."""
+    await brain.load()
+    runs = []
+    for text in texts:
+        verdict = await brain.analyze(text)
+        runs.append({"text": text, "votes": verdict["votes"], "timings": verdict["timings"]})
+    return runs
+
+
+def _decision(policy: CascadePolicy, verdict: dict):
+    return verdict["label"] if policy.tradeable(verdict) else None
+
+
+def simulate(policy: CascadePolicy, runs, impact_scorer: ImpactScorer) -> dict:
+    """Replay `policy` on full-council runs; invocation rates, savings and agreement."""
+    full_ms = cascade_ms = groq_saved_ms = 0.0
+    same_label = same_trade = trades_full = trades_cascade = 0
+    for run in runs:
+        votes, timings = run["votes"], run["timings"]
+        local_votes = [v for v in votes if v["agent"] != "Groq"]
+        local_ms = max([timings.get("finbert", 0.0), timings.get("deberta", 0.0)])
+        groq_ms = timings.get("groq")
+        impact = impact_scorer.score(run["text"])
+        full_ms += max(local_ms, groq_ms or 0.0)
+
+        if groq_ms is None:
+            groq, elapsed = "off", local_ms
+        elif policy.groq_first(impact):
+            groq, elapsed = "called", max(local_ms, groq_ms)
+        else:
+            needed, groq = policy.groq_needed(local_votes, impact)
+            groq = "called" if needed else groq
+            elapsed = local_ms + groq_ms if needed else local_ms
+            if needed and policy.groq_timeout(local_ms) == 0:
+                groq, elapsed = "budget", local_ms
+        if groq == "called" and policy.latency_budget_ms is not None and elapsed > policy.latency_budget_ms:
+            groq, elapsed = "timeout", policy.latency_budget_ms
+
+        policy.record([agent for agent in ("groq", "finbert", "deberta")
+                       if agent in timings and (agent != "groq" or groq in ("called", "timeout"))], groq)
+        if groq not in ("called", "off"):
+            groq_saved_ms += groq_ms if groq != "timeout" else 0.0
+        cascade_ms += elapsed
+
+        full = tally_votes(votes)
+        cascade = tally_votes(votes if groq in ("called", "off") else local_votes)
+        same_label += full["label"] == cascade["label"]
+        same_trade += _decision(policy, full) == _decision(policy, cascade)
+        trades_full += policy.tradeable(full)
+        trades_cascade += policy.tradeable(cascade)
+
+    n = len(runs) or 1
+    stats = policy.stats()
+    groq_runs = sum("groq" in run["timings"] for run in runs)
+    return {
+        **stats,
+        "groq_calls_saved": groq_runs - policy.invocations["groq"],
+        "groq_ms_saved": round(groq_saved_ms, 1),
+        "mean_item_ms": {"full": round(full_ms / n, 1), "cascade": round(cascade_ms / n, 1)},
+        "label_agreement": round(same_label / n, 4),
+        "trade_agreement": round(same_trade / n, 4),
+        "trades": {"full": trades_full, "cascade": trades_cascade},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cascade policy vs full council on a replay corpus")
+    parser.add_argument("source", help="recording directory or headlines file (one per line)")
+    parser.add_argument("--config", default="config/paper_trading_config.yaml")
+    parser.add_argument("--limit", type=int, default=None, help="first N items only")
+    parser.add_argument("--min-impact", type=int, nargs="+", default=None, help="keyword gates to compare")
+    parser.add_argument("--groq-impact", type=int, default=None)
+    parser.add_argument("--latency-budget-ms", type=float, default=None)
+    parser.add_argument("--json", default=None, help="also write the full report here")
+    args = parser.parse_args()
+
+    with open(args.config) as f:
+        brain_config = yaml.safe_load(f).get("brain", {}) or {}
+    cascade_config = dict(brain_config.get("cascade", {}) or {})
+    if args.groq_impact is not None:
+        cascade_config["groq_impact"] = args.groq_impact
+    if args.latency_budget_ms is not None:
+        cascade_config["latency_budget_ms"] = args.latency_budget_ms
+    threshold = brain_config.get("confidence_threshold", 0.85)
+
+    # Full council: no cascade, no cached verdicts
+    full_config = {**brain_config, "cascade": {"enabled": False}, "verdict_cache": {"enabled": False}}
+    brain = SentimentEngine(full_config, defer_loading=True)
+    texts = _corpus(args.source, args.limit)
+    runs = asyncio.run(_full_council(brain, texts))
+
+    impact_scorer = ImpactScorer(brain_config)
+    report = {}
+    for min_impact in args.min_impact or [cascade_config.get("min_impact", 1)]:
+        policy = CascadePolicy.from_config({**cascade_config, "min_impact": min_impact}, threshold)
+        report[min_impact] = simulate(policy, runs, impact_scorer)
+
+    print(f"{len(runs)} items, Groq always at impact >= {cascade_config.get('groq_impact', 10)}, "
+          f"latency budget {cascade_config.get('latency_budget_ms') or '-'} ms\n")
+    print(f"{'Gate':>4} | {'Groq':>5} | {'FinBERT':>7} | {'DeBERTa':>7} | {'Groq saved':>10} | "
+          f"{'ms/item':>13} | {'Label':>6} | {'Trade':>6} | {'Trades':>7}")
+    print("-" * 90)
+    for min_impact, r in report.items():
+        rate = r["invocation_rate"]
+        print(f"{min_impact:>4} | {rate['groq']:>5.0%} | {rate['finbert']:>7.0%} | {rate['deberta']:>7.0%} | "
+              f"{r['groq_calls_saved']:>10} | {r['mean_item_ms']['full']:>5.0f} -> {r['mean_item_ms']['cascade']:>5.0f} | "
+              f"{r['label_agreement']:>6.1%} | {r['trade_agreement']:>6.1%} | "
+              f"{r['trades']['full']:>3}/{r['trades']['cascade']:<3}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+SESSION REPLAY (load test on recorded traffic)
+
+Replays a session captured with `ingestion.record.enabled: true` through the
+engine's channel and staged pipeline - no network, no ingestion workers - and
+reports queue->decision latency and backlog growth (see src/core/replay.py).
+
+Always runs in PAPER mode. It writes to a scratch DB, with vector memory and
+Telegram alerts off, unless asked otherwise. The brain runs as configured (Groq
+calls included); use --stub-brain-ms to replace it with a fixed-latency stub
+and benchmark the pipeline alone.
+
+USAGE:
+    python3 scripts/benchmarks/replay_session.py data/recordings/20261102-083000 [--speed 10]
+    python3 scripts/benchmarks/replay_session.py <session> --max --stub-brain-ms 40 --json report.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import tempfile
+
+import yaml
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from src.core.engine import HedgemonyEngine
+from src.core.replay import SessionReplay, format_report
+from src.ingestion.recorder import read_recording
+from src.ingestion.supervisor import IngestionSupervisor
+from src.utils.db import Database
+
+
+def _build_engine(args) -> HedgemonyEngine:
+    with open(args.config) as f:
+        config = yaml.safe_load(f)
+    config.setdefault("system", {})["mode"] = "paper"
+    if not args.memory:
+        config.setdefault("brain", {}).setdefault("memory", {})["enabled"] = False
+
+    engine = HedgemonyEngine(config=config)
+    engine.db = Database(args.db)
+    engine.db.init_db()
+    engine.trader.db = engine.db
+    engine.trader.alerter.enabled = False
+
+    # Sharded live runs dedupe across shards in the engine: do the same here
+    shards = (engine.ingestion_config.get("workers", {}) or {}).get("shards") or []
+    if len(shards) > 1:
+        engine.supervisor = IngestionSupervisor(engine.news_channel, engine.ingestion_config)
+
+    if args.stub_brain_ms is not None:
+        async def analyze(text, similar_events=None):
+            await asyncio.sleep(args.stub_brain_ms / 1000.0)
+            return {"label": "neutral", "score": 0.0, "impact": 0, "timings": {"stub": args.stub_brain_ms}}
+        engine.brain.analyze = analyze
+    return engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded ingestion session through the engine pipeline")
+    parser.add_argument("session", help="recording directory (data/recordings/<session>)")
+    parser.add_argument("--config", default="config/paper_trading_config.yaml")
+    parser.add_argument("--speed", type=float, default=1.0, help="1 = original pace, 10 = ten times faster")
+    parser.add_argument("--max", action="store_true", help="inject as fast as the pipeline accepts")
+    parser.add_argument("--limit", type=int, default=None, help="replay only the first N items")
+    parser.add_argument("--db", default=os.path.join(tempfile.gettempdir(), "hedgemony_replay.db"))
+    parser.add_argument("--memory", action="store_true", help="keep vector memory enabled")
+    parser.add_argument("--stub-brain-ms", type=float, default=None, help="fixed-latency stub instead of the council")
+    parser.add_argument("--json", default=None, help="also write the full report here")
+    args = parser.parse_args()
+
+    engine = _build_engine(args)
+    records = itertools.islice(read_recording(args.session), args.limit)
+    replay = SessionReplay(engine, speed=0 if args.max else args.speed)
+    report = asyncio.run(replay.run(records))
+
+    print(format_report(report))
+    print(engine.pipeline.format_metrics())
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Inference Backends
+
+Pluggable CPU backends for the local council models (FinBERT, DeBERTa),
+selected with `brain.backend`:
+
+    torch       PyTorch eager through the HF pipeline (default)
+    onnx        ONNX Runtime, fp32 graph exported from the eager model
+    onnx-int8   ONNX Runtime, dynamically quantized int8 weights
+
+Export / cache: the first time an ONNX backend is asked for a model, the
+eager model is exported (dynamic batch and sequence axes) to
+`<cache_dir>/<model slug>/model.onnx`, and quantized to `model.int8.onnx` for
+the int8 backend. `meta.json` records the model revision, the torch /
+transformers versions and the opset; a mismatch re-exports, so upgrading
+either library or the checkpoint can't leave a stale graph behind.
+
+`OnnxModel` stands in for an AutoModelForSequenceClassification
+(`model(**inputs).logits`), so the single-pass zero-shot scorer runs on any
+backend unchanged; `SequenceClassifier` is the pipeline-compatible
+text-classification front end used for FinBERT on the ONNX backends.
+
+torch / transformers / onnxruntime are imported lazily: only the backend in
+use needs to be installed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger("hedgemony.brain.backends")
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+OPSET = 17
+
+
+def _fingerprint(model) -> dict:
+    import torch
+    import transformers
+    return {
+        "model": model.config._name_or_path,
+        "revision": getattr(model.config, "_commit_hash", None),
+        "torch": torch.__version__,
+        "transformers": transformers.__version__,
+        "opset": OPSET,
+    }
+
+
+def _slug(model_name: str) -> str:
+    digest = hashlib.sha1(model_name.encode()).hexdigest()[:8]
+    return f"{os.path.basename(model_name.rstrip('/'))}-{digest}"
+
+
+def export_onnx(model, tokenizer, directory: str, quantize: bool = False) -> str:
+    """Export (once) the eager model to ONNX under `directory`; returns the graph path for the backend."""
+    import torch
+
+    fp32_path = os.path.join(directory, "model.onnx")
+    int8_path = os.path.join(directory, "model.int8.onnx")
+    meta_path = os.path.join(directory, "meta.json")
+    fingerprint = _fingerprint(model)
+
+    try:
+        with open(meta_path) as f:
+            fresh = json.load(f) == fingerprint
+    except (OSError, ValueError):
+        fresh = False
+
+    if not fresh or not os.path.exists(fp32_path):
+        os.makedirs(directory, exist_ok=True)
+        for stale in (fp32_path, int8_path):
+            if os.path.exists(stale):
+                os.remove(stale)
+
+        sample = tokenizer("Fed holds rates steady", "This example is neutral news.", return_tensors="pt")
+        names = [n for n in tokenizer.model_input_names if n in sample]
+
+        class _Logits(torch.nn.Module):
+            def __init__(self, inner):
+                super().__init__()
+                self.inner = inner
+
+            def forward(self, *args):
+                return self.inner(**dict(zip(names, args))).logits
+
+        logger.info(f"Exporting {fingerprint['model']} to ONNX ({fp32_path})...")
+        axes = {n: {0: "batch", 1: "sequence"} for n in names}
+        axes["logits"] = {0: "batch"}
+        with torch.inference_mode():
+            torch.onnx.export(_Logits(model.eval()), tuple(sample[n] for n in names), fp32_path,
+                              input_names=names, output_names=["logits"], dynamic_axes=axes, opset_version=OPSET)
+        with open(meta_path, "w") as f:
+            json.dump(fingerprint, f, indent=2)
+
+    if not quantize:
+        return fp32_path
+    if not os.path.exists(int8_path):
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        logger.info(f"Quantizing {fp32_path} to int8...")
+        quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+    return int8_path
+
+
+class OnnxModel:
+    """ONNX Runtime session behind the `model(**inputs).logits` interface of an HF model."""
+
+    def __init__(self, path: str, config, threads: int = 0):
+        import onnxruntime as ort
+        import torch
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        self.input_names = [i.name for i in self.session.get_inputs()]
+        self.config = config
+        self.device = torch.device("cpu")
+        self.path = path
+
+    def eval(self):
+        return self
+
+    def __call__(self, **inputs):
+        import torch
+        feeds = {name: inputs[name].cpu().numpy() for name in self.input_names if name in inputs}
+        logits = self.session.run(["logits"], feeds)[0]
+        return SimpleNamespace(logits=torch.from_numpy(logits))
+
+
+class SequenceClassifier:
+    """
+    Text classification with the HF pipeline's call signature and output
+    ([{"label", "score"}] for the top class), over any backend's model.
+    """
+
+    def __init__(self, model, tokenizer, max_length: int = 512):
+        self.model = model.eval()
+        self.tokenizer = tokenizer
+        self.max_length = max_length
+        self.id2label = model.config.id2label
+
+    def __call__(self, texts, truncation: bool = True, batch_size: Optional[int] = None):
+        import torch
+
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        batch_size = batch_size or len(texts)
+        results = []
+        for start in range(0, len(texts), batch_size):
+            inputs = self.tokenizer(texts[start:start + batch_size], padding=True, truncation=truncation,
+                                    max_length=self.max_length, return_tensors="pt")
+            with torch.inference_mode():
+                probs = self.model(**inputs).logits.float().softmax(dim=-1)
+            scores, indices = probs.max(dim=-1)
+            results.extend({"label": self.id2label[i], "score": s} for i, s in zip(indices.tolist(), scores.tolist()))
+        return results[0] if single else results
+
+
+def load_model(model_name: str, backend: str = "torch", config: Optional[dict] = None) -> Tuple[object, object]:
+    """
+    (model, tokenizer) for `model_name` on `backend`. The eager model is always
+    loaded first (it is the export source and supplies the label config).
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown brain backend {backend!r} (expected one of {', '.join(BACKENDS)})")
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    config = config or {}
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name).eval()
+    if backend == "torch":
+        return model, tokenizer
+
+    directory = os.path.join(config.get("cache_dir", "data/onnx"), _slug(model_name))
+    path = export_onnx(model, tokenizer, directory, quantize=(backend == "onnx-int8"))
+    logger.info(f"{model_name}: ONNX Runtime backend ({backend}, {os.path.basename(path)})")
+    return OnnxModel(path, model.config, threads=config.get("threads", 0)), tokenizer
+
+
+def agreement(reference: List[dict], candidate: List[dict]) -> dict:
+    """Top-label agreement and score drift of `candidate` vs `reference` pipeline outputs."""
+    same = sum(r["label"] == c["label"] for r, c in zip(reference, candidate))
+    diffs = [abs(r["score"] - c["score"]) for r, c in zip(reference, candidate) if r["label"] == c["label"]]
+    return {
+        "items": len(reference),
+        "label_agreement": same / len(reference) if reference else 1.0,
+        "max_score_diff": max(diffs, default=0.0),
+        "mean_score_diff": sum(diffs) / len(diffs) if diffs else 0.0,
+    }
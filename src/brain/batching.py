@@ -0,0 +1,144 @@
+"""
+Micro-Batching
+
+Async micro-batcher in front of a local model. In a burst, concurrent
+headlines would otherwise each run their own forward pass in the default
+thread executor and compete for the same cores. Instead:
+
+- `submit(text)` parks the caller on a future;
+- requests are collected for up to `max_wait_ms` after the first one, or
+  until `max_batch` are waiting;
+- the batch is sorted by length (`length_key`), so the model's padding
+  stays tight (dynamic padding to the longest text in the batch, not the
+  maximum sequence length), and run as one call of `batch_fn(texts)` on a
+  dedicated single-thread executor (one forward pass at a time per model;
+  torch's intra-op threads do the parallel work);
+- results are mapped back to the original order and each future is resolved.
+  If the batch raises, its items are retried one at a time, so one bad
+  input only fails its own caller.
+
+Stats: batches, items, batch size, queue wait and forward-pass time (ms),
+failed batches and items failed on their own.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence
+
+from src.utils.stats import RollingStats
+
+
+def approx_tokens(text: str) -> int:
+    """Cheap token-count proxy for length sorting (whitespace words)."""
+    return len(text.split())
+
+
+class MicroBatcher:
+    def __init__(self, batch_fn: Callable[[List[str]], Sequence], name: str = "model", max_batch: int = 16,
+                 max_wait_ms: float = 5.0, length_key: Callable[[str], int] = approx_tokens):
+        self.logger = logging.getLogger(f"hedgemony.brain.batching.{name}")
+        self.batch_fn = batch_fn
+        self.name = name
+        self.max_batch = max(1, int(max_batch))
+        self.max_wait = max_wait_ms / 1000.0
+        self.length_key = length_key
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"batch-{name}")
+        self._pending: List[tuple] = [] # (text, future, submitted_at)
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running = set() # Strong refs to in-flight batch tasks
+
+        self.batches = 0
+        self.items = 0
+        self.batch_size = RollingStats()
+        self.wait_ms = RollingStats()
+        self.forward_ms = RollingStats()
+        self.failed_batches = 0
+        self.failed_items = 0
+
+    @classmethod
+    def from_config(cls, batch_fn, name: str, config: dict) -> "MicroBatcher":
+        return cls(batch_fn, name=name, max_batch=config.get("max_batch", 16),
+                   max_wait_ms=config.get("max_wait_ms", 5.0))
+
+    async def submit(self, text: str):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future, time.perf_counter()))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[tuple]):
+        now = time.perf_counter()
+        for _, _, submitted_at in batch:
+            self.wait_ms.add((now - submitted_at) * 1000)
+        order = sorted(range(len(batch)), key=lambda i: self.length_key(batch[i][0]))
+        texts = [batch[i][0] for i in order]
+
+        started = time.perf_counter()
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(self._executor, self.batch_fn, texts)
+        except Exception as e:
+            self.failed_batches += 1
+            if len(batch) == 1:
+                self.failed_items += 1
+                if not batch[0][1].done():
+                    batch[0][1].set_exception(e)
+                return
+            self.logger.warning(f"{self.name} batch of {len(batch)} failed ({e}); retrying items one by one")
+            await self._run_singly(batch)
+            return
+        finally:
+            self.forward_ms.add((time.perf_counter() - started) * 1000)
+            self.batches += 1
+            self.items += len(batch)
+            self.batch_size.add(len(batch))
+
+        for position, i in enumerate(order):
+            future = batch[i][1]
+            if not future.done(): # Caller may have been cancelled meanwhile
+                future.set_result(results[position])
+
+    async def _run_singly(self, batch: List[tuple]):
+        loop = asyncio.get_running_loop()
+        for text, future, _ in batch:
+            if future.done():
+                continue
+            try:
+                result = (await loop.run_in_executor(self._executor, self.batch_fn, [text]))[0]
+            except Exception as e:
+                self.failed_items += 1
+                self.logger.warning(f"{self.name} failed on '{text[:50]}': {e}")
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "batch_size": self.batch_size.summary(),
+            "wait_ms": self.wait_ms.summary(),
+            "forward_ms": self.forward_ms.summary(),
+            "failed_batches": self.failed_batches,
+            "failed_items": self.failed_items,
+        }
+
+    def close(self):
+        self._executor.shutdown(wait=False)
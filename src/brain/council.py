@@ -0,0 +1,239 @@
+"""
+Council Voting
+
+The Council of Three's ballot rules, shared by SentimentEngine (live) and the
+cascade replay report:
+
+- `collect_votes` turns the agents' raw results into ballots;
+- `tally_votes` applies the 2/3 rule (Groq weighs 1.1 as tie breaker);
+- `quorum_reached` / `provisional_verdict` call the vote early, once the
+  agents that have voted fix the majority (`brain.quorum`);
+- `CascadePolicy` decides whether the expensive agent (Groq) is worth
+  calling once the cheap signals are in.
+
+Cascade (`brain.cascade`):
+
+    1. keyword impact gate: below `min_impact` Groq is never called, the
+       local models decide alone;
+    2. local models (FinBERT + DeBERTa) vote;
+    3. Groq is called only when its vote can still change the outcome:
+       every possible Groq label is tallied with the local ballots, and if
+       they all give the same (label, tradeable) decision Groq is skipped.
+       Tradeable = non-neutral and confidence >= `confidence_threshold`, so
+       two local bulls still call Groq (its vote decides whether we trade),
+       two local neutrals do not. At `groq_impact` and above Groq is always
+       called, in parallel with the local models.
+    4. `latency_budget_ms` bounds the whole item: Groq gets what is left of
+       the budget, or is skipped when less than `min_groq_ms` remains.
+"""
+
+from itertools import product
+from typing import Iterable, List, Optional, Tuple
+
+LABELS = ("positive", "negative", "neutral")
+AGENT_NAMES = {"groq": "Groq", "finbert": "FinBERT", "deberta": "DeBERTa"}
+
+
+def collect_votes(r_groq: Optional[dict], r_finbert: Optional[dict], r_deberta: Optional[dict]) -> List[dict]:
+    votes = []
+
+    # Vote 1 (Groq)
+    if r_groq and r_groq.get('score'):
+        votes.append({
+            'agent': 'Groq',
+            'label': r_groq['label'], # 'positive', 'negative', 'neutral'
+            'score': r_groq['score'], # GroqAnalyzer: 0 (bearish) .. 1 (bullish)
+            'conf': r_groq.get('confidence', 0.5)
+        })
+
+    # Vote 2 (FinBERT)
+    if r_finbert:
+        votes.append({
+            'agent': 'FinBERT',
+            'label': r_finbert['label'],
+            'score': r_finbert['score'],
+            'conf': r_finbert['confidence']
+        })
+
+    # Vote 3 (DeBERTa)
+    if r_deberta:
+        votes.append({
+            'agent': 'DeBERTa',
+            'label': r_deberta['label'],
+            'score': r_deberta['score'],
+            'conf': r_deberta['confidence']
+        })
+    return votes
+
+
+def _weight(vote: dict) -> float:
+    # Straight 1-person-1-vote is safer against 1 hallucinating model.
+    # However, we can trust Groq slightly more.
+    return 1.1 if vote['agent'] == 'Groq' else 1.0 # Tie breaker
+
+
+def tally_votes(votes: List[dict]) -> dict:
+    """The Council Decides (2/3 Rule): label, score, confidence and reasoning."""
+    # Count ballots
+    counts = {'positive': 0, 'negative': 0, 'neutral': 0}
+
+    for v in votes:
+        if v['label'] in counts:
+            counts[v['label']] += _weight(v)
+
+    # Determine Winner
+    winner = max(counts, key=counts.get)
+    support = counts[winner]
+
+    # Consensus Check
+    is_consensus = support >= 1.9 # Effectively 2 out of 3 (or 2 out of 2)
+
+    # Unanimous? (God Mode Trigger)
+    is_unanimous = (support > 2.9)
+
+    # Calculate Final Composite Score
+    # Average the scores of the WINNING side only (to avoid dilution from the loser)
+    winning_scores = [v['score'] for v in votes if v['label'] == winner]
+    final_score = sum(winning_scores) / len(winning_scores) if winning_scores else 0.0
+
+    # Construct Reasoning
+    reasoning = f"Council Vote: {counts['positive']:.1f} bull / {counts['negative']:.1f} bear. "
+    reasoning += f"Winner: {winner.upper()}. "
+    if is_unanimous: reasoning += "GOD MODE (Unanimous). "
+    elif not is_consensus: reasoning += "NO CONSENSUS (Trade Skipped). "
+
+    return {
+        'label': winner if is_consensus else 'neutral', # Force neutral if split decision
+        'score': final_score if is_consensus else 0.0,
+        'confidence': support / 3.0, # Approximate confidence
+        'reasoning': reasoning,
+    }
+
+
+def provisional_trade(votes: List[dict], trade_threshold: Optional[float]) -> bool:
+    """
+    Provisional trade rule: the votes cast agree on a non-neutral label (two
+    or more agents) whose agents are, on average, at least `trade_threshold`
+    confident. Off when `trade_threshold` is None.
+    """
+    if trade_threshold is None or not votes:
+        return False
+    label = tally_votes(votes)['label']
+    agreeing = [v['conf'] for v in votes if v['label'] == label]
+    return label != 'neutral' and len(agreeing) >= 2 and sum(agreeing) / len(agreeing) >= trade_threshold
+
+
+def quorum_reached(votes: List[dict], outstanding: Iterable[str],
+                   confidence_threshold: Optional[float] = None, trade_threshold: Optional[float] = None) -> bool:
+    """
+    True once the votes cast fix the council's label: it comes out the same
+    whatever the `outstanding` agents (council names) vote, or if they fail.
+    With `confidence_threshold`, the trade decision (non-neutral label at or
+    above the threshold) must be fixed as well, unless the votes cast already
+    meet the provisional trade rule (`trade_threshold`, see provisional_trade).
+    """
+    outstanding = list(outstanding)
+    outcomes = set()
+    for ballots in product(LABELS + (None,), repeat=len(outstanding)):
+        extra = [{'agent': agent, 'label': label, 'score': 0.5, 'conf': 0.5}
+                 for agent, label in zip(outstanding, ballots) if label is not None]
+        decision = tally_votes(votes + extra)
+        tradeable = (confidence_threshold is not None and decision['label'] != 'neutral'
+                     and decision['confidence'] >= confidence_threshold)
+        outcomes.add((decision['label'], tradeable))
+        if len({label for label, _ in outcomes}) > 1:
+            return False
+    return len(outcomes) == 1 or provisional_trade(votes, trade_threshold)
+
+
+def provisional_verdict(votes: List[dict], outstanding: Iterable[str], trade_threshold: Optional[float] = None) -> dict:
+    """
+    Early verdict at quorum. Confidence stays on the full-council scale
+    (support / 3), so an agreeing pair is 2/3, as it would be if the pending
+    agent failed. A verdict meeting the provisional trade rule carries
+    'provisional_trade': True, which lets the executor trade it below the
+    full-council confidence threshold.
+    """
+    outstanding = list(outstanding)
+    verdict = tally_votes(votes)
+    voted = [v['agent'] for v in votes]
+    trade = provisional_trade(votes, trade_threshold)
+    kind = "Provisional trade" if trade else "Quorum"
+    verdict['reasoning'] = f"{kind} ({', '.join(voted)}; {', '.join(outstanding)} pending). " + verdict['reasoning']
+    verdict['provisional'] = True
+    verdict['provisional_trade'] = trade
+    verdict['voted'] = voted
+    verdict['pending'] = list(outstanding)
+    return verdict
+
+
+class CascadePolicy:
+    def __init__(self, min_impact: int = 1, groq_impact: int = 10, confidence_threshold: float = 0.85,
+                 latency_budget_ms: Optional[float] = None, min_groq_ms: float = 250):
+        self.min_impact = min_impact
+        self.groq_impact = groq_impact
+        self.confidence_threshold = confidence_threshold
+        self.latency_budget_ms = latency_budget_ms
+        self.min_groq_ms = min_groq_ms
+
+        self.items = 0
+        self.invocations = {agent: 0 for agent in AGENT_NAMES}
+        self.groq_skipped = {"gate": 0, "decided": 0, "budget": 0}
+        self.groq_timeouts = 0
+
+    @classmethod
+    def from_config(cls, config: dict, confidence_threshold: float = 0.85) -> "CascadePolicy":
+        return cls(
+            min_impact=config.get("min_impact", 1),
+            groq_impact=config.get("groq_impact", 10),
+            confidence_threshold=confidence_threshold,
+            latency_budget_ms=config.get("latency_budget_ms"),
+            min_groq_ms=config.get("min_groq_ms", 250),
+        )
+
+    def tradeable(self, decision: dict) -> bool:
+        return decision['label'] != 'neutral' and decision['confidence'] >= self.confidence_threshold
+
+    def outcome(self, votes: List[dict]) -> Tuple[str, bool]:
+        decision = tally_votes(votes)
+        return decision['label'], self.tradeable(decision)
+
+    def groq_first(self, impact: int) -> bool:
+        """High-impact items ask Groq right away, alongside the local models."""
+        return impact >= self.groq_impact
+
+    def groq_needed(self, local_votes: List[dict], impact: int) -> Tuple[bool, str]:
+        """(call Groq?, reason) once the local models have voted."""
+        if impact < self.min_impact:
+            return False, "gate"
+        outcomes = {self.outcome(local_votes + [{'agent': 'Groq', 'label': label, 'score': 0.5, 'conf': 0.5}])
+                    for label in LABELS}
+        if len(outcomes) == 1:
+            return False, "decided"
+        return True, "open"
+
+    def groq_timeout(self, elapsed_ms: float) -> Optional[float]:
+        """Seconds Groq may take (None = unbounded), or 0 when the budget is spent."""
+        if self.latency_budget_ms is None:
+            return None
+        remaining = self.latency_budget_ms - elapsed_ms
+        return remaining / 1000.0 if remaining >= self.min_groq_ms else 0.0
+
+    def record(self, invoked, groq: str):
+        """One council run: the agents actually invoked and what happened to Groq."""
+        self.items += 1
+        for agent in invoked:
+            self.invocations[agent] += 1
+        if groq in self.groq_skipped:
+            self.groq_skipped[groq] += 1
+        elif groq == "timeout":
+            self.groq_timeouts += 1
+
+    def stats(self) -> dict:
+        return {
+            "items": self.items,
+            "invocation_rate": {agent: round(n / self.items, 4) if self.items else 0.0
+                                for agent, n in self.invocations.items()},
+            "groq_skipped": dict(self.groq_skipped),
+            "groq_timeouts": self.groq_timeouts,
+        }
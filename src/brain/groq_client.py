@@ -0,0 +1,349 @@
+"""
+Groq Client
+
+Chat completions for the Groq agent over Groq's OpenAI-compatible endpoint
+(aiohttp, no SDK), bounded the way the council needs (`brain.groq`):
+
+- Deadline: a call ends within `timeout` seconds, limiter wait, retries and
+  hedges included; past it, GroqError (`timeouts` in stats).
+- Rate limits: token buckets at the plan's requests / tokens per minute
+  (`rpm`, `tpm`) and at most `max_concurrency` requests in flight. A call
+  that cannot get capacity before its deadline fails at once instead of
+  queueing behind the backlog (`throttled`).
+- 429 / 5xx: up to `max_retries` retries inside the deadline. A 429 honors
+  `retry-after` (else exponential back-off with jitter) and pauses the whole
+  limiter, not just the call that hit it.
+- Single-flight: identical requests in flight (same model and messages)
+  share one HTTP call (`coalesced`).
+- Hedging (`hedge_after_ms`, off by default): no answer after that long, a
+  second request is raised and the first answer wins. Each hedge costs rate
+  limit.
+- Prompt budget: `build_user_prompt` fits the headline and as many
+  precedents from vector memory as `prompt_tokens` allows, most similar
+  first, instead of pasting every hit.
+
+Tokens are estimated at CHARS_PER_TOKEN characters each; the tests and
+benchmark run against src/utils/mock_openai.py.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import time
+from typing import List, Optional
+
+import aiohttp
+
+from src.utils.stats import RollingStats
+
+DEFAULT_BASE_URL = "https://api.groq.com/openai/v1"
+CHARS_PER_TOKEN = 4
+
+
+class GroqError(Exception):
+    def __init__(self, message: str, status: Optional[int] = None, retry_after: Optional[float] = None,
+                 retryable: Optional[bool] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+        if retryable is None:
+            retryable = status == 429 or (status is not None and status >= 500)
+        self.retryable = retryable
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def build_user_prompt(text: str, historical_events: list = None, budget_tokens: int = 600,
+                      precedent_chars: int = 100) -> str:
+    """The headline, then the most similar precedents that fit in `budget_tokens`."""
+    news = f"News: {text}"[:budget_tokens * CHARS_PER_TOKEN]
+    header = "\nSimilar Past Events & Outcomes:\n"
+    footer = "\nUse these precedents to inform your impact score and reasoning."
+    used = estimate_tokens(news) + estimate_tokens(header + footer)
+
+    lines, seen = [], set()
+    for event in sorted(historical_events or [], key=lambda e: -(e.get('similarity') or 0.0)):
+        # event format from memory.search_similar
+        # {'text': '...', 'metadata': {'impact': 8}, 'similarity': 0.85}
+        snippet = event.get('text', '')[:precedent_chars]
+        if snippet in seen:
+            continue
+        meta = event.get('metadata') or {}
+        line = f"- '{snippet}...' (Impact: {meta.get('impact', '?')})\n"
+        cost = estimate_tokens(line)
+        if used + cost > budget_tokens:
+            break
+        lines.append(line)
+        seen.add(snippet)
+        used += cost
+
+    if not lines:
+        return news
+    return f"{news}\n{header}{''.join(lines)}{footer}"
+
+
+class TokenBucket:
+    """`rate_per_min` units per minute, bursting up to `capacity` (default: a minute's worth)."""
+
+    def __init__(self, rate_per_min: float, capacity: Optional[float] = None):
+        self.rate = rate_per_min / 60.0
+        self.capacity = capacity or rate_per_min
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def refund(self, cost: float):
+        """Give back units taken for a call that was never made."""
+        self.tokens = min(self.capacity, self.tokens + min(cost, self.capacity))
+
+    def pause(self, seconds: float):
+        """Hold every caller for `seconds` (server-side 429)."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    async def acquire(self, cost: float, deadline: float) -> float:
+        """Take `cost` units, waiting as needed; GroqError if that would pass `deadline` (monotonic). Returns the wait."""
+        cost = min(cost, self.capacity)
+        started = time.monotonic()
+        while True:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(0.0, self.paused_until - now)
+            if not wait and self.tokens >= cost:
+                self.tokens -= cost
+                return now - started
+            wait = max(wait, (cost - self.tokens) / self.rate)
+            if now + wait > deadline:
+                raise GroqError(f"Rate limit: no capacity within the deadline ({wait:.2f}s away)")
+            await asyncio.sleep(wait)
+
+
+class _Flight:
+    """One HTTP call shared by every identical request in flight."""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class GroqClient:
+    def __init__(self, api_key: str, model: str = "llama-3.3-70b-versatile", base_url: str = DEFAULT_BASE_URL,
+                 timeout: float = 8.0, rpm: float = 30, tpm: float = 12000, max_concurrency: int = 8,
+                 max_retries: int = 2, backoff_s: float = 0.5, hedge_after_ms: Optional[float] = None,
+                 max_tokens: int = 200, coalesce: bool = True):
+        self.logger = logging.getLogger("hedgemony.brain.groq_client")
+        self.api_key = api_key
+        self.model = model
+        self.url = base_url.rstrip("/") + "/chat/completions"
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_s = backoff_s
+        self.hedge_after_ms = hedge_after_ms
+        self.max_tokens = max_tokens
+        self.coalesce = coalesce
+
+        self.requests_bucket = TokenBucket(rpm)
+        self.tokens_bucket = TokenBucket(tpm)
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+        self._session = None
+        self._loop = None
+        self._flights = {}
+
+        self.calls = 0
+        self.http_requests = 0
+        self.coalesced = 0
+        self.rate_limited = 0 # 429s from the server
+        self.throttled = 0 # Refused locally: no capacity before the deadline
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.tokens_used = 0
+        self.latency_ms = RollingStats()
+        self.limiter_wait_ms = RollingStats()
+
+    @classmethod
+    def from_config(cls, config: dict, api_key: str) -> "GroqClient":
+        return cls(
+            api_key=api_key,
+            model=config.get("model", "llama-3.3-70b-versatile"),
+            base_url=config.get("base_url", DEFAULT_BASE_URL),
+            timeout=config.get("timeout", 8.0),
+            rpm=config.get("rpm", 30),
+            tpm=config.get("tpm", 12000),
+            max_concurrency=config.get("max_concurrency", 8),
+            max_retries=config.get("max_retries", 2),
+            backoff_s=config.get("backoff_s", 0.5),
+            hedge_after_ms=config.get("hedge_after_ms"),
+            max_tokens=config.get("max_tokens", 200),
+            coalesce=config.get("coalesce", True),
+        )
+
+    def _bind_loop(self):
+        """Session and semaphore belong to the running loop (replays / tests start new ones)."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._session = None
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._flights = {}
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(headers={"Authorization": f"Bearer {self.api_key}"})
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def complete(self, messages: List[dict], temperature: float = 0.1, response_format: dict = None) -> str:
+        """Assistant message content for `messages`, within the call deadline."""
+        self._bind_loop()
+        self.calls += 1
+        payload = {"model": self.model, "messages": messages, "temperature": temperature,
+                   "max_tokens": self.max_tokens}
+        if response_format:
+            payload["response_format"] = response_format
+
+        key = hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+        flight = self._flights.get(key) if self.coalesce else None
+        if flight is not None:
+            self.coalesced += 1
+        else:
+            flight = _Flight(asyncio.ensure_future(self._call(payload)))
+            if self.coalesce:
+                self._flights[key] = flight
+                flight.task.add_done_callback(lambda _: self._flights.pop(key, None))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                flight.task.cancel() # Every caller gave up
+
+    async def _call(self, payload: dict) -> str:
+        started = time.monotonic()
+        deadline = started + self.timeout
+        try:
+            content = await asyncio.wait_for(self._with_retries(payload, deadline), self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise GroqError(f"Deadline exceeded ({self.timeout:.1f}s)")
+        except GroqError:
+            self.errors += 1
+            raise
+        self.latency_ms.add((time.monotonic() - started) * 1000)
+        return content
+
+    async def _with_retries(self, payload: dict, deadline: float) -> str:
+        attempt = 0
+        while True:
+            try:
+                return await self._hedged(payload, deadline)
+            except GroqError as e:
+                if not e.retryable or attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                wait = e.retry_after if e.retry_after is not None else self.backoff_s * 2 ** (attempt - 1) * (1 + random.random())
+                if time.monotonic() + wait >= deadline:
+                    raise
+                if e.status == 429:
+                    self.requests_bucket.pause(wait) # Everyone backs off, not just this call
+                self.retries += 1
+                self.logger.warning(f"Groq HTTP {e.status}, retry {attempt}/{self.max_retries} in {wait:.2f}s")
+                await asyncio.sleep(wait)
+
+    async def _hedged(self, payload: dict, deadline: float) -> str:
+        """One request; with hedging, a second one if the first is slow. First answer wins."""
+        first = asyncio.ensure_future(self._request(payload, deadline))
+        if not self.hedge_after_ms:
+            return await first
+
+        pending = {first}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.hedge_after_ms / 1000.0)
+            if done:
+                return first.result()
+            self.hedges += 1
+            hedge = asyncio.ensure_future(self._request(payload, deadline))
+            pending.add(hedge)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self.hedge_wins += task is hedge
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _request(self, payload: dict, deadline: float) -> str:
+        text = "".join(m.get("content", "") for m in payload["messages"])
+        try:
+            waited = await self.requests_bucket.acquire(1, deadline)
+            try:
+                waited += await self.tokens_bucket.acquire(estimate_tokens(text) + self.max_tokens, deadline)
+            except (GroqError, asyncio.CancelledError):
+                self.requests_bucket.refund(1) # No request goes out: don't spend the slot
+                raise
+        except GroqError:
+            self.throttled += 1
+            raise
+        self.limiter_wait_ms.add(waited * 1000)
+
+        async with self._semaphore:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            self.http_requests += 1
+            try:
+                async with self._session.post(self.url, json=payload,
+                                              timeout=aiohttp.ClientTimeout(total=remaining)) as resp:
+                    if resp.status >= 400:
+                        body = await resp.text()
+                        if resp.status == 429:
+                            self.rate_limited += 1
+                        raise GroqError(f"HTTP {resp.status}: {body[:200]}", status=resp.status,
+                                        retry_after=self._retry_after(resp.headers))
+                    data = await resp.json()
+            except aiohttp.ClientError as e:
+                raise GroqError(f"Connection failed: {e}", retryable=True)
+        self.tokens_used += (data.get("usage") or {}).get("total_tokens", 0)
+        return data["choices"][0]["message"]["content"]
+
+    @staticmethod
+    def _retry_after(headers) -> Optional[float]:
+        try:
+            return float(headers["retry-after"])
+        except (KeyError, ValueError):
+            return None
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "http_requests": self.http_requests,
+            "coalesced": self.coalesced,
+            "rate_limited": self.rate_limited,
+            "throttled": self.throttled,
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "tokens_used": self.tokens_used,
+            "latency_ms": self.latency_ms.summary(),
+            "limiter_wait_ms": self.limiter_wait_ms.summary(),
+        }
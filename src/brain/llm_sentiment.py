@@ -3,6 +3,7 @@ Groq LLM Sentiment Analyzer
 
 Uses Llama-3 models via Groq API for ultra-fast, reasoning-based sentiment analysis.
 Outputs structured JSON with impact scores and reasoning.
+Requests go through GroqClient (deadlines, rate limits, coalescing: see groq_client.py).
 """
 
 import os
@@ -10,33 +11,14 @@ import json
 import logging
 from typing import Dict, Any, Optional
 
-try:
-    from groq import AsyncGroq
-    GROQ_AVAILABLE = True
-except ImportError:
-    GROQ_AVAILABLE = False
+from .groq_client import GroqClient, build_user_prompt
 
 class GroqAnalyzer:
     """
     Sentiment analyzer using Groq API (Llama-3).
     """
-    
-    def __init__(self, config: dict = None):
-        self.logger = logging.getLogger("hedgemony.brain.groq")
-        self.config = config or {}
-        
-        if not GROQ_AVAILABLE:
-            self.logger.error("Groq library not installed. Run: pip install groq")
-            raise ImportError("groq library required")
-            
-        self.api_key = self.config.get("groq", {}).get("api_key") or os.getenv("GROQ_API_KEY")
-        if not self.api_key:
-            self.logger.warning("GROQ_API_KEY not found. LLM sentiment will fail.")
-            
-        self.client = AsyncGroq(api_key=self.api_key)
-        self.model = self.config.get("groq", {}).get("model", "llama-3.3-70b-versatile")
-        
-        self.system_prompt = """
+
+    SYSTEM_PROMPT = """
         You are an expert financial sentiment analyzer for a high-frequency trading bot.
         Analyze the given news headline/text for its immediate impact on crypto (BTC, ETH).
         
@@ -57,6 +39,21 @@ class GroqAnalyzer:
             "reasoning": "brief explanation (max 15 words)"
         }
         """
+    
+    def __init__(self, config: dict = None):
+        self.logger = logging.getLogger("hedgemony.brain.groq")
+        self.config = config or {}
+        
+        groq_config = self.config.get("groq", {}) or {}
+        self.api_key = groq_config.get("api_key") or os.getenv("GROQ_API_KEY")
+        if not self.api_key:
+            self.logger.warning("GROQ_API_KEY not found. LLM sentiment will fail.")
+            
+        self.client = GroqClient.from_config(groq_config, self.api_key)
+        self.model = self.client.model
+        self.prompt_tokens = groq_config.get("prompt_tokens", 600) # Headline + precedents
+        
+        self.system_prompt = self.SYSTEM_PROMPT
 
     async def analyze(self, text: str, historical_events: list = None) -> Dict[str, Any]:
         """
@@ -64,22 +61,10 @@ class GroqAnalyzer:
         Optionally uses historical_events to ground the reasoning.
         """
         if not self.api_key:
-            return {"label": "neutral", "score": 0.5, "confidence": 0.0, "impact": 0, "reasoning": "No API Key"}
-
-        # Construct Context String if available
-        context_str = ""
-        if historical_events:
-            context_str = "\nSimilar Past Events & Outcomes:\n"
-            for event in historical_events:
-                # event format from memory.search_similar
-                # {'text': '...', 'metadata': {'impact': 8}, 'similarity': 0.85}
-                meta = event.get('metadata', {})
-                context_str += f"- '{event.get('text', '')[:100]}...' (Impact: {meta.get('impact', '?')})\n"
-            
-            context_str += "\nUse these precedents to inform your impact score and reasoning."
+            return {"label": "neutral", "score": 0.5, "confidence": 0.0, "impact": 0, "reasoning": "No API Key", "error": "No API Key"}
 
         try:
-            chat_completion = await self.client.chat.completions.create(
+            response_content = await self.client.complete(
                 messages=[
                     {
                         "role": "system",
@@ -87,15 +72,13 @@ class GroqAnalyzer:
                     },
                     {
                         "role": "user",
-                        "content": f"News: {text}\n{context_str}"
+                        # Headline + the most similar precedents that fit the prompt budget
+                        "content": build_user_prompt(text, historical_events, self.prompt_tokens)
                     }
                 ],
-                model=self.model,
                 temperature=0.1, # Low temp for deterministic JSON
                 response_format={"type": "json_object"},
             )
-            
-            response_content = chat_completion.choices[0].message.content
             result = json.loads(response_content)
             
             # Normalize keys if needed
@@ -1,16 +1,19 @@
 import logging
-import chromadb
-from chromadb.config import Settings
-from sentence_transformers import SentenceTransformer
 import time
 
 class MemoryManager:
     """
     Manages Long-Term Vector Memory using ChromaDB.
+
+    With `defer_loading` the ChromaDB client and the embedding model are only
+    built by `load()` (the engine runs it in a background thread at start-up);
+    until then searches return nothing and events are not stored.
     """
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, defer_loading: bool = False):
         self.logger = logging.getLogger("hedgemony.brain.memory")
         self.config = config.get("brain", {}).get("memory", {})
+        self.ready = False
+        self.load_time_ms = None
         
         self.enabled = self.config.get("enabled", True)
         if not self.enabled:
@@ -18,8 +21,17 @@ class MemoryManager:
 
         self.collection_name = self.config.get("collection_name", "market_events")
         self.persist_path = self.config.get("path", "data/chromadb")
-        
+        if not defer_loading:
+            self.load()
+
+    def load(self):
+        if not self.enabled or self.ready:
+            return
+        started = time.perf_counter()
         try:
+            import chromadb
+            from sentence_transformers import SentenceTransformer
+
             # Initialize Client
             self.client = chromadb.PersistentClient(path=self.persist_path)
             
@@ -32,7 +44,9 @@ class MemoryManager:
                 name=self.collection_name,
                 metadata={"hnsw:space": "cosine"} # Cosine similarity for text
             )
-            self.logger.info(f"🧠 Memory Initialized. Collection: {self.collection_name}")
+            self.ready = True
+            self.load_time_ms = (time.perf_counter() - started) * 1000
+            self.logger.info(f"🧠 Memory Initialized in {self.load_time_ms:.0f}ms. Collection: {self.collection_name}")
             
         except Exception as e:
             self.logger.error(f"Failed to initialize Memory: {e}")
@@ -42,7 +56,7 @@ class MemoryManager:
         """
         Store an event in vector memory.
         """
-        if not self.enabled:
+        if not self.enabled or not self.ready:
             return
 
         try:
@@ -71,7 +85,7 @@ class MemoryManager:
         """
         Find historically similar events.
         """
-        if not self.enabled:
+        if not self.enabled or not self.ready:
             return []
 
         try:
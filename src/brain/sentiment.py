@@ -1,53 +1,167 @@
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
-import torch
+import asyncio
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from .impact import ImpactScorer
+from .batching import MicroBatcher
+from .council import AGENT_NAMES, CascadePolicy, collect_votes, provisional_verdict, quorum_reached, tally_votes
+from src.utils.stats import RollingStats
+
+# torch / transformers are imported inside the loaders: importing this module is cheap,
+# and with `defer_loading` the models load in the background while ingestion starts.
 
 class SentimentEngine:
     _instance = None
+    DEBERTA_LABELS = ["bullish news", "bearish news", "neutral news"]
+    AGENTS = ("groq", "finbert", "deberta")
 
-    def __new__(cls, config=None):
+    def __new__(cls, config=None, defer_loading=False):
         if cls._instance is None:
             cls._instance = super(SentimentEngine, cls).__new__(cls)
             cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self, config=None):
+    def __init__(self, config=None, defer_loading=False):
+        """
+        Loads the three agents concurrently (one thread each). With
+        `defer_loading` nothing is loaded here: call `load()` from the event
+        loop; until it finishes, `analyze` goes through the readiness gate
+        (`readiness` config):
+
+            mode: partial   score with whichever agents are already up
+                            (waiting for at least `min_agents`)
+            mode: wait      hold items until every agent has loaded
+            timeout         max seconds an item waits at the gate, then
+                            it is scored by the agents that are up
+        """
         if self._initialized:
             return
             
         self.logger = logging.getLogger("hedgemony.brain.sentiment")
         self.config = config or {}
         self.impact_scorer = ImpactScorer(self.config)
+        self.groq_analyzer = None
+        self.batchers = {}
+        self.load_times = {} # agent -> ms
+        self.verdict_cache = None # Opened once the council is loaded (see _open_verdict_cache)
 
-        # ALWAYS initialize all three brains for the Council of Three
-        self.logger.info("🚀 Initializing Council of Three AI Brains...")
+        # Cheap agents first, Groq only when it can change the outcome (see council.py)
+        cascade_config = self.config.get("cascade", {}) or {}
+        self.cascade = None
+        if cascade_config.get("enabled", False):
+            self.cascade = CascadePolicy.from_config(cascade_config, self.config.get("confidence_threshold", 0.85))
 
-        # Initialize AGENT 1: Groq (LLM Reasoning)
-        try:
-            from .llm_sentiment import GroqAnalyzer
-            self.groq_analyzer = GroqAnalyzer(self.config)
-            self.logger.info("🟢 AGENT 1: Groq (Reasoning) Initialized")
-        except Exception as e:
-            self.logger.warning(f"⚠️  AGENT 1: Groq failed to init: {e}")
-            self.logger.warning("   Council will run with 2/3 brains (FinBERT + DeBERTa)")
-            self.groq_analyzer = None
+        # Early quorum: provisional verdict once the agents in fix the label and trade decision (see analyze)
+        quorum_config = self.config.get("quorum", {}) or {}
+        self.quorum_enabled = quorum_config.get("enabled", False)
+        self.quorum_trade_threshold = quorum_config.get("trade_threshold") # None: no provisional trades
+        self.confidence_threshold = self.config.get("confidence_threshold", 0.85)
+        self.quorum_items = 0
+        self.quorum_early = 0
+        self.quorum_lead_ms = RollingStats()
 
-        # Initialize AGENT 2: FinBERT (The Banker)
-        self._init_finbert()
+        readiness = self.config.get("readiness", {}) or {}
+        self.readiness_mode = readiness.get("mode", "partial")
+        self.readiness_min_agents = readiness.get("min_agents", 1)
+        self.readiness_timeout = readiness.get("timeout", 300)
+        self.pending_agents = set(self.AGENTS) if defer_loading else set() # Not loaded yet: skipped / waited for
+        self._loading = None
+        self._ready_changed = asyncio.Condition()
 
-        # Initialize AGENT 3: DeBERTa (The Logician)
-        self._init_deberta()
+        if not defer_loading:
+            # ALWAYS initialize all three brains for the Council of Three
+            self.logger.info("🚀 Initializing Council of Three AI Brains...")
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=len(self.AGENTS), thread_name_prefix="brain-load") as pool:
+                list(pool.map(self._load_agent, self.AGENTS))
+            self._on_loaded(started)
+            
+        self._initialized = True
+
+    def _load_agent(self, agent):
+        """Load one council member (runs in a worker thread) and time it."""
+        started = time.perf_counter()
+        if agent == "groq":
+            self._init_groq() # AGENT 1: Groq (LLM Reasoning)
+        elif agent == "finbert":
+            self._init_finbert() # AGENT 2: FinBERT (The Banker)
+        else:
+            self._init_deberta() # AGENT 3: DeBERTa (The Logician)
+        self.load_times[agent] = (time.perf_counter() - started) * 1000
 
+        # Micro-batch concurrent headlines into one forward pass per local model
+        batching_config = self.config.get("batching", {}) or {}
+        pipe = getattr(self, f"{agent}_pipe", None)
+        if agent != "groq" and pipe is not None and batching_config.get("enabled", True):
+            batch_fn = self._analyze_finbert_batch if agent == "finbert" else self._analyze_deberta_batch
+            self.batchers[agent] = MicroBatcher.from_config(batch_fn, agent, batching_config)
+
+    def _on_loaded(self, started):
+        """Every agent is up (or failed): open the verdict cache and report load times."""
         # Count active brains
         active_brains = sum([
             self.groq_analyzer is not None,
             hasattr(self, 'finbert_pipe') and self.finbert_pipe is not None,
             hasattr(self, 'deberta_pipe') and self.deberta_pipe is not None
         ])
-        self.logger.info(f"✅ Council initialized with {active_brains}/3 brains active")
-            
-        self._initialized = True
+        self._open_verdict_cache()
+        times = ", ".join(f"{agent} {ms:.0f}ms" for agent, ms in self.load_times.items())
+        self.logger.info(
+            f"✅ Council initialized with {active_brains}/3 brains active "
+            f"in {(time.perf_counter() - started) * 1000:.0f}ms ({times})"
+        )
+
+    async def load(self):
+        """Load every agent concurrently in the background; `analyze` is gated meanwhile."""
+        if self._loading is None:
+            self._loading = asyncio.create_task(self._load_all())
+        await asyncio.shield(self._loading)
+
+    async def _load_all(self):
+        self.logger.info("🚀 Loading Council of Three AI Brains in the background...")
+        started = time.perf_counter()
+
+        async def one(agent):
+            try:
+                await asyncio.to_thread(self._load_agent, agent)
+            finally:
+                self.pending_agents.discard(agent)
+                async with self._ready_changed:
+                    self._ready_changed.notify_all()
+            if agent in self.load_times:
+                self.logger.info(f"⏱️ {agent} loaded in {self.load_times[agent]:.0f}ms")
+
+        await asyncio.gather(*(one(agent) for agent in self.AGENTS))
+        self._on_loaded(started)
+
+    @property
+    def ready(self) -> bool:
+        return not self.pending_agents
+
+    async def _readiness_gate(self):
+        """Hold an item while the agents load (see `readiness` in __init__)."""
+        if self.ready:
+            return
+        if self.readiness_mode == "wait":
+            condition = lambda: self.ready
+        else:
+            condition = lambda: len(self.AGENTS) - len(self.pending_agents) >= self.readiness_min_agents or self.ready
+        try:
+            async with self._ready_changed:
+                await asyncio.wait_for(self._ready_changed.wait_for(condition), self.readiness_timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Readiness gate timed out; scoring without {', '.join(sorted(self.pending_agents))}")
+
+    def _init_groq(self):
+        """Initialize Groq LLM (Agent 1)."""
+        try:
+            from .llm_sentiment import GroqAnalyzer
+            self.groq_analyzer = GroqAnalyzer(self.config)
+            self.logger.info("🟢 AGENT 1: Groq (Reasoning) Initialized")
+        except Exception as e:
+            self.logger.warning(f"⚠️  AGENT 1: Groq failed to init: {e}")
+            self.logger.warning("   Council will run with 2/3 brains (FinBERT + DeBERTa)")
+            self.groq_analyzer = None
 
     def _init_finbert(self):
         """Initialize local FinBERT model."""
@@ -55,153 +169,312 @@ class SentimentEngine:
             model_name = self.config.get("finbert_model", "ProsusAI/finbert")
             self.logger.info(f"Loading AGENT 2: FinBERT... ({model_name})")
             
-            # ... (Standard HF Load)
-            from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
-            import torch
-            
-            device = -1
-            if torch.backends.mps.is_available(): device = "mps"
-            
-            self.finbert_pipe = pipeline("sentiment-analysis", model=model_name, device=device)
-            self.logger.info("🟢 AGENT 2: FinBERT (Financial) Ready")
+            backend = self.config.get("backend", "torch")
+            if backend == "torch":
+                # ... (Standard HF Load)
+                from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
+                import torch
+                
+                device = -1
+                if torch.backends.mps.is_available(): device = "mps"
+                
+                self.finbert_pipe = pipeline("sentiment-analysis", model=model_name, device=device)
+            else:
+                # ONNX Runtime (fp32 / int8) behind the same call signature as the pipeline
+                from .backends import SequenceClassifier, load_model
+                model, tokenizer = load_model(model_name, backend, self.config.get("onnx"))
+                self.finbert_pipe = SequenceClassifier(model, tokenizer)
+            self.logger.info(f"🟢 AGENT 2: FinBERT (Financial) Ready [{backend}]")
         except Exception as e:
             self.logger.error(f"Failed to load FinBERT: {e}")
 
     def _init_deberta(self):
         """Initialize DeBERTa Zero-Shot (Agent 3)."""
         try:
-            model_name = "MoritzLaurer/DeBERTa-v3-base-mnli-fever-anli"
+            model_name = self.config.get("deberta_model", "MoritzLaurer/DeBERTa-v3-base-mnli-fever-anli")
             self.logger.info(f"Loading AGENT 3: DeBERTa... ({model_name})")
             
-            from transformers import pipeline
-            import torch
-            device = -1
-            if torch.backends.mps.is_available(): device = "mps"
-            
-            self.deberta_pipe = pipeline("zero-shot-classification", model=model_name, device=device)
-            self.logger.info("🟢 AGENT 3: DeBERTa (Logic) Ready")
+            from .zero_shot import ZeroShotScorer
+            zero_shot_config = self.config.get("zero_shot", {}) or {}
+            premise_cache = zero_shot_config.get("premise_cache", 256)
+            backend = self.config.get("backend", "torch")
+            self.deberta_scorer = None
+
+            if backend == "torch":
+                from transformers import pipeline
+                import torch
+                device = -1
+                if torch.backends.mps.is_available(): device = "mps"
+                
+                self.deberta_pipe = pipeline("zero-shot-classification", model=model_name, device=device)
+
+                # All (headline, label) NLI pairs in one forward pass instead of the pipeline's one pass per label
+                if zero_shot_config.get("single_pass", True):
+                    self.deberta_scorer = ZeroShotScorer.from_pipeline(
+                        self.deberta_pipe, self.DEBERTA_LABELS, premise_cache=premise_cache
+                    )
+            else:
+                # ONNX Runtime graphs are always scored single-pass
+                from .backends import load_model
+                model, tokenizer = load_model(model_name, backend, self.config.get("onnx"))
+                self.deberta_scorer = ZeroShotScorer(model, tokenizer, self.DEBERTA_LABELS, premise_cache=premise_cache)
+                self.deberta_pipe = self.deberta_scorer
+            self.logger.info(f"🟢 AGENT 3: DeBERTa (Logic) Ready [{backend}]")
             
         except Exception as e:
             self.logger.warning(f"Failed to load DeBERTa: {e} (Will run with 2 agents)")
             self.deberta_pipe = None
 
+    async def warm_up(self):
+        """
+        Dummy forward pass through the local models (burst mode) so the first
+        real headline after a scheduled release pays no lazy-init / cold-cache cost.
+        """
+        loop = asyncio.get_running_loop()
+        text = "Federal Reserve holds interest rates steady as inflation cools."
+
+        for name, fn, ready in (
+            ("FinBERT", self._analyze_finbert, getattr(self, 'finbert_pipe', None) is not None and 'finbert' not in self.pending_agents),
+            ("DeBERTa", self._analyze_deberta, getattr(self, 'deberta_pipe', None) is not None and 'deberta' not in self.pending_agents),
+        ):
+            if not ready:
+                continue
+            started = time.perf_counter()
+            try:
+                await loop.run_in_executor(None, fn, text)
+                self.logger.info(f"🔥 {name} warmed up ({(time.perf_counter() - started) * 1000:.0f} ms)")
+            except Exception as e:
+                self.logger.warning(f"{name} warm-up failed: {e}")
+
     async def analyze(self, text: str, historical_events: list = None):
+        """
+        Council verdict for `text`, served from the verdict cache when this
+        exact (normalized) text was already scored by the same council.
+
+        With `quorum` enabled the verdict comes back as soon as the agents
+        that have voted fix the 2/3 majority and the trade decision
+        (`confidence_threshold`), or agree confidently enough to trade early
+        (`quorum.trade_threshold`, see council.provisional_trade): a provisional verdict
+        ('provisional': True, 'voted', 'pending') whose 'final' task resolves
+        to the full verdict once the last agent returns.
+        """
+        cache = self.verdict_cache
+        if cache is not None:
+            started = time.perf_counter()
+            verdict = await cache.lookup(text)
+            if verdict is not None:
+                verdict['cached'] = True
+                verdict['timings'] = {'cache': (time.perf_counter() - started) * 1000}
+                return verdict
+
+        if not self.quorum_enabled:
+            return await self._final_verdict(text, historical_events)
+
+        quorum = asyncio.get_running_loop().create_future()
+        final = asyncio.ensure_future(self._final_verdict(text, historical_events, quorum))
+        try:
+            await asyncio.wait({quorum, final}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            final.cancel()
+            raise
+        self.quorum_items += 1
+        if not quorum.done() or final.done():
+            quorum.cancel()
+            return await final # Nothing left to wait for
+
+        provisional = quorum.result()
+        provisional['final'] = final
+        self.quorum_early += 1
+        early = time.perf_counter()
+
+        def lead(task):
+            if not task.cancelled() and task.exception() is None:
+                self.quorum_lead_ms.add((time.perf_counter() - early) * 1000)
+        final.add_done_callback(lead)
+        return provisional
+
+    async def _final_verdict(self, text: str, historical_events: list = None, quorum=None):
+        verdict = await self._council(text, historical_events, quorum)
+        if self.verdict_cache is not None and verdict['complete']:
+            self.verdict_cache.store(text, {k: v for k, v in verdict.items() if k != 'timings'})
+        return verdict
+
+    def _open_verdict_cache(self):
+        """The fingerprint needs the loaded council (active agents, Groq model / prompt)."""
+        cache_config = self.config.get("verdict_cache", {}) or {}
+        if not cache_config.get("enabled", False):
+            return
+        from .verdict_cache import VerdictCache, council_fingerprint
+        zero_shot_config = self.config.get("zero_shot", {}) or {}
+        fingerprint = council_fingerprint(
+            agents=[agent for agent in self.AGENTS if self._agent_active(agent)],
+            groq_model=getattr(self.groq_analyzer, 'model', None),
+            groq_prompt=getattr(self.groq_analyzer, 'system_prompt', None),
+            finbert_model=self.config.get("finbert_model", "ProsusAI/finbert"),
+            deberta_model=self.config.get("deberta_model", "MoritzLaurer/DeBERTa-v3-base-mnli-fever-anli"),
+            deberta_labels=self.DEBERTA_LABELS,
+            deberta_single_pass=zero_shot_config.get("single_pass", True),
+            backend=self.config.get("backend", "torch"),
+            cascade=self.cascade and [self.cascade.min_impact, self.cascade.confidence_threshold],
+        )
+        try:
+            self.verdict_cache = VerdictCache.from_config(cache_config, fingerprint)
+            self.logger.info(f"🗄️ Verdict cache at {self.verdict_cache.path} ({self.verdict_cache.entries} entries)")
+        except Exception as e:
+            self.logger.error(f"Verdict cache unavailable: {e}")
+
+    def _agent_active(self, agent) -> bool:
+        if agent == "groq":
+            return self.groq_analyzer is not None
+        return getattr(self, f"{agent}_pipe", None) is not None
+
+    def cache_stats(self) -> dict:
+        return self.verdict_cache.stats() if self.verdict_cache is not None else {}
+
+    def _check_quorum(self, quorum, partial, outstanding, timings, text):
+        """Resolve `quorum` with the provisional verdict once the votes in decide the label and the trade."""
+        if quorum is None or quorum.done() or not outstanding:
+            return # No early verdict wanted, already given, or the full verdict is next
+        votes = collect_votes(partial.get('groq'), partial.get('finbert'), partial.get('deberta'))
+        pending = [AGENT_NAMES[agent] for agent in self.AGENTS if agent in outstanding]
+        if not votes or not quorum_reached(votes, pending, self.confidence_threshold, self.quorum_trade_threshold):
+            return
+        verdict = provisional_verdict(votes, pending, self.quorum_trade_threshold)
+        groq = partial.get('groq')
+        verdict['impact'] = groq.get('impact', 0) if groq else self.impact_scorer.score(text) # Keyword impact until Groq is in
+        verdict['votes'] = votes
+        verdict['timings'] = dict(timings)
+        quorum.set_result(verdict)
+
+    def quorum_stats(self) -> dict:
+        if not self.quorum_enabled:
+            return {}
+        return {
+            "items": self.quorum_items,
+            "early": self.quorum_early,
+            "early_rate": round(self.quorum_early / self.quorum_items, 4) if self.quorum_items else 0.0,
+            "lead_ms": self.quorum_lead_ms.summary(), # Provisional verdict ahead of the final one
+        }
+
+    def groq_stats(self) -> dict:
+        client = getattr(self.groq_analyzer, 'client', None)
+        return client.stats() if client is not None else {}
+
+    def cascade_stats(self) -> dict:
+        return self.cascade.stats() if self.cascade is not None else {}
+
+    async def _council(self, text: str, historical_events: list = None, quorum=None):
         """
         THE COUNCIL OF THREE (Voting System)
         ------------------------------------
         1. Groq (Reasoning)
         2. FinBERT (Finance Tone)
         3. DeBERTa (Logic/NLI)
+
+        `quorum` (a future) gets the provisional verdict as soon as the votes
+        in fix the outcome; the council keeps going for the full verdict.
         """
-        import asyncio
-        loop = asyncio.get_running_loop()
+        # Before every agent has loaded: wait at the readiness gate, skip the ones still loading
+        await self._readiness_gate()
+        pending = set(self.pending_agents)
 
-        # 1. Run All Agents in Parallel
-        tasks = []
-        
-        # Agent 1: Groq
-        if self.groq_analyzer:
-            tasks.append(self.groq_analyzer.analyze(text, historical_events))
-        else:
-            tasks.append(asyncio.sleep(0, result={}))
+        # 1. Run the Agents (in parallel, or cheapest first under the cascade policy)
+        timings = {} # agent -> ms (latency histograms per council member)
+        started = time.perf_counter()
 
-        # Agent 2: FinBERT
-        tasks.append(loop.run_in_executor(None, self._analyze_finbert, text))
+        policy = self.cascade
+        impact = self.impact_scorer.score(text) if policy else None
+        groq_active = self.groq_analyzer is not None and 'groq' not in pending
+        # Agents still expected to vote, and the votes in so far (early quorum)
+        outstanding = {agent for agent in self.AGENTS if agent not in pending and (agent != 'groq' or groq_active)}
+        partial = {}
 
-        # Agent 3: DeBERTa
-        tasks.append(loop.run_in_executor(None, self._analyze_deberta, text))
+        async def _timed(agent, awaitable):
+            started = time.perf_counter()
+            try:
+                result = await awaitable
+            finally:
+                timings[agent] = (time.perf_counter() - started) * 1000
+                outstanding.discard(agent)
+            partial[agent] = result
+            if groq_task is not None or not groq_active: # Not while the cascade holds Groq back
+                self._check_quorum(quorum, partial, outstanding, timings, text)
+            return result
+        groq_call = lambda: asyncio.ensure_future(_timed('groq', self.groq_analyzer.analyze(text, historical_events)))
+
+        # Agent 1: Groq (up front unless the cascade holds it back until the local votes are in)
+        groq_task = groq_call() if groq_active and (policy is None or policy.groq_first(impact)) else None
+
+        # Agents 2 & 3: FinBERT, DeBERTa
+        local = [
+            _timed(agent, self._run_local(agent, fn, text)) if agent not in pending else asyncio.sleep(0, result={})
+            for agent, fn in (('finbert', self._analyze_finbert), ('deberta', self._analyze_deberta))
+        ]
 
         # AWAIT RESULTS
-        results = await asyncio.gather(*tasks)
-        r_groq, r_finbert, r_deberta = results
+        r_finbert, r_deberta = await asyncio.gather(*local)
+        r_groq = {}
+        groq_status = "called" if groq_active else "off"
+        if policy is None:
+            if groq_task is not None:
+                r_groq = await groq_task
+        else:
+            if groq_active and groq_task is None:
+                # Ask Groq only if its vote can still change the decision, and the latency budget allows it
+                needed, groq_status = policy.groq_needed(collect_votes(None, r_finbert, r_deberta), impact)
+                if needed:
+                    groq_status = "called"
+                    if policy.groq_timeout((time.perf_counter() - started) * 1000) == 0:
+                        groq_status = "budget"
+                    else:
+                        groq_task = groq_call()
+                        self._check_quorum(quorum, partial, outstanding, timings, text)
+            if groq_task is not None:
+                try:
+                    r_groq = await asyncio.wait_for(groq_task, policy.groq_timeout((time.perf_counter() - started) * 1000))
+                except asyncio.TimeoutError:
+                    groq_status = "timeout"
+            policy.record([agent for agent in self.AGENTS if agent in timings], groq_status)
+        results = (r_groq, r_finbert, r_deberta)
 
         # 2. Collect Votes
-        votes = []
-        
-        # Vote 1 (Groq)
-        if r_groq and r_groq.get('score'):
-            votes.append({
-                'agent': 'Groq',
-                'label': r_groq['label'], # 'positive', 'negative', 'neutral'
-                'score': r_groq['score'], # 0 to 1 usually, need normalize? 
-                # GroqAnalyzer returns normalized scalar? No check llm_sentiment.
-                # Let's assume standardized labels: positive, negative, neutral.
-                'conf': r_groq.get('confidence', 0.5)
-            })
-
-        # Vote 2 (FinBERT)
-        if r_finbert:
-            votes.append({
-                'agent': 'FinBERT',
-                'label': r_finbert['label'],
-                'score': r_finbert['score'],
-                'conf': r_finbert['confidence']
-            })
-
-        # Vote 3 (DeBERTa)
-        if r_deberta:
-            votes.append({
-                'agent': 'DeBERTa',
-                'label': r_deberta['label'],
-                'score': r_deberta['score'],
-                'conf': r_deberta['confidence']
-            })
+        votes = collect_votes(r_groq, r_finbert, r_deberta)
 
         # 3. The Council Decides (2/3 Rule)
-        # Count ballots
-        counts = {'positive': 0, 'negative': 0, 'neutral': 0}
-        total_valid = 0
-        
-        for v in votes:
-            if v['label'] in counts:
-                # Weighted voting? Or straight 1-person-1-vote?
-                # User asked for "2/3 Agree". Straight vote is safer against 1 hallucinating model.
-                # However, we can trust Groq slightly more.
-                weight = 1.0
-                if v['agent'] == 'Groq': weight = 1.1 # Tie breaker
-                
-                counts[v['label']] += weight
-                total_valid += 1
-        
-        # Determine Winner
-        winner = max(counts, key=counts.get)
-        support = counts[winner]
-        
-        # Consensus Check
-        is_consensus = False
-        if support >= 1.9: # Effectively 2 out of 3 (or 2 out of 2)
-            is_consensus = True
-            
-        # Unanimous? (God Mode Trigger)
-        is_unanimous = (support > 2.9)
-
-        # Calculate Final Composite Score
-        # Average the scores of the WINNING side only (to avoid dilution from the loser)
-        winning_scores = [v['score'] for v in votes if v['label'] == winner]
-        if winning_scores:
-            final_score = sum(winning_scores) / len(winning_scores)
+        verdict = tally_votes(votes)
+        if r_groq or policy is None:
+            verdict['impact'] = max([v.get('impact', 0) for v in [r_groq, r_finbert] if isinstance(v, dict)]) # DeBERTa doesn't do impact
         else:
-            final_score = 0.0
+            verdict['impact'] = impact # Groq skipped: keyword impact
+        verdict['votes'] = votes # Each agent's raw vote
+        # Every agent that should have voted did (none skipped at the readiness gate or for time, none failed)
+        verdict['complete'] = not pending and groq_status not in ("budget", "timeout") and all(
+            r and 'error' not in r for r, agent in zip(results, self.AGENTS) if agent in timings)
+        if policy is not None:
+            verdict['cascade'] = {'impact': impact, 'groq': groq_status}
+        verdict['timings'] = timings
+        return verdict
 
-        # Construct Reasoning
-        reasoning = f"Council Vote: {counts['positive']:.1f} bull / {counts['negative']:.1f} bear. "
-        reasoning += f"Winner: {winner.upper()}. "
-        if is_unanimous: reasoning += "GOD MODE (Unanimous). "
-        elif not is_consensus: reasoning += "NO CONSENSUS (Trade Skipped). "
-        
-        # Override Label if specific Agent 1 veto? No, Democracy rules.
-        
-        return {
-            'label': winner if is_consensus else 'neutral', # Force neutral if split decision
-            'score': final_score if is_consensus else 0.0,
-            'confidence': support / 3.0, # Approximate confidence
-            'impact': max([v.get('impact', 0) for v in [r_groq, r_finbert] if isinstance(v, dict)]), # DeBERTa doesn't do impact
-            'reasoning': reasoning
-        }
+    def _run_local(self, agent, fn, text):
+        """A local model vote: through its micro-batcher, else one pass in the default executor."""
+        batcher = getattr(self, 'batchers', {}).get(agent)
+        if batcher:
+            return batcher.submit(text)
+        return asyncio.get_running_loop().run_in_executor(None, fn, text)
+
+    def batching_stats(self) -> dict:
+        return {agent: batcher.stats() for agent, batcher in getattr(self, 'batchers', {}).items()}
 
     def _analyze_finbert(self, text):
-        # ... (Keep existing logic, ensure return dict matches expected format)
-        res = self.finbert_pipe(text[:512], truncation=True)[0]
+        return self._analyze_finbert_batch([text])[0]
+
+    def _analyze_finbert_batch(self, texts):
+        """One batched FinBERT pass (padded to the longest text in the batch)."""
+        results = self.finbert_pipe([t[:512] for t in texts], truncation=True, batch_size=len(texts))
+        return [self._finbert_vote(res) for res in results]
+
+    @staticmethod
+    def _finbert_vote(res):
         # Map label positive/negative/neutral
         l = res['label']
         s = res['score']
@@ -213,10 +486,20 @@ class SentimentEngine:
     def _analyze_deberta(self, text):
         """Run Zero-Shot Classification"""
         if not self.deberta_pipe: return {}
-        
-        candidate_labels = ["bullish news", "bearish news", "neutral news"]
-        res = self.deberta_pipe(text, candidate_labels)
-        
+        return self._analyze_deberta_batch([text])[0]
+
+    def _analyze_deberta_batch(self, texts):
+        """Zero-shot classification of a whole batch of headlines (single-pass scorer when enabled)."""
+        if getattr(self, 'deberta_scorer', None) is not None:
+            results = self.deberta_scorer(list(texts))
+        else:
+            results = self.deberta_pipe(list(texts), self.DEBERTA_LABELS, batch_size=len(texts) * len(self.DEBERTA_LABELS))
+        if isinstance(results, dict):
+            results = [results]
+        return [self._deberta_vote(res) for res in results]
+
+    @staticmethod
+    def _deberta_vote(res):
         # res looks like {'labels': ['bullish news', ...], 'scores': [0.9, ...]}
         top_label = res['labels'][0]
         top_score = res['scores'][0]
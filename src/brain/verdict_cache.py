@@ -0,0 +1,191 @@
+"""
+Verdict Cache
+
+Persistent, content-addressed cache of council verdicts in front of
+`SentimentEngine.analyze`. The same headline comes back through live
+duplicates, BackfillEngine re-imports, backtests and audit re-runs; a hit
+skips the Groq call and both transformer passes.
+
+- Key: sha256 of the normalized text (NFKC, case-folded, whitespace
+  collapsed) plus the council fingerprint: a hash of everything that can
+  change a verdict (model names, backend, the Groq system prompt, zero-shot
+  labels, active agents, CACHE_VERSION).
+- Value: the full verdict, including every agent's raw vote.
+- Invalidation: rows are keyed by (text, fingerprint) and lookups only see
+  the current fingerprint, so a model or prompt change simply misses; rows
+  of other fingerprints stay (a rollback hits again) until LRU ages them out.
+- Eviction: LRU on last use, capped at `capacity` rows; trimmed every
+  `evict_every` writes. Hits only record their use in memory; `last_used`
+  is written in batches of `touch_every` (and with the next put / close).
+- `lookup` / `store` run the sqlite work on a dedicated single-thread
+  executor, so the event loop never waits on the file; the row count in
+  `stats()` is tracked in memory rather than queried.
+- Only complete councils are stored (no agent skipped or failed), so a
+  degraded verdict never outlives the outage.
+- sqlite in WAL mode, like the ingestion seen store.
+
+The similar-events context handed to Groq is not part of the key: it grounds
+the reasoning but the headline decides the verdict.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+CACHE_VERSION = 1 # Bump when the voting logic changes
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def council_fingerprint(**parts) -> str:
+    parts["cache_version"] = CACHE_VERSION
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+class VerdictCache:
+    def __init__(self, path: str = "data/verdict_cache.db", fingerprint: str = "", capacity: int = 200000,
+                 evict_every: int = 256, touch_every: int = 64):
+        self.logger = logging.getLogger("hedgemony.brain.verdict_cache")
+        self.path = path
+        self.fingerprint = fingerprint
+        self.capacity = capacity
+        self.evict_every = evict_every
+        self.touch_every = touch_every
+        self._touched: Dict[str, float] = {} # key -> last use, not yet written
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="verdict-cache")
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evicted = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS verdicts (
+                key TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                verdict TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (key, fingerprint)
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_verdicts_last_used ON verdicts(last_used)')
+        self._conn.commit()
+        self.entries = len(self) # Kept current by put / evict, so stats() never queries
+
+    @classmethod
+    def from_config(cls, config: dict, fingerprint: str) -> "VerdictCache":
+        return cls(
+            path=config.get("path", "data/verdict_cache.db"),
+            fingerprint=fingerprint,
+            capacity=config.get("capacity", 200000),
+        )
+
+    def get(self, text: str) -> Optional[dict]:
+        key = text_key(text)
+        row = self._conn.execute(
+            "SELECT verdict FROM verdicts WHERE key = ? AND fingerprint = ?", (key, self.fingerprint)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touched[key] = time.time()
+        if len(self._touched) >= self.touch_every:
+            self._write_touches()
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def put(self, text: str, verdict: dict):
+        now = time.time()
+        self._write_touches()
+        row = (text_key(text), self.fingerprint, json.dumps(verdict, default=str), now, now)
+        inserted = self._conn.execute(
+            "INSERT OR IGNORE INTO verdicts (key, fingerprint, verdict, created_at, last_used) VALUES (?, ?, ?, ?, ?)", row
+        ).rowcount
+        if inserted:
+            self.entries += 1
+        else:
+            self._conn.execute(
+                "UPDATE verdicts SET verdict = ?, created_at = ?, last_used = ? WHERE key = ? AND fingerprint = ?",
+                row[2:] + row[:2],
+            )
+        self._conn.commit()
+        self.writes += 1
+        if self.writes % self.evict_every == 0:
+            self.evict()
+
+    async def lookup(self, text: str) -> Optional[dict]:
+        """`get` on the cache's own thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.get, text)
+
+    def store(self, text: str, verdict: dict):
+        """`put` on the cache's own thread, without waiting for it."""
+        self._executor.submit(self._store, text, verdict)
+
+    def _store(self, text: str, verdict: dict):
+        try:
+            self.put(text, verdict)
+        except Exception as e:
+            self.logger.error(f"Verdict cache write failed: {e}")
+
+    def _write_touches(self):
+        if self._touched:
+            touched, self._touched = self._touched, {}
+            self._conn.executemany(
+                "UPDATE verdicts SET last_used = ? WHERE key = ? AND fingerprint = ?",
+                [(ts, key, self.fingerprint) for key, ts in touched.items()],
+            )
+
+    def evict(self):
+        """Trim to `capacity` rows, least recently used first (any fingerprint)."""
+        excess = self.entries - self.capacity
+        if excess > 0:
+            deleted = self._conn.execute(
+                "DELETE FROM verdicts WHERE rowid IN (SELECT rowid FROM verdicts ORDER BY last_used LIMIT ?)", (excess,)
+            ).rowcount
+            self._conn.commit()
+            self.entries -= deleted
+            self.evicted += deleted
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": self.entries,
+            "writes": self.writes,
+            "evicted": self.evicted,
+            "fingerprint": self.fingerprint,
+        }
+
+    def close(self):
+        self._executor.shutdown(wait=True) # Pending stores land first
+        if self._conn:
+            self._write_touches()
+            self._conn.commit()
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,138 @@
+"""
+Single-Pass Zero-Shot Scoring
+
+Drop-in replacement for the HF "zero-shot-classification" pipeline on the
+DeBERTa agent. The pipeline runs one NLI pass per (headline, candidate label)
+pair and re-tokenizes the premise and every hypothesis each time. Here:
+
+- the hypotheses ("This example is bullish news." ...) are tokenized once,
+  at construction, and cached;
+- each premise is tokenized once and shared by all of its pairs, optionally
+  through a small LRU (`premise_cache`) so repeated headlines (wire echoes,
+  replays) skip tokenization entirely;
+- every premise x hypothesis pair of a whole batch of headlines is padded to
+  the longest pair and scored in one forward pass.
+
+Scores follow the pipeline: with `multi_label=False` the entailment logits
+are soft-maxed across the candidate labels, with `multi_label=True` each
+label gets its own entailment-vs-contradiction softmax. Results come
+back in the pipeline's format: {"sequence", "labels", "scores"}, labels
+sorted by descending score.
+
+Hidden states are not reused across hypotheses: in a cross-encoder every
+layer attends across premise and hypothesis, so that would change the scores.
+
+torch is imported lazily; building a scorer needs a loaded model + tokenizer.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+HYPOTHESIS_TEMPLATE = "This example is {}." # The pipeline's default
+
+
+class ZeroShotScorer:
+    def __init__(self, model, tokenizer, candidate_labels: Sequence[str], hypothesis_template: str = HYPOTHESIS_TEMPLATE,
+                 multi_label: bool = False, max_length: Optional[int] = None, premise_cache: int = 0):
+        self.model = model.eval()
+        self.tokenizer = tokenizer
+        self.candidate_labels = list(candidate_labels)
+        # Like the pipeline: a single candidate label is always scored independently
+        self.multi_label = multi_label or len(self.candidate_labels) == 1
+
+        self.entailment_id = self._entailment_id(model.config.label2id)
+        self.contradiction_id = -1 if self.entailment_id == 0 else 0
+
+        # Cached hypotheses: token ids without special tokens
+        self.hypotheses = [
+            tokenizer(hypothesis_template.format(label), add_special_tokens=False)["input_ids"]
+            for label in self.candidate_labels
+        ]
+        limit = max_length or min(getattr(tokenizer, "model_max_length", 512), 512)
+        self.premise_budget = limit - max(map(len, self.hypotheses)) - tokenizer.num_special_tokens_to_add(pair=True)
+
+        self.premise_cache_size = premise_cache
+        self._premises: "OrderedDict[str, List[int]]" = OrderedDict()
+
+    @classmethod
+    def from_pipeline(cls, pipe, candidate_labels: Sequence[str], **kwargs) -> "ZeroShotScorer":
+        """Reuse the model + tokenizer an existing zero-shot pipeline already loaded."""
+        return cls(pipe.model, pipe.tokenizer, candidate_labels, **kwargs)
+
+    @staticmethod
+    def _entailment_id(label2id: Dict[str, int]) -> int:
+        """Entailment logit index, found the way the pipeline does."""
+        for label, index in label2id.items():
+            if label.lower().startswith("entail"):
+                return index
+        raise ValueError(f"Model has no entailment label (label2id: {label2id})")
+
+    def _premise_ids(self, text: str) -> List[int]:
+        ids = self._premises.get(text) if self.premise_cache_size else None
+        if ids is None:
+            ids = self.tokenizer(text, add_special_tokens=False, truncation=True,
+                                 max_length=self.premise_budget)["input_ids"]
+            if self.premise_cache_size:
+                self._premises[text] = ids
+                if len(self._premises) > self.premise_cache_size:
+                    self._premises.popitem(last=False)
+        else:
+            self._premises.move_to_end(text)
+        return ids
+
+    def _pairs(self, texts: Sequence[str]) -> dict:
+        """Every premise x hypothesis pair, padded to the longest one."""
+        tok = self.tokenizer
+        input_ids, token_type_ids = [], []
+        for text in texts:
+            premise = self._premise_ids(text)
+            for hypothesis in self.hypotheses:
+                input_ids.append(tok.build_inputs_with_special_tokens(premise, hypothesis))
+                token_type_ids.append(tok.create_token_type_ids_from_sequences(premise, hypothesis))
+
+        width = max(map(len, input_ids))
+        pad = tok.pad_token_id or 0
+        right = tok.padding_side == "right"
+
+        def padded(row, value):
+            fill = [value] * (width - len(row))
+            return row + fill if right else fill + row
+
+        batch = {
+            "input_ids": [padded(r, pad) for r in input_ids],
+            "attention_mask": [padded([1] * len(r), 0) for r in input_ids],
+        }
+        if "token_type_ids" in tok.model_input_names:
+            batch["token_type_ids"] = [padded(r, 0) for r in token_type_ids]
+        return batch
+
+    def __call__(self, texts):
+        """Score one headline (returns a dict) or a list of them (returns a list)."""
+        import torch
+
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        if not texts:
+            return []
+
+        device = self.model.device
+        batch = {name: torch.tensor(rows, device=device) for name, rows in self._pairs(texts).items()}
+        with torch.inference_mode():
+            logits = self.model(**batch).logits.float().cpu()
+        logits = logits.view(len(texts), len(self.candidate_labels), -1)
+
+        if self.multi_label:
+            pair = logits[..., [self.contradiction_id, self.entailment_id]]
+            scores = pair.softmax(dim=-1)[..., 1]
+        else:
+            scores = logits[..., self.entailment_id].softmax(dim=-1)
+
+        results = []
+        for text, row in zip(texts, scores.tolist()):
+            order = sorted(range(len(row)), key=lambda i: -row[i])
+            results.append({
+                "sequence": text,
+                "labels": [self.candidate_labels[i] for i in order],
+                "scores": [row[i] for i in order],
+            })
+        return results[0] if single else results
@@ -6,7 +6,9 @@ from src.ingestion.stream_manager import StreamManager
 from src.brain.sentiment import SentimentEngine
 from src.trading.executor import PaperTradingExecutor
 from src.ingestion.base import NewsItem
+from src.core.pipeline import NewsPipeline, PipelineJob, STAGES
 from src.utils.db import Database
+from src.utils.latency import LatencyTracker, stamp
 
 import os
 from dotenv import load_dotenv
@@ -22,20 +24,20 @@ logging.basicConfig(
 logger = logging.getLogger("hedgemony.core")
 
 class HedgemonyEngine:
-    def __init__(self, config_path="config/config.yaml"):
-        self.config = self._load_config(config_path)
+    def __init__(self, config_path="config/config.yaml", config: dict = None):
+        self.config = config if config is not None else self._load_config(config_path)
         logger.info("Initializing Hedgemony Engine...")
         
         # 0. Setup DB
         self.db = Database()
         self.db.init_db()
 
-        # 1. Setup Brain (AI)
-        self.brain = SentimentEngine(self.config.get("brain"))
+        # 1. Setup Brain (AI) - models load in the background from start() (see load_models)
+        self.brain = SentimentEngine(self.config.get("brain"), defer_loading=True)
         
         # 1.5 Setup Memory (Long-Term Vector Store)
         from src.brain.memory import MemoryManager
-        self.memory = MemoryManager(self.config)
+        self.memory = MemoryManager(self.config, defer_loading=True)
         
         # 2. Setup Execution (Trading)
         from src.trading.executor import PaperTradingExecutor
@@ -63,13 +65,40 @@ class HedgemonyEngine:
         self.ingestion_config['twitter']['access_token'] = os.getenv("TWITTER_ACCESS_TOKEN")
         self.ingestion_config['twitter']['access_token_secret'] = os.getenv("TWITTER_ACCESS_TOKEN_SECRET")
 
+        # Burst mode settings are needed on both sides of the process split
+        self.burst_config = self.config.get("burst_mode", {}) or {}
+        self.ingestion_config["burst_mode"] = self.burst_config
+
         # Load RSS sources needed for worker config
         rss_sources = self._load_rss_sources(self.ingestion_config.get("rss_sources_file"))
         self.ingestion_config["rss_sources"] = rss_sources
+
+        # Capture mode: every worker records into the same session directory
+        record_config = self.ingestion_config.get("record") or {}
+        if record_config.get("enabled", False):
+            from datetime import datetime
+            record_config.setdefault("session", datetime.now().strftime("%Y%m%d-%H%M%S"))
         
-        # Initialize Queue for IPC which is PROCESS SAFE
-        from multiprocessing import Queue
-        self.news_queue = Queue()
+        # Initialize awaitable IPC channel (PROCESS SAFE, wakes the loop on publish)
+        from src.ingestion.channel import NewsChannel
+        self.pipeline_config = self.config.get("pipeline", {}) or {}
+        self.news_channel = NewsChannel(
+            priority_aging=self.pipeline_config.get("priority_aging", 10.0),
+            max_pending=self.pipeline_config.get("channel_max_pending", 1024))
+        self.supervisor = None # Ingestion worker processes, spawned in start()
+
+        # 4. Per-stage / per-source latency histograms (stamps carried on every NewsItem)
+        self.latency = LatencyTracker() # Includes the live exchange round-trip (order_* stamps)
+
+        # 5. Setup staged processing pipeline
+        self._stage_handlers = {
+            "context": self._stage_context,
+            "analyze": self._stage_analyze,
+            "log": self._stage_log,
+            "execute": self._stage_execute,
+        }
+        self.pipeline = NewsPipeline(self._stage_handlers, self.pipeline_config, on_complete=self._record_latency)
+        self._finalizing = set() # Councils still running after an early-quorum verdict (see _stage_log)
         
         # Remove StreamManager init from main process (it moves to Worker)
         # self.stream_manager = StreamManager(ingestion_config)
@@ -93,93 +122,237 @@ class HedgemonyEngine:
 
     async def _handle_news_item(self, item: NewsItem):
         """
-        The Core Pipeline Logic:
+        The Core Pipeline Logic (sequential form):
         Ingest -> Memory Context -> Analyze -> Decision -> Execute -> Store Memory
+
+        The live loop runs the same stages concurrently through NewsPipeline;
+        this helper runs them back-to-back for one item.
         """
+        job = PipelineJob(item=item, symbol=self._resolve_symbol(item))
+        for stage in STAGES:
+            stamp(item, f"{stage}_start")
+            await self._stage_handlers[stage](job)
+            stamp(item, f"{stage}_end")
+        self._record_latency(job)
+
+    def _record_latency(self, job: PipelineJob):
+        """Aggregate the item's stage stamps and persist its compact latency record."""
+        record = self.latency.record(job.item, job.analysis)
+        record['news_id'] = job.news_id
+        asyncio.get_running_loop().run_in_executor(None, self.db.log_latency, record)
+
+    def _resolve_symbol(self, item: NewsItem) -> str:
+        return 'BTC-PERP' # Default for now
+
+    async def _stage_context(self, job: PipelineJob):
+        """0. Retrieve Historical Context"""
+        item = job.item
         logger.info(f"Received News from Queue: {item.title}")
-        
-        loop = asyncio.get_event_loop()
-        text_to_analyze = item.title + " " + item.content
-        
-        # 0. Retrieve Historical Context
-        similar_events = []
+        job.text = item.title + " " + item.content
+
         if self.memory.enabled:
             # Run in executor to avoid blocking loop (vector search calculation)
-            similar_events = await loop.run_in_executor(None, self.memory.search_similar, text_to_analyze)
-            if similar_events:
-                logger.info(f"🧠 Found {len(similar_events)} similar past events")
-        
-        # 1. Analyze (with context)
-        # Note: We must ensure brain.analyze accepts the new argument or we update SentimentEngine wrapper too
-        # checking SentimentEngine wrapper... usually it just forwards or we call specific model.
-        # Ideally SentimentEngine.analyze should accept **kwargs and pass to model.
-        # For now, let's assume we need to update SentimentEngine.analyze sig as well, 
-        # but let's check if we can pass it directly.
-        # self.brain is 'SentimentEngine'.
-        
-        # 1. Analyze (Ensemble - runs parallel internally)
-        analysis = await self.brain.analyze(text_to_analyze, similar_events)
-        
-        logger.info(f"Sentiment: {analysis['label'].upper()} ({analysis['score']:.2f})")
-        
-        # Log to DB
-        item.impact_score = analysis.get('impact', 0)
-        self.db.log_news(item, analysis)
-        
-        # 2. Decide & Execute
+            loop = asyncio.get_running_loop()
+            job.similar_events = await loop.run_in_executor(None, self.memory.search_similar, job.text)
+            if job.similar_events:
+                logger.info(f"🧠 Found {len(job.similar_events)} similar past events")
+
+    async def _stage_analyze(self, job: PipelineJob):
+        """1. Analyze (Ensemble - runs parallel internally)"""
+        job.analysis = await self.brain.analyze(job.text, job.similar_events)
+        early = f" [quorum: {', '.join(job.analysis['voted'])}]" if job.analysis.get('provisional') else ""
+        logger.info(f"Sentiment: {job.analysis['label'].upper()} ({job.analysis['score']:.2f}){early}")
+
+    async def _stage_log(self, job: PipelineJob):
+        """Log to DB (sqlite write off the loop)"""
+        job.item.impact_score = job.analysis.get('impact', 0)
+        loop = asyncio.get_running_loop()
+        news_id = await loop.run_in_executor(None, self.db.log_news, job.item, job.analysis)
+        job.news_id = news_id
+
+        # Early-quorum verdict: the remaining agents finish in the background and update the stored record
+        final = job.analysis.get('final')
+        if final is not None:
+            task = asyncio.create_task(self._store_final_verdict(news_id, job.item, final, job.analysis))
+            self._finalizing.add(task)
+            task.add_done_callback(self._finalizing.discard)
+
+    async def _store_final_verdict(self, news_id, item: NewsItem, final: asyncio.Future, provisional: dict):
+        try:
+            verdict = await final
+        except Exception as e:
+            logger.error(f"Council failed after quorum for '{item.title[:60]}': {e}")
+            return
+        if news_id is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.db.update_news_analysis, news_id, verdict, verdict.get('impact')
+            )
+        logger.info(f"Final verdict: {verdict['label'].upper()} ({verdict['score']:.2f}, "
+                    f"confidence {verdict['confidence']:.2f}) for '{item.title[:60]}'")
+        if provisional.get('provisional_trade') and verdict['label'] != provisional['label']:
+            logger.warning(f"Provisional trade on '{item.title[:60]}' was {provisional['label'].upper()}, "
+                           f"full council says {verdict['label'].upper()}")
+
+    async def _stage_execute(self, job: PipelineJob):
+        """2. Decide & Execute, 3. Store in Memory"""
+        item, analysis = job.item, job.analysis
         signal = {
             'source_item': item,
             'analysis': analysis,
-            'symbol': 'BTC-PERP' # Default for now
+            'symbol': job.symbol
         }
         
         await self.trader.execute_signal(signal)
         
-        # 3. Store in Memory (Async)
         if self.memory.enabled:
             # Store with impact score for future reference
             metadata = {
-                "source": item.source,
+                "source": item.source_id,
                 "impact": item.impact_score,
                 "label": analysis['label'],
                 "timestamp": item.published_at.timestamp() if item.published_at else 0
             }
             # Fire and forget (in executor)
-            loop.run_in_executor(None, self.memory.add_event, text_to_analyze, metadata)
+            asyncio.get_running_loop().run_in_executor(None, self.memory.add_event, job.text, metadata)
+
+    def get_pipeline_metrics(self) -> dict:
+        """Per-stage queue depth / wait time / throughput."""
+        metrics = self.pipeline.metrics()
+        metrics["channel"] = self.news_channel.metrics()
+        if self.supervisor:
+            metrics["workers"] = self.supervisor.stats()
+        metrics["latency"] = self.latency.summary()
+        metrics["batching"] = self.brain.batching_stats()
+        metrics["verdict_cache"] = self.brain.cache_stats()
+        metrics["cascade"] = self.brain.cascade_stats()
+        metrics["quorum"] = self.brain.quorum_stats()
+        metrics["groq"] = self.brain.groq_stats()
+        return metrics
+
+    async def _report_metrics(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            logger.info(f"📊 Pipeline [channel: {self.news_channel.qsize()}] {self.pipeline.format_metrics()}")
+            channel_waits = " ".join(
+                f"P{p} {s['p50']:.1f}/{s['p99']:.1f}ms" for p, s in self.news_channel.metrics()["wait_ms_by_priority"].items()
+            )
+            logger.info(f"🚦 Priority wait p50/p99 [channel: {channel_waits}] {self.pipeline.format_priority_waits()}")
+            logger.info(f"⏱️ Latency {self.latency.format_summary()}")
+            logger.info(f"👷 Workers {self.supervisor.format_stats()}")
+            batching = " | ".join(
+                f"{agent} {s['items']} items/{s['batches']} passes (mean {s['batch_size']['mean']:.1f}, "
+                f"wait p99 {s['wait_ms']['p99']:.1f}ms, pass p99 {s['forward_ms']['p99']:.0f}ms)"
+                for agent, s in self.brain.batching_stats().items()
+            )
+            if batching:
+                logger.info(f"🧮 Batching {batching}")
+            cache = self.brain.cache_stats()
+            if cache:
+                logger.info(f"🗄️ Verdict cache {cache['hits']} hits / {cache['misses']} misses "
+                            f"({cache['hit_rate']:.1%}), {cache['entries']} entries, {cache['evicted']} evicted")
+            cascade = self.brain.cascade_stats()
+            if cascade:
+                rates = " ".join(f"{agent} {rate:.0%}" for agent, rate in cascade['invocation_rate'].items())
+                skipped = " ".join(f"{reason} {n}" for reason, n in cascade['groq_skipped'].items())
+                logger.info(f"🪜 Cascade {cascade['items']} items, invoked [{rates}], Groq skipped [{skipped}], "
+                            f"{cascade['groq_timeouts']} timeouts")
+            quorum = self.brain.quorum_stats()
+            if quorum:
+                logger.info(f"🗳️ Quorum {quorum['early']}/{quorum['items']} verdicts early ({quorum['early_rate']:.0%}), "
+                            f"final p50/p99 {quorum['lead_ms']['p50']:.0f}/{quorum['lead_ms']['p99']:.0f}ms later")
+            groq = self.brain.groq_stats()
+            if groq:
+                logger.info(f"🛰️ Groq {groq['calls']} calls / {groq['http_requests']} requests "
+                            f"({groq['coalesced']} coalesced, {groq['hedges']} hedged), {groq['rate_limited']} x 429, "
+                            f"{groq['throttled']} throttled, {groq['timeouts']} timeouts, "
+                            f"p50/p99 {groq['latency_ms']['p50']:.0f}/{groq['latency_ms']['p99']:.0f}ms")
+
+    async def _burst_mode_loop(self):
+        """Warm up the local models and the exchange connector ahead of each scheduled release."""
+        from datetime import datetime, timezone
+        from src.utils.economic_calendar import EconomicCalendar
+        calendar = EconomicCalendar.from_config(self.burst_config)
+
+        while True:
+            release = calendar.next_release()
+            if release is None:
+                logger.info("Burst mode: no more scheduled releases in calendar.")
+                return
+            wait = (release.at - datetime.now(timezone.utc)).total_seconds() - calendar.warmup_lead
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            logger.info(f"⏰ Burst mode: warming up for {release.name} ({release.at.isoformat()})")
+            await asyncio.gather(
+                self.brain.warm_up(),
+                self.trader.warm_up(release.symbols),
+                return_exceptions=True
+            )
+
+            # Skip past this release's burst window
+            remaining = (release.at - datetime.now(timezone.utc)).total_seconds() + calendar.window_after
+            await asyncio.sleep(max(0, remaining) + 1)
+
+    async def load_models(self):
+        """
+        Council agents and vector memory, all loading concurrently. Ingestion
+        does not wait: until the brain is ready, items go through its
+        readiness gate (see SentimentEngine).
+        """
+        started = asyncio.get_running_loop().time()
+        await asyncio.gather(self.brain.load(), asyncio.to_thread(self.memory.load))
+        times = ", ".join(f"{agent} {ms:.0f}ms" for agent, ms in self.brain.load_times.items())
+        if self.memory.load_time_ms is not None:
+            times += f", memory {self.memory.load_time_ms:.0f}ms"
+        logger.info(f"🧠 Models ready after {(asyncio.get_running_loop().time() - started) * 1000:.0f}ms ({times})")
+
+    async def _consume(self):
+        """Channel -> pipeline. Also drives replays (see core.replay)."""
+        while True:
+            item = await self.news_channel.get()
+            stamp(item, "dequeued")
+            if self.supervisor and not self.supervisor.accept(item):
+                continue # Echo of a story another shard already delivered
+            # Blocks when the context stage is full (backpressure)
+            await self.pipeline.submit(item, self._resolve_symbol(item))
 
     async def start(self):
         logger.info("Starting Hedgemony Engine v2 (Resilient)...")
+
+        # 0. Models load in the background; ingestion starts right away
+        models_task = asyncio.create_task(self.load_models())
         
-        # 1. Start Ingestion Process
-        from src.ingestion.worker import start_ingestion_worker
-        from multiprocessing import Process
-        
-        # Spawn the worker process
-        self.ingest_proc = Process(target=start_ingestion_worker, args=(self.news_queue, self.config))
-        self.ingest_proc.daemon = True # Kill if main dies
-        self.ingest_proc.start()
+        # 1. Start Ingestion Processes (sharded, heartbeat-supervised, auto-restart)
+        from src.ingestion.supervisor import IngestionSupervisor
         
-        logger.info(f"Ingestion Worker PID: {self.ingest_proc.pid}")
+        # Each worker gets its own channel lane; all lanes merge into news_channel
+        self.news_channel.attach()
+        self.supervisor = IngestionSupervisor(self.news_channel, self.ingestion_config)
+        await self.supervisor.start()
         
-        # 2. Main Event Loop (Consumes Queue)
+        # 2. Staged processing pipeline (context -> analyze -> log -> execute)
+        await self.pipeline.start()
+        metrics_task = asyncio.create_task(self._report_metrics(self.pipeline_config.get("metrics_interval", 60)))
+        burst_task = None
+        if self.burst_config.get("enabled", False):
+            burst_task = asyncio.create_task(self._burst_mode_loop())
+
+        # 3. Main Event Loop (Consumes Channel - woken by the workers, no polling)
         try:
-            while True:
-                # Non-blocking check of the queue
-                try:
-                    while not self.news_queue.empty():
-                         item = self.news_queue.get_nowait()
-                         await self._handle_news_item(item)
-                except Exception:
-                    pass
-                
-                await asyncio.sleep(0.1) # Yield control
-                
+            await self._consume()
         except asyncio.CancelledError:
             logger.info("Engine Shutdown requested.")
         finally:
-            logger.info("Terminating Ingest Process...")
-            self.ingest_proc.terminate()
-            self.ingest_proc.join()
+            logger.info("Terminating Ingest Processes...")
+            metrics_task.cancel()
+            models_task.cancel()
+            if burst_task:
+                burst_task.cancel()
+            await self.pipeline.stop()
+            for task in list(self._finalizing):
+                task.cancel()
+            await self.supervisor.stop()
+            self.news_channel.detach()
 
 if __name__ == "__main__":
     # Needed for MacOS spawn method safety
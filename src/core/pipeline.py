@@ -0,0 +1,274 @@
+"""
+Staged News Pipeline
+
+Runs the engine's per-item work as four bounded, concurrent stages:
+
+    context -> analyze -> log -> execute
+
+- Every stage has its own bounded queue and N worker tasks.
+  A full downstream queue blocks the upstream stage (per-stage backpressure),
+  all the way back to `submit()`.
+- The context / analyze / log queues are PriorityBuffers: Tier-1 items are
+  served first, with aging so lower classes still progress (`priority_aging`).
+- Execution preserves per-symbol ordering: jobs are released to the execute
+  stage in admission order for their symbol, and a symbol always maps to the
+  same execute lane, so two signals on one symbol never race. Priority only
+  decides which analyses run first; a Tier-1 signal still executes after
+  earlier signals on its symbol. `execute_order_by_priority: true` relaxes
+  this to ordering per (symbol, priority class), so a Tier-1 signal no longer
+  waits for earlier aggregator analyses on the same symbol.
+- Queue depth, queue wait (also per priority class) and service time are
+  tracked per stage, and every item gets `<stage>_start` / `<stage>_end`
+  latency stamps.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from src.ingestion.base import NewsItem
+from src.ingestion.priority import PriorityBuffer
+from src.utils.stats import RollingStats
+
+STAGES = ("context", "analyze", "log", "execute")
+
+DEFAULT_STAGE_CONFIG = {
+    "context": {"concurrency": 4, "queue_size": 64},
+    "analyze": {"concurrency": 4, "queue_size": 32},
+    "log": {"concurrency": 1, "queue_size": 128},
+    "execute": {"concurrency": 2, "queue_size": 64},
+}
+
+
+@dataclass
+class PipelineJob:
+    """One news item travelling through the pipeline."""
+    item: NewsItem
+    symbol: str
+    seq: int = 0                 # Admission order within the job's order key
+    text: str = ""
+    similar_events: list = field(default_factory=list)
+    analysis: Optional[dict] = None
+    news_id: Optional[int] = None  # `news` row id, set by the log stage
+    failed: bool = False
+    enqueued_at: float = 0.0     # time.monotonic() of the last stage hand-off
+
+
+class StageMetrics:
+    def __init__(self, name: str, capacity: int, concurrency: int):
+        self.name = name
+        self.capacity = capacity
+        self.concurrency = concurrency
+        self.processed = 0
+        self.failed = 0
+        self.wait_ms = RollingStats()
+        self.wait_ms_by_priority: Dict[int, RollingStats] = defaultdict(RollingStats)
+        self.service_ms = RollingStats()
+
+
+StageHandler = Callable[[PipelineJob], Awaitable[None]]
+
+
+class NewsPipeline:
+    def __init__(self, handlers: Dict[str, StageHandler], config: dict = None,
+                 on_complete: Optional[Callable[[PipelineJob], None]] = None):
+        missing = [s for s in STAGES if s not in handlers]
+        if missing:
+            raise ValueError(f"Missing pipeline stage handlers: {missing}")
+
+        self.logger = logging.getLogger("hedgemony.core.pipeline")
+        self.handlers = handlers
+        self.config = config or {}
+        self.on_complete = on_complete  # Called once per job after the execute stage
+        self.priority_aging = float(self.config.get("priority_aging", 10.0))
+        # False: strict per-symbol execution order. True: per symbol and class.
+        self.order_by_priority = bool(self.config.get("execute_order_by_priority", False))
+
+        self.stage_config = {}
+        for stage in STAGES:
+            cfg = dict(DEFAULT_STAGE_CONFIG[stage])
+            cfg.update(self.config.get(stage, {}) or {})
+            cfg["concurrency"] = max(1, int(cfg["concurrency"]))
+            cfg["queue_size"] = max(1, int(cfg["queue_size"]))
+            self.stage_config[stage] = cfg
+
+        self.metrics_by_stage = {
+            s: StageMetrics(s, self.stage_config[s]["queue_size"], self.stage_config[s]["concurrency"])
+            for s in STAGES
+        }
+
+        self._queues: Dict[str, List[asyncio.Queue]] = {}
+        self._tasks: List[asyncio.Task] = []
+
+        # Per-symbol ordering state (log -> execute hand-off), see _order_key
+        self._admit_seq = defaultdict(int)       # order key -> next seq to hand out
+        self._release_seq = defaultdict(int)     # order key -> next seq allowed to execute
+        self._reorder: Dict[str, list] = defaultdict(list)
+        self._tiebreak = itertools.count()
+        self._order_locks: Dict[object, asyncio.Lock] = defaultdict(asyncio.Lock) # Per order key
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    async def start(self):
+        for stage in STAGES:
+            cfg = self.stage_config[stage]
+            if stage == "execute":
+                # One queue per lane; a symbol is pinned to a lane.
+                lane_size = max(1, cfg["queue_size"] // cfg["concurrency"])
+                self._queues[stage] = [asyncio.Queue(maxsize=lane_size) for _ in range(cfg["concurrency"])]
+                for lane in self._queues[stage]:
+                    self._tasks.append(asyncio.create_task(self._stage_worker(stage, lane)))
+            else:
+                queue = PriorityBuffer(maxsize=cfg["queue_size"], aging=self.priority_aging)
+                self._queues[stage] = [queue]
+                for _ in range(cfg["concurrency"]):
+                    self._tasks.append(asyncio.create_task(self._stage_worker(stage, queue)))
+
+        summary = ", ".join(f"{s}={self.stage_config[s]['concurrency']}x{self.stage_config[s]['queue_size']}" for s in STAGES)
+        self.logger.info(f"News pipeline started ({summary})")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def join(self):
+        """Wait until every admitted job has left the pipeline (used by tests/replay)."""
+        # task_done() is only called after a job was forwarded, so draining the
+        # stages in order also flushes the per-symbol reorder buffer.
+        for stage in STAGES:
+            for queue in self._queues.get(stage, []):
+                await queue.join()
+
+    # ------------------------------------------------------------------
+    # Admission
+    # ------------------------------------------------------------------
+    async def submit(self, item: NewsItem, symbol: str):
+        """Admit an item. Blocks while the context stage is full (backpressure)."""
+        job = PipelineJob(item=item, symbol=symbol)
+        key = self._order_key(job)
+        job.seq = self._admit_seq[key]
+        self._admit_seq[key] += 1
+        await self._put("context", self._queues["context"][0], job)
+        return job
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _order_key(self, job: PipelineJob):
+        return (job.symbol, job.item.priority) if self.order_by_priority else job.symbol
+
+    async def _put(self, stage: str, queue: asyncio.Queue, job: PipelineJob):
+        job.enqueued_at = time.monotonic()
+        await queue.put(job)
+
+    async def _stage_worker(self, stage: str, queue: asyncio.Queue):
+        metrics = self.metrics_by_stage[stage]
+        handler = self.handlers[stage]
+        while True:
+            job = await queue.get()
+            try:
+                started = time.monotonic()
+                waited_ms = (started - job.enqueued_at) * 1000
+                metrics.wait_ms.add(waited_ms)
+                metrics.wait_ms_by_priority[job.item.priority].add(waited_ms)
+
+                if not job.failed:
+                    job.item.stamps[f"{stage}_start"] = started
+                    try:
+                        await handler(job)
+                    except Exception as e:
+                        job.failed = True
+                        metrics.failed += 1
+                        self.logger.error(f"Stage '{stage}' failed for '{job.item.title[:50]}': {e}")
+
+                finished = time.monotonic()
+                if not job.failed:
+                    job.item.stamps[f"{stage}_end"] = finished
+                metrics.service_ms.add((finished - started) * 1000)
+                metrics.processed += 1
+
+                if stage == "execute" and self.on_complete:
+                    try:
+                        self.on_complete(job)
+                    except Exception as e:
+                        self.logger.error(f"on_complete failed for '{job.item.title[:50]}': {e}")
+
+                # Failed jobs keep flowing so the per-symbol sequence keeps advancing.
+                await self._forward(stage, job)
+            finally:
+                queue.task_done()
+
+    async def _forward(self, stage: str, job: PipelineJob):
+        if stage == "execute":
+            return
+        next_stage = STAGES[STAGES.index(stage) + 1]
+        if next_stage == "execute":
+            await self._release_in_order(job)
+        else:
+            await self._put(next_stage, self._queues[next_stage][0], job)
+
+    async def _release_in_order(self, job: PipelineJob):
+        """Hold jobs until all earlier jobs with the same order key reached the execute stage."""
+        key = self._order_key(job)
+        heap = self._reorder[key]
+        heapq.heappush(heap, (job.seq, next(self._tiebreak), job))
+        ready = []
+        while heap and heap[0][0] == self._release_seq[key]: # No await: atomic on the loop
+            ready.append(heapq.heappop(heap)[2])
+            self._release_seq[key] += 1
+        if not ready:
+            return
+        # Only this key's later batches wait behind a full execute lane; the
+        # lock is FIFO, so batches reach the lane in sequence order.
+        lanes = self._queues["execute"]
+        async with self._order_locks[key]:
+            for ready_job in ready:
+                await self._put("execute", lanes[hash(ready_job.symbol) % len(lanes)], ready_job)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+    def metrics(self) -> Dict[str, dict]:
+        out = {}
+        for stage in STAGES:
+            m = self.metrics_by_stage[stage]
+            depth = sum(q.qsize() for q in self._queues.get(stage, []))
+            if stage == "execute":
+                depth += sum(len(h) for h in self._reorder.values())
+            out[stage] = {
+                "depth": depth,
+                "capacity": m.capacity,
+                "concurrency": m.concurrency,
+                "processed": m.processed,
+                "failed": m.failed,
+                "wait_ms": m.wait_ms.summary(),
+                "wait_ms_by_priority": {p: s.summary() for p, s in sorted(m.wait_ms_by_priority.items())},
+                "service_ms": m.service_ms.summary(),
+            }
+        return out
+
+    def format_metrics(self) -> str:
+        parts = []
+        for stage, m in self.metrics().items():
+            parts.append(
+                f"{stage}: depth {m['depth']}/{m['capacity']} "
+                f"wait p50 {m['wait_ms']['p50']:.1f}ms p99 {m['wait_ms']['p99']:.1f}ms "
+                f"done {m['processed']} fail {m['failed']}"
+            )
+        return " | ".join(parts)
+
+    def format_priority_waits(self) -> str:
+        """Queue wait p50/p99 per stage and priority class, e.g. `analyze P1 0.2/1.5ms`."""
+        parts = []
+        for stage, m in self.metrics().items():
+            for priority, s in m["wait_ms_by_priority"].items():
+                parts.append(f"{stage} P{priority} {s['p50']:.1f}/{s['p99']:.1f}ms")
+        return " | ".join(parts)
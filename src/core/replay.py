@@ -0,0 +1,163 @@
+"""
+Session Replay
+
+Feeds a recorded ingestion session (see ingestion.recorder) back through a
+HedgemonyEngine's channel and staged pipeline, with no network and no worker
+processes, at the original pace (speed=1), N times faster, or as fast as the
+pipeline accepts (speed=0).
+
+Items enter at the same point live traffic does (the engine side of the
+channel), re-stamped so their fetch/parse/worker segments keep the recorded
+durations and `queued` is the injection time. The report covers:
+
+- queue -> decision latency (`queued` -> `analyze_end`) and queue -> done
+  (`queued` -> `execute_end`), p50/p95/p99/max in ms;
+- backlog (channel + every stage queue) sampled every `sample_interval`:
+  peak, depth when the last item was injected, and its growth rate over the
+  injection window (items/s; > 0 means the pipeline can't keep up);
+- the pipeline's own per-stage metrics.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Iterable, List, Tuple
+
+from src.ingestion.base import NewsItem
+from src.utils.stats import RollingStats
+
+logger = logging.getLogger("hedgemony.core.replay")
+
+
+def _restamp(item: NewsItem, now: float):
+    """Shift the recorded stamps so `queued` (or the latest stamp) lands on `now`."""
+    if not item.stamps:
+        item.stamps = {"queued": now}
+        return
+    anchor = item.stamps.get("queued", max(item.stamps.values()))
+    shift = now - anchor
+    item.stamps = {name: at + shift for name, at in item.stamps.items()}
+    item.stamps["queued"] = now
+
+
+def _slope(samples: List[Tuple[float, int]]) -> float:
+    """Least-squares slope of (t, depth) samples."""
+    if len(samples) < 2:
+        return 0.0
+    n = len(samples)
+    mean_t = sum(t for t, _ in samples) / n
+    mean_d = sum(d for _, d in samples) / n
+    var = sum((t - mean_t) ** 2 for t, _ in samples)
+    if var == 0:
+        return 0.0
+    return sum((t - mean_t) * (d - mean_d) for t, d in samples) / var
+
+
+class SessionReplay:
+    def __init__(self, engine, speed: float = 1.0, sample_interval: float = 0.1):
+        self.engine = engine
+        self.speed = speed
+        self.sample_interval = sample_interval
+        self.decision_ms = RollingStats(window=1_000_000)
+        self.done_ms = RollingStats(window=1_000_000)
+        self.backlog: List[Tuple[float, int]] = []
+        self.injected = 0
+        self.completed = 0
+        self._all_done = None
+
+    def _backlog(self) -> int:
+        return self.engine.news_channel.qsize() + sum(m["depth"] for m in self.engine.pipeline.metrics().values())
+
+    def _on_complete(self, job, downstream):
+        stamps = job.item.stamps
+        if "queued" in stamps:
+            if "analyze_end" in stamps:
+                self.decision_ms.add((stamps["analyze_end"] - stamps["queued"]) * 1000)
+            if "execute_end" in stamps:
+                self.done_ms.add((stamps["execute_end"] - stamps["queued"]) * 1000)
+        self.completed += 1
+        self._check_done()
+        downstream(job)
+
+    def _check_done(self):
+        suppressed = self.engine.supervisor.suppressed if self.engine.supervisor else 0
+        if self._all_done is not None and self.completed + suppressed >= self.injected:
+            self._all_done.set()
+
+    async def _sample(self, started: float):
+        while True:
+            self.backlog.append((time.monotonic() - started, self._backlog()))
+            await asyncio.sleep(self.sample_interval)
+
+    async def run(self, records: Iterable[Tuple[float, NewsItem]]) -> dict:
+        engine = self.engine
+        downstream = engine.pipeline.on_complete or (lambda job: None)
+        engine.pipeline.on_complete = lambda job: self._on_complete(job, downstream)
+
+        await engine.load_models() # Measure steady state, not the cold start
+        engine.news_channel.attach()
+        await engine.pipeline.start()
+        consumer = asyncio.create_task(engine._consume())
+        started = time.monotonic()
+        sampler = asyncio.create_task(self._sample(started))
+        try:
+            first_arrival = None
+            for arrived_at, item in records:
+                if first_arrival is None:
+                    first_arrival = arrived_at
+                if self.speed > 0:
+                    delay = started + (arrived_at - first_arrival) / self.speed - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                _restamp(item, time.monotonic())
+                engine.news_channel.inject(item)
+                self.injected += 1
+                if self.speed <= 0 and self.injected % 64 == 0:
+                    await asyncio.sleep(0) # Let the consumer run; the backlog then reflects real capacity
+            injected_after = time.monotonic() - started
+            backlog_at_end = self._backlog()
+            growth = _slope([s for s in self.backlog if s[0] <= injected_after])
+
+            self._all_done = asyncio.Event()
+            self._check_done()
+            await self._all_done.wait()
+            drained_after = time.monotonic() - started
+        finally:
+            sampler.cancel()
+            consumer.cancel()
+            await asyncio.gather(sampler, consumer, return_exceptions=True)
+            await engine.pipeline.stop()
+            engine.news_channel.detach()
+            engine.pipeline.on_complete = downstream
+
+        return {
+            "items": self.injected,
+            "completed": self.completed,
+            "suppressed": engine.supervisor.suppressed if engine.supervisor else 0,
+            "speed": self.speed,
+            "injection_s": round(injected_after, 3),
+            "drain_s": round(drained_after, 3),
+            "throughput_per_s": round(self.completed / drained_after, 2) if drained_after else 0.0,
+            "queue_to_decision_ms": self.decision_ms.summary(),
+            "queue_to_done_ms": self.done_ms.summary(),
+            "backlog": {
+                "peak": max((d for _, d in self.backlog), default=0),
+                "at_last_injection": backlog_at_end,
+                "growth_per_s": round(growth, 3),
+            },
+            "pipeline": engine.pipeline.metrics(),
+        }
+
+
+def format_report(report: dict) -> str:
+    d, e, b = report["queue_to_decision_ms"], report["queue_to_done_ms"], report["backlog"]
+    speed = "max" if report["speed"] <= 0 else f"{report['speed']:g}x"
+    return "\n".join([
+        f"Replayed {report['items']} items at {speed}: injected in {report['injection_s']:.1f}s, "
+        f"drained after {report['drain_s']:.1f}s ({report['throughput_per_s']:.1f} items/s, "
+        f"{report['suppressed']} echoes suppressed)",
+        f"queue->decision  p50 {d['p50']:.1f}  p95 {d['p95']:.1f}  p99 {d['p99']:.1f}  max {d['max']:.1f} ms",
+        f"queue->done      p50 {e['p50']:.1f}  p95 {e['p95']:.1f}  p99 {e['p99']:.1f}  max {e['max']:.1f} ms",
+        f"backlog          peak {b['peak']}  at last injection {b['at_last_injection']}  "
+        f"growth {b['growth_per_s']:+.2f} items/s",
+    ])
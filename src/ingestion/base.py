@@ -1,12 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Callable, Awaitable
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Callable, Awaitable
+from dataclasses import dataclass, field
 from datetime import datetime
 import asyncio
 import logging
+from .seen_store import SeenStore
 
-# Standard data format for the entire system
-@dataclass
+# Standard data format for the entire system (fixed schema; see wire.py for the IPC encoding)
+@dataclass(slots=True)
 class NewsItem:
     source_id: str      # e.g., "rss:reuters", "twitter:user123"
     title: str          # Headline or tweet content
@@ -17,6 +18,10 @@ class NewsItem:
     impact_score: int = 0 # 1-10 score (0 = unrated)
     ingested_at: Optional[datetime] = None # When WE saw it
     raw_data: Optional[dict] = None # Original payload for debugging
+    story_id: Optional[str] = None # Cross-source story (set by the worker's dedupe)
+    first_seen_source: Optional[str] = None # source_id that broke the story first
+    priority: int = 3 # 1 = Tier-1 direct, 2 = social, 3 = aggregator (see ingestion.priority)
+    stamps: Dict[str, float] = field(default_factory=dict) # stage -> time.monotonic() (see utils.latency)
 
 class BaseIngester(ABC):
     def __init__(self, name: str, config: dict):
@@ -24,11 +29,34 @@ class BaseIngester(ABC):
         self.config = config
         self.logger = logging.getLogger(f"hedgemony.ingest.{name}")
         self._callback: Optional[Callable[[NewsItem], Awaitable[None]]] = None
+        # In-memory until the StreamManager hands out the shared persistent store
+        self.seen_store: SeenStore = SeenStore(path=None)
+        # Shared HTTP transport (connection pool + DNS cache), set by the StreamManager
+        self.transport = None
 
     def set_callback(self, callback: Callable[[NewsItem], Awaitable[None]]):
         """Set the async function to call when new data arrives."""
         self._callback = callback
 
+    def set_seen_store(self, store: SeenStore):
+        """Share the bounded, persistent dedupe/ETag store across ingesters."""
+        self.seen_store = store
+
+    def set_transport(self, transport):
+        """Share one tuned HTTP session (see transport.HttpTransport) across ingesters."""
+        self.transport = transport
+
+    async def _http_session(self):
+        """The shared aiohttp session; standalone ingesters get a private transport."""
+        if self.transport is None:
+            from .transport import HttpTransport
+            self.transport = HttpTransport(self.config.get("http", {}))
+        return await self.transport.get_session()
+
+    async def _is_new(self, key) -> bool:
+        """True (and remembered) the first time this ingester sees `key`."""
+        return await self.seen_store.is_new(self.name, str(key))
+
     @abstractmethod
     async def start(self):
         """Start the ingestion process (polling loops or stream connections)."""
@@ -0,0 +1,309 @@
+import asyncio
+import logging
+import multiprocessing
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+from .priority import PriorityBuffer
+from .wire import decode, encode
+
+
+class _PipeSender:
+    """
+    Writes frames to a pipe from a background thread: `send_bytes` blocks
+    while the pipe is full (engine behind), and that must not stall the
+    worker's event loop. Started lazily in the process that sends, since the
+    pipe end travels to the worker by pickling.
+
+    At most `max_pending` frames wait for the pipe. Beyond that (engine not
+    reading) the oldest frame of the least urgent priority class is dropped,
+    or the new frame if everything queued is more urgent; `dropped` counts them.
+    """
+
+    def __init__(self, connection, lock=None, max_pending: int = 1024):
+        self.connection = connection
+        self.lock = lock
+        self.max_pending = max(1, int(max_pending))
+        self.dropped = 0
+        self._frames = deque() # (priority, frame), oldest first
+        self._cond = threading.Condition()
+        self._closing = False
+        self._thread: Optional[threading.Thread] = None
+
+    def send(self, frame: bytes, priority: int = 3):
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="channel-writer", daemon=True)
+                self._thread.start()
+            if len(self._frames) >= self.max_pending:
+                # Least urgent class (highest number), oldest within it
+                victim = max(range(len(self._frames)), key=lambda i: (self._frames[i][0], -i))
+                self.dropped += 1
+                if self.dropped == 1 or self.dropped % 1000 == 0:
+                    logging.getLogger("hedgemony.ingest.channel").warning(
+                        f"News channel backlog full ({self.max_pending} frames): {self.dropped} dropped so far")
+                if self._frames[victim][0] < priority:
+                    return # Everything queued is more urgent than this frame
+                del self._frames[victim]
+            self._frames.append((priority, frame))
+            self._cond.notify()
+
+    def pending(self) -> int:
+        return len(self._frames)
+
+    def _run(self):
+        logger = logging.getLogger("hedgemony.ingest.channel")
+        while True:
+            with self._cond:
+                while not self._frames and not self._closing:
+                    self._cond.wait()
+                if not self._frames:
+                    return # Closing and drained
+                _, frame = self._frames.popleft()
+            try:
+                if self.lock is not None:
+                    with self.lock:
+                        self.connection.send_bytes(frame)
+                else:
+                    self.connection.send_bytes(frame)
+            except (OSError, EOFError, ValueError) as e:
+                logger.error(f"News channel write failed, dropping item: {e}")
+
+    def flush(self, timeout: float = 5.0):
+        """Wait (up to `timeout`) for every queued frame to be written, then stop the thread."""
+        with self._cond:
+            thread, self._thread = self._thread, None
+            self._closing = True
+            self._cond.notify()
+        if thread is not None:
+            thread.join(timeout)
+        with self._cond:
+            self._closing = False
+
+
+class ChannelWriter:
+    """
+    Producer end of one channel lane. Handed to exactly one worker process, so
+    a worker that is killed mid-write can only ever corrupt its own lane.
+    """
+
+    def __init__(self, connection, codec: str = None, max_pending: int = 1024):
+        self._writer = connection
+        self.codec = codec
+        self.max_pending = max_pending
+        self._sender = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_sender'] = None
+        return state
+
+    def put(self, item):
+        """Queue an item for the lane; never blocks on a full pipe."""
+        if self._sender is None:
+            self._sender = _PipeSender(self._writer, max_pending=self.max_pending)
+        self._sender.send(encode(item, self.codec), item.priority)
+
+    @property
+    def dropped(self) -> int:
+        """Items shed because the engine stopped reading (see _PipeSender)."""
+        return self._sender.dropped if self._sender is not None else 0
+
+    def flush(self, timeout: float = 5.0):
+        if self._sender is not None:
+            self._sender.flush(timeout)
+
+    def close(self):
+        self.flush()
+        self._writer.close()
+
+
+class NewsChannel:
+    """
+    Process-safe, awaitable hand-off of NewsItems from the ingestion worker(s)
+    to the engine.
+
+    Items travel over one-way multiprocessing Pipes as compact wire frames
+    (see wire.py: fixed schema, slimmed raw_data, msgpack or struct) instead
+    of pickles. The engine registers the read ends with its asyncio loop
+    (`loop.add_reader`), so it wakes up the moment a worker publishes
+    instead of busy-polling a multiprocessing.Queue.
+
+    Received items wait in a PriorityBuffer, so during a burst the engine
+    always takes Tier-1 items first (aging bounds how long others can wait).
+
+    Producer side (worker process):  channel.put(item); ...; channel.flush()
+    Consumer side (engine process):  channel.attach(); item = await channel.get()
+
+    `put` never blocks: frames are written by a background thread, so a full
+    pipe cannot stall the worker's event loop. Up to `max_pending` frames per
+    producer wait for the pipe; beyond that the least urgent are dropped
+    (`dropped`). `flush` before the producer exits.
+
+    Supervised workers each get a private lane (`add_lane()` -> ChannelWriter),
+    which the supervisor drops and replaces when it restarts that worker.
+    """
+
+    def __init__(self, priority_aging: float = 10.0, codec: str = None, max_pending: int = 1024):
+        self._reader, self._writer = multiprocessing.Pipe(duplex=False)
+        # Several worker processes may write to the default pipe.
+        self._write_lock = multiprocessing.Lock()
+        self.priority_aging = priority_aging
+        self.codec = codec # None = msgpack when installed, else struct
+        self.max_pending = max_pending # Per producer, frames waiting for a full pipe
+        self._lanes: Dict[ChannelWriter, object] = {} # lane -> read end (one per supervised worker)
+        self._buffer: Optional[PriorityBuffer] = PriorityBuffer(aging=priority_aging) # Consumer side only
+        self._sender = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._threaded = False
+        self._reader_tasks = {}
+        self.logger = logging.getLogger("hedgemony.ingest.channel")
+
+    def __getstate__(self):
+        # Only the default pipe ends and the lock cross the process boundary.
+        state = self.__dict__.copy()
+        state['_lanes'] = {}
+        state['_buffer'] = None
+        state['_sender'] = None
+        state['_loop'] = None
+        state['_reader_tasks'] = {}
+        state['logger'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.logger = logging.getLogger("hedgemony.ingest.channel")
+
+    # ------------------------------------------------------------------
+    # Producer
+    # ------------------------------------------------------------------
+    def put(self, item):
+        """Publish an item. Safe to call from any process holding the channel; never blocks on a full pipe."""
+        if self._sender is None:
+            # Several worker processes may share the default pipe: frames are written whole under the lock
+            self._sender = _PipeSender(self._writer, self._write_lock, self.max_pending)
+        self._sender.send(encode(item, self.codec), item.priority)
+
+    @property
+    def dropped(self) -> int:
+        """Items this process shed because the engine stopped reading."""
+        return self._sender.dropped if self._sender is not None else 0
+
+    def flush(self, timeout: float = 5.0):
+        """Wait for this process's queued items to reach the pipe (call before the producer exits)."""
+        if self._sender is not None:
+            self._sender.flush(timeout)
+
+    # ------------------------------------------------------------------
+    # Lanes (consumer process)
+    # ------------------------------------------------------------------
+    def add_lane(self) -> ChannelWriter:
+        """Open a private pipe for one worker; returns its producer end."""
+        reader, writer = multiprocessing.Pipe(duplex=False)
+        lane = ChannelWriter(writer, self.codec, self.max_pending)
+        self._lanes[lane] = reader
+        if self._loop:
+            self._watch(reader)
+        return lane
+
+    def remove_lane(self, lane: ChannelWriter):
+        """Drain and drop a lane (its worker is gone)."""
+        reader = self._lanes.pop(lane, None)
+        if reader is not None:
+            if self._buffer is not None:
+                try:
+                    self._drain(reader)
+                except (EOFError, OSError):
+                    pass
+            self._unwatch(reader)
+            reader.close()
+        lane.close()
+
+    # ------------------------------------------------------------------
+    # Consumer
+    # ------------------------------------------------------------------
+    def attach(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Register the read ends with the running loop. Call once, in the consumer process."""
+        self._loop = loop or asyncio.get_running_loop()
+        for reader in [self._reader, *self._lanes.values()]:
+            self._watch(reader)
+
+    def detach(self):
+        for reader in [self._reader, *self._lanes.values()]:
+            self._unwatch(reader)
+
+    def _watch(self, reader):
+        if not self._threaded:
+            try:
+                self._loop.add_reader(reader.fileno(), self._on_readable, reader)
+                return
+            except NotImplementedError:
+                # e.g. Windows Proactor loop: fall back to blocking reader threads
+                self.logger.warning("Loop has no add_reader(); using threaded channel reader.")
+                self._threaded = True
+        self._reader_tasks[id(reader)] = self._loop.create_task(self._threaded_reader(reader))
+
+    def _unwatch(self, reader):
+        if not self._loop:
+            return
+        task = self._reader_tasks.pop(id(reader), None)
+        if task:
+            task.cancel()
+            return
+        try:
+            self._loop.remove_reader(reader.fileno())
+        except Exception as e:
+            self.logger.debug(f"remove_reader failed: {e}")
+
+    def _drain(self, reader):
+        """Move every complete message currently in `reader` into the local buffer."""
+        while reader.poll():
+            self._buffer.put_nowait(decode(reader.recv_bytes()))
+
+    def _on_readable(self, reader):
+        try:
+            self._drain(reader)
+        except EOFError:
+            if reader is self._reader:
+                self.logger.error("News channel closed by all writers.")
+            self._unwatch(reader)
+        except Exception as e:
+            self.logger.error(f"Failed to read from news channel: {e}")
+
+    async def _threaded_reader(self, reader):
+        while True:
+            try:
+                item = decode(await self._loop.run_in_executor(None, reader.recv_bytes))
+            except EOFError:
+                if reader is self._reader:
+                    self.logger.error("News channel closed by all writers.")
+                return
+            except Exception as e:
+                self.logger.error(f"Failed to read from news channel: {e}")
+                continue
+            self._buffer.put_nowait(item)
+
+    def inject(self, item):
+        """Deliver an item as if it had arrived through a pipe (replay / tests)."""
+        self._buffer.put_nowait(item)
+
+    async def get(self):
+        """Wait for the next item."""
+        if self._buffer is None:
+            raise RuntimeError("NewsChannel.get() is only available in the process that created the channel")
+        return await self._buffer.get()
+
+    def qsize(self) -> int:
+        """Items received but not yet consumed by the engine."""
+        return self._buffer.qsize() if self._buffer else 0
+
+    def metrics(self) -> dict:
+        """Buffer depth and queue wait (ms) per priority class."""
+        if not self._buffer:
+            return {"depth": 0, "depth_by_priority": {}, "wait_ms_by_priority": {}}
+        return {
+            "depth": self._buffer.qsize(),
+            "depth_by_priority": self._buffer.depth_by_priority(),
+            "wait_ms_by_priority": self._buffer.wait_summary(),
+        }
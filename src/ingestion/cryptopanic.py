@@ -1,9 +1,10 @@
-import aiohttp
 import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import Optional
 from .base import BaseIngester, NewsItem
+from src.utils.latency import stamp
 
 class CryptoPanicIngester(BaseIngester):
     BASE_URL = "https://cryptopanic.com/api/v1/posts/"
@@ -12,6 +13,7 @@ class CryptoPanicIngester(BaseIngester):
         super().__init__("cryptopanic", config)
         self.api_key = config.get("api_key")
         self.interval = config.get("interval", 60) # Poll every 60s by default
+        self.base_url = config.get("base_url", self.BASE_URL)
         self._running = False
         self._task: Optional[asyncio.Task] = None
         
@@ -37,14 +39,14 @@ class CryptoPanicIngester(BaseIngester):
         self.logger.info("CryptoPanic Ingester Stopped.")
 
     async def _poll_loop(self):
-        async with aiohttp.ClientSession() as session:
-            while self._running:
-                try:
-                    await self._fetch_posts(session)
-                except Exception as e:
-                    self.logger.error(f"Error polling CryptoPanic: {e}")
-                
-                await asyncio.sleep(self.interval)
+        session = await self._http_session()
+        while self._running:
+            try:
+                await self._fetch_posts(session)
+            except Exception as e:
+                self.logger.error(f"Error polling CryptoPanic: {e}")
+            
+            await asyncio.sleep(self.interval)
 
     async def _fetch_posts(self, session):
         params = {
@@ -53,33 +55,24 @@ class CryptoPanicIngester(BaseIngester):
             "kind": "news" # or 'media', 'news' covers most
         }
         
-        async with session.get(self.BASE_URL, params=params) as resp:
+        fetch_start = time.monotonic()
+        async with session.get(self.base_url, params=params) as resp:
             if resp.status != 200:
                 self.logger.error(f"Failed to fetch: {resp.status} - {await resp.text()}")
                 return
             
             data = await resp.json()
+            fetched = time.monotonic()
             results = data.get("results", [])
             
-            # Inverse order to process oldest first if needed, but newest is fine
-            # We need a way to deduplicate. Ideally the Manager handles it, or we track last_id.
-            # For v1 simple: just emit everything and let the DB/Manager dedup if possible,
-            # BUT raw polling will re-emit same news every minute. We MUST track last_id.
-            
-            # Use the first item as the "latest" marker after processing
-            # But since we're async, just dedupe by ID in memory for now.
-            
-            # Simple in-memory dedup for this session
-            if not hasattr(self, '_seen_ids'):
-                self._seen_ids = set()
-
+            # Raw polling re-returns the same posts every minute; dedupe by post ID
+            # through the shared seen store (survives restarts).
             new_count = 0
             for post in results:
                 post_id = post.get("id")
-                if post_id in self._seen_ids:
+                if post_id is None or not await self._is_new(post_id):
                     continue
                 
-                self._seen_ids.add(post_id)
                 new_count += 1
                 
                 # Convert to NewsItem
@@ -90,8 +83,10 @@ class CryptoPanicIngester(BaseIngester):
                     published_at=datetime.now(), # CryptoPanic gives 'created_at' but format varies, safe to use now() for ingestion time
                     content=post.get("title", ""), # Content is usually link-only
                     author=post.get("domain", "cryptopanic"),
-                    raw_data=post
+                    raw_data=post,
+                    stamps={"fetch_start": fetch_start, "fetched": fetched}
                 )
+                stamp(item, "parsed")
                 
                 await self._emit(item)
             
@@ -0,0 +1,273 @@
+"""
+Cross-source near-duplicate suppression.
+
+The same story reaches us through Direct, RSS, CryptoPanic and Twitter. Each
+ingester only dedupes its own IDs, so the council would score (and possibly
+trade) one headline several times. NearDuplicateDetector keeps the normalized
+token set of every title seen within a sliding time window and flags echoes
+whose Jaccard similarity to an earlier story is >= `threshold`.
+
+Candidates come from a MinHash LSH index (`bands` x `rows` signature), so a
+check costs a handful of dict lookups regardless of window size; the exact
+Jaccard of the (short) token sets is then used to confirm a match.
+
+Token overlap alone cannot tell "Fed hikes rates by 25bp" from "Fed cuts
+rates by 25bp", so a match is refused when the two titles disagree on a
+number, a named entity or the direction of a polarity verb (hike/cut,
+approve/reject, rise/fall, list/delist): those are different stories.
+"""
+
+import hashlib
+import html
+import itertools
+import logging
+import re
+import struct
+import time
+import unicodedata
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from .base import NewsItem
+
+_TOKEN_RE = re.compile(r"[a-z0-9$%]+(?:[.,][0-9]+)*")
+_PREFIX_RE = re.compile(r"^\s*(breaking|just in|update|updated|alert|flash|urgent)\s*[:\-–—|]\s*", re.I)
+_SUFFIX_RE = re.compile(r"\s+[\-–—|]\s+[^\-–—|]{2,40}$")  # " - Reuters", " | CoinDesk"
+
+_STOPWORDS = {
+    "a", "an", "the", "of", "to", "in", "on", "for", "and", "or", "at", "by",
+    "is", "are", "was", "be", "as", "with", "from", "its", "it", "that", "this",
+}
+
+_MERSENNE = (1 << 61) - 1
+
+_NUMBER_RE = re.compile(r"[0-9]+(?:[.,][0-9]+)*")
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z0-9]*")
+
+# Normalized token -> (axis, direction). Titles that move the same axis in
+# opposite directions never describe the same story.
+_POLARITY = {}
+for _axis, _up, _down in (
+    ("rates", "hike hiked raise raised tighten tightened", "cut lower lowered ease eased"),
+    ("decision", "approve approved approval greenlight greenlit grant granted accept accepted",
+     "reject rejected rejection deny denied block blocked veto vetoed"),
+    ("move", "rise rose risen gain gained jump jumped surge surged soar soared climb climbed rally rallied up",
+     "fall fell fallen drop dropped slide slid plunge plunged sink sank tumble tumbled decline declined down"),
+    ("listing", "list listed listing add added", "delist delisted delisting remove removed"),
+):
+    _POLARITY.update({w: (_axis, 1) for w in _up.split()})
+    _POLARITY.update({w: (_axis, -1) for w in _down.split()})
+
+
+def normalize_title(title: str) -> List[str]:
+    """Lower-case, strip wire prefixes/suffixes, HTML entities, accents, stopwords and plural 's'."""
+    text = html.unescape(title or "")
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    text = _PREFIX_RE.sub("", text)
+    text = _SUFFIX_RE.sub("", text)
+    text = text.lower().replace("'s", "")
+    tokens = []
+    for t in _TOKEN_RE.findall(text):
+        if t in _STOPWORDS:
+            continue
+        if len(t) > 3 and t.endswith("s") and not t.endswith("ss"):
+            t = t[:-1]
+        tokens.append(t)
+    return tokens
+
+
+def title_facts(title: str, tokens: FrozenSet[str]) -> "TitleFacts":
+    """Numbers, named entities and polarity verbs of a title (see TitleFacts.conflicts)."""
+    numbers = frozenset(n for t in tokens for n in _NUMBER_RE.findall(t))
+    polarity = frozenset(_POLARITY[t] for t in tokens if t in _POLARITY)
+
+    # Entities: acronyms and mixed-case words anywhere (SEC, BlackRock); plain
+    # capitalised words too unless the headline is Title Case throughout.
+    words = _WORD_RE.findall(unicodedata.normalize("NFKD", html.unescape(title or "")))
+    plain = [w for w in words[1:] if w.lower() not in _STOPWORDS and not w.isupper()]
+    title_case = bool(plain) and sum(w[0].isupper() for w in plain) * 2 > len(plain)
+    entities = set()
+    for w in words:
+        if w.isupper() and len(w) > 1 or any(c.isupper() for c in w[1:]) or w[0].isupper() and not title_case:
+            entities.update(normalize_title(w))
+    initials = "".join(w[0].lower() for w in words if w.lower() not in _STOPWORDS)
+    return TitleFacts(numbers, frozenset(entities), polarity, initials)
+
+
+@dataclass(frozen=True)
+class TitleFacts:
+    numbers: FrozenSet[str]
+    entities: FrozenSet[str]
+    polarity: FrozenSet[Tuple[str, int]]
+    initials: str = ""           # First letters of the title's words, for acronyms
+
+    def _missing_entities(self, other: "TitleFacts", other_tokens: FrozenSet[str]) -> bool:
+        """An entity of ours the other title doesn't name, even abbreviated (Fed/Federal, SEC/initials)."""
+        return any(e not in other_tokens and e not in other.initials
+                   and not any(t.startswith(e) or e.startswith(t) for t in other_tokens if len(t) > 2)
+                   for e in self.entities)
+
+    def conflicts(self, tokens: FrozenSet[str], other: "TitleFacts", other_tokens: FrozenSet[str]) -> bool:
+        """True if two similar titles must still be different stories."""
+        # Each side carries a number the other lacks ("3.2%" vs "3.5%"); extra detail on one side is fine
+        if self.numbers - other.numbers and other.numbers - self.numbers:
+            return True
+        # An entity swapped for another ("Binance lists X" vs "Coinbase lists X")
+        if self._missing_entities(other, other_tokens) and other._missing_entities(self, tokens):
+            return True
+        # Same axis, opposite direction ("hikes" vs "cuts")
+        return any((axis, -sign) in other.polarity and (axis, -sign) not in self.polarity
+                   for axis, sign in self.polarity)
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _token_hash(token: str) -> int:
+    return struct.unpack(">Q", hashlib.blake2b(token.encode(), digest_size=8).digest())[0] % _MERSENNE
+
+
+class MinHasher:
+    """Universal-hash MinHash: h_i(x) = (a_i * x + b_i) mod p, min over the set."""
+
+    def __init__(self, num_perm: int, seed: int = 1):
+        rng_state = seed
+        self.params: List[Tuple[int, int]] = []
+        for _ in range(num_perm):
+            # Tiny deterministic LCG so signatures are stable across processes/restarts
+            rng_state = (rng_state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+            a = (rng_state % (_MERSENNE - 1)) + 1
+            rng_state = (rng_state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+            b = rng_state % _MERSENNE
+            self.params.append((a, b))
+
+    def signature(self, tokens: FrozenSet[str]) -> Tuple[int, ...]:
+        hashes = [_token_hash(t) for t in tokens]
+        return tuple(min((a * h + b) % _MERSENNE for h in hashes) for a, b in self.params)
+
+
+@dataclass
+class Story:
+    story_id: str
+    tokens: FrozenSet[str]
+    band_keys: Tuple[Tuple[int, ...], ...]
+    exact: bool                  # Too short for fuzzy matching: exact token set only
+    title: str
+    first_seen_source: str
+    first_seen_at: float         # time.monotonic()
+    facts: Optional[TitleFacts] = None
+    echoes: int = 0
+    echo_sources: Set[str] = field(default_factory=set)
+
+
+class NearDuplicateDetector:
+    def __init__(self, window_seconds: float = 900, threshold: float = 0.6, min_tokens: int = 3,
+                 bands: int = 16, rows: int = 2):
+        self.logger = logging.getLogger("hedgemony.ingest.dedupe")
+        self.window_seconds = window_seconds
+        self.threshold = threshold
+        self.min_tokens = min_tokens
+        self.bands = bands
+        self.rows = rows
+        self._hasher = MinHasher(bands * rows)
+
+        self._stories: deque = deque()                    # oldest first
+        self._index: List[Dict[Tuple[int, ...], List[Story]]] = [{} for _ in range(bands)]
+        self._ids = itertools.count(1)
+
+        self.checked = 0
+        self.suppressed = 0
+        self.vetoed = 0                                   # Similar enough, but facts disagree
+
+    @classmethod
+    def from_config(cls, config: dict) -> "NearDuplicateDetector":
+        return cls(
+            window_seconds=config.get("window_seconds", 900),
+            threshold=config.get("threshold", 0.6),
+            min_tokens=config.get("min_tokens", 3),
+            bands=config.get("bands", 16),
+            rows=config.get("rows", 2),
+        )
+
+    def _band_keys(self, tokens: FrozenSet[str]) -> Tuple[Tuple[int, ...], ...]:
+        sig = self._hasher.signature(tokens)
+        return tuple(sig[i * self.rows:(i + 1) * self.rows] for i in range(self.bands))
+
+    def _expire(self, now: float):
+        while self._stories and now - self._stories[0].first_seen_at > self.window_seconds:
+            old = self._stories.popleft()
+            for i, key in enumerate(old.band_keys):
+                bucket = self._index[i].get(key)
+                if bucket:
+                    bucket.remove(old)
+                    if not bucket:
+                        del self._index[i][key]
+
+    def _find(self, tokens: FrozenSet[str], band_keys, exact: bool, facts: TitleFacts) -> Optional[Story]:
+        seen = set()
+        best, best_sim = None, 0.0
+        for i, key in enumerate(band_keys):
+            for story in self._index[i].get(key, ()):
+                if story.story_id in seen:
+                    continue
+                seen.add(story.story_id)
+                if exact or story.exact:
+                    if tokens == story.tokens:
+                        return story
+                    continue
+                sim = jaccard(tokens, story.tokens)
+                if sim >= self.threshold and sim > best_sim:
+                    if facts.conflicts(tokens, story.facts, story.tokens):
+                        self.vetoed += 1
+                        continue
+                    best, best_sim = story, sim
+        return best
+
+    def check(self, item: NewsItem, now: float = None) -> Optional[Story]:
+        """
+        Returns the earlier Story if `item` is an echo of it (caller should drop it).
+        Otherwise registers a new story, stamps `first_seen_source` / `story_id`
+        on the item and returns None.
+        """
+        now = time.monotonic() if now is None else now
+        self.checked += 1
+        self._expire(now)
+
+        tokens = frozenset(normalize_title(item.title))
+        if not tokens:
+            return None
+        exact = len(tokens) < self.min_tokens
+        band_keys = self._band_keys(tokens)
+        facts = title_facts(item.title, tokens)
+
+        match = self._find(tokens, band_keys, exact, facts)
+        if match:
+            match.echoes += 1
+            match.echo_sources.add(item.source_id)
+            self.suppressed += 1
+            return match
+
+        story = Story(
+            story_id=f"story-{next(self._ids)}",
+            tokens=tokens,
+            band_keys=band_keys,
+            exact=exact,
+            title=item.title,
+            first_seen_source=item.source_id,
+            first_seen_at=now,
+            facts=facts,
+        )
+        self._stories.append(story)
+        for i, key in enumerate(band_keys):
+            self._index[i].setdefault(key, []).append(story)
+
+        item.story_id = story.story_id
+        item.first_seen_source = story.first_seen_source
+        return None
+
+    def __len__(self):
+        return len(self._stories)
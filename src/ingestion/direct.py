@@ -1,20 +1,30 @@
 
 import asyncio
-import aiohttp
-import feedparser
 import logging
+import time
 from datetime import datetime
 from typing import List, Dict, Optional
 from .base import BaseIngester, NewsItem
+from .feed_parser import IncrementalFeedParser, published_timestamp
+from .html_monitor import HtmlPageMonitor
+from .scheduler import AdaptivePollScheduler
+from src.utils.economic_calendar import EconomicCalendar, BURST, WARMUP
+from src.utils.latency import stamp
 
 class DirectIngester(BaseIngester):
     """
     "Hunter" styling polling for Tier-1 Critical Sources.
     
     Features:
-    - Dedicated session per target for keep-alive.
+    - One shared, tuned session (connection pool + DNS cache) across all
+      targets, so targets on the same host reuse warm keep-alive connections.
     - ETag / Last-Modified support to minimize bandwidth.
-    - Aggressive polling interval (configurable).
+    - Adaptive polling: a global request budget is steered toward the targets and
+      hours of the week that actually publish (see AdaptivePollScheduler).
+    - HTML targets: pages without a feed are diffed on a CSS/XPath-selected
+      region and new list entries are emitted (see HtmlPageMonitor).
+    - Burst mode: around scheduled releases (economic calendar) the release's
+      targets are kept warm and then polled sub-second.
     - Proxy support structure (ready for residential proxies).
     """
     
@@ -25,10 +35,25 @@ class DirectIngester(BaseIngester):
         self.running = False
         self.tasks = []
         
-        # State tracking for diffing
-        self.last_etags = {} # url -> etag
-        self.last_modified = {} # url -> last_modified
-        self.seen_guids = set() # global dedupe for session
+        # State tracking for diffing (seen GUIDs + ETag/Last-Modified) lives in
+        # self.seen_store, shared with the other ingesters and persisted across restarts
+
+        # Learned per-target poll cadence under a global request budget
+        self.direct_config = config.get("direct", {})
+        self.scheduler = AdaptivePollScheduler(targets, self.direct_config)
+        self.report_interval = self.direct_config.get("report_interval", 300)
+
+        # Calendar-driven burst mode (CPI / NFP / FOMC ...)
+        burst_config = config.get("burst_mode", {})
+        self.calendar = EconomicCalendar.from_config(burst_config) if burst_config.get("enabled", False) else None
+        self.burst_interval = burst_config.get("poll_interval", 0.5)
+        self.warmup_interval = burst_config.get("keepalive_interval", 10.0)
+
+        # Streams each feed newest-first and stops at the first entry seen last poll
+        self.feed_parser = IncrementalFeedParser()
+        # `type: "html"` targets: selector-region diffing, parsed in a worker pool
+        self.html_monitor = HtmlPageMonitor(workers=self.direct_config.get("html_workers", 2))
+        self._html_primed = set()
 
     async def start(self):
         self.running = True
@@ -39,6 +64,7 @@ class DirectIngester(BaseIngester):
         for target in self.targets:
             task = asyncio.create_task(self._monitor_target(target))
             self.tasks.append(task)
+        self.tasks.append(asyncio.create_task(self._report_loop()))
 
     async def stop(self):
         self.running = False
@@ -46,95 +72,170 @@ class DirectIngester(BaseIngester):
         for task in self.tasks:
             task.cancel()
         await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.html_monitor.close()
+        self.scheduler.save()
+
+    async def _report_loop(self):
+        """Periodically log per-target requests/item + detection delay and persist the learned profile."""
+        while self.running:
+            await asyncio.sleep(self.report_interval)
+            self.logger.info(f"Direct poll report:\n{self.scheduler.format_report()}")
+            self.scheduler.save()
 
     async def _monitor_target(self, target: Dict):
         """
         Continuous monitoring loop for a single target.
         """
         url = target['url']
-        interval = target.get('poll_interval', 5.0)
         name = target['name']
         
-        # Use a dedicated session for keep-alive connection reuse
-        # In production, we would inject proxy here: connector=aiohttp.TCPConnector(ssl=False)
-        headers = {
-             'User-Agent': 'Mozilla/5.0 (Compatible; HedgemonyBot/1.0; +http://hedgemony.ai)'
-        }
-
-        async with aiohttp.ClientSession(headers=headers) as session:
-            self.logger.info(f"Ref: {name} | Monitoring started ({interval}s)")
-            
-            while self.running:
-                try:
-                    start_time = asyncio.get_event_loop().time()
+        # Shared transport: targets on the same host (sec.gov, federalreserve.gov)
+        # reuse its keep-alive connections and cached DNS answers.
+        # In production, we would inject proxy here (transport config)
+        session = await self._http_session()
+        self.logger.info(f"Ref: {name} | Monitoring started ({self.scheduler.interval_for(name):.1f}s)")
+        phase = None
+        
+        while self.running:
+            if self.calendar:
+                new_phase = self.calendar.target_phase(name)
+                if new_phase != phase and new_phase in (WARMUP, BURST):
+                    self.logger.info(f"{name}: burst mode -> {new_phase.upper()}")
+                phase = new_phase
+
+            start_time = asyncio.get_event_loop().time()
+            new_items, delays = 0, []
+            try:
+                # 1. Prepare conditional headers
+                request_headers = {}
+                last_etag, last_modified = self.seen_store.get_http_cache(self.name, url)
+                if last_etag:
+                    request_headers['If-None-Match'] = last_etag
+                if last_modified:
+                    request_headers['If-Modified-Since'] = last_modified
+
+                # 2. Fetch
+                fetch_start = time.monotonic()
+                async with session.get(url, headers=request_headers, timeout=5) as response:
                     
-                    # 1. Prepare conditional headers
-                    request_headers = {}
-                    if url in self.last_etags:
-                        request_headers['If-None-Match'] = self.last_etags[url]
-                    if url in self.last_modified:
-                        request_headers['If-Modified-Since'] = self.last_modified[url]
-
-                    # 2. Fetch
-                    async with session.get(url, headers=request_headers, timeout=5) as response:
+                    # 304 Not Modified - Minimal Bandwidth
+                    if response.status == 304:
+                        # self.logger.debug(f"{name}: No Change (304)")
+                        pass
                         
-                        # 304 Not Modified - Minimal Bandwidth
-                        if response.status == 304:
-                            # self.logger.debug(f"{name}: No Change (304)")
-                            pass
-                            
-                        elif response.status == 200:
-                            # Extract Caching Headers
-                            etag = response.headers.get('ETag')
-                            lmod = response.headers.get('Last-Modified')
-                            
-                            if etag: self.last_etags[url] = etag
-                            if lmod: self.last_modified[url] = lmod
-                            
-                            # Parse Content
-                            content = await response.text()
-                            
-                            # Detect Type (RSS vs HTML)
-                            # For MVP we treat all as feedparser compatible or raw text check
-                            if target['type'] == 'rss':
-                                await self._process_rss_content(name, url, content)
-                            else:
-                                # TODO: Implement HTML selector diffing for non-RSS pages
-                                pass
-                                
+                    elif response.status == 200:
+                        # Extract Caching Headers
+                        etag = response.headers.get('ETag')
+                        lmod = response.headers.get('Last-Modified')
+                        self.seen_store.set_http_cache(self.name, url, etag, lmod)
+                        
+                        # Parse Content (raw bytes: the XML declaration carries the encoding)
+                        content = await response.read()
+                        stamps = {"fetch_start": fetch_start, "fetched": time.monotonic()}
+                        
+                        # Detect Type (RSS vs HTML)
+                        if target['type'] == 'rss':
+                            new_items, delays = await self._process_rss_content(name, url, content, stamps, target.get('priority', 1))
+                        elif target['type'] == 'html':
+                            new_items = await self._process_html_content(target, content, stamps)
                         else:
-                            self.logger.warning(f"{name}: Check failed. Status {response.status}")
-                
-                except asyncio.TimeoutError:
-                     self.logger.warning(f"{name}: Timeout (5s)")
-                except Exception as e:
-                     self.logger.error(f"{name}: Error - {e}")
-
-                # Smart Sleep: Adjust for time taken to request
-                elapsed = asyncio.get_event_loop().time() - start_time
-                sleep_time = max(0.1, interval - elapsed)
-                await asyncio.sleep(sleep_time)
-
-    async def _process_rss_content(self, name, url, content):
+                            self.logger.warning(f"{name}: Unknown target type '{target['type']}'")
+                            
+                    else:
+                        self.logger.warning(f"{name}: Check failed. Status {response.status}")
+            
+            except asyncio.TimeoutError:
+                 self.logger.warning(f"{name}: Timeout (5s)")
+            except Exception as e:
+                 self.logger.error(f"{name}: Error - {e}")
+
+            # Adaptive Sleep: learned interval, jittered, host-spaced, minus request time
+            self.scheduler.record_poll(name, new_items, delays)
+            elapsed = asyncio.get_event_loop().time() - start_time
+            await asyncio.sleep(self._burst_delay(name, self.scheduler.next_delay(name, elapsed)))
+
+    def _burst_delay(self, name: str, delay: float) -> float:
+        """
+        Calendar override of the learned interval:
+        burst -> sub-second polling; warm-up -> poll often enough to keep the
+        keep-alive connection (and the connector's DNS cache) hot, so the first
+        burst request skips both; idle -> wake up in time for the next warm-up.
+        """
+        if not self.calendar:
+            return delay
+        phase = self.calendar.target_phase(name)
+        if phase == BURST:
+            return self.burst_interval
+        if phase == WARMUP:
+            return min(delay, self.warmup_interval)
+        until = self.calendar.seconds_until_next_phase(name)
+        if until is not None:
+            return min(delay, max(0.1, until))
+        return delay
+
+    async def _process_html_content(self, target, content, stamps=None):
+        """
+        Diff the target's selected region and emit its new list entries.
+        A brand-new target (none of its entries known yet) is primed silently
+        instead of flooding the council with the page's back catalogue.
+        Returns the new item count.
+        """
+        name = target['name']
+        entries = await self.html_monitor.changed_entries(target, content)
+        if entries is None:
+            return 0
+
+        fresh = [e for e in entries if await self._is_new(e['id'])]
+        first_poll = name not in self._html_primed
+        self._html_primed.add(name)
+        if first_poll and fresh and len(fresh) == len(entries):
+            self.logger.info(f"{name}: Primed {len(fresh)} existing page entries.")
+            return 0
+
+        for entry in fresh:
+            item = NewsItem(
+                source_id=f"direct:{name}",
+                title=entry['title'],
+                url=entry['link'],
+                published_at=datetime.now(),
+                content=entry['title'], # List pages only carry the headline
+                author=name,
+                raw_data=entry,
+                priority=target.get('priority', 1),
+                stamps=dict(stamps or {})
+            )
+            stamp(item, "parsed")
+            self.logger.info(f"⚡️ DIRECT HIT [{name}]: {item.title}")
+            await self._emit(item)
+
+        if fresh:
+            self.logger.info(f"{name}: Emitted {len(fresh)} new items.")
+        return len(fresh)
+
+    async def _process_rss_content(self, name, url, content, stamps=None, priority=1):
         """
         Parse RSS content in executor to avoid blocking the HFT loop.
+        Only entries newer than the previous poll are built (see IncrementalFeedParser).
+        Returns (new item count, publish->detect delays in seconds).
         """
         loop = asyncio.get_event_loop()
         # Offload CPU-bound parsing
-        feed = await loop.run_in_executor(None, feedparser.parse, content)
+        feed = await loop.run_in_executor(None, self.feed_parser.parse, url, content)
         
-        # Process entries (Newest First usually)
-        # We iterate and check if seen.
+        # Only entries not returned on an earlier poll; the seen store still guards restarts
         new_items_count = 0
+        delays = []
         
         for entry in feed.entries:
             item_id = entry.get('id', entry.get('link'))
-            if not item_id or item_id in self.seen_guids:
+            if not item_id or not await self._is_new(item_id):
                 continue
             
             # New Item!
-            self.seen_guids.add(item_id)
             new_items_count += 1
+            published = published_timestamp(entry)
+            if published is not None:
+                delays.append(time.time() - published)
             
             # Create NewsItem
             item = NewsItem(
@@ -144,11 +245,15 @@ class DirectIngester(BaseIngester):
                 published_at=datetime.now(), # Real-time detection time is what matters for HFT
                 content=entry.get('summary', '') or entry.get('description', ''),
                 author=name,
-                raw_data=dict(entry)
+                raw_data=dict(entry),
+                priority=priority,
+                stamps=dict(stamps or {})
             )
+            stamp(item, "parsed")
             
             self.logger.info(f"⚡️ DIRECT HIT [{name}]: {item.title}")
             await self._emit(item)
             
         if new_items_count > 0:
             self.logger.info(f"{name}: Emitted {new_items_count} new items.")
+        return new_items_count, delays
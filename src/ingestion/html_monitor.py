@@ -0,0 +1,170 @@
+"""
+HTML Page-Diff Monitoring (DirectIngester `type: "html"` targets)
+
+Press pages without a feed (exchange announcement lists, agency newsrooms) are
+watched by diffing one region of the page:
+
+    {"name": "Binance Announcements", "url": "...", "type": "html",
+     "selector": "div.article-list",          # CSS (BeautifulSoup)   -- or --
+     "xpath": "//div[@class='article-list']", # XPath (lxml)
+     "entry_selector": "a[href]",             # optional, CSS within the region
+     "entry_xpath": ".//a[@href]",            # optional, XPath within the region
+     "priority": 1, "poll_interval": 3.0}
+
+- The raw body is hashed first: identical bytes never reach the parser.
+- Otherwise the page is parsed in a worker pool (never on the event loop) and
+  only the selected region is fingerprinted (text + links, so rotating CSRF
+  tokens, ads or timestamps elsewhere on the page don't count as changes).
+- When the region changed, its list entries (title + absolute link) are
+  returned; the ingester emits the ones its seen store doesn't know yet.
+"""
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+_WS_RE = re.compile(r"\s+")
+
+
+def _clean(text: str) -> str:
+    return _WS_RE.sub(" ", text or "").strip()
+
+
+def _entry(title: str, href: Optional[str], base_url: str) -> Optional[dict]:
+    title = _clean(title)
+    if not title:
+        return None
+    link = urljoin(base_url, href) if href else None
+    key = link or "title:" + hashlib.blake2b(title.encode(), digest_size=12).hexdigest()
+    return {"id": key, "title": title, "link": link or base_url}
+
+
+def _extract_css(body: bytes, base_url: str, selector: str, entry_selector: str):
+    soup = BeautifulSoup(body, "lxml" if LXML_AVAILABLE else "html.parser")
+    regions = soup.select(selector)
+    fingerprint, entries = [], []
+    for region in regions:
+        for el in region.select(entry_selector):
+            link = el if el.name == "a" else el.find("a", href=True)
+            href = link.get("href") if link is not None else None
+            fingerprint.append(f"{_clean(el.get_text(' '))}|{href}")
+            entry = _entry(el.get_text(" "), href, base_url)
+            if entry:
+                entries.append(entry)
+        if not entries:
+            fingerprint.append(_clean(region.get_text(" ")))
+    return bool(regions), fingerprint, entries
+
+
+def _extract_xpath(body: bytes, base_url: str, xpath: str, entry_xpath: str):
+    doc = lxml_html.fromstring(body)
+    regions = doc.xpath(xpath)
+    fingerprint, entries = [], []
+    for region in regions:
+        for el in region.xpath(entry_xpath):
+            links = [el] if el.tag == "a" else el.xpath(".//a[@href]")
+            href = links[0].get("href") if links else None
+            fingerprint.append(f"{_clean(el.text_content())}|{href}")
+            entry = _entry(el.text_content(), href, base_url)
+            if entry:
+                entries.append(entry)
+        if not entries:
+            fingerprint.append(_clean(region.text_content()))
+    return bool(regions), fingerprint, entries
+
+
+def extract_region(body: bytes, base_url: str, selector: Optional[str] = None, xpath: Optional[str] = None,
+                   entry_selector: str = "a[href]", entry_xpath: str = ".//a[@href]") -> Tuple[Optional[str], List[dict]]:
+    """
+    Runs in a pool worker. Returns (region fingerprint, entries in page order),
+    or (None, []) when the selector matched nothing.
+    """
+    if xpath:
+        if not LXML_AVAILABLE:
+            raise RuntimeError("XPath targets need lxml installed")
+        matched, fingerprint, entries = _extract_xpath(body, base_url, xpath, entry_xpath)
+    else:
+        matched, fingerprint, entries = _extract_css(body, base_url, selector, entry_selector)
+    if not matched:
+        return None, []
+    digest = hashlib.blake2b("\n".join(fingerprint).encode(), digest_size=16).hexdigest()
+    return digest, entries
+
+
+@dataclass
+class _PageState:
+    body_hash: Optional[str] = None
+    region_hash: Optional[str] = None
+    polls: int = 0
+    parses: int = 0
+    changes: int = 0
+
+
+class HtmlPageMonitor:
+    def __init__(self, workers: int = 2):
+        self.logger = logging.getLogger("hedgemony.ingest.html")
+        self.workers = workers
+        self._pool: Optional[Executor] = None
+        self._pages: Dict[str, _PageState] = {}
+
+    def _executor(self) -> Executor:
+        if self._pool is None:
+            if multiprocessing.current_process().daemon:
+                # Daemonic processes (the engine's ingestion worker) cannot have children
+                self.logger.info("Running inside a daemon process: parsing HTML in threads")
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="html-parse")
+            else:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    async def changed_entries(self, target: dict, body: bytes) -> Optional[List[dict]]:
+        """
+        Entries of the target's region if it changed since the last poll,
+        None if nothing changed (or the selector matched nothing).
+        """
+        name = target["name"]
+        state = self._pages.setdefault(name, _PageState())
+        state.polls += 1
+
+        body_hash = hashlib.blake2b(body, digest_size=16).hexdigest()
+        if body_hash == state.body_hash:
+            return None
+        state.body_hash = body_hash
+
+        loop = asyncio.get_running_loop()
+        state.parses += 1
+        region_hash, entries = await loop.run_in_executor(
+            self._executor(), extract_region, body, target["url"],
+            target.get("selector"), target.get("xpath"),
+            target.get("entry_selector", "a[href]"), target.get("entry_xpath", ".//a[@href]"),
+        )
+        if region_hash is None:
+            self.logger.warning(f"{name}: selector matched nothing (page layout changed?)")
+            return None
+        if region_hash == state.region_hash:
+            return None
+        state.region_hash = region_hash
+        state.changes += 1
+        return entries
+
+    def stats(self) -> Dict[str, dict]:
+        return {name: {"polls": s.polls, "parses": s.parses, "changes": s.changes} for name, s in self._pages.items()}
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
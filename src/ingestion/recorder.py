@@ -0,0 +1,139 @@
+"""
+Stream Recorder
+
+Capture mode for the ingestion workers: every NewsItem a worker pushes to the
+engine is appended, with its wall-clock arrival time, to a segmented
+append-only log. `scripts/benchmarks/replay_session.py` feeds a recorded
+session back into the engine pipeline (see core.replay).
+
+    data/recordings/<session>/<shard>-000001.seg, <shard>-000002.seg, ...
+
+Segment file: MAGIC, then frames of
+    <u32 payload length><f64 arrival time.time()><payload: wire.encode(item, "struct")>
+
+- Segments roll over at `segment_mb` / `segment_minutes`; a restarted worker
+  continues with the next segment number.
+- Frames are written whole and flushed every `flush_every` items (default:
+  each one, news arrives at a few items/s), so a killed worker loses at most
+  its unflushed tail; readers stop at the first truncated frame.
+- The struct codec is used regardless of msgpack so recordings replay anywhere.
+"""
+
+import glob
+import heapq
+import logging
+import os
+import re
+import struct
+import time
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+
+from .base import NewsItem
+from .wire import decode, encode
+
+MAGIC = b"HGREC1\n"
+_FRAME = struct.Struct("<Id")
+_SEGMENT_RE = re.compile(r"^(?P<shard>.+)-(?P<seq>\d{6})\.seg$")
+
+
+class StreamRecorder:
+    def __init__(self, directory: str, shard: str = "ingestion", segment_mb: float = 64,
+                 segment_minutes: float = 60, flush_every: int = 1):
+        self.logger = logging.getLogger("hedgemony.ingest.recorder")
+        self.directory = directory
+        self.shard = shard
+        self.segment_bytes = int(segment_mb * 1024 * 1024)
+        self.segment_seconds = segment_minutes * 60
+        self.flush_every = flush_every
+        os.makedirs(directory, exist_ok=True)
+
+        self._file = None
+        self._seq = self._last_seq()
+        self._opened_at = 0.0
+        self._size = 0
+        self._unflushed = 0
+        self.recorded = 0
+
+    @classmethod
+    def from_config(cls, config: dict, shard: str) -> "StreamRecorder":
+        session = config.get("session") or datetime.now().strftime("%Y%m%d-%H%M%S")
+        return cls(
+            directory=os.path.join(config.get("dir", "data/recordings"), session),
+            shard=shard,
+            segment_mb=config.get("segment_mb", 64),
+            segment_minutes=config.get("segment_minutes", 60),
+        )
+
+    def _last_seq(self) -> int:
+        seqs = [int(m.group("seq")) for m in map(_SEGMENT_RE.match, os.listdir(self.directory))
+                if m and m.group("shard") == self.shard]
+        return max(seqs, default=0)
+
+    def _roll(self):
+        self.close()
+        self._seq += 1
+        path = os.path.join(self.directory, f"{self.shard}-{self._seq:06d}.seg")
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._opened_at = time.monotonic()
+        self._size = len(MAGIC)
+        self.logger.info(f"Recording to {path}")
+
+    def append(self, item: NewsItem, arrived_at: Optional[float] = None):
+        payload = encode(item, "struct")
+        if (self._file is None or self._size >= self.segment_bytes
+                or time.monotonic() - self._opened_at >= self.segment_seconds):
+            self._roll()
+        frame = _FRAME.pack(len(payload), time.time() if arrived_at is None else arrived_at) + payload
+        self._file.write(frame)
+        self._size += len(frame)
+        self.recorded += 1
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if self._file:
+            self._file.flush()
+            self._unflushed = 0
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+def read_segment(path: str) -> Iterator[Tuple[float, NewsItem]]:
+    """(arrival time, item) for every complete frame in one segment file."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a recording segment")
+        while True:
+            header = f.read(_FRAME.size)
+            if len(header) < _FRAME.size:
+                return
+            length, arrived_at = _FRAME.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                return # Truncated tail (writer was killed mid-frame)
+            yield arrived_at, decode(payload)
+
+
+def segment_paths(directory: str) -> List[str]:
+    """All segment files of a session directory, grouped by shard in write order."""
+    paths = [p for p in glob.glob(os.path.join(directory, "*.seg")) if _SEGMENT_RE.match(os.path.basename(p))]
+    return sorted(paths, key=lambda p: (_SEGMENT_RE.match(os.path.basename(p)).group("shard"), p))
+
+
+def read_recording(directory: str) -> Iterator[Tuple[float, NewsItem]]:
+    """Every shard of a recorded session, merged into arrival order."""
+    by_shard = {}
+    for path in segment_paths(directory):
+        by_shard.setdefault(_SEGMENT_RE.match(os.path.basename(path)).group("shard"), []).append(path)
+
+    def shard_stream(paths):
+        for path in paths:
+            yield from read_segment(path)
+
+    yield from heapq.merge(*(shard_stream(p) for p in by_shard.values()), key=lambda record: record[0])
@@ -1,80 +1,178 @@
 import asyncio
 import aiohttp
-import feedparser
+import random
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from dateutil import parser as date_parser
-from typing import List, Set
+from typing import Dict, List, Union
 from .base import BaseIngester, NewsItem
+from .feed_parser import IncrementalFeedParser
+from src.utils.latency import stamp
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+@dataclass
+class FeedCycleStats:
+    """Counters for one reporting window (reset after each report)."""
+    requests: int = 0
+    not_modified: int = 0
+    errors: int = 0
+    bytes: int = 0
+    parse_cpu_ms: float = 0.0
+    items: int = 0
+
 
 class AsyncRSSIngester(BaseIngester):
-    def __init__(self, config: dict, feed_urls: List[str]):
+    """
+    Aggregator RSS feeds, each on its own timer.
+
+    - A slow or hung feed only delays itself (per-feed timeout), never the others.
+    - Conditional GET (If-None-Match / If-Modified-Since) through the shared
+      seen store, so unchanged feeds cost a 304 and no parsing.
+    - Failing feeds back off exponentially (with jitter) up to `rss_max_backoff`.
+    - Bandwidth, 304s, errors and parse CPU are reported every `rss_report_interval`.
+
+    Feeds are URLs or dicts {"url": ..., "interval": ..., "timeout": ...}
+    overriding the global interval / timeout for that feed.
+    """
+
+    def __init__(self, config: dict, feed_urls: List[Union[str, Dict]]):
         super().__init__("rss", config)
-        self.feed_urls = feed_urls
+        self.feeds = [f if isinstance(f, dict) else {"url": f} for f in feed_urls]
+        self.feed_urls = [f["url"] for f in self.feeds]
         self.is_running = False
-        self.seen_urls: Set[str] = set()
         self.poll_interval = config.get("rss_poll_interval", 60)
+        self.timeout = config.get("rss_timeout", 10)
+        self.max_backoff = config.get("rss_max_backoff", 900)
+        self.report_interval = config.get("rss_report_interval", 300)
+        self.feed_parser = IncrementalFeedParser()
+
+        self.cycle = FeedCycleStats()
+        self._failures: Dict[str, int] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._loop_task = None
 
-    async def fetch_feed(self, session: aiohttp.ClientSession, url: str):
+    async def fetch_feed(self, session: aiohttp.ClientSession, url: str, timeout: float = None) -> bool:
+        """Poll one feed. Returns False on failure (drives the back-off)."""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            async with session.get(url, timeout=10, headers=headers) as response:
+            headers = {'User-Agent': USER_AGENT}
+            etag, last_modified = self.seen_store.get_http_cache(self.name, url)
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+            self.cycle.requests += 1
+            fetch_start = time.monotonic()
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout or self.timeout), headers=headers) as response:
+                if response.status == 304:
+                    self.cycle.not_modified += 1
+                    return True
                 if response.status != 200:
                     self.logger.warning(f"Failed to fetch {url}: Status {response.status}")
-                    return
-                
-                content = await response.text()
-                # Feedparser is blocking, but fast for small XML. 
-                # For massive scale, run in executor.
-                loop = asyncio.get_event_loop()
-                feed = await loop.run_in_executor(None, feedparser.parse, content)
-                
-                for entry in feed.entries:
-                    link = entry.get('link', '')
-                    if not link or link in self.seen_urls:
-                        continue
-                        
-                    self.seen_urls.add(link)
-                    
-                    # Parse date safely
-                    pub_date = datetime.now()
-                    if 'published' in entry:
-                        try:
-                            pub_date = date_parser.parse(entry.published)
-                        except:
-                            pass
-                            
-                    item = NewsItem(
-                        source_id=f"rss:{feed.feed.get('title', 'unknown')}",
-                        title=entry.get('title', ''),
-                        url=link,
-                        published_at=pub_date,
-                        content=entry.get('summary', '') or entry.get('description', ''),
-                        author=entry.get('author', None),
-                        raw_data=dict(entry)
-                    )
-                    
-                    await self._emit(item)
-                    
+                    self.cycle.errors += 1
+                    return False
+
+                content = await response.read()
+                stamps = {"fetch_start": fetch_start, "fetched": time.monotonic()}
+                self.cycle.bytes += len(content)
+                self.seen_store.set_http_cache(self.name, url, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+
+            # Streaming parse that stops at the first entry seen last poll
+            # (and skips unchanged bodies entirely), off the event loop.
+            loop = asyncio.get_event_loop()
+            feed, cpu_ms = await loop.run_in_executor(None, self._parse, url, content)
+            self.cycle.parse_cpu_ms += cpu_ms
+
+            for entry in feed.entries:
+                link = entry.get('link', '')
+                if not link or not await self._is_new(link):
+                    continue
+
+                # Parse date safely
+                pub_date = datetime.now()
+                if 'published' in entry:
+                    try:
+                        pub_date = date_parser.parse(entry['published'])
+                    except:
+                        pass
+
+                item = NewsItem(
+                    source_id=f"rss:{feed.title or 'unknown'}",
+                    title=entry.get('title', ''),
+                    url=link,
+                    published_at=pub_date,
+                    content=entry.get('summary', '') or entry.get('description', ''),
+                    author=entry.get('author', None),
+                    raw_data=dict(entry),
+                    stamps=dict(stamps)
+                )
+                stamp(item, "parsed")
+                self.cycle.items += 1
+
+                await self._emit(item)
+            return True
+
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Timeout fetching {url} ({timeout or self.timeout}s)")
         except Exception as e:
             self.logger.error(f"Error fetching {url}: {e}")
+        self.cycle.errors += 1
+        return False
+
+    def _parse(self, url: str, content: bytes):
+        """Runs in the executor; returns (ParsedFeed, CPU ms spent in this thread)."""
+        started = time.thread_time()
+        feed = self.feed_parser.parse(url, content)
+        return feed, (time.thread_time() - started) * 1000
+
+    def _next_delay(self, url: str, interval: float, ok: bool) -> float:
+        """Regular interval on success, exponential back-off (jittered) on consecutive failures."""
+        failures = 0 if ok else self._failures.get(url, 0) + 1
+        self._failures[url] = failures
+        delay = interval if failures == 0 else min(self.max_backoff, interval * 2 ** failures)
+        return delay * random.uniform(0.9, 1.1)
+
+    async def _feed_loop(self, session: aiohttp.ClientSession, feed: Dict):
+        url = feed["url"]
+        interval = feed.get("interval", self.poll_interval)
+        # Spread the first polls so the feeds don't all fire in the same instant
+        await asyncio.sleep(random.uniform(0, min(interval, 5.0)))
+        while self.is_running:
+            ok = await self.fetch_feed(session, url, feed.get("timeout"))
+            delay = self._next_delay(url, interval, ok)
+            if not ok and self._failures[url] > 1:
+                self.logger.info(f"{url}: {self._failures[url]} consecutive failures, backing off {delay:.0f}s")
+            await asyncio.sleep(delay)
+
+    async def _report_loop(self):
+        while self.is_running:
+            await asyncio.sleep(self.report_interval)
+            c, self.cycle = self.cycle, FeedCycleStats()
+            self.logger.info(
+                f"RSS report ({self.report_interval}s): {c.requests} req, {c.not_modified} x 304, "
+                f"{c.errors} errors, {c.bytes / 1024:.1f} KiB, parse CPU {c.parse_cpu_ms:.1f} ms, {c.items} new items"
+            )
 
     async def loop(self):
-        conn = aiohttp.TCPConnector(limit=100) # Connection pooling
-        async with aiohttp.ClientSession(connector=conn) as session:
-            while self.is_running:
-                tasks = [self.fetch_feed(session, url) for url in self.feed_urls]
-                await asyncio.gather(*tasks)
-                
-                self.logger.info(f"RSS Poll complete. Sleeping {self.poll_interval}s")
-                await asyncio.sleep(self.poll_interval)
+        # Connection pooling / DNS cache come from the shared transport
+        session = await self._http_session()
+        self._tasks = [asyncio.create_task(self._feed_loop(session, feed)) for feed in self.feeds]
+        self._tasks.append(asyncio.create_task(self._report_loop()))
+        await asyncio.gather(*self._tasks, return_exceptions=True)
 
     async def start(self):
         self.is_running = True
-        self.logger.info(f"Starting RSS Ingester with {len(self.feed_urls)} feeds")
-        asyncio.create_task(self.loop())
+        self.logger.info(f"Starting RSS Ingester with {len(self.feeds)} feeds")
+        self._loop_task = asyncio.create_task(self.loop())
 
     async def stop(self):
         self.is_running = False
         self.logger.info("Stopping RSS Ingester")
+        tasks = self._tasks + ([self._loop_task] if self._loop_task else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks, self._loop_task = [], None
@@ -0,0 +1,227 @@
+"""
+Adaptive Poll Scheduler (DirectIngester)
+
+Learns when each direct target actually publishes and spends a global request
+budget where news is most likely to appear.
+
+- Each target keeps an hour-of-week profile (168 buckets) of new items and
+  polling exposure, exponentially decayed so the profile follows schedule changes.
+  The rate estimate for "now" blends the hour-of-week bucket, the same hour on
+  any weekday, and a prior (so quiet buckets are never starved entirely).
+- The budget (requests/sec over all targets) is split with the square-root rule:
+  minimising expected detection delay sum(w_i * lambda_i / 2r_i) subject to
+  sum(r_i) = R gives r_i ~ sqrt(w_i * lambda_i), w_i = 1 / priority.
+- Polls are jittered and requests to the same host are spaced apart so targets
+  on one host (sec.gov, federalreserve.gov) never fire in lock-step.
+- Per target we report requests, detected items, requests per item and
+  detection delay (publish -> detect).
+"""
+
+import json
+import logging
+import math
+import os
+import random
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from src.utils.stats import RollingStats
+
+HOURS_PER_WEEK = 168
+
+
+def hour_of_week(ts: float = None) -> int:
+    dt = datetime.fromtimestamp(ts if ts is not None else time.time())
+    return dt.weekday() * 24 + dt.hour
+
+
+class TargetProfile:
+    """Decayed publish-rate profile of a single target."""
+
+    def __init__(self, name: str, url: str, priority: int = 1, base_interval: float = 5.0):
+        self.name = name
+        self.host = urlparse(url).hostname or url
+        self.priority = max(1, int(priority or 1))
+        self.base_interval = base_interval
+
+        self.items = [0.0] * HOURS_PER_WEEK       # decayed new-item counts
+        self.exposure = [0.0] * HOURS_PER_WEEK    # decayed hours spent watching
+        self.updated = [0.0] * HOURS_PER_WEEK     # wall time of last decay per bucket
+
+        # Reporting
+        self.requests = 0
+        self.detected = 0
+        self.detection_delay_ms = RollingStats()
+        self.last_poll_at: Optional[float] = None  # wall time
+
+    def _decay(self, bucket: int, now: float, half_life: float):
+        last = self.updated[bucket]
+        if last:
+            factor = 0.5 ** ((now - last) / half_life)
+            self.items[bucket] *= factor
+            self.exposure[bucket] *= factor
+        self.updated[bucket] = now
+
+    def observe(self, now: float, new_items: int, half_life: float):
+        bucket = hour_of_week(now)
+        self._decay(bucket, now, half_life)
+        if self.last_poll_at is not None:
+            # Cap a single gap (e.g. process was down) at one hour of exposure
+            self.exposure[bucket] += min(now - self.last_poll_at, 3600.0) / 3600.0
+        self.items[bucket] += new_items
+        self.last_poll_at = now
+
+    def rate(self, now: float, prior_rate: float, prior_hours: float) -> float:
+        """Estimated new items / hour for the current hour of week."""
+        bucket = hour_of_week(now)
+        hour = bucket % 24
+        day_items = sum(self.items[d * 24 + hour] for d in range(7))
+        day_exposure = sum(self.exposure[d * 24 + hour] for d in range(7))
+        hour_rate = (day_items + prior_rate * prior_hours) / (day_exposure + prior_hours)
+        # The weekday-specific bucket shrinks towards the hour-of-day estimate
+        return (self.items[bucket] + hour_rate * prior_hours) / (self.exposure[bucket] + prior_hours)
+
+    def to_dict(self) -> dict:
+        return {"items": self.items, "exposure": self.exposure, "updated": self.updated}
+
+    def load(self, state: dict):
+        for key in ("items", "exposure", "updated"):
+            values = state.get(key)
+            if values and len(values) == HOURS_PER_WEEK:
+                setattr(self, key, [float(v) for v in values])
+
+
+class AdaptivePollScheduler:
+    def __init__(self, targets: List[Dict], config: dict = None):
+        self.logger = logging.getLogger("hedgemony.ingest.scheduler")
+        self.config = config or {}
+
+        self.profiles: Dict[str, TargetProfile] = {
+            t['name']: TargetProfile(t['name'], t['url'], t.get('priority', 1), t.get('poll_interval', 5.0))
+            for t in targets
+        }
+
+        # Default budget = what the fixed intervals used to spend
+        default_budget = sum(1.0 / max(0.1, p.base_interval) for p in self.profiles.values()) or 1.0
+        self.budget_rps = float(self.config.get("budget_rps", default_budget))
+        self.min_interval = float(self.config.get("min_interval", 1.0))
+        self.max_interval = float(self.config.get("max_interval", 120.0))
+        self.jitter = float(self.config.get("jitter", 0.2))
+        self.host_spacing = float(self.config.get("host_spacing", 0.25))
+        self.prior_rate = float(self.config.get("prior_items_per_hour", 0.5))
+        self.prior_hours = float(self.config.get("prior_hours", 2.0))
+        self.half_life = float(self.config.get("half_life_days", 14)) * 86400
+        self.state_path = self.config.get("state_path", "data/poll_schedule.json")
+
+        self._host_next_slot: Dict[str, float] = {}   # host -> earliest monotonic time for next request
+        self._rng = random.Random()
+        self.load()
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+    def intervals(self, now: float = None) -> Dict[str, float]:
+        """Current target -> poll interval (seconds) under the global budget."""
+        now = time.time() if now is None else now
+        weights = {
+            name: math.sqrt(p.rate(now, self.prior_rate, self.prior_hours) / p.priority)
+            for name, p in self.profiles.items()
+        }
+        total = sum(weights.values()) or 1.0
+        out = {}
+        for name, w in weights.items():
+            rps = self.budget_rps * w / total
+            interval = 1.0 / rps if rps > 0 else self.max_interval
+            out[name] = min(self.max_interval, max(self.min_interval, interval))
+        return out
+
+    def interval_for(self, name: str, now: float = None) -> float:
+        return self.intervals(now)[name]
+
+    def next_delay(self, name: str, elapsed: float = 0.0) -> float:
+        """
+        Seconds to sleep before polling `name` again, given the last request took
+        `elapsed` seconds. Applies jitter and per-host spacing.
+        """
+        interval = self.interval_for(name)
+        interval *= 1.0 + self._rng.uniform(-self.jitter, self.jitter)
+        delay = max(0.1, interval - elapsed)
+
+        host = self.profiles[name].host
+        due = time.monotonic() + delay
+        slot = self._host_next_slot.get(host, 0.0)
+        if due < slot:
+            due = slot
+        self._host_next_slot[host] = due + self.host_spacing
+        return max(0.1, due - time.monotonic())
+
+    # ------------------------------------------------------------------
+    # Feedback
+    # ------------------------------------------------------------------
+    def record_poll(self, name: str, new_items: int = 0, delays: List[float] = None):
+        """Feed back one poll result. `delays` = publish->detect seconds per new item."""
+        profile = self.profiles.get(name)
+        if profile is None:
+            return
+        profile.requests += 1
+        profile.detected += new_items
+        profile.observe(time.time(), new_items, self.half_life)
+        for d in delays or []:
+            if 0 <= d < 86400:
+                profile.detection_delay_ms.add(d * 1000)
+
+    def report(self) -> Dict[str, dict]:
+        intervals = self.intervals()
+        out = {}
+        for name, p in self.profiles.items():
+            delay = p.detection_delay_ms.summary()
+            out[name] = {
+                "interval_s": round(intervals[name], 2),
+                "requests": p.requests,
+                "items": p.detected,
+                "requests_per_item": (p.requests / p.detected) if p.detected else None,
+                "detection_delay_p50_s": delay["p50"] / 1000,
+                "detection_delay_p95_s": delay["p95"] / 1000,
+            }
+        return out
+
+    def format_report(self) -> str:
+        lines = []
+        for name, r in self.report().items():
+            rpi = f"{r['requests_per_item']:.0f}" if r['requests_per_item'] is not None else "-"
+            lines.append(
+                f"{name}: every {r['interval_s']}s | req {r['requests']} | items {r['items']} | "
+                f"req/item {rpi} | delay p50 {r['detection_delay_p50_s']:.1f}s p95 {r['detection_delay_p95_s']:.1f}s"
+            )
+        return "\n".join(lines)
+
+    # ------------------------------------------------------------------
+    # Persistence (learned profiles survive restarts)
+    # ------------------------------------------------------------------
+    def save(self):
+        if not self.state_path:
+            return
+        try:
+            directory = os.path.dirname(self.state_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp = self.state_path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump({name: p.to_dict() for name, p in self.profiles.items()}, f)
+            os.replace(tmp, self.state_path)
+        except Exception as e:
+            self.logger.error(f"Failed to save poll schedule: {e}")
+
+    def load(self):
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, "r") as f:
+                state = json.load(f)
+            for name, p in self.profiles.items():
+                if name in state:
+                    p.load(state[name])
+        except Exception as e:
+            self.logger.warning(f"Could not load poll schedule from {self.state_path}: {e}")
@@ -0,0 +1,269 @@
+"""
+Seen-ID Store
+
+Bounded, persistent "have we already emitted this?" state shared by every
+BaseIngester, plus the HTTP validators (ETag / Last-Modified) per ingester and
+URL: two ingesters polling the same URL each send their own validators, so
+one's 200 can't turn into the other's 304. Ingesters also keep small named
+cursors here (e.g. the newest tweet ID), so a restart resumes where it stopped.
+
+- Hot set: one LRU (OrderedDict) capped at `capacity` keys, so memory stays flat
+  no matter how long the worker runs.
+- Cold set: a small sqlite file (WAL) holding every key younger than `ttl_seconds`.
+  An LRU miss falls back to an indexed point lookup, so nothing is re-emitted
+  after a restart or after a key was evicted from memory.
+- All sqlite work after open runs on one dedicated thread: `is_new` awaits the
+  point lookup there, and batched writes are handed over without waiting, so
+  the ingestion loop never blocks on the file.
+
+Startup preloads only the validators (one row per polled URL) and cursors
+besides the TTL prune, so a restarted worker is polling again within a few
+milliseconds. New keys, validators and cursors are written in batches; the owner calls `flush_if_due()`
+periodically so a quiet spell can't leave them only in memory.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+
+class SeenStore:
+    def __init__(self, path: Optional[str] = "data/ingestion_state.db", capacity: int = 50000,
+                 ttl_seconds: float = 7 * 86400, flush_every: int = 64, flush_interval: float = 2.0):
+        self.logger = logging.getLogger("hedgemony.ingest.seen")
+        self.path = path
+        self.capacity = capacity
+        self.ttl_seconds = ttl_seconds
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._last_flush = time.time()
+
+        self._lru: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._pending = []
+        self._pending_http = []
+        self._pending_cursors = []
+        self._http_cache = {}   # (ns, url) -> (etag, last_modified); all of them, loaded on open
+        self._cursors = {}      # (ns, name) -> value; loaded on open
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.hits = 0
+        self.misses = 0
+
+        if path:
+            self._open()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "SeenStore":
+        return cls(
+            path=config.get("path", "data/ingestion_state.db"),
+            capacity=config.get("capacity", 50000),
+            ttl_seconds=config.get("ttl_hours", 168) * 3600,
+        )
+
+    def _open(self):
+        started = time.perf_counter()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS seen (
+                ns TEXT NOT NULL,
+                key TEXT NOT NULL,
+                ts REAL NOT NULL,
+                PRIMARY KEY (ns, key)
+            ) WITHOUT ROWID
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_seen_ts ON seen(ts)')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_cache (
+                ns TEXT NOT NULL,
+                url TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                updated_at REAL,
+                PRIMARY KEY (ns, url)
+            )
+        ''')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS cursors (
+                ns TEXT NOT NULL,
+                name TEXT NOT NULL,
+                value TEXT,
+                updated_at REAL,
+                PRIMARY KEY (ns, name)
+            )
+        ''')
+        self.prune()
+        for ns, url, etag, last_modified in self._conn.execute("SELECT ns, url, etag, last_modified FROM http_cache"):
+            self._http_cache[(ns, url)] = (etag, last_modified)
+        for ns, name, value in self._conn.execute("SELECT ns, name, value FROM cursors"):
+            self._cursors[(ns, name)] = value
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="seen-store")
+        self.logger.info(f"Seen store ready at {self.path} ({(time.perf_counter() - started) * 1000:.1f} ms)")
+
+    # ------------------------------------------------------------------
+    # Seen IDs
+    # ------------------------------------------------------------------
+    def _remember(self, k: Tuple[str, str], ts: float):
+        self._lru[k] = ts
+        self._lru.move_to_end(k)
+        if len(self._lru) > self.capacity:
+            self._lru.popitem(last=False)
+
+    def _hot(self, k: Tuple[str, str]) -> bool:
+        ts = self._lru.get(k)
+        if ts is not None:
+            if time.time() - ts <= self.ttl_seconds:
+                self._lru.move_to_end(k)
+                self.hits += 1
+                return True
+            del self._lru[k] # Expired: same answer as the cold set
+        self.misses += 1
+        return False
+
+    def _cold_ts(self, k: Tuple[str, str]) -> Optional[float]:
+        row = self._conn.execute(
+            "SELECT ts FROM seen WHERE ns = ? AND key = ? AND ts > ?",
+            (k[0], k[1], time.time() - self.ttl_seconds)
+        ).fetchone()
+        return row[0] if row else None
+
+    def seen(self, ns: str, key: str) -> bool:
+        """Blocking check; on the event loop use `is_new`."""
+        k = (ns, str(key))
+        if self._hot(k):
+            return True
+        if self._conn is None:
+            return False
+        ts = self._executor.submit(self._cold_ts, k).result()
+        if ts is not None:
+            self._remember(k, ts)
+            return True
+        return False
+
+    def add(self, ns: str, key: str):
+        k = (ns, str(key))
+        now = time.time()
+        self._remember(k, now)
+        if self._conn is not None:
+            self._pending.append((k[0], k[1], now))
+            if len(self._pending) >= self.flush_every or now - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    def check_and_add(self, ns: str, key: str) -> bool:
+        """True if `key` is new in `ns` (and records it), False if already seen. Blocking."""
+        if self.seen(ns, key):
+            return False
+        self.add(ns, key)
+        return True
+
+    async def is_new(self, ns: str, key: str) -> bool:
+        """`check_and_add` with the cold lookup on the store's thread."""
+        k = (ns, str(key))
+        if self._hot(k):
+            return False
+        if self._conn is None:
+            self.add(ns, key)
+            return True
+        self._remember(k, time.time()) # Claimed first: a concurrent check sees it as known
+        ts = await asyncio.get_running_loop().run_in_executor(self._executor, self._cold_ts, k)
+        if ts is not None:
+            self._lru[k] = ts
+            return False
+        self.add(ns, key)
+        return True
+
+    # ------------------------------------------------------------------
+    # HTTP validators
+    # ------------------------------------------------------------------
+    def get_http_cache(self, ns: str, url: str) -> Tuple[Optional[str], Optional[str]]:
+        return self._http_cache.get((ns, url), (None, None))
+
+    def set_http_cache(self, ns: str, url: str, etag: Optional[str], last_modified: Optional[str]):
+        if not etag and not last_modified:
+            return
+        if self._http_cache.get((ns, url)) == (etag, last_modified):
+            return # Unchanged (a 200 for the same version)
+        self._http_cache[(ns, url)] = (etag, last_modified)
+        if self._conn is not None:
+            self._pending_http.append((ns, url, etag, last_modified, time.time()))
+            if time.time() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    # ------------------------------------------------------------------
+    # Cursors
+    # ------------------------------------------------------------------
+    def get_cursor(self, ns: str, name: str) -> Optional[str]:
+        return self._cursors.get((ns, name))
+
+    def set_cursor(self, ns: str, name: str, value: str):
+        if self._cursors.get((ns, name)) == value:
+            return
+        self._cursors[(ns, name)] = value
+        if self._conn is not None:
+            self._pending_cursors.append((ns, name, value, time.time()))
+            if time.time() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def flush(self, wait: bool = False):
+        """Hand pending keys, validators and cursors to the store's thread (`wait`: until written)."""
+        if self._conn is None:
+            return
+        if self._pending or self._pending_http or self._pending_cursors:
+            self._executor.submit(self._write, self._pending, self._pending_http, self._pending_cursors)
+            self._pending, self._pending_http, self._pending_cursors = [], [], []
+            self._last_flush = time.time()
+        if wait:
+            self._executor.submit(lambda: None).result() # Single thread: everything before it is done
+
+    def _write(self, seen_rows, http_rows, cursor_rows):
+        try:
+            self._conn.executemany("INSERT OR REPLACE INTO seen (ns, key, ts) VALUES (?, ?, ?)", seen_rows)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO http_cache (ns, url, etag, last_modified, updated_at) VALUES (?, ?, ?, ?, ?)",
+                http_rows
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cursors (ns, name, value, updated_at) VALUES (?, ?, ?, ?)", cursor_rows
+            )
+            self._conn.commit()
+        except Exception as e:
+            self.logger.error(f"Failed to persist seen IDs: {e}")
+
+    def flush_if_due(self):
+        """Persist pending keys once `flush_interval` has passed (call on a timer)."""
+        if (self._pending or self._pending_http or self._pending_cursors) and time.time() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def prune(self):
+        if self._conn is None:
+            return
+        cutoff = time.time() - self.ttl_seconds
+        self._conn.execute("DELETE FROM seen WHERE ts <= ?", (cutoff,))
+        self._conn.execute("DELETE FROM http_cache WHERE updated_at <= ?", (cutoff,))
+        self._conn.execute("DELETE FROM cursors WHERE updated_at <= ?", (cutoff,))
+        self._conn.commit()
+
+    def close(self):
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True) # Pending writes land first
+            self._executor = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def stats(self) -> dict:
+        return {"hot_keys": len(self._lru), "capacity": self.capacity, "hits": self.hits, "misses": self.misses}
@@ -1,7 +1,9 @@
 import asyncio
 import logging
-from typing import List, Dict, Type
+from typing import List, Dict, Optional, Type
 from .base import BaseIngester
+from .seen_store import SeenStore
+from .transport import HttpTransport
 from .direct import DirectIngester
 from .rss_fetcher import AsyncRSSIngester
 from .cryptopanic import CryptoPanicIngester
@@ -11,47 +13,80 @@ import json
 class StreamManager:
     """
     Orchestrates multiple ingestion streams (RSS, API, Websockets).
+
+    `kinds` / `targets` restrict it to one shard (see supervisor.py): only the
+    listed ingester kinds ("rss", "cryptopanic", "twitter", "direct") and, when
+    given, only the direct targets (by name) / RSS feeds (by URL) listed.
     """
-    def __init__(self, config: dict):
+    KINDS = ("rss", "cryptopanic", "twitter", "direct")
+
+    def __init__(self, config: dict, kinds: Optional[List[str]] = None, targets: Optional[List[str]] = None):
         self.logger = logging.getLogger("hedgemony.ingest.manager")
         self.config = config
+        self.kinds = set(kinds) if kinds else set(self.KINDS)
+        self.targets = set(targets) if targets else None
         self.ingesters: List[BaseIngester] = []
         self._callback = None
         
+        # Shared, bounded + persistent seen-ID / ETag store
+        self.seen_store = SeenStore.from_config(self.config.get("state", {}))
+        
+        # One tuned HTTP session (pool, DNS cache, keep-alive) for every ingester
+        http_config = self.config.get("http", {})
+        self.transport = HttpTransport(http_config)
+        self.transport_report_interval = http_config.get("report_interval", 300)
+        self._report_task = None
+        
         # Initialize Ingesters based on config
         self._init_ingesters()
+        for ingester in self.ingesters:
+            ingester.set_seen_store(self.seen_store)
+            ingester.set_transport(self.transport)
+
+    def _in_shard(self, *names) -> bool:
+        return self.targets is None or any(n in self.targets for n in names)
 
     def _init_ingesters(self):
         # 1. RSS (Aggregators/Slow)
-        rss_config = self.config.get("rss", {})
-        rss_sources = self.config.get("rss_sources", [])
-        if rss_sources:
+        rss_config = dict(self.config.get("rss", {}))
+        # Per-feed scheduling knobs live at the ingestion level of the config
+        for key in ("rss_poll_interval", "rss_timeout", "rss_max_backoff", "rss_report_interval"):
+            if key in self.config:
+                rss_config.setdefault(key, self.config[key])
+        rss_sources = [f for f in self.config.get("rss_sources", [])
+                       if self._in_shard(f["url"] if isinstance(f, dict) else f)]
+        if rss_sources and "rss" in self.kinds:
             self.ingesters.append(AsyncRSSIngester(rss_config, rss_sources))
         
         # 2. CryptoPanic
         cp_config = self.config.get("cryptopanic")
-        if cp_config and cp_config.get("enabled", False):
+        if cp_config and cp_config.get("enabled", False) and "cryptopanic" in self.kinds:
             self.ingesters.append(CryptoPanicIngester(cp_config))
             
         # 3. Twitter
         tw_config = self.config.get("twitter")
-        if tw_config and tw_config.get("enabled", False):
+        if tw_config and tw_config.get("enabled", False) and "twitter" in self.kinds:
             self.ingesters.append(TwitterMonitor(tw_config))
             
         # 4. Direct HFT (New Tier 1 Hunter)
+        if "direct" in self.kinds:
+            self._init_direct()
+            
+        self.logger.info(f"Initialized {len(self.ingesters)} ingesters.")
+
+    def _init_direct(self):
         # Load targets from file
+        path = self.config.get("direct_targets_file", "config/sources/direct_targets.json")
         try:
-            with open("config/sources/direct_targets.json", "r") as f:
-                direct_targets = json.load(f)
+            with open(path, "r") as f:
+                direct_targets = [t for t in json.load(f) if self._in_shard(t.get("name"), t.get("url"))]
                 if direct_targets:
                     # Pass global config for proxy settings if we add them later
                     self.ingesters.append(DirectIngester(self.config, direct_targets))
         except FileNotFoundError:
-            self.logger.warning("config/sources/direct_targets.json not found. Skipping HFT Direct Ingester.")
+            self.logger.warning(f"{path} not found. Skipping HFT Direct Ingester.")
         except Exception as e:
             self.logger.error(f"Failed to load Direct targets: {e}")
-            
-        self.logger.info(f"Initialized {len(self.ingesters)} ingesters.")
 
     def set_callback(self, callback):
         self._callback = callback
@@ -69,8 +104,24 @@ class StreamManager:
         # Start all ingesters concurrently
         tasks = [ingester.start() for ingester in self.ingesters]
         await asyncio.gather(*tasks)
+        self._report_task = asyncio.create_task(self._report_loop())
+
+    async def _report_loop(self):
+        """Periodically log per-host handshakes, DNS lookups and bytes."""
+        while True:
+            await asyncio.sleep(self.transport_report_interval)
+            report = self.transport.format_report()
+            if report:
+                self.logger.info(f"HTTP transport report:\n{report}")
 
     async def stop(self):
         self.logger.info("Stopping Stream Manager...")
+        if self._report_task:
+            self._report_task.cancel()
         tasks = [ingester.stop() for ingester in self.ingesters]
         await asyncio.gather(*tasks)
+        report = self.transport.format_report()
+        if report:
+            self.logger.info(f"HTTP transport report:\n{report}")
+        await self.transport.close()
+        self.seen_store.close()
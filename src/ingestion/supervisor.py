@@ -0,0 +1,277 @@
+"""
+Ingestion Supervisor
+
+Runs the ingesters as N worker processes (shards) and keeps them alive.
+
+    ingestion:
+      workers:
+        shards:
+          - {name: direct, ingesters: [direct]}
+          - {name: social, ingesters: [twitter, cryptopanic]}
+          - {name: aggregators, ingesters: [rss]}
+
+A shard lists ingester kinds and, optionally, `targets` (direct target names /
+RSS feed URLs) to split one ingester's target list across processes. Without
+`shards` everything runs in one worker, as before.
+
+- Each worker writes to its own NewsChannel lane; the engine reads all lanes
+  through the one channel (merged, priority ordered).
+- Workers heartbeat on a private control pipe every `heartbeat_interval`
+  (private, like the lanes: killing a worker can't wedge a shared lock). A worker
+  that exited is restarted as soon as it is noticed (<= one check interval);
+  one whose heartbeats stopped for `stale_after` (hung loop) is killed and
+  restarted. Crash loops back off from `restart_backoff` up to
+  `max_restart_backoff`, so a restart always happens within
+  stale_after + max_restart_backoff.
+- Stopping a worker sends SIGTERM, which the worker turns into an orderly
+  shutdown (ingesters stopped, seen IDs and queued items flushed); only a
+  worker still alive after `stop_timeout` is killed.
+- Cross-source near-duplicate suppression needs to see every source, so with
+  more than one shard it moves from the workers to `accept()` in the engine.
+- Per-worker CPU % and items/s come from the heartbeats (`stats()`).
+"""
+
+import asyncio
+import copy
+import logging
+import multiprocessing
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .channel import ChannelWriter, NewsChannel
+from .dedupe import NearDuplicateDetector
+from .worker import start_ingestion_worker
+
+
+@dataclass
+class WorkerState:
+    shard: dict
+    process: Optional[multiprocessing.Process] = None
+    lane: Optional[ChannelWriter] = None
+    control: Optional[object] = None   # Read end of the heartbeat pipe
+    started_at: float = 0.0
+    last_heartbeat: float = 0.0   # monotonic, engine side
+    restarts: int = 0
+    crash_streak: int = 0
+    restart_at: Optional[float] = None
+    # Rates between the last two heartbeats
+    cpu_pct: float = 0.0
+    items_per_s: float = 0.0
+    pushed: int = 0
+    suppressed: int = 0
+    dropped: int = 0
+    ingesters: List[str] = field(default_factory=list)
+    _last: Optional[dict] = None
+
+    @property
+    def name(self) -> str:
+        return self.shard["name"]
+
+
+class IngestionSupervisor:
+    def __init__(self, channel: NewsChannel, config: dict, target=start_ingestion_worker):
+        self.logger = logging.getLogger("hedgemony.ingest.supervisor")
+        self.channel = channel
+        self.config = config
+        self.target = target # (lane, config, shard, heartbeat pipe) -> runs the worker
+        workers = config.get("workers", {}) or {}
+        self.heartbeat_interval = float(workers.get("heartbeat_interval", 1.0))
+        self.stale_after = float(workers.get("stale_after", 10.0))
+        self.restart_backoff = float(workers.get("restart_backoff", 1.0))
+        self.max_restart_backoff = float(workers.get("max_restart_backoff", 30.0))
+        self.stable_after = float(workers.get("stable_after", 60.0)) # Uptime that clears the crash streak
+        self.stop_timeout = float(workers.get("stop_timeout", 5.0)) # SIGTERM grace before kill()
+
+        shards = workers.get("shards") or [{"name": "ingestion"}]
+        self.workers: Dict[str, WorkerState] = {s["name"]: WorkerState(shard=dict(s)) for s in shards}
+
+        # One deduper for all shards, in the engine process
+        self.deduper = None
+        dedupe_config = config.get("dedupe", {})
+        if len(self.workers) > 1 and dedupe_config.get("enabled", True):
+            self.deduper = NearDuplicateDetector.from_config(dedupe_config)
+        self.suppressed = 0
+
+        self._ctx = multiprocessing.get_context()
+        self._task = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    async def start(self):
+        for worker in self.workers.values():
+            self._spawn(worker)
+        self._task = asyncio.create_task(self._monitor())
+        summary = ", ".join(f"{w.name}={w.shard.get('ingesters') or 'all'}" for w in self.workers.values())
+        self.logger.info(f"Ingestion supervisor started {len(self.workers)} worker(s): {summary}")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(None, self._terminate, w) for w in self.workers.values()))
+        for worker in self.workers.values():
+            self._drop_lane(worker)
+
+    def _worker_config(self, shard: dict) -> dict:
+        config = copy.deepcopy(self.config)
+        if self.deduper is not None:
+            config["dedupe"] = dict(config.get("dedupe", {}), enabled=False)
+        if shard.get("targets"):
+            # Direct targets split across shards: keep their learned schedules apart
+            direct = config.setdefault("direct", {})
+            path = direct.get("state_path", "data/poll_schedule.json")
+            if path:
+                stem, dot, ext = path.rpartition(".")
+                direct["state_path"] = f"{stem}.{shard['name']}.{ext}" if dot else f"{path}.{shard['name']}"
+        return config
+
+    def _spawn(self, worker: WorkerState):
+        worker.lane = self.channel.add_lane()
+        worker.control, heartbeat = self._ctx.Pipe(duplex=False)
+        worker.process = self._ctx.Process(
+            target=self.target,
+            args=(worker.lane, self._worker_config(worker.shard), worker.shard, heartbeat),
+            name=f"ingest-{worker.name}",
+        )
+        # Not a daemon: workers may run their own parser process pools.
+        # They exit on their own when the engine disappears (parent PID check).
+        worker.process.start()
+        # The worker holds the only write ends now (EOF as soon as it dies)
+        worker.lane.close()
+        heartbeat.close()
+        worker.started_at = worker.last_heartbeat = time.monotonic()
+        worker.restart_at = None
+        worker._last = None
+        self.logger.info(f"Worker '{worker.name}' PID: {worker.process.pid}")
+
+    def _terminate(self, worker: WorkerState):
+        proc = worker.process
+        if proc is None:
+            return
+        if proc.is_alive():
+            proc.terminate() # The worker's SIGTERM handler runs its shutdown path
+            proc.join(timeout=self.stop_timeout)
+            if proc.is_alive():
+                self.logger.warning(f"Worker '{worker.name}' ignored SIGTERM for {self.stop_timeout:.0f}s; killing")
+                proc.kill()
+        proc.join(timeout=3)
+
+    def _drop_lane(self, worker: WorkerState):
+        if worker.lane is not None:
+            self.channel.remove_lane(worker.lane)
+            worker.lane = None
+        if worker.control is not None:
+            worker.control.close()
+            worker.control = None
+
+    # ------------------------------------------------------------------
+    # Monitoring
+    # ------------------------------------------------------------------
+    async def _monitor(self):
+        check_every = min(self.heartbeat_interval, 1.0)
+        while True:
+            await asyncio.sleep(check_every)
+            now = time.monotonic()
+            for worker in self.workers.values():
+                self._drain_heartbeats(worker)
+                await self._check(worker, now)
+
+    def _drain_heartbeats(self, worker: WorkerState):
+        while worker.control is not None:
+            try:
+                if not worker.control.poll():
+                    return
+                beat = worker.control.recv()
+            except (EOFError, OSError):
+                return # Worker gone; _check() handles it
+            now = time.monotonic()
+            worker.last_heartbeat = now
+            worker.pushed = beat["pushed"]
+            worker.suppressed = beat["suppressed"]
+            worker.dropped = beat.get("dropped", 0)
+            worker.ingesters = beat.get("ingesters", [])
+            last = worker._last
+            if last and beat["at"] > last["at"]:
+                dt = beat["at"] - last["at"]
+                worker.cpu_pct = 100.0 * (beat["cpu_s"] - last["cpu_s"]) / dt
+                worker.items_per_s = (beat["pushed"] - last["pushed"]) / dt
+            worker._last = beat
+
+    async def _check(self, worker: WorkerState, now: float):
+        if worker.restart_at is not None:
+            if now >= worker.restart_at:
+                self._spawn(worker)
+            return
+
+        proc = worker.process
+        if proc.is_alive() and now - worker.last_heartbeat <= self.stale_after:
+            if worker.crash_streak and now - worker.started_at >= self.stable_after:
+                worker.crash_streak = 0
+            return
+
+        if proc.is_alive():
+            reason = f"no heartbeat for {now - worker.last_heartbeat:.1f}s"
+        else:
+            reason = f"exited with code {proc.exitcode}"
+        await asyncio.get_running_loop().run_in_executor(None, self._terminate, worker)
+        self._drop_lane(worker)
+
+        delay = 0.0
+        if worker.crash_streak:
+            delay = min(self.max_restart_backoff, self.restart_backoff * 2 ** (worker.crash_streak - 1))
+        worker.crash_streak += 1
+        worker.restarts += 1
+        worker.restart_at = time.monotonic() + delay
+        self.logger.error(f"Worker '{worker.name}' down ({reason}); restart #{worker.restarts} in {delay:.1f}s")
+        if delay == 0:
+            self._spawn(worker)
+
+    # ------------------------------------------------------------------
+    # Engine-side helpers
+    # ------------------------------------------------------------------
+    def accept(self, item) -> bool:
+        """Cross-shard near-duplicate check; False = echo, drop it."""
+        if self.deduper is None:
+            return True
+        story = self.deduper.check(item)
+        if story:
+            self.suppressed += 1
+            self.logger.info(
+                f"Suppressed echo from {item.source_id} of {story.story_id} "
+                f"(first seen: {story.first_seen_source}, echoes: {story.echoes})"
+            )
+            return False
+        return True
+
+    def stats(self) -> Dict[str, dict]:
+        now = time.monotonic()
+        out = {}
+        for worker in self.workers.values():
+            alive = bool(worker.process and worker.process.is_alive() and worker.restart_at is None)
+            out[worker.name] = {
+                "pid": worker.process.pid if worker.process else None,
+                "alive": alive,
+                "uptime_s": round(now - worker.started_at, 1) if alive else 0.0,
+                "heartbeat_age_s": round(now - worker.last_heartbeat, 2),
+                "restarts": worker.restarts,
+                "cpu_pct": round(worker.cpu_pct, 1),
+                "items_per_s": round(worker.items_per_s, 3),
+                "pushed": worker.pushed,
+                "suppressed": worker.suppressed,
+                "dropped": worker.dropped,
+                "ingesters": worker.ingesters,
+            }
+        return out
+
+    def format_stats(self) -> str:
+        parts = []
+        for name, s in self.stats().items():
+            state = "up" if s["alive"] else "DOWN"
+            parts.append(
+                f"{name}[{state} pid {s['pid']}]: cpu {s['cpu_pct']:.0f}% "
+                f"{s['items_per_s']:.2f} items/s pushed {s['pushed']} restarts {s['restarts']}"
+            )
+        return " | ".join(parts)
@@ -1,50 +1,93 @@
-
 import asyncio
+import aiohttp
+import json
 import logging
+import random
+import time
 from datetime import datetime
 import tweepy
-import tweepy.asynchronous
 from typing import List, Optional
 from .base import BaseIngester, NewsItem
+from .priority import PRIORITY_SOCIAL
+from src.utils.latency import stamp
+
+TWEET_FIELDS = "created_at,author_id,lang"
+
+
+class StreamHTTPError(Exception):
+    def __init__(self, status: int, body: str = ""):
+        super().__init__(f"HTTP {status}: {body[:200]}")
+        self.status = status
 
-class HFTTwitterStreamer(tweepy.asynchronous.AsyncStreamingClient):
+
+class StreamBackoff:
     """
-    Subclass of AsyncStreamingClient to handle incoming tweets.
+    Reconnect delays per Twitter's filtered-stream guidelines, with jitter:
+    network errors back off linearly (250 ms steps, max 16 s), HTTP errors
+    exponentially from 5 s (max 320 s), rate limits (420/429) from 60 s.
     """
-    def __init__(self, bearer_token, parent_monitor):
-        super().__init__(bearer_token)
-        self.parent = parent_monitor
-        self.logger = logging.getLogger("hedgemony.ingest.twitter.stream")
-
-    async def on_tweet(self, tweet):
-        """Called when a new tweet is received."""
-        # This is where the magic happens - real-time!
-        await self.parent._process_tweet(tweet)
-
-    async def on_error(self, status_code):
-        self.logger.error(f"Stream Error: {status_code}")
-        if status_code == 420:
-            # Rate limit - disconnect (Enhancement: Implement exponential backoff)
-            return False
+
+    def __init__(self, rng: random.Random = None):
+        self.rng = rng or random.Random()
+        self.reset()
+
+    def reset(self):
+        self.network_wait = 0.0
+        self.http_wait = 0.0
+
+    def next_delay(self, error: Exception) -> float:
+        if isinstance(error, StreamHTTPError):
+            floor = 60.0 if error.status in (420, 429) else 5.0
+            self.http_wait = min(320.0, max(floor, self.http_wait * 2))
+            base = self.http_wait
+        else:
+            self.network_wait = min(16.0, self.network_wait + 0.25)
+            base = self.network_wait
+        # Equal jitter: never reconnect in lock-step with other clients
+        return base / 2 + self.rng.uniform(0, base / 2)
+
 
 class TwitterMonitor(BaseIngester):
     """
-    Ingests tweets using Tweepy (Twitter API v2).
-    Supports both Polling and Streaming (Filtered Stream).
+    Ingests tweets from the Twitter API v2.
+    Supports both Polling (recent search) and Streaming (Filtered Stream).
+
+    Streaming runs under a supervisor:
+    - reconnects with jittered back-off (StreamBackoff) after errors / disconnects;
+    - stall detector: the API sends a keep-alive newline every ~20 s, so no bytes
+      for `stall_timeout` seconds means a dead connection -> reconnect;
+    - gap backfill: after a reconnect, recent search from the last seen tweet ID
+      recovers tweets published during the outage (deduplicated with the live
+      stream through the seen store). The last seen ID is kept in the seen
+      store too, so the first connection after a restart backfills the downtime.
+
+    `base_url` points the stream / rules / search calls at a local stand-in server
+    in tests and benchmarks.
     """
     def __init__(self, config: dict):
         super().__init__("twitter", config)
         self.client: Optional[tweepy.Client] = None
-        self.stream_client: Optional[HFTTwitterStreamer] = None
-        
+
         self.poll_interval = config.get("poll_interval", 60)
         self.query = config.get("query", "crypto -is:retweet")
         self.max_results = config.get("max_results", 10)
         self.use_streaming = config.get("use_streaming", True) # Default to streaming for speed
-        
+        self.priority = config.get("priority", PRIORITY_SOCIAL)
+
+        # Stream supervision
+        self.base_url = config.get("base_url", "https://api.twitter.com").rstrip("/")
+        self.stall_timeout = config.get("stall_timeout", 30)
+        self.stable_after = config.get("stable_after", 60) # Connection age that resets the back-off
+        self.backfill_max_results = config.get("backfill_max_results", 100)
+        self.backfill_max_pages = config.get("backfill_max_pages", 5)
+        self.backoff = StreamBackoff()
+        self.last_seen_id: Optional[int] = None
+        self.last_activity: Optional[float] = None # monotonic time of last byte from the stream
+        self.stream_stats = {"connects": 0, "disconnects": 0, "stalls": 0, "backfilled": 0}
+
         self.running = False
         self._task = None
-        
+
         self.bearer_token = config.get("bearer_token")
 
     async def start(self):
@@ -57,52 +100,21 @@ class TwitterMonitor(BaseIngester):
              return
 
         self.running = True
-        
+        saved = self.seen_store.get_cursor(self.name, "last_seen_id")
+        if saved and self.last_seen_id is None:
+            self.last_seen_id = int(saved)
+
         if self.use_streaming:
             self.logger.info("Initializing HFT Twitter Stream...")
-            await self._start_streaming()
+            self._task = asyncio.create_task(self._supervise_stream())
         else:
             self.logger.info(f"Starting Polling Monitor (every {self.poll_interval}s)")
             self.client = tweepy.Client(bearer_token=self.bearer_token)
             self._task = asyncio.create_task(self._poll_loop())
 
-    async def _start_streaming(self):
-        """Setup and start the filtered stream."""
-        self.stream_client = HFTTwitterStreamer(self.bearer_token, self)
-        
-        # 1. Clear existing rules to avoid duplication
-        try:
-            current_rules = await self.stream_client.get_rules()
-            if current_rules and current_rules.data:
-                rule_ids = [r.id for r in current_rules.data]
-                if rule_ids:
-                    await self.stream_client.delete_rules(rule_ids)
-                    self.logger.info(f"Cleared {len(rule_ids)} old rules.")
-        except Exception as e:
-            self.logger.warning(f"Could not clear rules: {e}")
-
-        # 2. Add our specific highly-targeted alpha rule
-        try:
-            # Tweepy async add_rules
-            rule = tweepy.StreamRule(value=self.query, tag="hedgemony-alpha")
-            await self.stream_client.add_rules([rule])
-            self.logger.info(f"Added Stream Rule: {self.query}")
-        except Exception as e:
-            self.logger.error(f"Failed to add rule: {e}")
-            return
-
-        # 3. Start the stream in background task
-        # filter() is long-running
-        self._task = asyncio.create_task(self.stream_client.filter(tweet_fields=["created_at", "author_id", "lang"]))
-        self.logger.info("Twitter Stream ACTIVE. Listening for events...")
-
     async def stop(self):
         self.running = False
-        
-        if self.stream_client:
-            self.logger.info("Disconnecting Stream...")
-            self.stream_client.disconnect()
-            
+
         if self._task:
             self._task.cancel()
             try:
@@ -111,9 +123,146 @@ class TwitterMonitor(BaseIngester):
                 pass
         self.logger.info("Twitter Monitor stopped.")
 
-    async def _process_tweet(self, tweet):
-        """Convert tweet to NewsItem and emit."""
-        # Basic deduplication could happen here if needed
+    # ------------------------------------------------------------------
+    # Filtered stream
+    # ------------------------------------------------------------------
+    def _headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.bearer_token}"}
+
+    async def _sync_rules(self, session: aiohttp.ClientSession):
+        """Replace whatever rules are registered with our alpha rule."""
+        url = f"{self.base_url}/2/tweets/search/stream/rules"
+        async with session.get(url, headers=self._headers()) as resp:
+            if resp.status != 200:
+                raise StreamHTTPError(resp.status, await resp.text())
+            current = (await resp.json()).get("data") or []
+
+        existing = [r for r in current if r.get("value") == self.query]
+        stale = [r["id"] for r in current if r.get("value") != self.query]
+        if stale:
+            async with session.post(url, headers=self._headers(), json={"delete": {"ids": stale}}) as resp:
+                if resp.status != 200:
+                    self.logger.warning(f"Could not clear rules: HTTP {resp.status}")
+                else:
+                    self.logger.info(f"Cleared {len(stale)} old rules.")
+        if not existing:
+            payload = {"add": [{"value": self.query, "tag": "hedgemony-alpha"}]}
+            async with session.post(url, headers=self._headers(), json=payload) as resp:
+                if resp.status not in (200, 201):
+                    raise StreamHTTPError(resp.status, await resp.text())
+            self.logger.info(f"Added Stream Rule: {self.query}")
+
+    async def _supervise_stream(self):
+        """Keep the filtered stream connected for as long as the monitor runs."""
+        session = await self._http_session()
+        rules_synced = False
+        while self.running:
+            connected_at = time.monotonic()
+            try:
+                if not rules_synced:
+                    await self._sync_rules(session)
+                    rules_synced = True
+                await self._stream_once(session)
+                error = ConnectionError("stream closed by server")
+            except asyncio.CancelledError:
+                raise
+            except asyncio.TimeoutError:
+                self.stream_stats["stalls"] += 1
+                error = ConnectionError(f"stalled (no data or keep-alive for {self.stall_timeout}s)")
+            except Exception as e:
+                error = e
+
+            if not self.running:
+                break
+            self.stream_stats["disconnects"] += 1
+            if time.monotonic() - connected_at >= self.stable_after:
+                self.backoff.reset()
+            delay = self.backoff.next_delay(error)
+            self.logger.warning(f"Twitter stream down ({error}). Reconnecting in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def _stream_once(self, session: aiohttp.ClientSession):
+        """One connection: returns / raises when it ends. A read gap > stall_timeout raises TimeoutError."""
+        url = f"{self.base_url}/2/tweets/search/stream"
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=self.stall_timeout)
+        async with session.get(url, headers=self._headers(), params={"tweet.fields": TWEET_FIELDS},
+                               timeout=timeout) as resp:
+            if resp.status != 200:
+                raise StreamHTTPError(resp.status, await resp.text())
+
+            self.stream_stats["connects"] += 1
+            self.last_activity = time.monotonic()
+            self.logger.info("Twitter Stream ACTIVE. Listening for events...")
+            # Capture the gap start now: the live stream advances last_seen_id immediately
+            gap_start = self.last_seen_id
+            backfill = asyncio.create_task(self._backfill(session, gap_start)) if gap_start else None
+            try:
+                async for line in resp.content:
+                    self.last_activity = time.monotonic()
+                    line = line.strip()
+                    if not line:
+                        continue # keep-alive
+                    await self._on_stream_line(line)
+            finally:
+                if backfill and not backfill.done():
+                    backfill.cancel()
+
+    async def _on_stream_line(self, line: bytes):
+        try:
+            payload = json.loads(line)
+        except ValueError:
+            self.logger.warning(f"Undecodable stream line: {line[:100]!r}")
+            return
+        if "data" in payload:
+            await self._process_tweet(tweepy.Tweet(payload["data"]))
+        elif "errors" in payload:
+            self.logger.warning(f"Stream error payload: {payload['errors']}")
+
+    async def _backfill(self, session: aiohttp.ClientSession, since_id: int):
+        """Recent search since the last tweet seen before the outage: recovers what it missed."""
+        url = f"{self.base_url}/2/tweets/search/recent"
+        params = {
+            "query": self.query,
+            "since_id": str(since_id),
+            "max_results": str(max(10, min(100, self.backfill_max_results))),
+            "tweet.fields": TWEET_FIELDS,
+        }
+        recovered = []
+        try:
+            for _ in range(self.backfill_max_pages):
+                async with session.get(url, headers=self._headers(), params=params) as resp:
+                    if resp.status != 200:
+                        self.logger.warning(f"Backfill failed: HTTP {resp.status}")
+                        break
+                    body = await resp.json()
+                recovered.extend(body.get("data") or [])
+                next_token = (body.get("meta") or {}).get("next_token")
+                if not next_token:
+                    break
+                params["next_token"] = next_token
+        except Exception as e:
+            self.logger.warning(f"Backfill error: {e}")
+
+        emitted = 0
+        for data in sorted(recovered, key=lambda d: int(d["id"])): # oldest first
+            if await self._process_tweet(tweepy.Tweet(data)):
+                emitted += 1
+        self.stream_stats["backfilled"] += emitted
+        if recovered:
+            self.logger.info(f"Backfill recovered {emitted} missed tweets ({len(recovered) - emitted} already seen).")
+
+    # ------------------------------------------------------------------
+    # Shared
+    # ------------------------------------------------------------------
+    async def _process_tweet(self, tweet) -> bool:
+        """Convert tweet to NewsItem and emit. Returns False for duplicates."""
+        received = time.monotonic()
+        tweet_id = int(tweet.id)
+        if self.last_seen_id is None or tweet_id > self.last_seen_id:
+            self.last_seen_id = tweet_id
+            self.seen_store.set_cursor(self.name, "last_seen_id", str(tweet_id))
+        if not await self._is_new(tweet.id):
+            return False
         item = NewsItem(
             source_id=f"twitter:{tweet.id}",
             title=tweet.text[:100] + "..." if len(tweet.text) > 100 else tweet.text,
@@ -121,15 +270,19 @@ class TwitterMonitor(BaseIngester):
             published_at=tweet.created_at or datetime.now(),
             content=tweet.text,
             author=str(tweet.author_id),
-            raw_data=tweet.data
+            raw_data=tweet.data,
+            priority=self.priority,
+            stamps={"fetched": received}
         )
+        stamp(item, "parsed")
         self.logger.info(f"🐦 ALERT: {item.title}")
         await self._emit(item)
+        return True
 
     async def _poll_loop(self):
         """Main polling loop (Fallback)."""
         # Keep track of the newest tweet ID we've seen to avoid duplicates
-        since_id = None
+        since_id = self.last_seen_id
 
         while self.running:
             try:
@@ -141,14 +294,14 @@ class TwitterMonitor(BaseIngester):
                     since_id=since_id,
                     tweet_fields=["created_at", "author_id", "lang"]
                 )
-                
+
                 if response and response.data:
                     newest_id = max(t.id for t in response.data)
                     since_id = newest_id
 
                     for tweet in response.data:
                         await self._process_tweet(tweet)
-                
+
             except Exception as e:
                 self.logger.error(f"Error polling Twitter: {e}")
 
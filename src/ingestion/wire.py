@@ -0,0 +1,187 @@
+"""
+NewsItem Wire Format
+
+Compact, fixed-schema binary encoding for NewsItems crossing the worker ->
+engine pipe (replaces pickling the dataclass with its raw payload).
+
+- Field order is fixed (WIRE_FIELDS); datetimes travel as (epoch seconds,
+  UTC offset) so aware and naive timestamps both round-trip.
+- `raw_data` is cut down to RAW_DATA_FIELDS with plain JSON-able values only
+  (feedparser's FeedParserDict / struct_time, tweepy objects and full HTML
+  bodies stay in the worker). The full payload is for debugging, not the brain.
+- Two codecs, chosen by the first byte so either end can decode both:
+    msgpack  (when installed)        - array of the fields
+    struct   (stdlib fallback)       - fixed header + length-prefixed strings
+
+See scripts/benchmarks/bench_wire_codec.py for pickle vs msgpack vs struct.
+"""
+
+import json
+import math
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Tuple
+
+from .base import NewsItem
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+WIRE_FIELDS = (
+    "source_id", "title", "url", "published_at", "content", "author", "impact_score",
+    "ingested_at", "raw_data", "story_id", "first_seen_source", "priority", "stamps",
+)
+
+# raw_data keys worth keeping downstream (IDs, links, timestamps, tickers)
+RAW_DATA_FIELDS = (
+    "id", "link", "published", "updated", "created_at", "author", "author_id",
+    "lang", "domain", "kind", "source", "currencies", "votes",
+)
+
+STRUCT_VERSION = 1 # First byte of struct frames (msgpack arrays start at 0x90)
+_HEADER = struct.Struct("<BhbddhhH") # version, impact, priority, published, ingested, 2x tz minutes, n stamps
+_NO_TZ = -32768
+_NONE = 0xFFFFFFFF
+_U32 = struct.Struct("<I")
+_STAMP = struct.Struct("<Bd")
+
+
+def _plain(value: Any, depth: int = 0) -> Any:
+    """JSON-able copy of value (dicts / lists / scalars); anything else becomes str."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if depth < 3 and isinstance(value, dict):
+        return {str(k): _plain(v, depth + 1) for k, v in value.items()}
+    if depth < 3 and isinstance(value, (list, tuple)):
+        return [_plain(v, depth + 1) for v in value]
+    return str(value)
+
+
+def slim_raw_data(raw: Optional[dict]) -> Optional[dict]:
+    if not raw:
+        return None
+    slim = {k: _plain(raw[k]) for k in RAW_DATA_FIELDS if k in raw and raw[k] is not None}
+    return slim or None
+
+
+def _pack_dt(dt: Optional[datetime]) -> Tuple[float, int]:
+    if dt is None:
+        return math.nan, _NO_TZ
+    offset = dt.utcoffset()
+    return dt.timestamp(), _NO_TZ if offset is None else int(offset.total_seconds() // 60)
+
+
+def _unpack_dt(ts: float, tz_minutes: int) -> Optional[datetime]:
+    if math.isnan(ts):
+        return None
+    if tz_minutes == _NO_TZ:
+        return datetime.fromtimestamp(ts)
+    return datetime.fromtimestamp(ts, timezone(timedelta(minutes=tz_minutes)))
+
+
+# ----------------------------------------------------------------------
+# struct codec
+# ----------------------------------------------------------------------
+def _put_str(out: bytearray, value: Optional[str]):
+    if value is None:
+        out += _U32.pack(_NONE)
+    else:
+        raw = value.encode("utf-8")
+        out += _U32.pack(len(raw))
+        out += raw
+
+
+def _get_str(data: memoryview, pos: int) -> Tuple[Optional[str], int]:
+    (n,) = _U32.unpack_from(data, pos)
+    pos += 4
+    if n == _NONE:
+        return None, pos
+    return str(data[pos:pos + n], "utf-8"), pos + n
+
+
+def _encode_struct(item: NewsItem) -> bytes:
+    published, published_tz = _pack_dt(item.published_at)
+    ingested, ingested_tz = _pack_dt(item.ingested_at)
+    stamps = item.stamps or {}
+    out = bytearray(_HEADER.pack(STRUCT_VERSION, item.impact_score or 0, item.priority,
+                                 published, ingested, published_tz, ingested_tz, len(stamps)))
+    raw = slim_raw_data(item.raw_data)
+    for value in (item.source_id, item.title, item.url, item.content, item.author,
+                  item.story_id, item.first_seen_source, json.dumps(raw) if raw else None):
+        _put_str(out, value)
+    for name, at in stamps.items():
+        key = name.encode("utf-8")
+        out += _STAMP.pack(len(key), at)
+        out += key
+    return bytes(out)
+
+
+def _decode_struct(data: bytes) -> NewsItem:
+    view = memoryview(data)
+    _, impact, priority, published, ingested, published_tz, ingested_tz, n_stamps = _HEADER.unpack_from(view, 0)
+    pos = _HEADER.size
+    strings = []
+    for _ in range(8):
+        value, pos = _get_str(view, pos)
+        strings.append(value)
+    source_id, title, url, content, author, story_id, first_seen, raw = strings
+    stamps = {}
+    for _ in range(n_stamps):
+        n, at = _STAMP.unpack_from(view, pos)
+        pos += _STAMP.size
+        stamps[str(view[pos:pos + n], "utf-8")] = at
+        pos += n
+    return NewsItem(
+        source_id=source_id, title=title, url=url,
+        published_at=_unpack_dt(published, published_tz), content=content, author=author,
+        impact_score=impact, ingested_at=_unpack_dt(ingested, ingested_tz),
+        raw_data=json.loads(raw) if raw else None, story_id=story_id,
+        first_seen_source=first_seen, priority=priority, stamps=stamps,
+    )
+
+
+# ----------------------------------------------------------------------
+# msgpack codec
+# ----------------------------------------------------------------------
+def _encode_msgpack(item: NewsItem) -> bytes:
+    return msgpack.packb([
+        item.source_id, item.title, item.url, _pack_dt(item.published_at), item.content, item.author,
+        item.impact_score, _pack_dt(item.ingested_at), slim_raw_data(item.raw_data), item.story_id,
+        item.first_seen_source, item.priority, item.stamps or {},
+    ], use_bin_type=True)
+
+
+def _decode_msgpack(data: bytes) -> NewsItem:
+    values = msgpack.unpackb(data, raw=False, strict_map_key=False)
+    fields = dict(zip(WIRE_FIELDS, values))
+    fields["published_at"] = _unpack_dt(*fields["published_at"])
+    fields["ingested_at"] = _unpack_dt(*fields["ingested_at"])
+    return NewsItem(**fields)
+
+
+# ----------------------------------------------------------------------
+# Public API
+# ----------------------------------------------------------------------
+DEFAULT_CODEC = "msgpack" if MSGPACK_AVAILABLE else "struct"
+
+
+def encode(item: NewsItem, codec: str = None) -> bytes:
+    codec = codec or DEFAULT_CODEC
+    if codec == "msgpack":
+        if not MSGPACK_AVAILABLE:
+            raise RuntimeError("msgpack codec requested but msgpack is not installed")
+        return _encode_msgpack(item)
+    if codec == "struct":
+        return _encode_struct(item)
+    raise ValueError(f"Unknown wire codec: {codec}")
+
+
+def decode(data: bytes) -> NewsItem:
+    if data[0] == STRUCT_VERSION:
+        return _decode_struct(data)
+    if not MSGPACK_AVAILABLE:
+        raise RuntimeError("Received a msgpack frame but msgpack is not installed")
+    return _decode_msgpack(data)
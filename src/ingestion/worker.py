@@ -1,30 +1,60 @@
+import os
 import time
+import signal
 import asyncio
 import logging
 import traceback
-from multiprocessing import Queue
+from src.ingestion.channel import NewsChannel
 from src.ingestion.stream_manager import StreamManager
+from src.ingestion.dedupe import NearDuplicateDetector
+from src.ingestion.recorder import StreamRecorder
 from src.utils.db import Database
+from src.utils.latency import stamp
 
 class IngestionWorker:
     """
-    Standalone worker process that fetches news and pushes to a queue.
+    Standalone worker process that fetches news and pushes to the engine's channel.
     Run this in a separate multiprocessing.Process.
+
+    Under the IngestionSupervisor a worker runs one shard (a subset of the
+    ingesters / targets), writes to its own channel lane and sends a
+    heartbeat with CPU and throughput counters down its control pipe.
+
+    Capture mode (`record.enabled`) appends every pushed item, with its arrival
+    time, to a segmented log for replay (see recorder.py).
     """
-    def __init__(self, queue: Queue, config: dict):
+    def __init__(self, queue: NewsChannel, config: dict, shard: dict = None, control=None):
         self.queue = queue
         self.config = config
-        self.logger = logging.getLogger("hedgemony.ingestion.worker")
-        
+        self.shard = shard or {}
+        self.name = self.shard.get("name", "ingestion")
+        self.control = control
+        self.heartbeat_interval = (config.get("workers", {}) or {}).get("heartbeat_interval", 1.0)
+        self.logger = logging.getLogger(f"hedgemony.ingestion.worker.{self.name}")
+
+        # Throughput counters (reported with every heartbeat)
+        self.pushed = 0
+        self.suppressed = 0
+
+        # Cross-source near-duplicate suppression (one story -> one council run)
+        dedupe_config = config.get("dedupe", {})
+        self.deduper = None
+        if dedupe_config.get("enabled", True):
+            self.deduper = NearDuplicateDetector.from_config(dedupe_config)
+
+        record_config = config.get("record", {}) or {}
+        self.record_config = record_config if record_config.get("enabled", False) else None
+        self.recorder = None
+
     def run(self):
         """Entry point for the worker process."""
         # Re-configure logging for this process
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - WORKER - %(levelname)s - %(message)s'
+            format=f'%(asctime)s - WORKER[{self.name}] - %(levelname)s - %(message)s'
         )
         self.logger.info("🟢 Ingestion Worker Started")
-        
+
         try:
             asyncio.run(self._async_run())
         except KeyboardInterrupt:
@@ -34,34 +64,80 @@ class IngestionWorker:
             traceback.print_exc()
 
     async def _handle_stream_item(self, item):
-        """Callback for stream manager to push to queue."""
+        """Callback for stream manager to push to the engine channel (wakes the engine)."""
+        if self.deduper:
+            story = self.deduper.check(item)
+            if story:
+                self.suppressed += 1
+                self.logger.info(
+                    f"Suppressed echo from {item.source_id} of {story.story_id} "
+                    f"(first seen: {story.first_seen_source}, echoes: {story.echoes})"
+                )
+                return
         try:
+            stamp(item, "queued")
             self.queue.put(item)
+            self.pushed += 1
+            if self.recorder:
+                self.recorder.append(item)
             self.logger.info(f"Pushed item to queue: {item.title[:50]}...")
         except Exception as e:
             self.logger.error(f"Failed to push to queue: {e}")
 
+    def _heartbeat(self):
+        if self.control is None:
+            return
+        self.control.send({
+            "shard": self.name,
+            "pid": os.getpid(),
+            "at": time.time(),
+            "cpu_s": time.process_time(), # all threads, incl. parser executors
+            "pushed": self.pushed,
+            "suppressed": self.suppressed,
+            "dropped": getattr(self.queue, "dropped", 0), # Shed while the engine wasn't reading
+            "ingesters": [i.name for i in self.stream_manager.ingesters],
+        })
+
     async def _async_run(self):
         """Async loop within the worker process."""
+        parent = os.getppid()
         self.db = Database() # New connection for this process
-        self.stream_manager = StreamManager(self.config)
-        
+        if self.record_config:
+            self.recorder = StreamRecorder.from_config(self.record_config, self.name)
+        self.stream_manager = StreamManager(self.config, self.shard.get("ingesters"), self.shard.get("targets"))
+
         # Connect Pipeline: Stream -> Worker Callback -> Multiprocessing Queue
         self.stream_manager.set_callback(self._handle_stream_item)
-        
-        # Start Ingesters (RSS, Twitter, etc. run as background tasks)
-        await self.stream_manager.start()
-        
-        self.logger.info("🟢 Ingestion Streams Active. Waiting for events...")
 
-        # Keep process alive
+        # SIGTERM (supervisor restart / shutdown) cancels this task, so the
+        # finally below still stops the ingesters and flushes their state
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        except (NotImplementedError, RuntimeError):
+            pass # No loop signal handlers on this platform
+
+        # Keep process alive; the heartbeat doubles as an event-loop liveness probe
         try:
+            # Start Ingesters (RSS, Twitter, etc. run as background tasks)
+            await self.stream_manager.start()
+            self.logger.info("🟢 Ingestion Streams Active. Waiting for events...")
+
             while True:
-                await asyncio.sleep(1)
+                self._heartbeat()
+                self.stream_manager.seen_store.flush_if_due()
+                if os.getppid() != parent:
+                    self.logger.warning("Engine process is gone; worker exiting.")
+                    break
+                await asyncio.sleep(self.heartbeat_interval)
         except asyncio.CancelledError:
             self.logger.info("Worker shutting down...")
+        finally:
             await self.stream_manager.stop()
+            self.queue.flush() # Items still queued for the pipe writer
+            if self.recorder:
+                self.recorder.close()
+
 # Helper for spawning
-def start_ingestion_worker(queue, config):
-    worker = IngestionWorker(queue, config)
+def start_ingestion_worker(queue, config, shard=None, control=None):
+    worker = IngestionWorker(queue, config, shard, control)
     worker.run()
@@ -39,6 +39,11 @@ class PaperTradingExecutor:
         
         self.logger.info(f"Paper Trader Initialized. Balance: ${self.balance:,.2f}")
 
+    async def warm_up(self, symbols: list = None):
+        """Burst mode pre-fetch: load settings before a scheduled release."""
+        self.settings.reload()
+        self.logger.info(f"Paper trader warmed up (balance ${self.balance:,.2f})")
+
     async def execute_signal(self, signal: dict):
         """
         signal format: {
@@ -57,8 +62,8 @@ class PaperTradingExecutor:
         # Dynamic Confidence Threshold
         min_confidence = self.settings.get("brain.confidence_threshold", 0.85)
         
-        # Simple Logic: Only trade if confidence is high
-        if confidence < min_confidence:
+        # Simple Logic: Only trade if confidence is high (or an early quorum met the provisional trade rule)
+        if confidence < min_confidence and not signal['analysis'].get('provisional_trade'):
             self.logger.info(f"Skipping signal (Confidence {confidence:.2f} < Threshold {min_confidence})")
             return
 
@@ -9,6 +9,7 @@ Upgraded Execution Engine handling:
 
 import logging
 import asyncio
+import time
 from datetime import datetime
 from typing import Optional
 import os
@@ -20,6 +21,7 @@ from .exchange import Exchange, OrderResult
 from .binance import BinanceConnector
 from .hyperliquid import HyperliquidConnector
 from src.utils.db import Database
+from src.utils.latency import stamp
 
 # Load environment variables
 load_dotenv()
@@ -68,6 +70,10 @@ class LiveTradingExecutor:
         # Active Management Tasks
         self.active_trades = {} # symbol -> asyncio.Task
         
+        # Burst mode pre-fetch (balance reused by the first trade after a release)
+        self.PREFETCH_TTL_SEC = 300
+        self._prefetched_balance = None # (balance, monotonic time)
+        
     def _init_exchange(self):
         """Initialize the configured exchange."""
         exchange_class = self.EXCHANGE_MAP.get(self.exchange_name)
@@ -91,6 +97,35 @@ class LiveTradingExecutor:
             return await self.exchange.connect()
         return False
     
+    async def warm_up(self, symbols: list = None):
+        """
+        Burst mode pre-fetch ahead of a scheduled release: opens the connector's
+        HTTP connections and caches balance + prices, so the first trade after
+        the release pays no cold-path cost.
+        """
+        if not self.exchange:
+            return
+        started = time.perf_counter()
+        try:
+            balance = await self.exchange.get_balance("USDT")
+            self._prefetched_balance = (balance, time.monotonic())
+            prices = {s: await self.exchange.get_price(s) for s in (symbols or [])}
+            self.logger.info(
+                f"🔥 {self.exchange_name} warmed up in {(time.perf_counter() - started) * 1000:.0f} ms "
+                f"(balance {balance:,.2f}, prices {prices})"
+            )
+        except Exception as e:
+            self.logger.warning(f"Exchange warm-up failed: {e}")
+
+    async def _get_balance(self) -> float:
+        """Use the burst-mode pre-fetched balance while fresh, else ask the exchange."""
+        if self._prefetched_balance:
+            balance, fetched_at = self._prefetched_balance
+            self._prefetched_balance = None # One-shot: a fill changes the balance
+            if time.monotonic() - fetched_at < self.PREFETCH_TTL_SEC:
+                return balance
+        return await self.exchange.get_balance("USDT") # Hyperliquid uses USDC but interface says USDT
+
     async def execute_signal(self, signal: dict):
         """
         Entry point for Engine signals.
@@ -112,12 +147,13 @@ class LiveTradingExecutor:
         3. Manage Trailing Stop
         """
         symbol = signal.get('symbol', 'SOL/USD') # Default to SOL/USD
-        if "SOL" in signal.get('source_item',{}).get('title',"").upper():
+        item = signal.get('source_item')
+        title = getattr(item, 'title', None) or 'Unknown News'
+        if "SOL" in title.upper():
              symbol = "SOL/USD" # Force SOL for now as strategy is tuned for it
              
         conf = signal['analysis']['confidence']
         label = signal['analysis']['label']
-        title = signal['source_item'].get('title', 'Unknown News')
         
         direction = 1 if label == 'positive' else -1
         side = 'buy' if direction == 1 else 'sell'
@@ -139,7 +175,7 @@ class LiveTradingExecutor:
         self.logger.info(f"✅ CONFIRMED! Executing {side.upper()} on {symbol}")
         
         # Calculate Size
-        balance = await self.exchange.get_balance("USDT") # Hyperliquid uses USDC but interface says USDT
+        balance = await self._get_balance()
         if balance <= 0:
             self.logger.error("Zero Balance. Cannot trade.")
             return
@@ -151,8 +187,12 @@ class LiveTradingExecutor:
         # Round quantity (SOL precision 2 decimals usually, safer to int or 1 decimal)
         quantity = round(quantity, 2) 
 
-        # Execute
+        # Execute (the engine's latency record picks up the order segment from these stamps)
+        if item is not None:
+            stamp(item, "order_sent")
         result = await self.exchange.place_order(symbol, side, quantity, "market")
+        if item is not None:
+            stamp(item, "order_filled")
         
         if result.status != 'filled':
             self.logger.error(f"Entry Failed: {result.raw_response}")
@@ -27,7 +27,8 @@ class Database:
                 confidence REAL,
                 impact_score INTEGER DEFAULT 0,
                 ingested_at TIMESTAMP,
-                raw_data TEXT
+                raw_data TEXT,
+                verdict TEXT
             )
         ''')
         
@@ -76,11 +77,25 @@ class Database:
             )
         ''')
         
+        # Per-item latency record (segment -> ms, see utils.latency), one row per logged news item
+        c.execute('''
+            CREATE TABLE IF NOT EXISTS news_latency (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                recorded_at TIMESTAMP,
+                news_id INTEGER UNIQUE,
+                source_id TEXT,
+                url TEXT,
+                total_ms REAL,
+                segments TEXT
+            )
+        ''')
+        
         conn.commit()
         conn.close()
         self.logger.info(f"Database initialized at {self.db_path}")
 
     def log_news(self, item, analysis):
+        """Insert a scored news item; returns its row id (None if the write failed)."""
         try:
             conn = self.get_connection()
             c = conn.cursor()
@@ -90,14 +105,15 @@ class Database:
             # but for this MVP iteration, assuming user can wipe DB or we handle it.
             # Let's just create table if not exists, but if it exists without column we have an issue.
             # Doing a quick "ALTER TABLE" check is better.
-            try:
-                c.execute("ALTER TABLE news ADD COLUMN ingested_at TIMESTAMP")
-            except Exception:
-                pass
+            for column in ("ingested_at TIMESTAMP", "verdict TEXT"):
+                try:
+                    c.execute(f"ALTER TABLE news ADD COLUMN {column}")
+                except Exception:
+                    pass
 
             c.execute('''
-                INSERT INTO news (source_id, title, published_at, sentiment_score, sentiment_label, confidence, impact_score, ingested_at, raw_data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                INSERT INTO news (source_id, title, published_at, sentiment_score, sentiment_label, confidence, impact_score, ingested_at, raw_data, verdict)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 item.source_id,
                 item.title,
@@ -107,13 +123,74 @@ class Database:
                 analysis['confidence'],
                 item.impact_score,
                 item.ingested_at,
-                json.dumps(item.raw_data) if item.raw_data else "{}"
+                json.dumps(item.raw_data) if item.raw_data else "{}",
+                self._verdict_json(analysis)
             ))
+            news_id = c.lastrowid
             conn.commit()
             conn.close()
+            return news_id
         except Exception as e:
             self.logger.error(f"Failed to log news: {e}")
 
+    def update_news_analysis(self, news_id, analysis, impact_score=None):
+        """Replace a logged item's verdict (the full council after a provisional, early-quorum one)."""
+        try:
+            conn = self.get_connection()
+            c = conn.cursor()
+            c.execute('''
+                UPDATE news SET sentiment_score = ?, sentiment_label = ?, confidence = ?,
+                    impact_score = COALESCE(?, impact_score), verdict = ?
+                WHERE id = ?
+            ''', (
+                analysis['score'],
+                analysis['label'],
+                analysis['confidence'],
+                impact_score,
+                self._verdict_json(analysis),
+                news_id
+            ))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            self.logger.error(f"Failed to update news {news_id}: {e}")
+
+    @staticmethod
+    def _verdict_json(analysis):
+        """Council detail kept with the item: each agent's vote, reasoning, provisional or final."""
+        return json.dumps({
+            "provisional": analysis.get('provisional', False),
+            "provisional_trade": analysis.get('provisional_trade', False),
+            "votes": analysis.get('votes', []),
+            "pending": analysis.get('pending', []),
+            "reasoning": analysis.get('reasoning'),
+        }, default=str)
+
+    def log_latency(self, record):
+        """
+        Store a compact latency record {news_id, source_id, url, total_ms, segments},
+        keyed by the item's `news` row id (items without one, e.g. a failed
+        log write, get a row each).
+        """
+        try:
+            conn = self.get_connection()
+            c = conn.cursor()
+            c.execute('''
+                INSERT OR REPLACE INTO news_latency (recorded_at, news_id, source_id, url, total_ms, segments)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (
+                datetime.now(),
+                record.get('news_id'),
+                record['source_id'],
+                record['url'],
+                record['total_ms'],
+                json.dumps(record['segments'])
+            ))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            self.logger.error(f"Failed to log latency: {e}")
+
     def log_trade(self, trade):
         try:
             conn = self.get_connection()
@@ -0,0 +1,139 @@
+"""
+Economic Calendar (Burst Mode)
+
+Most of the market-moving events we trade (CPI 08:30 ET, NFP, FOMC 14:00 ET)
+are scheduled. The calendar file lists each release with its local time and the
+direct targets / symbols it concerns, and this module answers "which phase are
+we in right now?" for both processes:
+
+    ... idle ... | warm-up (lead) | burst (window_before .. window_after) | ... idle ...
+
+- Ingestion worker: polls the release's targets often enough during the lead
+  phase to keep their connections (and cached DNS answers) warm, and polls
+  them sub-second during the burst window.
+- Engine: warms the local models and pre-fetches balance/price at the start of
+  the lead phase.
+
+Calendar file format (config/sources/economic_calendar.json):
+    [{"name": "US CPI (Oct)", "date": "2026-11-12", "time": "08:30",
+      "tz": "America/New_York", "targets": ["BLS CPI Release"], "symbols": ["BTC-PERP"]}]
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger("hedgemony.calendar")
+
+IDLE = "idle"
+WARMUP = "warmup"
+BURST = "burst"
+
+
+@dataclass
+class ScheduledRelease:
+    name: str
+    at: datetime                      # timezone-aware (UTC)
+    targets: List[str] = field(default_factory=list)
+    symbols: List[str] = field(default_factory=list)
+
+
+class EconomicCalendar:
+    def __init__(self, releases: List[ScheduledRelease], warmup_lead: float = 120,
+                 window_before: float = 15, window_after: float = 120,
+                 clock: Callable[[], datetime] = None):
+        self.releases = sorted(releases, key=lambda r: r.at)
+        self.clock = clock or (lambda: datetime.now(timezone.utc)) # Aware UTC "now"; fixed in tests
+        self.warmup_lead = warmup_lead
+        self.window_before = window_before
+        self.window_after = window_after
+
+    @classmethod
+    def from_config(cls, config: dict) -> "EconomicCalendar":
+        path = config.get("calendar_file", "config/sources/economic_calendar.json")
+        return cls(
+            load_releases(path),
+            warmup_lead=config.get("warmup_lead", 120),
+            window_before=config.get("window_before", 15),
+            window_after=config.get("window_after", 120),
+        )
+
+    def _now(self, now: Optional[datetime]) -> datetime:
+        return now or self.clock()
+
+    def phase(self, release: ScheduledRelease, now: datetime = None) -> str:
+        now = self._now(now)
+        delta = (release.at - now).total_seconds()   # > 0 before the release
+        if -self.window_after <= delta <= self.window_before:
+            return BURST
+        if self.window_before < delta <= self.warmup_lead:
+            return WARMUP
+        return IDLE
+
+    def active(self, now: datetime = None, target: str = None) -> List[ScheduledRelease]:
+        """Releases currently in warm-up or burst (optionally only those watching `target`)."""
+        now = self._now(now)
+        out = []
+        for r in self.releases:
+            if target and r.targets and target not in r.targets:
+                continue
+            if self.phase(r, now) != IDLE:
+                out.append(r)
+        return out
+
+    def target_phase(self, target: str, now: datetime = None) -> str:
+        """Most urgent phase across releases that concern `target`."""
+        phases = {self.phase(r, now) for r in self.active(now, target)}
+        if BURST in phases:
+            return BURST
+        if WARMUP in phases:
+            return WARMUP
+        return IDLE
+
+    def seconds_until_next_phase(self, target: str = None, now: datetime = None) -> Optional[float]:
+        """Seconds until the next warm-up begins for `target` (None if nothing is scheduled)."""
+        now = self._now(now)
+        for r in self.releases:
+            if target and r.targets and target not in r.targets:
+                continue
+            start = r.at - timedelta(seconds=self.warmup_lead)
+            if start > now:
+                return (start - now).total_seconds()
+        return None
+
+    def next_release(self, now: datetime = None) -> Optional[ScheduledRelease]:
+        now = self._now(now)
+        for r in self.releases:
+            if r.at + timedelta(seconds=self.window_after) >= now:
+                return r
+        return None
+
+
+def load_releases(path: str) -> List[ScheduledRelease]:
+    try:
+        with open(path, "r") as f:
+            raw = json.load(f)
+    except FileNotFoundError:
+        logger.warning(f"Economic calendar {path} not found. Burst mode has nothing scheduled.")
+        return []
+    except Exception as e:
+        logger.error(f"Failed to load economic calendar {path}: {e}")
+        return []
+
+    releases = []
+    for entry in raw:
+        try:
+            tz = ZoneInfo(entry.get("tz", "America/New_York"))
+            local = datetime.strptime(f"{entry['date']} {entry['time']}", "%Y-%m-%d %H:%M").replace(tzinfo=tz)
+            releases.append(ScheduledRelease(
+                name=entry["name"],
+                at=local.astimezone(timezone.utc),
+                targets=entry.get("targets", []),
+                symbols=entry.get("symbols", []),
+            ))
+        except Exception as e:
+            logger.warning(f"Skipping calendar entry {entry}: {e}")
+    return releases
@@ -0,0 +1,110 @@
+"""
+End-to-end Latency Stamps
+
+Every NewsItem carries `stamps`: stage-boundary name -> time.monotonic().
+CLOCK_MONOTONIC is system-wide, so stamps taken in the ingestion worker and in
+the engine process are directly comparable (same host).
+
+    fetch_start -> fetched -> parsed -> queued -> dequeued
+      -> context_start -> context_end -> analyze_start -> analyze_end
+      -> log_start -> log_end -> execute_start -> execute_end
+    (live)  order_sent -> order_filled
+
+LatencyTracker turns the stamps into named segments (ms), keeps per-source and
+"all" histograms (p50/p95/p99 via RollingStats) and builds the compact record
+persisted by Database.log_latency. Per-agent council timings (FinBERT,
+DeBERTa, Groq) come from `analysis["timings"]` since the agents run in parallel.
+"""
+
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, Optional
+
+from src.utils.stats import RollingStats
+
+# (segment, from stamp, to stamp)
+SEGMENTS = (
+    ("fetch", "fetch_start", "fetched"),           # HTTP request / stream receive
+    ("parse", "fetched", "parsed"),                # feed/page parsing, NewsItem build
+    ("worker", "parsed", "queued"),                # emit callback, cross-source dedupe
+    ("ipc", "queued", "dequeued"),                 # worker -> engine channel
+    ("context_wait", "dequeued", "context_start"),
+    ("context", "context_start", "context_end"),   # memory (vector) search
+    ("analyze_wait", "context_end", "analyze_start"),
+    ("analyze", "analyze_start", "analyze_end"),   # council (see agent:* segments)
+    ("log_wait", "analyze_end", "log_start"),
+    ("log", "log_start", "log_end"),               # DB write
+    ("execute_wait", "log_end", "execute_start"),
+    ("execute", "execute_start", "execute_end"),   # execute_signal
+    ("order", "order_sent", "order_filled"),       # exchange place_order (live)
+)
+
+
+def stamp(item, name: str, at: Optional[float] = None):
+    """Record stage boundary `name` on `item` (monotonic seconds)."""
+    item.stamps[name] = time.monotonic() if at is None else at
+
+
+def segments(stamps: Dict[str, float], only: Iterable[str] = None) -> Dict[str, float]:
+    """Segment durations (ms) for every segment whose two stamps are present."""
+    wanted = set(only) if only else None
+    out = {}
+    for name, start, end in SEGMENTS:
+        if wanted is not None and name not in wanted:
+            continue
+        if start in stamps and end in stamps:
+            out[name] = round((stamps[end] - stamps[start]) * 1000, 3)
+    return out
+
+
+class LatencyTracker:
+    def __init__(self, window: int = 2048):
+        self.window = window
+        # source -> segment -> stats ("all" aggregates every source)
+        self.stats: Dict[str, Dict[str, RollingStats]] = defaultdict(lambda: defaultdict(lambda: RollingStats(self.window)))
+
+    @staticmethod
+    def source_key(source_id: str) -> str:
+        """Histogram bucket for a source: 'direct:SEC Press Releases' stays, 'cryptopanic:123' -> 'cryptopanic'."""
+        kind, _, rest = (source_id or "unknown").partition(":")
+        return kind if kind in ("cryptopanic", "twitter") or not rest else source_id
+
+    def record(self, item, analysis: dict = None, only: Iterable[str] = None) -> dict:
+        """
+        Aggregate the item's segments (optionally just `only`) and return the
+        compact record to persist.
+        """
+        segs = segments(item.stamps, only)
+        if analysis and not only:
+            for agent, ms in (analysis.get("timings") or {}).items():
+                segs[f"agent:{agent}"] = round(ms, 3)
+
+        source = self.source_key(item.source_id)
+        for name, ms in segs.items():
+            self.stats[source][name].add(ms)
+            self.stats["all"][name].add(ms)
+
+        total_ms = None
+        if not only and item.stamps:
+            total_ms = round((max(item.stamps.values()) - min(item.stamps.values())) * 1000, 3)
+            self.stats[source]["total"].add(total_ms)
+            self.stats["all"]["total"].add(total_ms)
+
+        return {"source_id": item.source_id, "url": item.url, "total_ms": total_ms, "segments": segs}
+
+    def summary(self, source: str = "all") -> Dict[str, dict]:
+        """Per-segment stats in pipeline order (agent:* after analyze, total last)."""
+        order = {name: i for i, (name, _, _) in enumerate(SEGMENTS)}
+        order["total"] = len(SEGMENTS) + 1
+
+        def rank(name):
+            return order.get(name, order["analyze"] + 0.5)
+
+        stats = self.stats.get(source, {})
+        return {name: stats[name].summary() for name in sorted(stats, key=rank)}
+
+    def format_summary(self, source: str = "all") -> str:
+        parts = []
+        for name, s in self.summary(source).items():
+            parts.append(f"{name} p50 {s['p50']:.0f}/p95 {s['p95']:.0f}/p99 {s['p99']:.0f}ms")
+        return " | ".join(parts)
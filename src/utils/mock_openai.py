@@ -0,0 +1,178 @@
+"""
+Mock OpenAI-compatible Chat Server
+
+Local stand-in for the Groq API (`/openai/v1/chat/completions`), for tests and
+benchmarks of the Groq client (src/brain/groq_client.py), with no network
+and no API key involved.
+
+- Answers in the OpenAI chat.completion shape with the JSON the Groq agent
+  expects; the sentiment comes from keywords in the headline, or from
+  `responder(messages) -> dict` when given.
+- Rate limits: at most `rpm` requests per sliding minute, beyond that 429
+  with a `retry-after` header. `rate_limit_rate` adds random 429s and the
+  first `rate_limit_first` requests are always refused.
+- Latency: `latency_ms` (+/- `latency_jitter_ms`) before every answer; the
+  first `hang_first` requests hang for `hang_s` (a stuck upstream, for hedging).
+- `/__stats` and `stats`: requests, completions, 429s, peak concurrency.
+
+Run standalone with `python3 -m src.utils.mock_openai --latency-ms 300 --rpm 30`
+and point `brain.groq.base_url` at `http://127.0.0.1:<port>/openai/v1`.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import deque
+from typing import Callable, List, Optional
+
+from aiohttp import web
+
+POSITIVE = ("approves", "approved", "surge", "launch", "beats", "record", "rally", "partnership")
+NEGATIVE = ("hack", "ban", "sue", "lawsuit", "probe", "delay", "rejects", "insolvent", "outflows")
+
+
+def keyword_sentiment(messages: List[dict]) -> dict:
+    """Groq-agent JSON for the headline in the last user message."""
+    text = next((m["content"] for m in reversed(messages) if m.get("role") == "user"), "").lower()
+    headline = text.split("\n", 1)[0]
+    if any(word in headline for word in NEGATIVE):
+        sentiment, score = "negative", 0.15
+    elif any(word in headline for word in POSITIVE):
+        sentiment, score = "positive", 0.85
+    else:
+        sentiment, score = "neutral", 0.5
+    return {"sentiment": sentiment, "score": score, "confidence": 0.8, "impact": 5,
+            "reasoning": f"mock: {sentiment} keywords"}
+
+
+class MockOpenAIServer:
+    def __init__(self, latency_ms: float = 0.0, latency_jitter_ms: float = 0.0, rpm: Optional[int] = None,
+                 rate_limit_rate: float = 0.0, rate_limit_first: int = 0, retry_after_s: float = 1.0,
+                 hang_first: int = 0, hang_s: float = 30.0, responder: Callable[[List[dict]], dict] = None,
+                 seed: int = 7):
+        self.rng = random.Random(seed)
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.rpm = rpm
+        self.rate_limit_rate = rate_limit_rate
+        self.rate_limit_first = rate_limit_first
+        self.retry_after_s = retry_after_s
+        self.hang_first = hang_first
+        self.hang_s = hang_s
+        self.responder = responder or keyword_sentiment
+
+        self.stats = {"requests": 0, "completions": 0, "rate_limited": 0, "unauthorized": 0,
+                      "in_flight": 0, "peak_in_flight": 0}
+        self.prompts: List[str] = [] # User message of every completed request
+        self._window = deque() # Accepted request times (rpm sliding window)
+        self._runner: Optional[web.AppRunner] = None
+        self.port: Optional[int] = None
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI-compatible API root (what `brain.groq.base_url` points at)."""
+        return f"http://127.0.0.1:{self.port}/openai/v1"
+
+    def _rate_limited(self) -> bool:
+        n = self.stats["requests"]
+        if n <= self.rate_limit_first or self.rng.random() < self.rate_limit_rate:
+            return True
+        if self.rpm is not None:
+            now = time.monotonic()
+            while self._window and now - self._window[0] >= 60.0:
+                self._window.popleft()
+            if len(self._window) >= self.rpm:
+                return True
+            self._window.append(now)
+        return False
+
+    async def handle_chat(self, request: web.Request) -> web.Response:
+        self.stats["requests"] += 1
+        n = self.stats["requests"]
+        if not request.headers.get("Authorization", "").startswith("Bearer "):
+            self.stats["unauthorized"] += 1
+            return web.json_response({"error": {"message": "Invalid API Key"}}, status=401)
+        if self._rate_limited():
+            self.stats["rate_limited"] += 1
+            return web.json_response(
+                {"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}},
+                status=429, headers={"retry-after": f"{self.retry_after_s:g}"},
+            )
+
+        body = await request.json()
+        self.stats["in_flight"] += 1
+        self.stats["peak_in_flight"] = max(self.stats["peak_in_flight"], self.stats["in_flight"])
+        try:
+            if n <= self.rate_limit_first + self.hang_first:
+                await asyncio.sleep(self.hang_s)
+            if self.latency_ms or self.latency_jitter_ms:
+                delay = self.latency_ms + self.rng.uniform(-self.latency_jitter_ms, self.latency_jitter_ms)
+                await asyncio.sleep(max(0.0, delay) / 1000.0)
+        finally:
+            self.stats["in_flight"] -= 1
+
+        messages = body.get("messages", [])
+        content = json.dumps(self.responder(messages))
+        prompt = "".join(m.get("content", "") for m in messages)
+        self.prompts.append(next((m["content"] for m in reversed(messages) if m.get("role") == "user"), ""))
+        self.stats["completions"] += 1
+        return web.json_response({
+            "id": f"chatcmpl-mock-{n}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4,
+                      "total_tokens": (len(prompt) + len(content)) // 4},
+        })
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats)
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/openai/v1/chat/completions", self.handle_chat)
+        app.router.add_get("/__stats", self.handle_stats)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0):
+        self._runner = web.AppRunner(self.app(), shutdown_timeout=1.0)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock OpenAI-compatible chat server (Groq stand-in)")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=100.0)
+    parser.add_argument("--rpm", type=int, default=None, help="requests per minute before 429")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="random 429 probability")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    args = parser.parse_args()
+
+    server = MockOpenAIServer(latency_ms=args.latency_ms, latency_jitter_ms=args.latency_jitter_ms, rpm=args.rpm,
+                              rate_limit_rate=args.rate_limit_rate, retry_after_s=args.retry_after)
+
+    async def serve():
+        await server.start(port=args.port)
+        print(f"Mock chat completions at {server.base_url}")
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
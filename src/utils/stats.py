@@ -0,0 +1,47 @@
+"""
+Rolling Statistics
+
+Lightweight, dependency-free latency/queue statistics used by the engine,
+the ingestion worker and the benchmark scripts.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list (pct in 0-100)."""
+    if not values:
+        return 0.0
+    k = max(0, min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1)))))
+    return values[k]
+
+
+class RollingStats:
+    """
+    Keeps the last `window` samples and reports count / mean / p50 / p95 / p99 / max.
+    Samples are whatever unit the caller records (we use milliseconds everywhere).
+    """
+
+    def __init__(self, window: int = 2048):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, value: float):
+        self.samples.append(value)
+        self.count += 1
+
+    def extend(self, values: Iterable[float]):
+        for v in values:
+            self.add(v)
+
+    def summary(self) -> Dict[str, float]:
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "mean": (sum(ordered) / len(ordered)) if ordered else 0.0,
+            "p50": percentile(ordered, 50),
+            "p95": percentile(ordered, 95),
+            "p99": percentile(ordered, 99),
+            "max": ordered[-1] if ordered else 0.0,
+        }
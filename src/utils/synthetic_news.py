@@ -0,0 +1,309 @@
+"""
+Synthetic News Server
+
+Local stand-in for the sources the ingesters poll, for benchmarks and tests:
+hundreds of RSS 2.0 / Atom feeds plus a CryptoPanic-shaped JSON API, with no
+network involved.
+
+    /rss/<n>.xml    /atom/<n>.xml    /api/v1/posts/?auth_token=...    /__stats
+
+- Publishing: every feed (and the API) publishes a Poisson stream at
+  `rate_per_min`, generated lazily from a seeded RNG, keeping the newest
+  `window` items. A few `history` items predate the server start.
+- Every item link carries its publish time (`?pub=<epoch seconds>`), so a
+  consumer in another process can measure detection delay (see
+  `published_at()`).
+- Conditional GET: a fraction `etag_ratio` of the feeds send ETag /
+  Last-Modified and answer 304 to matching If-None-Match / If-Modified-Since.
+  The other feeds always return 200, like many real servers.
+- Fault injection: `latency_ms` (+/- `latency_jitter_ms`) before every
+  response, 500/503 with probability `error_rate`, and a hang of `hang_s`
+  with probability `hang_rate`.
+
+Run standalone with `python3 -m src.utils.synthetic_news --feeds 200`. The
+benchmark harness is scripts/benchmarks/bench_ingestion.py.
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import format_datetime, parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+from aiohttp import web
+
+WORDS = ("Fed", "SEC", "ETF", "bitcoin", "inflation", "rates", "Treasury", "CPI", "payrolls", "approves",
+         "delays", "probe", "stablecoin", "exchange", "listing", "hack", "outflows", "surge", "guidance", "tariffs")
+
+
+def published_at(url: str) -> Optional[float]:
+    """Publish time (epoch seconds) embedded in a synthetic item link, else None."""
+    values = parse_qs(urlparse(url or "").query).get("pub")
+    try:
+        return float(values[0]) if values else None
+    except ValueError:
+        return None
+
+
+@dataclass
+class SyntheticFeed:
+    name: str
+    kind: str                     # "rss" | "atom" | "api"
+    rate_per_min: float
+    conditional: bool
+    rng: random.Random
+    window: int = 20
+    items: List[dict] = field(default_factory=list)
+    next_at: float = 0.0
+    published: int = 0
+
+    def advance(self, now: float):
+        """Publish everything scheduled up to `now` (epoch seconds)."""
+        rate = self.rate_per_min / 60.0
+        if rate <= 0:
+            return
+        while self.next_at <= now:
+            self._publish(self.next_at)
+            self.next_at += self.rng.expovariate(rate)
+
+    def _publish(self, at: float):
+        self.published += 1
+        n = self.published
+        words = " ".join(self.rng.choice(WORDS) for _ in range(6))
+        self.items.append({
+            "id": f"{self.name}-{n}",
+            "title": f"{self.name} #{n}: {words}",
+            "link": f"http://synthetic.local/{self.name}/{n}?pub={at:.3f}",
+            "published": at,
+            "summary": f"Synthetic story {n} from {self.name}. " + words * 4,
+        })
+        del self.items[:-self.window]
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.name}-{self.published}"'
+
+    @property
+    def last_modified(self) -> float:
+        return self.items[-1]["published"] if self.items else 0.0
+
+
+class SyntheticNewsServer:
+    def __init__(self, feeds: int = 100, atom_ratio: float = 0.5, rate_per_min: float = 1.0,
+                 api_rate_per_min: float = 6.0, etag_ratio: float = 0.8, latency_ms: float = 0.0,
+                 latency_jitter_ms: float = 0.0, error_rate: float = 0.0, hang_rate: float = 0.0,
+                 hang_s: float = 30.0, history: int = 5, seed: int = 7):
+        self.rng = random.Random(seed)
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.error_rate = error_rate
+        self.hang_rate = hang_rate
+        self.hang_s = hang_s
+
+        now = time.time()
+        self.feeds: Dict[str, SyntheticFeed] = {}
+        n_atom = int(round(feeds * atom_ratio))
+        for i in range(feeds):
+            kind = "atom" if i < n_atom else "rss"
+            self._add(SyntheticFeed(f"{kind}-{i}", kind, rate_per_min, self.rng.random() < etag_ratio,
+                                    random.Random(self.rng.random())), now, history)
+        self.api = SyntheticFeed("cryptopanic", "api", api_rate_per_min, False, random.Random(self.rng.random()),
+                                 window=50)
+        self._add(self.api, now, history)
+
+        self.stats = {"requests": 0, "not_modified": 0, "errors": 0, "hangs": 0, "bytes": 0}
+        self.started = time.monotonic()
+        self._runner: Optional[web.AppRunner] = None
+        self.port: Optional[int] = None
+
+    def _add(self, feed: SyntheticFeed, now: float, history: int):
+        for k in range(history, 0, -1):
+            feed._publish(now - 600 - 60 * k) # Back catalogue: well before the run
+        rate = feed.rate_per_min / 60.0
+        feed.next_at = now + (feed.rng.expovariate(rate) if rate > 0 else math.inf)
+        if feed.kind != "api":
+            self.feeds[feed.name] = feed
+
+    # ------------------------------------------------------------------
+    # URLs
+    # ------------------------------------------------------------------
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def feed_urls(self) -> List[str]:
+        return [f"{self.base_url}/{f.kind}/{f.name.split('-')[1]}.xml" for f in self.feeds.values()]
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.base_url}/api/v1/posts/"
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _rss(feed: SyntheticFeed) -> str:
+        items = "".join(
+            f"<item><title>{escape(i['title'])}</title><link>{escape(i['link'])}</link>"
+            f"<guid isPermaLink=\"false\">{i['id']}</guid>"
+            f"<pubDate>{format_datetime(datetime.fromtimestamp(i['published'], timezone.utc))}</pubDate>"
+            f"<description>{escape(i['summary'])}</description></item>"
+            for i in reversed(feed.items)
+        )
+        return (f'<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+                f"<title>{feed.name}</title><link>http://synthetic.local/{feed.name}</link>{items}</channel></rss>")
+
+    @staticmethod
+    def _atom(feed: SyntheticFeed) -> str:
+        def iso(ts):
+            return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+        entries = "".join(
+            f"<entry><title>{escape(i['title'])}</title><link href=\"{escape(i['link'])}\"/>"
+            f"<id>{i['id']}</id><updated>{iso(i['published'])}</updated><published>{iso(i['published'])}</published>"
+            f"<summary>{escape(i['summary'])}</summary></entry>"
+            for i in reversed(feed.items)
+        )
+        return (f'<?xml version="1.0" encoding="utf-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+                f"<title>{feed.name}</title><id>urn:{feed.name}</id><updated>{iso(feed.last_modified)}</updated>"
+                f"{entries}</feed>")
+
+    # ------------------------------------------------------------------
+    # Handlers
+    # ------------------------------------------------------------------
+    async def _faults(self) -> Optional[web.Response]:
+        self.stats["requests"] += 1
+        if self.latency_ms or self.latency_jitter_ms:
+            delay = self.latency_ms + self.rng.uniform(-self.latency_jitter_ms, self.latency_jitter_ms)
+            await asyncio.sleep(max(0.0, delay) / 1000.0)
+        roll = self.rng.random()
+        if roll < self.hang_rate:
+            self.stats["hangs"] += 1
+            await asyncio.sleep(self.hang_s)
+        elif roll < self.hang_rate + self.error_rate:
+            self.stats["errors"] += 1
+            return web.Response(status=self.rng.choice((500, 503)), text="synthetic failure")
+        return None
+
+    async def handle_feed(self, request: web.Request) -> web.Response:
+        failure = await self._faults()
+        if failure:
+            return failure
+        kind, number = request.match_info["kind"], request.match_info["n"]
+        feed = self.feeds.get(f"{kind}-{number}")
+        if feed is None:
+            raise web.HTTPNotFound()
+        feed.advance(time.time())
+
+        headers = {}
+        if feed.conditional:
+            last_modified = format_datetime(datetime.fromtimestamp(int(feed.last_modified), timezone.utc), usegmt=True)
+            headers = {"ETag": feed.etag, "Last-Modified": last_modified}
+            if request.headers.get("If-None-Match") == feed.etag or self._not_modified_since(request, feed):
+                self.stats["not_modified"] += 1
+                return web.Response(status=304, headers=headers)
+
+        body = (self._atom(feed) if kind == "atom" else self._rss(feed)).encode()
+        self.stats["bytes"] += len(body)
+        content_type = "application/atom+xml" if kind == "atom" else "application/rss+xml"
+        return web.Response(body=body, headers=headers, content_type=content_type)
+
+    @staticmethod
+    def _not_modified_since(request: web.Request, feed: SyntheticFeed) -> bool:
+        since = request.headers.get("If-Modified-Since")
+        if not since or "If-None-Match" in request.headers:
+            return False
+        try:
+            return int(feed.last_modified) <= parsedate_to_datetime(since).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+    async def handle_api(self, request: web.Request) -> web.Response:
+        failure = await self._faults()
+        if failure:
+            return failure
+        if not request.query.get("auth_token"):
+            return web.json_response({"status": "Incomplete", "info": "Missing auth_token"}, status=401)
+        self.api.advance(time.time())
+        results = [{
+            "kind": "news",
+            "domain": "synthetic.local",
+            "id": self.api.published - k,
+            "title": item["title"],
+            "url": item["link"],
+            "created_at": datetime.fromtimestamp(item["published"], timezone.utc).isoformat(),
+            "currencies": [{"code": "BTC", "title": "Bitcoin"}],
+        } for k, item in enumerate(reversed(self.api.items))]
+        response = web.json_response({"count": len(results), "results": results})
+        self.stats["bytes"] += len(response.body)
+        return response
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        elapsed = time.monotonic() - self.started
+        stats = dict(self.stats, elapsed_s=round(elapsed, 3),
+                     requests_per_s=round(self.stats["requests"] / elapsed, 2) if elapsed else 0.0,
+                     published=sum(f.published for f in self.feeds.values()) + self.api.published)
+        return web.json_response(stats)
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get(r"/{kind:rss|atom}/{n:\d+}.xml", self.handle_feed)
+        app.router.add_get("/api/v1/posts/", self.handle_api)
+        app.router.add_get("/__stats", self.handle_stats)
+        return app
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    async def start(self, host: str = "127.0.0.1", port: int = 0):
+        self._runner = web.AppRunner(self.app(), shutdown_timeout=1.0)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        self.started = time.monotonic()
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic RSS/Atom + CryptoPanic-style news server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--feeds", type=int, default=100)
+    parser.add_argument("--atom-ratio", type=float, default=0.5)
+    parser.add_argument("--rate-per-min", type=float, default=1.0, help="items per feed per minute")
+    parser.add_argument("--api-rate-per-min", type=float, default=6.0)
+    parser.add_argument("--etag-ratio", type=float, default=0.8)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = SyntheticNewsServer(
+        feeds=args.feeds, atom_ratio=args.atom_ratio, rate_per_min=args.rate_per_min,
+        api_rate_per_min=args.api_rate_per_min, etag_ratio=args.etag_ratio, latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms, error_rate=args.error_rate, hang_rate=args.hang_rate,
+    )
+
+    async def serve():
+        await server.start(port=args.port)
+        print(f"Serving {len(server.feeds)} feeds at {server.base_url} (API: {server.api_url})")
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+
+@pytest.fixture
+def tiny_nli_model(tmp_path):
+    """
+    Factory for a randomly initialised 2-layer BERT NLI model and a word-level
+    tokenizer over the words of `texts` (no downloads): make(texts) -> (model, tokenizer).
+    """
+    torch = pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+
+    def make(texts):
+        words = {w.lower().strip(".,;$%") for text in texts for w in text.split()}
+        vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", ".", ",", ";", "$", "%"] + sorted(w for w in words if w)
+        vocab_file = tmp_path / "vocab.txt"
+        vocab_file.write_text("\n".join(vocab))
+        tokenizer = transformers.BertTokenizerFast(str(vocab_file))
+
+        torch.manual_seed(0)
+        config = transformers.BertConfig(
+            vocab_size=len(vocab), hidden_size=32, num_hidden_layers=2, num_attention_heads=2, intermediate_size=64,
+            num_labels=3, id2label={0: "contradiction", 1: "neutral", 2: "entailment"},
+            label2id={"contradiction": 0, "neutral": 1, "entailment": 2},
+        )
+        return transformers.BertForSequenceClassification(config).eval(), tokenizer
+
+    return make
+
+
+@pytest.fixture
+def stub_brain(monkeypatch):
+    """
+    Factory for a fresh (non-singleton) SentimentEngine with stub agents (no models, no API key):
+    make(config=None, finbert="positive", deberta="positive", groq=None, load_delay=None, calls=None,
+    **engine_kwargs) -> SentimentEngine.
+
+    `finbert` / `deberta` are the labels the local agents vote (score and confidence 0.7),
+    `groq` the Groq analyzer (None: Groq is off), `load_delay` seconds each agent's
+    init sleeps, and `calls` (a list) records every local agent invocation.
+    Batching is off unless `config` turns it on.
+    """
+    from src.brain.sentiment import SentimentEngine
+
+    def make(config=None, finbert="positive", deberta="positive", groq=None, load_delay=None, calls=None,
+             **engine_kwargs):
+        def init(agent, attr, value):
+            def load(self):
+                time.sleep((load_delay or {}).get(agent, 0.0))
+                setattr(self, attr, value)
+            return load
+
+        def vote(agent, label):
+            def analyze(self, text):
+                if calls is not None:
+                    calls.append(agent)
+                return {"label": label, "score": 0.7, "confidence": 0.7}
+            return analyze
+
+        monkeypatch.setattr(SentimentEngine, "_init_groq", init("groq", "groq_analyzer", groq))
+        monkeypatch.setattr(SentimentEngine, "_init_finbert", init("finbert", "finbert_pipe", object()))
+        monkeypatch.setattr(SentimentEngine, "_init_deberta", init("deberta", "deberta_pipe", object()))
+        monkeypatch.setattr(SentimentEngine, "_analyze_finbert", vote("finbert", finbert))
+        monkeypatch.setattr(SentimentEngine, "_analyze_deberta", vote("deberta", deberta))
+
+        SentimentEngine._instance = None
+        return SentimentEngine({"batching": {"enabled": False}, **(config or {})}, **engine_kwargs)
+
+    yield make
+    SentimentEngine._instance = None
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+pytest.importorskip("onnxruntime")
+
+from src.brain.backends import OnnxModel, SequenceClassifier, agreement, export_onnx, load_model
+from src.brain.zero_shot import ZeroShotScorer
+
+CORPUS = os.path.join(os.path.dirname(__file__), "data", "parity_headlines.txt")
+LABELS = ["bullish news", "bearish news", "neutral news"]
+
+
+def _headlines():
+    with open(CORPUS) as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def test_onnx_fp32_matches_eager(tmp_path, tiny_nli_model):
+    model, tokenizer = tiny_nli_model(_headlines() + [f"This example is {l}." for l in LABELS])
+    onnx = OnnxModel(export_onnx(model, tokenizer, str(tmp_path / "onnx")), model.config)
+    headlines = _headlines()
+
+    # Sequence classification (FinBERT path)
+    report = agreement(SequenceClassifier(model, tokenizer)(headlines, batch_size=8),
+                       SequenceClassifier(onnx, tokenizer)(headlines, batch_size=8))
+    assert report["label_agreement"] == 1.0
+    assert report["max_score_diff"] < 1e-4
+
+    # Zero-shot (DeBERTa path)
+    eager = ZeroShotScorer(model, tokenizer, LABELS)(headlines)
+    exported = ZeroShotScorer(onnx, tokenizer, LABELS)(headlines)
+    for want, got in zip(eager, exported):
+        assert got["labels"] == want["labels"]
+        assert got["scores"] == pytest.approx(want["scores"], abs=1e-4)
+
+
+def test_export_is_cached_and_invalidated(tmp_path, monkeypatch, tiny_nli_model):
+    model, tokenizer = tiny_nli_model(_headlines() + [f"This example is {l}." for l in LABELS])
+    directory = str(tmp_path / "onnx")
+    path = export_onnx(model, tokenizer, directory)
+    built = os.path.getmtime(path)
+    assert export_onnx(model, tokenizer, directory) == path
+    assert os.path.getmtime(path) == built # Reused
+
+    int8 = export_onnx(model, tokenizer, directory, quantize=True)
+    assert int8.endswith("model.int8.onnx") and os.path.exists(int8)
+    assert len(SequenceClassifier(OnnxModel(int8, model.config), tokenizer)(_headlines())) == len(_headlines())
+
+    monkeypatch.setattr(transformers, "__version__", "0.0.0-upgraded")
+    os.utime(path, (0, 0))
+    export_onnx(model, tokenizer, directory)
+    assert os.path.getmtime(path) != 0 # Library changed: re-exported
+    assert not os.path.exists(int8) # ...and the stale int8 graph dropped
+
+
+# Real checkpoints on the fixed corpus (downloads the models): HEDGEMONY_PARITY_MODELS=1
+real_models = pytest.mark.skipif(not os.environ.get("HEDGEMONY_PARITY_MODELS"), reason="set HEDGEMONY_PARITY_MODELS=1")
+TOLERANCE = {"onnx": (1.0, 1e-3), "onnx-int8": (0.9, 0.05)} # min label agreement, max mean score drift
+
+
+@real_models
+@pytest.mark.parametrize("backend", ["onnx", "onnx-int8"])
+def test_finbert_parity(tmp_path, backend):
+    headlines = _headlines()
+    eager = SequenceClassifier(*load_model("ProsusAI/finbert"))(headlines, batch_size=8)
+    other = SequenceClassifier(*load_model("ProsusAI/finbert", backend, {"cache_dir": str(tmp_path)}))(headlines, batch_size=8)
+    report = agreement(eager, other)
+    min_agreement, max_drift = TOLERANCE[backend]
+    assert report["label_agreement"] >= min_agreement
+    assert report["mean_score_diff"] <= max_drift
+
+
+@real_models
+@pytest.mark.parametrize("backend", ["onnx", "onnx-int8"])
+def test_deberta_parity(tmp_path, backend):
+    name = "MoritzLaurer/DeBERTa-v3-base-mnli-fever-anli"
+    headlines = _headlines()
+    eager = ZeroShotScorer(*load_model(name), LABELS)(headlines)
+    other = ZeroShotScorer(*load_model(name, backend, {"cache_dir": str(tmp_path)}), LABELS)(headlines)
+    report = agreement([{"label": r["labels"][0], "score": r["scores"][0]} for r in eager],
+                       [{"label": r["labels"][0], "score": r["scores"][0]} for r in other])
+    min_agreement, max_drift = TOLERANCE[backend]
+    assert report["label_agreement"] >= min_agreement
+    assert report["mean_score_diff"] <= max_drift
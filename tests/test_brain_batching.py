@@ -0,0 +1,79 @@
+import asyncio
+import threading
+
+from src.brain.batching import MicroBatcher
+
+
+def test_concurrent_requests_share_one_sorted_batch():
+    calls = []
+
+    def batch_fn(texts):
+        calls.append(list(texts))
+        return [t.upper() for t in texts]
+
+    async def run():
+        batcher = MicroBatcher(batch_fn, max_batch=8, max_wait_ms=20)
+        texts = ["a b c d", "a", "a b c", "a b"]
+        results = await asyncio.gather(*(batcher.submit(t) for t in texts))
+        batcher.close()
+        return texts, results, batcher
+
+    texts, results, batcher = asyncio.run(run())
+    assert results == [t.upper() for t in texts] # Each caller gets its own result back
+    assert calls == [["a", "a b", "a b c", "a b c d"]] # One pass, shortest first
+    assert batcher.batches == 1 and batcher.items == 4
+
+
+def test_batch_cap_flushes_without_waiting():
+    sizes = []
+    threads = set()
+
+    def batch_fn(texts):
+        sizes.append(len(texts))
+        threads.add(threading.current_thread().name)
+        return list(texts)
+
+    async def run():
+        batcher = MicroBatcher(batch_fn, name="cap", max_batch=3, max_wait_ms=10_000)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.gather(*(batcher.submit(str(i)) for i in range(6)))
+        batcher.close()
+        return loop.time() - started
+
+    elapsed = asyncio.run(run())
+    assert sizes == [3, 3]
+    assert elapsed < 1.0 # Never waited for the 10s window
+    assert len(threads) == 1 and threads.pop().startswith("batch-cap")
+
+
+def test_batch_failure_reaches_every_caller():
+    def batch_fn(texts):
+        raise RuntimeError("model exploded")
+
+    async def run():
+        batcher = MicroBatcher(batch_fn, max_wait_ms=1)
+        results = await asyncio.gather(batcher.submit("x"), batcher.submit("y"), return_exceptions=True)
+        batcher.close()
+        return results
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_one_bad_input_only_fails_its_caller():
+    def batch_fn(texts):
+        if "poison" in texts:
+            raise ValueError("tokenizer choked")
+        return [t.upper() for t in texts]
+
+    async def run():
+        batcher = MicroBatcher(batch_fn, max_wait_ms=5)
+        results = await asyncio.gather(*(batcher.submit(t) for t in ("a", "poison", "b")), return_exceptions=True)
+        batcher.close()
+        return results, batcher.stats()
+
+    results, stats = asyncio.run(run())
+    assert results[0] == "A" and results[2] == "B"
+    assert isinstance(results[1], ValueError)
+    assert stats["failed_batches"] == 1 and stats["failed_items"] == 1
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from src.brain.council import CascadePolicy, collect_votes, tally_votes
+
+
+def _votes(*labels):
+    return [{"agent": agent, "label": label, "score": 0.7, "conf": 0.7}
+            for agent, label in zip(("FinBERT", "DeBERTa"), labels)]
+
+
+def test_tally_matches_two_thirds_rule():
+    unanimous = tally_votes(_votes("positive", "positive") + [{"agent": "Groq", "label": "positive", "score": 0.9, "conf": 0.9}])
+    assert unanimous["label"] == "positive" and unanimous["confidence"] > 1.0
+    assert "GOD MODE" in unanimous["reasoning"]
+
+    split = tally_votes(_votes("positive", "negative") + [{"agent": "Groq", "label": "neutral", "score": 0.5, "conf": 0.5}])
+    assert split["label"] == "neutral" and split["score"] == 0.0
+    assert "NO CONSENSUS" in split["reasoning"]
+
+    assert collect_votes({"label": "neutral", "score": 0}, None, None) == [] # Groq with no score doesn't vote
+
+
+def test_groq_only_asked_when_it_can_change_the_decision():
+    policy = CascadePolicy(min_impact=5, confidence_threshold=0.85)
+    assert policy.groq_needed(_votes("positive", "positive"), impact=1) == (False, "gate")
+    assert policy.groq_needed(_votes("neutral", "neutral"), impact=5) == (False, "decided") # Neutral whatever Groq says
+    assert policy.groq_needed(_votes("positive", "positive"), impact=5) == (True, "open") # Groq decides the trade
+    assert policy.groq_needed(_votes("positive", "negative"), impact=5) == (True, "open")
+    assert policy.groq_first(10) and not policy.groq_first(5)
+
+
+def test_latency_budget():
+    assert CascadePolicy().groq_timeout(1000) is None
+    policy = CascadePolicy(latency_budget_ms=1000, min_groq_ms=250)
+    assert policy.groq_timeout(200) == pytest.approx(0.8)
+    assert policy.groq_timeout(800) == 0.0
+
+
+class _Groq:
+    def __init__(self, label, delay=0.0):
+        self.label, self.delay, self.calls = label, delay, 0
+
+    async def analyze(self, text, historical_events=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"label": self.label, "score": 0.9, "confidence": 0.9, "impact": 7}
+
+
+@pytest.fixture
+def make_brain(stub_brain):
+    def make(local_label, groq, **cascade):
+        return stub_brain({"confidence_threshold": 0.85, "cascade": {"enabled": True, **cascade}},
+                          finbert=local_label, deberta=local_label, groq=groq)
+    return make
+
+
+def test_decided_council_skips_groq(make_brain):
+    groq = _Groq("positive")
+    brain = make_brain("neutral", groq, min_impact=1)
+    verdict = asyncio.run(brain.analyze("Exchange publishes monthly report"))
+    assert groq.calls == 0
+    assert verdict["label"] == "neutral" and verdict["complete"]
+    assert verdict["cascade"] == {"impact": 1, "groq": "decided"}
+
+    stats = brain.cascade_stats()
+    assert stats["invocation_rate"] == {"groq": 0.0, "finbert": 1.0, "deberta": 1.0}
+    assert stats["groq_skipped"]["decided"] == 1
+
+
+def test_open_vote_asks_groq(make_brain):
+    groq = _Groq("positive")
+    brain = make_brain("positive", groq, min_impact=1)
+    verdict = asyncio.run(brain.analyze("Exchange lists new token"))
+    assert groq.calls == 1
+    assert verdict["label"] == "positive" and verdict["confidence"] >= 0.85 # Unanimous: tradeable
+    assert verdict["impact"] == 7 and verdict["cascade"]["groq"] == "called"
+
+
+def test_impact_gate_keeps_groq_out(make_brain):
+    groq = _Groq("positive")
+    brain = make_brain("positive", groq, min_impact=5)
+    verdict = asyncio.run(brain.analyze("Exchange publishes monthly report"))
+    assert groq.calls == 0 and verdict["cascade"]["groq"] == "gate"
+    assert verdict["impact"] == 1 # Keyword impact
+    assert verdict["complete"]
+
+
+def test_groq_over_budget_is_incomplete(make_brain):
+    groq = _Groq("positive", delay=0.5)
+    brain = make_brain("positive", groq, min_impact=1, latency_budget_ms=50, min_groq_ms=10)
+    verdict = asyncio.run(brain.analyze("Exchange lists new token"))
+    assert verdict["cascade"]["groq"] == "timeout"
+    assert verdict["label"] == "positive" and verdict["confidence"] < 0.85 # Two local votes never trade
+    assert not verdict["complete"]
+    assert brain.cascade_stats()["groq_timeouts"] == 1
@@ -0,0 +1,140 @@
+import asyncio
+import time
+
+import pytest
+
+from src.brain.groq_client import GroqClient, GroqError, TokenBucket, build_user_prompt, estimate_tokens
+from src.brain.llm_sentiment import GroqAnalyzer
+from src.utils.mock_openai import MockOpenAIServer
+
+MESSAGES = [{"role": "system", "content": "Output JSON."}, {"role": "user", "content": "News: SEC approves ETF"}]
+
+
+def _with_server(server, fn):
+    async def run():
+        await server.start()
+        try:
+            return await fn()
+        finally:
+            await server.stop()
+    return asyncio.run(run())
+
+
+def test_identical_prompts_share_one_call():
+    server = MockOpenAIServer(latency_ms=100)
+
+    async def run():
+        client = GroqClient("key", base_url=server.base_url)
+        answers = await asyncio.gather(*(client.complete(MESSAGES) for _ in range(5)))
+        await client.close()
+        return client, answers
+
+    client, answers = _with_server(server, run)
+    assert len(set(answers)) == 1
+    assert server.stats["completions"] == 1
+    assert client.stats()["coalesced"] == 4 and client.stats()["calls"] == 5
+
+
+def test_429_backs_off_with_retry_after():
+    server = MockOpenAIServer(rate_limit_first=1, retry_after_s=0.05)
+
+    async def run():
+        client = GroqClient("key", base_url=server.base_url, timeout=2.0)
+        answer = await client.complete(MESSAGES)
+        await client.close()
+        return client, answer
+
+    client, answer = _with_server(server, run)
+    assert '"positive"' in answer
+    stats = client.stats()
+    assert stats["rate_limited"] == 1 and stats["retries"] == 1 and stats["http_requests"] == 2
+
+
+def test_deadline_bounds_the_call():
+    server = MockOpenAIServer(latency_ms=500)
+
+    async def run():
+        client = GroqClient("key", base_url=server.base_url, timeout=0.1)
+        started = time.monotonic()
+        with pytest.raises(GroqError):
+            await client.complete(MESSAGES)
+        elapsed = time.monotonic() - started
+        await client.close()
+        return client, elapsed
+
+    client, elapsed = _with_server(server, run)
+    assert elapsed < 0.4
+    assert client.stats()["timeouts"] == 1
+
+
+def test_hedged_request_beats_a_stuck_one():
+    server = MockOpenAIServer(hang_first=1, hang_s=5.0, latency_ms=10)
+
+    async def run():
+        client = GroqClient("key", base_url=server.base_url, timeout=2.0, hedge_after_ms=50)
+        started = time.monotonic()
+        await client.complete(MESSAGES)
+        elapsed = time.monotonic() - started
+        await client.close()
+        return client, elapsed
+
+    client, elapsed = _with_server(server, run)
+    assert elapsed < 1.0
+    assert client.stats()["hedges"] == 1 and client.stats()["hedge_wins"] == 1
+
+
+def test_token_bucket_waits_then_refuses_past_deadline():
+    async def run():
+        bucket = TokenBucket(rate_per_min=600, capacity=1) # 10 per second
+        await bucket.acquire(1, deadline=time.monotonic() + 1)
+        waited = await bucket.acquire(1, deadline=time.monotonic() + 1)
+        with pytest.raises(GroqError):
+            await bucket.acquire(1, deadline=time.monotonic() + 0.01)
+        return waited
+
+    assert 0.05 < asyncio.run(run()) < 0.3
+
+
+def test_token_budget_refusal_refunds_the_request_slot():
+    client = GroqClient("key", rpm=2, tpm=10) # Any prompt costs more tokens than are left
+    client.tokens_bucket.tokens = 0
+    payload = {"model": client.model, "messages": MESSAGES}
+
+    async def run():
+        client._bind_loop()
+        with pytest.raises(GroqError):
+            await client._request(payload, deadline=time.monotonic() + 0.01)
+
+    asyncio.run(run())
+    assert client.requests_bucket.tokens == pytest.approx(2, abs=0.01) # Slot given back
+    assert client.stats()["throttled"] == 1
+
+
+def test_from_config_passes_every_knob():
+    client = GroqClient.from_config({"backoff_s": 0.1, "coalesce": False, "hedge_after_ms": 300}, "key")
+    assert (client.backoff_s, client.coalesce, client.hedge_after_ms) == (0.1, False, 300)
+
+
+def test_prompt_fits_the_budget():
+    events = [{"text": f"Past event number {i} " * 10, "metadata": {"impact": i}, "similarity": i / 100}
+              for i in range(50)]
+    prompt = build_user_prompt("SEC approves spot bitcoin ETF", events, budget_tokens=200)
+    assert prompt.startswith("News: SEC approves spot bitcoin ETF\n")
+    assert estimate_tokens(prompt) <= 200 + 5
+    assert "(Impact: 49)" in prompt and "(Impact: 0)" not in prompt # Most similar first
+    assert build_user_prompt("Fed holds", None) == "News: Fed holds"
+
+
+def test_analyzer_through_the_client():
+    server = MockOpenAIServer(latency_ms=5)
+
+    async def run():
+        analyzer = GroqAnalyzer({"groq": {"api_key": "key", "base_url": server.base_url}})
+        result = await analyzer.analyze("Exchange hack drains hot wallet",
+                                        [{"text": "Exchange hacked in 2022", "metadata": {"impact": 8}, "similarity": 0.9}])
+        await analyzer.client.close()
+        return result
+
+    result = _with_server(server, run)
+    assert result["label"] == "negative" and result["impact"] == 5 and "error" not in result
+    assert "Exchange hacked in 2022" in server.prompts[0]
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from src.brain.council import provisional_trade, provisional_verdict, quorum_reached
+from src.ingestion.base import NewsItem
+from src.utils.db import Database
+
+
+def _vote(agent, label):
+    return {"agent": agent, "label": label, "score": 0.7, "conf": 0.7}
+
+
+def test_quorum_once_the_label_is_fixed():
+    assert quorum_reached([_vote("FinBERT", "positive"), _vote("DeBERTa", "positive")], ["Groq"])
+    assert quorum_reached([_vote("Groq", "negative"), _vote("DeBERTa", "negative")], ["FinBERT"])
+    assert not quorum_reached([_vote("FinBERT", "positive"), _vote("DeBERTa", "negative")], ["Groq"])
+    assert not quorum_reached([_vote("FinBERT", "positive")], ["Groq", "DeBERTa"])
+
+    # Two agreeing agents fix the label, but not the trade: only a unanimous council clears 0.85
+    assert not quorum_reached([_vote("FinBERT", "positive"), _vote("DeBERTa", "positive")], ["Groq"], 0.85)
+    assert quorum_reached([_vote("FinBERT", "neutral"), _vote("DeBERTa", "neutral")], ["Groq"], 0.85)
+
+    verdict = provisional_verdict([_vote("FinBERT", "positive"), _vote("DeBERTa", "positive")], ["Groq"])
+    assert verdict["label"] == "positive" and verdict["confidence"] == pytest.approx(2 / 3) # Full-council scale
+    assert verdict["provisional"] and verdict["voted"] == ["FinBERT", "DeBERTa"] and verdict["pending"] == ["Groq"]
+    assert not verdict["provisional_trade"]
+
+
+def test_provisional_trade_rule():
+    agreeing = [_vote("FinBERT", "positive"), _vote("DeBERTa", "positive")] # conf 0.7 each
+    assert provisional_trade(agreeing, 0.7) and not provisional_trade(agreeing, 0.75)
+    assert not provisional_trade(agreeing, None)
+    assert not provisional_trade([_vote("FinBERT", "neutral"), _vote("DeBERTa", "neutral")], 0.5) # Nothing to trade
+    assert not provisional_trade([_vote("FinBERT", "positive")], 0.5) # One agent is no quorum
+
+    # Label fixed but the trade open: only the provisional trade rule ends the wait
+    assert not quorum_reached(agreeing, ["Groq"], 0.85, trade_threshold=0.75)
+    assert quorum_reached(agreeing, ["Groq"], 0.85, trade_threshold=0.7)
+    assert not quorum_reached([_vote("FinBERT", "positive"), _vote("DeBERTa", "negative")], ["Groq"], 0.85, 0.5)
+    verdict = provisional_verdict(agreeing, ["Groq"], trade_threshold=0.7)
+    assert verdict["provisional_trade"] and verdict["reasoning"].startswith("Provisional trade")
+
+
+class _SlowGroq:
+    def __init__(self, label, delay):
+        self.label, self.delay = label, delay
+
+    async def analyze(self, text, historical_events=None):
+        await asyncio.sleep(self.delay)
+        return {"label": self.label, "score": 0.9, "confidence": 0.9, "impact": 8}
+
+
+@pytest.fixture
+def make_brain(stub_brain):
+    def make(finbert, deberta, groq, **quorum):
+        return stub_brain({"quorum": {"enabled": True, **quorum}}, finbert=finbert, deberta=deberta, groq=groq)
+    return make
+
+
+def test_provisional_verdict_before_the_slowest_agent(make_brain):
+    brain = make_brain("neutral", "neutral", _SlowGroq("negative", delay=0.3))
+
+    async def run():
+        provisional = await brain.analyze("Exchange lists new token")
+        assert provisional["provisional"] and not provisional["final"].done()
+        assert provisional["label"] == "neutral" and provisional["pending"] == ["Groq"]
+        assert set(provisional["timings"]) == {"finbert", "deberta"}
+        final = await provisional["final"]
+        return provisional, final
+
+    provisional, final = asyncio.run(run())
+    assert final["label"] == "neutral" # Groq dissents, majority holds
+    assert final["confidence"] == pytest.approx(2 / 3)
+    assert [v["agent"] for v in final["votes"]] == ["Groq", "FinBERT", "DeBERTa"]
+    assert final["impact"] == 8 and final["complete"]
+    assert brain.quorum_stats()["early"] == 1
+
+
+def test_possible_trade_waits_for_the_full_council(make_brain):
+    brain = make_brain("positive", "positive", _SlowGroq("positive", delay=0.05))
+    verdict = asyncio.run(brain.analyze("Exchange lists new token"))
+    assert not verdict.get("provisional")
+    assert verdict["label"] == "positive" and verdict["confidence"] >= 0.85 # Unanimous: tradeable
+    assert brain.quorum_stats()["early"] == 0
+
+
+def test_confident_pair_trades_before_the_slowest_agent(make_brain):
+    brain = make_brain("positive", "positive", _SlowGroq("negative", delay=0.3), trade_threshold=0.7)
+
+    async def run():
+        provisional = await brain.analyze("Exchange lists new token")
+        assert not provisional["final"].done()
+        return provisional, await provisional["final"]
+
+    provisional, final = asyncio.run(run())
+    assert provisional["provisional_trade"] and provisional["label"] == "positive"
+    assert provisional["confidence"] == pytest.approx(2 / 3) # Still the full-council scale
+    assert final["label"] == "positive" and not final.get("provisional_trade")
+    assert brain.quorum_stats()["early"] == 1
+
+
+def test_split_vote_waits_for_the_full_council(make_brain):
+    brain = make_brain("positive", "negative", _SlowGroq("negative", delay=0.05))
+    verdict = asyncio.run(brain.analyze("Exchange lists new token"))
+    assert "final" not in verdict and not verdict.get("provisional")
+    assert verdict["label"] == "negative"
+    assert brain.quorum_stats() == {"items": 1, "early": 0, "early_rate": 0.0,
+                                    "lead_ms": brain.quorum_lead_ms.summary()}
+
+
+def test_stored_verdict_is_updated(tmp_path):
+    db = Database(str(tmp_path / "news.db"))
+    db.init_db()
+    item = NewsItem(source_id="rss:test", title="Exchange lists new token", url="http://x", published_at=datetime.now(), content="")
+    provisional = {"label": "positive", "score": 0.7, "confidence": 1.0, "provisional": True,
+                   "votes": [_vote("FinBERT", "positive"), _vote("DeBERTa", "positive")], "pending": ["Groq"]}
+    news_id = db.log_news(item, provisional)
+    assert news_id is not None
+
+    final = {"label": "positive", "score": 0.7, "confidence": 2 / 3, "impact": 8,
+             "votes": provisional["votes"] + [_vote("Groq", "negative")]}
+    db.update_news_analysis(news_id, final, final["impact"])
+
+    conn = sqlite3.connect(db.db_path)
+    label, confidence, impact, verdict = conn.execute(
+        "SELECT sentiment_label, confidence, impact_score, verdict FROM news WHERE id = ?", (news_id,)).fetchone()
+    conn.close()
+    assert (label, impact) == ("positive", 8) and confidence == pytest.approx(2 / 3)
+    verdict = json.loads(verdict)
+    assert not verdict["provisional"] and len(verdict["votes"]) == 3
@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+import pytest
+
+from src.brain.sentiment import SentimentEngine
+
+LOAD_DELAY = {"groq": 0.0, "finbert": 0.05, "deberta": 0.4}
+
+
+@pytest.fixture
+def brain_factory(stub_brain):
+    """Deferred-loading engine whose agents 'load' with the delays above."""
+    def make(**readiness):
+        return stub_brain({"readiness": readiness}, load_delay=LOAD_DELAY, defer_loading=True)
+    return make
+
+
+def test_loads_concurrently_and_reports_times(stub_brain):
+    started = time.perf_counter()
+    brain = stub_brain(load_delay=LOAD_DELAY) # Eager: still one thread per agent
+    elapsed = time.perf_counter() - started
+    assert elapsed < sum(LOAD_DELAY.values())
+    assert set(brain.load_times) == set(SentimentEngine.AGENTS)
+    assert brain.load_times["deberta"] >= 400 * 0.9
+    assert brain.ready
+
+
+def test_partial_mode_scores_with_agents_already_up(brain_factory):
+    async def run():
+        brain = brain_factory(mode="partial", min_agents=2)
+        assert not hasattr(brain, "finbert_pipe") # Nothing loaded at construction
+        loading = asyncio.create_task(brain.load())
+
+        early = await brain.analyze("SEC approves spot bitcoin ETF")
+        assert not loading.done()
+        assert set(early["timings"]) == {"finbert"} # DeBERTa still loading: not asked
+
+        await loading
+        late = await brain.analyze("SEC approves spot bitcoin ETF")
+        assert set(late["timings"]) == {"finbert", "deberta"}
+        assert late["label"] == "positive"
+
+    asyncio.run(run())
+
+
+def test_wait_mode_holds_items_until_every_agent_is_up(brain_factory):
+    async def run():
+        brain = brain_factory(mode="wait")
+        loading = asyncio.create_task(brain.load())
+        await asyncio.sleep(0)
+
+        result = await brain.analyze("SEC approves spot bitcoin ETF")
+        assert loading.done() or brain.ready
+        assert set(result["timings"]) == {"finbert", "deberta"}
+
+    asyncio.run(run())
+
+
+def test_gate_timeout_falls_back_to_partial(brain_factory):
+    async def run():
+        brain = brain_factory(mode="wait", timeout=0.1)
+        loading = asyncio.create_task(brain.load())
+        result = await brain.analyze("SEC approves spot bitcoin ETF")
+        assert "deberta" not in result["timings"]
+        await loading
+
+    asyncio.run(run())
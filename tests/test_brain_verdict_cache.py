@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+import pytest
+
+from src.brain.sentiment import SentimentEngine
+from src.brain.verdict_cache import VerdictCache, council_fingerprint, normalize_text, text_key
+
+
+def test_normalized_text_hits(tmp_path):
+    cache = VerdictCache(str(tmp_path / "verdicts.db"), fingerprint="a")
+    cache.put("SEC  approves spot Bitcoin ETF", {"label": "positive", "votes": [{"agent": "FinBERT"}]})
+    assert cache.get("sec approves spot bitcoin etf ")["votes"] == [{"agent": "FinBERT"}]
+    assert cache.get("SEC rejects spot bitcoin ETF") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+    assert normalize_text("Ｆｅｄ\tHolds") == "fed holds" # NFKC + casefold + whitespace
+
+
+def test_new_fingerprint_misses_but_keeps_old_rows(tmp_path):
+    path = str(tmp_path / "verdicts.db")
+    cache = VerdictCache(path, fingerprint=council_fingerprint(groq_prompt="v1"))
+    cache.put("Fed holds rates", {"label": "neutral"})
+    cache.close()
+
+    changed = VerdictCache(path, fingerprint=council_fingerprint(groq_prompt="v2"))
+    assert changed.get("Fed holds rates") is None
+    changed.put("Fed holds rates", {"label": "positive"})
+    assert len(changed) == 2 # Both councils' verdicts, side by side
+    changed.put("Fed holds rates", {"label": "negative"}) # Replaces its own row
+    assert changed.stats()["entries"] == len(changed) == 2
+    changed.close()
+
+    rolled_back = VerdictCache(path, fingerprint=council_fingerprint(groq_prompt="v1"))
+    assert rolled_back.get("Fed holds rates") == {"label": "neutral"}
+    rolled_back.close()
+
+
+def test_hits_touch_last_used_in_batches(tmp_path):
+    path = str(tmp_path / "verdicts.db")
+    cache = VerdictCache(path, fingerprint="a", touch_every=2)
+
+    def last_used(text):
+        return cache._conn.execute("SELECT last_used FROM verdicts WHERE key = ?", (text_key(text),)).fetchone()[0]
+
+    cache.put("one", {"n": 1})
+    cache.put("two", {"n": 2})
+    before = last_used("one")
+    time.sleep(0.01)
+    cache.get("one")
+    assert last_used("one") == before # Only remembered in memory
+    cache.get("two")
+    assert last_used("one") > before # Batch of two written
+    cache.close()
+
+
+def test_async_lookup_and_store(tmp_path):
+    cache = VerdictCache(str(tmp_path / "verdicts.db"), fingerprint="a")
+
+    async def run():
+        assert await cache.lookup("Fed holds") is None
+        cache.store("Fed holds", {"label": "neutral"})
+        return await cache.lookup("Fed holds") # Same thread, after the store
+
+    assert asyncio.run(run()) == {"label": "neutral"}
+    cache.close()
+
+
+def test_lru_eviction(tmp_path):
+    cache = VerdictCache(str(tmp_path / "verdicts.db"), capacity=2, evict_every=1)
+    cache.put("one", {"n": 1})
+    cache.put("two", {"n": 2})
+    assert cache.get("one") # "two" is now the least recently used
+    cache.put("three", {"n": 3})
+    assert cache.get("two") is None
+    assert cache.get("one") and cache.get("three")
+    assert cache.stats()["evicted"] == 1 and cache.stats()["entries"] == 2
+
+
+@pytest.fixture
+def brain(tmp_path, stub_brain):
+    calls = []
+    engine = stub_brain({"verdict_cache": {"enabled": True, "path": str(tmp_path / "verdicts.db")}}, calls=calls)
+    engine.calls = calls
+    yield engine
+    engine.verdict_cache.close()
+
+
+def test_council_verdicts_are_cached(brain):
+    first = asyncio.run(brain.analyze("SEC approves spot bitcoin ETF"))
+    assert [v["agent"] for v in first["votes"]] == ["FinBERT", "DeBERTa"]
+    assert first["complete"] and "cached" not in first
+
+    again = asyncio.run(brain.analyze("sec approves spot  bitcoin etf"))
+    assert brain.calls == ["finbert", "deberta"] # No agent ran for the repeat
+    assert again["cached"] and set(again["timings"]) == {"cache"}
+    assert again["label"] == first["label"] and again["votes"] == first["votes"]
+
+
+def test_incomplete_council_is_not_cached(brain, monkeypatch):
+    monkeypatch.setattr(SentimentEngine, "_analyze_deberta",
+                        lambda self, text: {"label": "neutral", "score": 0, "confidence": 0, "error": "boom"})
+    verdict = asyncio.run(brain.analyze("Exchange halts withdrawals"))
+    assert not verdict["complete"]
+    assert brain.cache_stats()["entries"] == 0
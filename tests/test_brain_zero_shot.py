@@ -0,0 +1,35 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from src.brain.zero_shot import ZeroShotScorer
+
+LABELS = ["bullish news", "bearish news", "neutral news"]
+HEADLINES = [
+    "SEC approves spot bitcoin ETF",
+    "Exchange halts withdrawals after hack",
+    "Fed holds rates steady as inflation cools and payrolls beat forecasts",
+]
+
+
+def _tiny_nli_pipeline(tiny_nli_model):
+    model, tokenizer = tiny_nli_model(HEADLINES + [f"This example is {l}." for l in LABELS])
+    return transformers.pipeline("zero-shot-classification", model=model, tokenizer=tokenizer, device=-1)
+
+
+@pytest.mark.parametrize("multi_label", [False, True])
+def test_matches_pipeline(tiny_nli_model, multi_label):
+    pipe = _tiny_nli_pipeline(tiny_nli_model)
+    scorer = ZeroShotScorer.from_pipeline(pipe, LABELS, multi_label=multi_label, premise_cache=8)
+
+    expected = [pipe(text, LABELS, multi_label=multi_label) for text in HEADLINES]
+    actual = scorer(HEADLINES)
+    for want, got in zip(expected, actual):
+        assert got["labels"] == want["labels"]
+        assert got["scores"] == pytest.approx(want["scores"], abs=1e-4)
+
+    # Single headline in, single result out (and served from the premise cache)
+    again = scorer(HEADLINES[0])
+    assert again["labels"] == expected[0]["labels"]
+    assert len(scorer._premises) == len(HEADLINES)
@@ -0,0 +1,201 @@
+import asyncio
+import random
+from datetime import datetime
+
+from src.core.pipeline import NewsPipeline
+from src.ingestion.base import NewsItem
+
+
+def _item(i):
+    return NewsItem(f"test:{i}", f"Headline {i}", "http://url", datetime.now(), "content")
+
+
+def _handlers(executed, fail_titles=()):
+    async def context(job):
+        await asyncio.sleep(0)
+
+    async def analyze(job):
+        # Random service time so jobs finish out of order
+        await asyncio.sleep(random.uniform(0, 0.01))
+        if job.item.title in fail_titles:
+            raise RuntimeError("model exploded")
+        job.analysis = {"label": "positive"}
+
+    async def log(job):
+        pass
+
+    async def execute(job):
+        executed.append((job.symbol, job.item.title))
+
+    return {"context": context, "analyze": analyze, "log": log, "execute": execute}
+
+
+def test_per_symbol_ordering_is_preserved():
+    executed = []
+
+    async def run():
+        pipeline = NewsPipeline(_handlers(executed), {"analyze": {"concurrency": 8}})
+        await pipeline.start()
+        for i in range(40):
+            await pipeline.submit(_item(i), "BTC-PERP" if i % 2 else "SOL/USD")
+        await pipeline.join()
+        await pipeline.stop()
+        return pipeline.metrics()
+
+    metrics = asyncio.run(run())
+    btc = [t for s, t in executed if s == "BTC-PERP"]
+    sol = [t for s, t in executed if s == "SOL/USD"]
+    assert btc == [f"Headline {i}" for i in range(1, 40, 2)]
+    assert sol == [f"Headline {i}" for i in range(0, 40, 2)]
+    assert metrics["execute"]["processed"] == 40
+    assert metrics["context"]["depth"] == 0
+
+
+def test_failed_job_does_not_stall_symbol():
+    executed = []
+
+    async def run():
+        pipeline = NewsPipeline(_handlers(executed, fail_titles={"Headline 1"}))
+        await pipeline.start()
+        for i in range(4):
+            await pipeline.submit(_item(i), "BTC-PERP")
+        await asyncio.wait_for(pipeline.join(), timeout=5)
+        await pipeline.stop()
+        return pipeline.metrics()
+
+    metrics = asyncio.run(run())
+    assert [t for _, t in executed] == ["Headline 0", "Headline 2", "Headline 3"]
+    assert metrics["analyze"]["failed"] == 1
+
+
+def test_bounded_queue_applies_backpressure():
+    release = None
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        handlers = _handlers([])
+
+        async def slow_context(job):
+            await release.wait()
+
+        handlers["context"] = slow_context
+        pipeline = NewsPipeline(handlers, {"context": {"concurrency": 1, "queue_size": 2}})
+        await pipeline.start()
+        # 1 in service + 2 queued fit; the 4th submit must block
+        for i in range(3):
+            await pipeline.submit(_item(i), "BTC-PERP")
+        blocked = asyncio.create_task(pipeline.submit(_item(3), "BTC-PERP"))
+        await asyncio.sleep(0.05)
+        was_blocked = not blocked.done()
+        depth = pipeline.metrics()["context"]["depth"]
+        release.set()
+        await blocked
+        await pipeline.join()
+        await pipeline.stop()
+        return was_blocked, depth
+
+    was_blocked, depth = asyncio.run(run())
+    assert was_blocked
+    assert depth == 2
+
+
+def test_stage_stamps_reach_on_complete():
+    completed = []
+
+    async def run():
+        pipeline = NewsPipeline(_handlers([]), on_complete=completed.append)
+        await pipeline.start()
+        await pipeline.submit(_item(0), "BTC-PERP")
+        await pipeline.join()
+        await pipeline.stop()
+
+    asyncio.run(run())
+    assert len(completed) == 1
+    stamps = completed[0].item.stamps
+    ordered = [f"{stage}_{edge}" for stage in ("context", "analyze", "log", "execute") for edge in ("start", "end")]
+    assert [stamps[k] for k in ordered] == sorted(stamps[k] for k in ordered)
+
+
+def _run_tier1_after_backlog(config):
+    analyzed = []
+    executed = []
+
+    async def run():
+        release = asyncio.Event()
+        handlers = _handlers(executed)
+
+        async def analyze(job):
+            await release.wait()
+            analyzed.append(job.item.title)
+
+        handlers["analyze"] = analyze
+        pipeline = NewsPipeline(handlers, {"analyze": {"concurrency": 1}, **config})
+        await pipeline.start()
+        for i in range(5):
+            await pipeline.submit(_item(i), "BTC-PERP")
+        urgent = _item("fed")
+        urgent.priority = 1
+        await pipeline.submit(urgent, "BTC-PERP")
+        await asyncio.sleep(0.05)
+        release.set()
+        await pipeline.join()
+        await pipeline.stop()
+        return pipeline.metrics()
+
+    metrics = asyncio.run(run())
+    return analyzed, [t for _, t in executed], metrics
+
+
+def test_tier1_items_jump_the_analyze_queue():
+    analyzed, executed, metrics = _run_tier1_after_backlog({})
+    # The Tier-1 item was admitted last but overtakes every queued aggregator item...
+    assert analyzed == ["Headline fed"] + [f"Headline {i}" for i in range(5)]
+    # ...yet still executes after the earlier signals on its symbol
+    assert executed == [f"Headline {i}" for i in range(5)] + ["Headline fed"]
+    assert set(metrics["analyze"]["wait_ms_by_priority"]) == {1, 3}
+
+
+def test_execute_order_by_priority_lets_tier1_overtake():
+    _, executed, _ = _run_tier1_after_backlog({"execute_order_by_priority": True})
+    assert executed[0] == "Headline fed"
+    assert executed[1:] == [f"Headline {i}" for i in range(5)]
+
+
+def test_full_execute_lane_does_not_hold_other_symbols():
+    executed = []
+    release = None
+    slow = "BTC-PERP"
+    fast = next(s for s in (f"ALT{i}/USD" for i in range(100)) if hash(s) % 2 != hash(slow) % 2) # Other lane
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        handlers = _handlers(executed)
+
+        async def execute(job):
+            if job.symbol == slow:
+                await release.wait()
+            executed.append((job.symbol, job.item.title))
+
+        handlers["execute"] = execute
+        pipeline = NewsPipeline(handlers, {"log": {"concurrency": 4}, "execute": {"concurrency": 2, "queue_size": 2}})
+        await pipeline.start()
+        # One in service, one in the lane, the rest wait to be released into it
+        for i in range(4):
+            await pipeline.submit(_item(i), slow)
+        await asyncio.sleep(0.1)
+        await pipeline.submit(_item("other"), fast)
+        for _ in range(100):
+            if executed:
+                break
+            await asyncio.sleep(0.01)
+        first = list(executed)
+        release.set()
+        await asyncio.wait_for(pipeline.join(), timeout=5)
+        await pipeline.stop()
+        return first
+
+    first = asyncio.run(run())
+    assert first == [(fast, "Headline other")]
+    assert [t for s, t in executed if s == slow] == [f"Headline {i}" for i in range(4)]
@@ -0,0 +1,143 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from src.ingestion.direct import DirectIngester
+from src.utils.economic_calendar import BURST, IDLE, WARMUP, EconomicCalendar, ScheduledRelease
+
+T0 = datetime(2026, 11, 12, 13, 20, tzinfo=timezone.utc)
+RELEASE_AT = T0 + timedelta(seconds=600) # CPI 08:30 ET
+TARGETS = [
+    {"name": "BLS CPI Release", "url": "https://www.bls.gov/feed/cpi.rss", "type": "rss", "priority": 1, "poll_interval": 900.0},
+    {"name": "Fed Press", "url": "https://www.federalreserve.gov/feeds/press_all.xml", "type": "rss", "priority": 1, "poll_interval": 900.0},
+]
+
+
+class _Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += timedelta(seconds=seconds)
+
+
+def _calendar(clock):
+    release = ScheduledRelease("US CPI (Oct)", RELEASE_AT, targets=["BLS CPI Release"])
+    return EconomicCalendar([release], warmup_lead=120, window_before=15, window_after=120, clock=clock)
+
+
+def _ingester(clock):
+    config = {
+        "direct": {"state_path": None, "jitter": 0.0, "max_interval": 900},
+        "burst_mode": {"poll_interval": 0.5, "keepalive_interval": 10.0},
+    }
+    ingester = DirectIngester(config, TARGETS)
+    ingester.calendar = _calendar(clock)
+    return ingester
+
+
+def test_calendar_phase_transitions():
+    clock = _Clock(T0)
+    calendar = _calendar(clock)
+    expected = [
+        (0, IDLE),          # 10 min out
+        (479, IDLE),
+        (480, WARMUP),      # lead (120s) starts
+        (584, WARMUP),
+        (585, BURST),       # window_before (15s)
+        (600, BURST),       # the release
+        (720, BURST),       # window_after (120s) ends
+        (721, IDLE),
+    ]
+    for offset, phase in expected:
+        clock.now = T0 + timedelta(seconds=offset)
+        assert calendar.target_phase("BLS CPI Release") == phase, offset
+        # Targets the release doesn't list never leave idle
+        assert calendar.target_phase("Fed Press") == IDLE
+
+    clock.now = T0
+    assert calendar.seconds_until_next_phase("BLS CPI Release") == 480
+    clock.now = T0 + timedelta(seconds=500)
+    assert calendar.seconds_until_next_phase("BLS CPI Release") is None # Nothing after this release
+
+
+def test_burst_delay_overrides_learned_interval():
+    clock = _Clock(T0)
+    ingester = _ingester(clock)
+
+    # Idle: wake up in time for the warm-up, but never poll slower than learned
+    assert ingester._burst_delay("BLS CPI Release", 900) == 480
+    assert ingester._burst_delay("BLS CPI Release", 60) == 60
+    clock.now = T0 + timedelta(seconds=479.99)
+    assert ingester._burst_delay("BLS CPI Release", 900) == 0.1 # Clamped, no busy loop
+
+    # Warm-up: at most the keep-alive interval
+    clock.now = T0 + timedelta(seconds=500)
+    assert ingester._burst_delay("BLS CPI Release", 900) == 10.0
+    assert ingester._burst_delay("BLS CPI Release", 3.0) == 3.0
+
+    # Burst: sub-second regardless of the learned interval
+    clock.now = T0 + timedelta(seconds=600)
+    assert ingester._burst_delay("BLS CPI Release", 900) == 0.5
+
+    # Other targets and no calendar keep the learned interval
+    assert ingester._burst_delay("Fed Press", 900) == 900
+    ingester.calendar = None
+    assert ingester._burst_delay("BLS CPI Release", 900) == 900
+
+
+def test_monitor_loop_warms_up_then_bursts(monkeypatch):
+    clock = _Clock(T0)
+    ingester = _ingester(clock)
+    polls = []
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    class _Response:
+        status = 304
+        headers = {}
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    class _Session:
+        def get(self, url, **kwargs):
+            polls.append(clock.now)
+            return _Response()
+
+    class _Transport:
+        async def get_session(self):
+            return _Session()
+
+    async def fake_sleep(delay, *args):
+        if delay == 0:
+            return await real_sleep(0)
+        sleeps.append(delay)
+        clock.advance(delay)
+        if clock.now > RELEASE_AT:
+            ingester.running = False
+        await real_sleep(0)
+
+    async def run():
+        ingester.transport = _Transport()
+        ingester.running = True
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        await ingester._monitor_target(TARGETS[0])
+
+    asyncio.run(run())
+    monkeypatch.undo()
+
+    offsets = [(t - T0).total_seconds() for t in polls]
+    assert sleeps[0] == 480 # Idle until the warm-up starts
+    warmup = [o for o in offsets if 480 <= o < 585]
+    burst = [o for o in offsets if o >= 585]
+    # Warm-up polls every keepalive_interval (keeps the pooled connection + DNS answer hot)...
+    assert warmup == [480 + 10 * i for i in range(11)]
+    # ...then sub-second polling through the release
+    assert all(b - a == 0.5 for a, b in zip(burst, burst[1:]))
+    assert burst[0] == 590 and burst[-1] == 600
@@ -0,0 +1,138 @@
+import asyncio
+import multiprocessing
+import time
+from datetime import datetime
+
+from src.ingestion.base import NewsItem
+from src.ingestion.channel import NewsChannel
+
+
+def _publish(channel, n):
+    for i in range(n):
+        channel.put(NewsItem(f"test:{i}", f"Headline {i}", "http://url", datetime.now(), "content"))
+    channel.flush()
+
+
+def test_channel_wakes_consumer_in_process():
+    async def run():
+        channel = NewsChannel()
+        channel.attach()
+        try:
+            asyncio.get_running_loop().call_later(0.01, _publish, channel, 3)
+            items = [await asyncio.wait_for(channel.get(), timeout=2) for _ in range(3)]
+        finally:
+            channel.detach()
+        return items
+
+    items = asyncio.run(run())
+    assert [i.title for i in items] == ["Headline 0", "Headline 1", "Headline 2"]
+
+
+def test_channel_across_processes():
+    async def run():
+        channel = NewsChannel()
+        proc = multiprocessing.Process(target=_publish, args=(channel, 5))
+        proc.start()
+        channel.attach()
+        try:
+            items = [await asyncio.wait_for(channel.get(), timeout=10) for _ in range(5)]
+        finally:
+            channel.detach()
+            proc.join()
+        return items
+
+    items = asyncio.run(run())
+    assert len(items) == 5
+    assert items[-1].source_id == "test:4"
+
+
+def test_channel_serves_tier1_first_with_aging():
+    from src.ingestion.priority import PriorityBuffer
+
+    def _item(name, priority):
+        return NewsItem(f"test:{name}", name, "http://url", datetime.now(), "content", priority=priority)
+
+    async def run():
+        channel = NewsChannel(priority_aging=10.0)
+        channel.attach()
+        try:
+            for name in ("rss-1", "rss-2"):
+                channel.put(_item(name, 3))
+            channel.put(_item("fed", 1))
+            await asyncio.sleep(0.05)
+            order = [(await asyncio.wait_for(channel.get(), timeout=2)).title for _ in range(3)]
+        finally:
+            channel.detach()
+
+        # Aging: an aggregator item that waited > 2 * aging beats a fresh Tier-1 item
+        buffer = PriorityBuffer(aging=0.01)
+        buffer.put_nowait(_item("old-rss", 3))
+        await asyncio.sleep(0.05)
+        buffer.put_nowait(_item("new-fed", 1))
+        aged = [buffer.get_nowait().title for _ in range(2)]
+        return order, aged, channel.metrics()
+
+    order, aged, metrics = asyncio.run(run())
+    assert order == ["fed", "rss-1", "rss-2"]
+    assert aged == ["old-rss", "new-fed"]
+    assert set(metrics["wait_ms_by_priority"]) == {1, 3}
+
+
+def test_put_does_not_block_on_a_full_pipe():
+    channel = NewsChannel()
+    big = "x" * 65536 # A few of these fill the pipe; nothing reads it yet
+    started = time.monotonic()
+    for i in range(8):
+        channel.put(NewsItem(f"test:{i}", f"Headline {i}", "http://url", datetime.now(), big))
+    assert time.monotonic() - started < 1.0
+
+    async def run():
+        channel.attach()
+        try:
+            return [(await asyncio.wait_for(channel.get(), timeout=2)).source_id for _ in range(8)]
+        finally:
+            channel.detach()
+            channel.flush()
+
+    assert sorted(asyncio.run(run())) == [f"test:{i}" for i in range(8)]
+
+
+def test_full_sender_sheds_least_urgent_frames():
+    import threading
+
+    from src.ingestion.channel import _PipeSender
+
+    class _StalledPipe:
+        def __init__(self):
+            self.open = threading.Event()
+            self.sent = []
+
+        def send_bytes(self, frame):
+            self.open.wait(5)
+            self.sent.append(frame)
+
+    pipe = _StalledPipe()
+    sender = _PipeSender(pipe, max_pending=3)
+    sender.send(b"first", 3)
+    deadline = time.monotonic() + 2
+    while sender.pending() and time.monotonic() < deadline:
+        time.sleep(0.001) # Writer thread takes it and stalls on the pipe
+
+    for frame, priority in ((b"a", 3), (b"b", 1), (b"c", 3), (b"d", 1), (b"e", 3), (b"f", 2), (b"g", 3)):
+        sender.send(frame, priority)
+    assert sender.pending() == 3
+    assert sender.dropped == 4
+
+    pipe.open.set()
+    sender.flush()
+    # Oldest aggregator frames go first; a new frame less urgent than all queued is refused
+    assert pipe.sent == [b"first", b"b", b"d", b"f"]
+
+
+def test_get_before_attach():
+    async def run():
+        channel = NewsChannel()
+        channel.inject(NewsItem("manual", "Manual headline", "http://url", datetime.now(), ""))
+        return (await asyncio.wait_for(channel.get(), timeout=1)).title
+
+    assert asyncio.run(run()) == "Manual headline"
@@ -0,0 +1,77 @@
+from datetime import datetime
+
+from src.ingestion.base import NewsItem
+from src.ingestion.dedupe import NearDuplicateDetector, normalize_title, jaccard
+
+
+def _item(source, title):
+    return NewsItem(source, title, "http://url", datetime.now(), "")
+
+
+def test_normalize_strips_wire_noise():
+    assert normalize_title("BREAKING: SEC Approves Spot Bitcoin ETF - Reuters") == \
+        normalize_title("sec approves spot bitcoin etf")
+
+
+def test_echo_across_sources_is_suppressed():
+    detector = NearDuplicateDetector(window_seconds=900, threshold=0.6)
+    first = _item("direct:SEC Press Releases", "SEC approves spot Bitcoin ETF applications from BlackRock and Fidelity")
+    echo = _item("rss:Reuters", "BREAKING: SEC approves spot bitcoin ETFs from BlackRock, Fidelity - Reuters")
+
+    assert detector.check(first, now=0) is None
+    assert first.first_seen_source == "direct:SEC Press Releases"
+
+    story = detector.check(echo, now=5)
+    assert story is not None
+    assert story.first_seen_source == "direct:SEC Press Releases"
+    assert story.echo_sources == {"rss:Reuters"}
+    assert detector.suppressed == 1
+
+
+def test_different_story_is_not_suppressed():
+    detector = NearDuplicateDetector()
+    assert detector.check(_item("a", "Fed raises rates by 25 basis points"), now=0) is None
+    assert detector.check(_item("b", "Binance halts withdrawals after exploit"), now=1) is None
+    assert len(detector) == 2
+
+
+def test_window_expiry():
+    detector = NearDuplicateDetector(window_seconds=60)
+    title = "Federal Reserve announces emergency rate cut"
+    assert detector.check(_item("a", title), now=0) is None
+    assert detector.check(_item("b", title), now=30) is not None
+    assert detector.check(_item("c", title), now=120) is None
+
+
+def test_reworded_headline_is_an_echo():
+    detector = NearDuplicateDetector()
+    assert detector.check(_item("a", "Fed raises interest rates by 25 basis points"), now=0) is None
+    assert detector.check(_item("b", "Federal Reserve raises interest rates by 25 basis points"), now=2) is not None
+
+
+def test_jaccard_of_normalized_titles():
+    a = frozenset(normalize_title("Trump announces new tariffs on Chinese imports starting Monday"))
+    b = frozenset(normalize_title("Trump announces new tariffs on Chinese goods starting Monday"))
+    c = frozenset(normalize_title("Ethereum developers delay Pectra upgrade"))
+    assert jaccard(a, b) > 0.6
+    assert jaccard(a, c) == 0
+
+
+def test_similar_titles_with_different_facts_are_not_echoes():
+    pairs = [
+        ("Fed hikes rates by 25bp", "Fed cuts rates by 25bp"),
+        ("CPI rises 3.2% in June", "CPI rises 3.5% in June"),
+        ("SEC approves spot Solana ETF", "SEC rejects spot Solana ETF"),
+        ("Binance lists PEPE perpetuals", "Coinbase lists PEPE perpetuals"),
+    ]
+    for first, second in pairs:
+        detector = NearDuplicateDetector(min_tokens=1)
+        assert detector.check(_item("a", first), now=0) is None
+        assert detector.check(_item("b", second), now=1) is None, (first, second)
+        assert len(detector) == 2
+
+
+def test_extra_detail_is_still_an_echo():
+    detector = NearDuplicateDetector()
+    assert detector.check(_item("a", "Bitcoin rises 5% as ETF inflows surge"), now=0) is None
+    assert detector.check(_item("b", "Bitcoin rises 5% to $64,000 as ETF inflows surge"), now=1) is not None
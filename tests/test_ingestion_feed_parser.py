@@ -0,0 +1,69 @@
+from src.ingestion.feed_parser import IncrementalFeedParser, published_timestamp
+
+
+def _rss(ids, build_date="Mon, 02 Nov 2026 13:00:00 GMT"):
+    items = "".join(
+        f"<item><title>Headline {i}</title><link>https://sec.gov/news/{i}</link>"
+        f"<guid>sec-{i}</guid><pubDate>Mon, 02 Nov 2026 12:{i:02d}:00 GMT</pubDate>"
+        f"<description>Body {i}</description></item>"
+        for i in ids
+    )
+    return (f'<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+            f"<title>SEC Press Releases</title><lastBuildDate>{build_date}</lastBuildDate>"
+            f"{items}</channel></rss>").encode()
+
+
+def test_first_poll_returns_all_entries_newest_first():
+    parser = IncrementalFeedParser()
+    feed = parser.parse("u", _rss([3, 2, 1]))
+    assert feed.title == "SEC Press Releases"
+    assert [e["id"] for e in feed.entries] == ["sec-3", "sec-2", "sec-1"]
+    assert feed.entries[0]["link"] == "https://sec.gov/news/3"
+    assert published_timestamp(feed.entries[0]) == 1793620980  # 2026-11-02 12:03 UTC
+
+
+def test_stops_at_first_known_entry():
+    parser = IncrementalFeedParser()
+    parser.parse("u", _rss([3, 2, 1]))
+    feed = parser.parse("u", _rss([5, 4, 3, 2, 1]))
+    assert [e["id"] for e in feed.entries] == ["sec-5", "sec-4"]
+    assert feed.stopped_early
+    assert parser.stats()["entries_scanned"] == 3 + 4 # Stops at the second known entry
+
+
+def test_unchanged_head_skips_parsing_even_if_channel_metadata_changes():
+    parser = IncrementalFeedParser()
+    parser.parse("u", _rss([2, 1]))
+    feed = parser.parse("u", _rss([2, 1], build_date="Mon, 02 Nov 2026 13:05:00 GMT"))
+    assert feed.unchanged and feed.entries == []
+    assert parser.stats()["skipped_unchanged"] == 1
+
+
+def test_atom_entries():
+    body = b"""<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Fed</title>
+        <entry><id>tag:fed,1</id><title>FOMC statement</title>
+        <link rel="alternate" href="https://fed.gov/1"/><updated>2026-10-28T18:00:00Z</updated>
+        <author><name>Board</name></author><summary>Rates unchanged</summary></entry></feed>"""
+    feed = IncrementalFeedParser().parse("atom", body)
+    assert feed.title == "Fed"
+    entry = feed.entries[0]
+    assert (entry["id"], entry["link"], entry["author"]) == ("tag:fed,1", "https://fed.gov/1", "Board")
+    assert published_timestamp(entry) == 1793210400
+
+
+def test_oldest_first_feed_is_scanned_to_the_end():
+    parser = IncrementalFeedParser(head_bytes=256) # Appended entries lie beyond the head
+    parser.parse("u", _rss([1, 2, 3]))
+    feed = parser.parse("u", _rss([1, 2, 3, 4, 5]))
+    assert not feed.unchanged and not feed.stopped_early
+    assert [e["id"] for e in feed.entries] == ["sec-4", "sec-5"]
+    assert parser.parse("u", _rss([1, 2, 3, 4, 5])).unchanged
+
+
+def test_undated_feed_does_not_stop_early():
+    parser = IncrementalFeedParser()
+    parser.parse("u", _rss([3, 2, 1]))
+    # Same IDs, but the known entry comes first and the new one after it
+    body = _rss([3, 9, 2, 1]).replace(b"<pubDate>Mon, 02 Nov 2026 12:09:00 GMT</pubDate>", b"")
+    feed = parser.parse("u", body)
+    assert [e["id"] for e in feed.entries] == ["sec-9"] and not feed.stopped_early
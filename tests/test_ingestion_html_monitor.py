@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("bs4")
+
+from src.ingestion.html_monitor import HtmlPageMonitor, extract_region
+
+TARGET = {"name": "Exchange Announcements", "url": "https://exchange.example/support/announcements",
+          "type": "html", "selector": "ul.announcements", "entry_selector": "li"}
+
+
+def _page(titles, csrf="a1"):
+    items = "".join(f'<li><a href="/a/{i}">{t}</a> <span>2026-11-02</span></li>' for i, t in enumerate(titles))
+    return (f'<html><head><meta name="csrf" content="{csrf}"></head><body>'
+            f'<ul class="announcements">{items}</ul><div class="ads">{csrf}</div></body></html>').encode()
+
+
+def test_extracts_entries_with_absolute_links():
+    region, entries = extract_region(_page(["Will list FOO"]), TARGET["url"], selector="ul.announcements",
+                                     entry_selector="li")
+    assert region is not None
+    assert entries == [{"id": "https://exchange.example/a/0", "title": "Will list FOO 2026-11-02",
+                        "link": "https://exchange.example/a/0"}]
+
+
+def test_changes_outside_the_region_are_ignored():
+    async def scenario():
+        monitor = HtmlPageMonitor(workers=1)
+        try:
+            first = await monitor.changed_entries(TARGET, _page(["Will list FOO"], csrf="a1"))
+            noise = await monitor.changed_entries(TARGET, _page(["Will list FOO"], csrf="b2"))
+            update = await monitor.changed_entries(TARGET, _page(["Will list BAR", "Will list FOO"], csrf="c3"))
+            return first, noise, update, monitor.stats()
+        finally:
+            monitor.close()
+
+    first, noise, update, stats = asyncio.run(scenario())
+    assert len(first) == 1
+    assert noise is None
+    assert [e["title"].split(" 2026")[0] for e in update] == ["Will list BAR", "Will list FOO"]
+    assert stats["Exchange Announcements"] == {"polls": 3, "parses": 3, "changes": 2}
+
+
+def test_missing_region_returns_none():
+    assert extract_region(b"<html><body></body></html>", TARGET["url"], selector="ul.announcements") == (None, [])
@@ -0,0 +1,101 @@
+import asyncio
+import random
+
+from src.ingestion.rss_fetcher import AsyncRSSIngester
+
+RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Wire</title>
+<item><title>Headline 1</title><link>http://wire/1</link><guid>http://wire/1</guid></item>
+</channel></rss>"""
+
+
+class _Response:
+    def __init__(self, status, body=b"", headers=None, hang=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.hang = hang # (seconds, timeout) for a server that never answers
+
+    async def __aenter__(self):
+        if self.hang:
+            seconds, timeout = self.hang
+            await asyncio.wait_for(asyncio.sleep(seconds), timeout.total) # As aiohttp's total timeout
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return self.body
+
+
+class _Session:
+    """Stub aiohttp session: one ETag-validated feed, optional hung URLs."""
+
+    def __init__(self, hung=()):
+        self.hung = set(hung)
+        self.requests = []
+
+    def get(self, url, timeout=None, headers=None):
+        self.requests.append((url, dict(headers or {})))
+        if url in self.hung:
+            return _Response(200, hang=(60, timeout))
+        if (headers or {}).get("If-None-Match") == '"v1"':
+            return _Response(304)
+        return _Response(200, RSS, {"ETag": '"v1"'})
+
+
+def _ingester(feeds, **config):
+    emitted = []
+
+    async def on_item(item):
+        emitted.append(item.url)
+
+    ingester = AsyncRSSIngester({"rss_report_interval": 3600, **config}, feeds)
+    ingester.set_callback(on_item)
+    return ingester, emitted
+
+
+def test_not_modified_emits_nothing_and_keeps_validators():
+    ingester, emitted = _ingester(["http://wire/rss"])
+    session = _Session()
+
+    async def run():
+        assert await ingester.fetch_feed(session, "http://wire/rss") is True
+        assert await ingester.fetch_feed(session, "http://wire/rss") is True
+
+    asyncio.run(run())
+    assert emitted == ["http://wire/1"]
+    assert session.requests[1][1]["If-None-Match"] == '"v1"'
+    assert ingester.cycle.not_modified == 1 and ingester.cycle.errors == 0
+    assert ingester.seen_store.get_http_cache("rss", "http://wire/rss") == ('"v1"', None)
+
+
+def test_hung_feed_does_not_delay_the_others():
+    ingester, emitted = _ingester(["http://hung/rss", "http://wire/rss"], rss_poll_interval=0.05, rss_timeout=0.3)
+    session = _Session(hung=["http://hung/rss"])
+
+    async def run():
+        async def fake_session():
+            return session
+
+        ingester._http_session = fake_session
+        await ingester.start()
+        await asyncio.sleep(0.25) # Less than the hung feed's timeout
+        await ingester.stop()
+
+    asyncio.run(run())
+    wire_polls = [url for url, _ in session.requests if url == "http://wire/rss"]
+    assert len(wire_polls) >= 3
+    assert emitted == ["http://wire/1"]
+    assert ingester._loop_task is None and not ingester._tasks
+
+
+def test_backoff_grows_and_resets(monkeypatch):
+    monkeypatch.setattr(random, "uniform", lambda a, b: 1.0) # No jitter
+    ingester, _ = _ingester(["http://wire/rss"], rss_max_backoff=50)
+    url = "http://wire/rss"
+    delays = [ingester._next_delay(url, 5.0, ok=False) for _ in range(4)]
+    assert delays == [10.0, 20.0, 40.0, 50.0] # Doubling, capped at rss_max_backoff
+    assert ingester._next_delay(url, 5.0, ok=True) == 5.0
+    assert ingester._next_delay(url, 5.0, ok=False) == 10.0 # Counting starts over
@@ -0,0 +1,63 @@
+import time
+
+from src.ingestion.scheduler import AdaptivePollScheduler
+
+TARGETS = [
+    {"name": "Busy Wire", "url": "https://wire.example.com/feed", "priority": 1, "poll_interval": 5.0},
+    {"name": "Quiet Agency", "url": "https://agency.example.gov/feed", "priority": 1, "poll_interval": 5.0},
+    {"name": "Agency Speeches", "url": "https://agency.example.gov/speeches", "priority": 1, "poll_interval": 5.0},
+]
+
+
+def _scheduler(**overrides):
+    config = {"state_path": None, "min_interval": 0.5, "max_interval": 600, "jitter": 0.0}
+    config.update(overrides)
+    return AdaptivePollScheduler(TARGETS, config)
+
+
+def test_default_budget_matches_fixed_intervals():
+    scheduler = _scheduler()
+    assert abs(scheduler.budget_rps - 3 / 5.0) < 1e-9
+    intervals = scheduler.intervals()
+    # No observations yet: equal split
+    assert len(set(round(v, 6) for v in intervals.values())) == 1
+
+
+def test_budget_shifts_toward_active_target():
+    scheduler = _scheduler()
+    for _ in range(50):
+        scheduler.record_poll("Busy Wire", new_items=2)
+        scheduler.record_poll("Quiet Agency", new_items=0)
+        scheduler.record_poll("Agency Speeches", new_items=0)
+        for p in scheduler.profiles.values():
+            p.last_poll_at -= 60  # pretend a minute passed between polls
+    intervals = scheduler.intervals()
+    assert intervals["Busy Wire"] < intervals["Quiet Agency"]
+    # Budget is conserved
+    assert abs(sum(1 / v for v in intervals.values()) - scheduler.budget_rps) < 1e-6
+
+
+def test_same_host_requests_are_spaced():
+    scheduler = _scheduler(host_spacing=1.0)
+    a = scheduler.next_delay("Quiet Agency")
+    b = scheduler.next_delay("Agency Speeches")
+    assert b >= a + 0.99
+
+
+def test_report_counts_requests_per_item_and_delay():
+    scheduler = _scheduler()
+    scheduler.record_poll("Busy Wire", new_items=1, delays=[3.0])
+    scheduler.record_poll("Busy Wire", new_items=0)
+    report = scheduler.report()["Busy Wire"]
+    assert report["requests"] == 2
+    assert report["requests_per_item"] == 2
+    assert report["detection_delay_p50_s"] == 3.0
+
+
+def test_profile_persists(tmp_path):
+    path = str(tmp_path / "schedule.json")
+    scheduler = _scheduler(state_path=path)
+    scheduler.record_poll("Busy Wire", new_items=5)
+    scheduler.save()
+    reloaded = _scheduler(state_path=path)
+    assert sum(reloaded.profiles["Busy Wire"].items) == 5
@@ -0,0 +1,106 @@
+import asyncio
+import time
+
+from src.ingestion.seen_store import SeenStore
+
+
+def test_check_and_add_in_memory():
+    store = SeenStore(path=None)
+    assert store.check_and_add("rss", "http://a") is True
+    assert store.check_and_add("rss", "http://a") is False
+    # Namespaces are independent
+    assert store.check_and_add("direct_hft", "http://a") is True
+
+
+def test_lru_is_bounded_but_disk_remembers(tmp_path):
+    store = SeenStore(path=str(tmp_path / "state.db"), capacity=10)
+    for i in range(100):
+        store.add("rss", f"id-{i}")
+    assert store.stats()["hot_keys"] == 10
+    # Evicted from memory, still known via sqlite
+    assert store.seen("rss", "id-0") is True
+    store.close()
+
+
+def test_state_survives_restart(tmp_path):
+    path = str(tmp_path / "state.db")
+    store = SeenStore(path=path)
+    store.add("cryptopanic", 12345)
+    store.set_http_cache("rss", "http://feed", '"etag-1"', "Mon, 01 Jan 2026 00:00:00 GMT")
+    store.close()
+
+    started = time.perf_counter()
+    reopened = SeenStore(path=path)
+    assert (time.perf_counter() - started) < 0.5
+    assert reopened.check_and_add("cryptopanic", "12345") is False
+    assert reopened.get_http_cache("rss", "http://feed") == ('"etag-1"', "Mon, 01 Jan 2026 00:00:00 GMT")
+    reopened.close()
+
+
+def test_ttl_expiry(tmp_path):
+    path = str(tmp_path / "state.db")
+    store = SeenStore(path=path, ttl_seconds=0.05)
+    store.add("rss", "old")
+    store.flush()
+    store._lru.clear()
+    time.sleep(0.1)
+    assert store.seen("rss", "old") is False
+    store.close()
+
+
+def test_ttl_applies_to_hot_keys():
+    store = SeenStore(path=None, ttl_seconds=0.05)
+    store.add("rss", "old")
+    assert store.seen("rss", "old") is True
+    time.sleep(0.1)
+    assert store.seen("rss", "old") is False
+    assert store.check_and_add("rss", "old") is True
+
+
+def test_pending_keys_flush_on_the_timer(tmp_path):
+    path = str(tmp_path / "state.db")
+    store = SeenStore(path=path, flush_every=1000, flush_interval=0.05)
+    store.add("rss", "quiet")
+    store.flush_if_due()
+    assert store.stats()["hot_keys"] == 1 and store._pending
+    time.sleep(0.1)
+    store.flush_if_due() # No further add() needed
+    assert not store._pending
+    store.flush(wait=True) # The write itself runs on the store's thread
+
+    reopened = SeenStore(path=path) # The first store was never closed (SIGKILL)
+    assert reopened.seen("rss", "quiet") is True
+    reopened.close()
+    store.close()
+
+
+def test_http_validators_are_per_ingester():
+    store = SeenStore(path=None)
+    store.set_http_cache("rss", "http://feed", '"etag-1"', None)
+    assert store.get_http_cache("rss", "http://feed") == ('"etag-1"', None)
+    assert store.get_http_cache("direct_hft", "http://feed") == (None, None)
+
+
+def test_is_new_checks_disk_off_the_loop(tmp_path):
+    path = str(tmp_path / "state.db")
+    store = SeenStore(path=path, capacity=2)
+    for i in range(10):
+        store.add("rss", f"id-{i}")
+    store.set_http_cache("rss", "http://feed", '"etag-1"', None)
+    store.flush(wait=True)
+
+    async def run():
+        # Evicted keys are found on disk; concurrent checks of a new key emit it once
+        evicted = await store.is_new("rss", "id-0")
+        racing = await asyncio.gather(*(store.is_new("rss", "fresh") for _ in range(5)))
+        return evicted, racing
+
+    evicted, racing = asyncio.run(run())
+    assert evicted is False
+    assert racing.count(True) == 1
+    store.close()
+
+    reopened = SeenStore(path=path)
+    assert reopened.get_http_cache("rss", "http://feed") == ('"etag-1"', None)
+    assert asyncio.run(reopened.is_new("rss", "fresh")) is False
+    reopened.close()
@@ -0,0 +1,120 @@
+import asyncio
+import multiprocessing
+import os
+import signal
+import time
+from datetime import datetime
+
+from src.ingestion.base import NewsItem
+from src.ingestion.channel import NewsChannel
+from src.ingestion.supervisor import IngestionSupervisor
+from src.ingestion.worker import start_ingestion_worker
+
+
+def _fake_worker(lane, config, shard, control):
+    """Stand-in worker: publishes a few items with heartbeats, then misbehaves per shard."""
+    generation = int(time.time() * 1000) % 100000
+    for i in range(3):
+        lane.put(NewsItem(f"{shard['name']}:{generation}-{i}", f"{shard['name']} headline {generation} {i}",
+                          "http://url", datetime.now(), "content"))
+        control.send({"shard": shard["name"], "pid": os.getpid(), "at": time.time(),
+                      "cpu_s": time.process_time(), "pushed": i + 1, "suppressed": 0, "ingesters": [shard["name"]]})
+        time.sleep(0.05)
+    if shard["name"] == "crashy":
+        os._exit(1)
+    if shard["name"] == "hung":
+        time.sleep(3600) # Alive but no more heartbeats
+    while True:
+        control.send({"shard": shard["name"], "pid": os.getpid(), "at": time.time(),
+                      "cpu_s": time.process_time(), "pushed": 3, "suppressed": 0, "ingesters": [shard["name"]]})
+        time.sleep(0.05)
+
+
+def test_supervisor_merges_shards_and_restarts_dead_or_hung_workers():
+    config = {"workers": {"heartbeat_interval": 0.1, "stale_after": 0.5, "restart_backoff": 0.1,
+                          "max_restart_backoff": 0.2,
+                          "shards": [{"name": "steady"}, {"name": "crashy"}, {"name": "hung"}]}}
+
+    async def run():
+        channel = NewsChannel()
+        channel.attach()
+        supervisor = IngestionSupervisor(channel, config, target=_fake_worker)
+        await supervisor.start()
+        try:
+            deadline = time.monotonic() + 20
+            while time.monotonic() < deadline:
+                stats = supervisor.stats()
+                if stats["crashy"]["restarts"] >= 2 and stats["hung"]["restarts"] >= 1:
+                    break
+                await asyncio.sleep(0.1)
+            items = []
+            while channel.qsize():
+                items.append(await channel.get())
+            return supervisor.stats(), items
+        finally:
+            await supervisor.stop()
+            channel.detach()
+
+    stats, items = asyncio.run(run())
+    assert stats["crashy"]["restarts"] >= 2
+    assert stats["hung"]["restarts"] >= 1
+    assert stats["steady"]["restarts"] == 0 and stats["steady"]["alive"]
+    assert stats["steady"]["pushed"] == 3
+    sources = {item.source_id.split(":")[0] for item in items}
+    assert sources == {"steady", "crashy", "hung"}
+    # Every generation of the crashing worker delivered its items
+    assert sum(item.source_id.startswith("crashy:") for item in items) >= 9
+
+
+def test_supervisor_dedupes_across_shards():
+    supervisor = IngestionSupervisor(NewsChannel(), {"workers": {"shards": [{"name": "a"}, {"name": "b"}]}})
+    first = NewsItem("direct:SEC", "SEC approves spot bitcoin ETF applications", "http://a", datetime.now(), "")
+    echo = NewsItem("rss:CoinDesk", "SEC approves spot Bitcoin ETF applications", "http://b", datetime.now(), "")
+    assert supervisor.accept(first)
+    assert not supervisor.accept(echo)
+    assert supervisor._worker_config({"name": "a"})["dedupe"]["enabled"] is False
+
+
+def test_worker_shuts_down_cleanly_on_sigterm(tmp_path):
+    config = {"state": {"path": str(tmp_path / "state.db")}, "direct_targets_file": str(tmp_path / "none.json"),
+              "workers": {"heartbeat_interval": 0.05}}
+    lane = NewsChannel().add_lane()
+    control, heartbeat = multiprocessing.Pipe(duplex=False)
+    proc = multiprocessing.Process(target=start_ingestion_worker,
+                                   args=(lane, config, {"name": "t", "ingesters": ["rss"]}, heartbeat))
+    proc.start()
+    try:
+        assert control.poll(10), "worker never sent a heartbeat"
+        proc.terminate()
+        proc.join(5)
+        assert proc.exitcode == 0 # Ran its shutdown path instead of dying on the signal
+    finally:
+        if proc.is_alive():
+            proc.kill()
+
+
+def _stubborn_worker(lane, config, shard, control):
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    while True:
+        control.send({"shard": shard["name"], "pid": os.getpid(), "at": time.time(),
+                      "cpu_s": time.process_time(), "pushed": 0, "suppressed": 0, "ingesters": []})
+        time.sleep(0.05)
+
+
+def test_worker_ignoring_sigterm_is_killed_after_the_grace_period():
+    config = {"workers": {"stop_timeout": 0.3, "shards": [{"name": "stubborn"}]}}
+
+    async def run():
+        channel = NewsChannel()
+        channel.attach()
+        supervisor = IngestionSupervisor(channel, config, target=_stubborn_worker)
+        await supervisor.start()
+        await asyncio.sleep(0.3)
+        started = time.monotonic()
+        await supervisor.stop()
+        channel.detach()
+        return time.monotonic() - started, supervisor.workers["stubborn"].process
+
+    elapsed, proc = asyncio.run(run())
+    assert 0.3 <= elapsed < 3.0
+    assert proc.exitcode == -signal.SIGKILL
@@ -0,0 +1,60 @@
+import asyncio
+
+from src.ingestion.stream_manager import StreamManager
+from src.ingestion.transport import HttpTransport
+from src.utils.synthetic_news import SyntheticNewsServer
+
+
+def test_ingesters_share_one_session(tmp_path):
+    config = {
+        "rss_sources": ["http://localhost/rss/0.xml"],
+        "cryptopanic": {"enabled": True, "api_key": "dummy"},
+        "state": {"path": str(tmp_path / "state.db")},
+    }
+    manager = StreamManager(config, kinds=["rss", "cryptopanic"])
+
+    async def run():
+        try:
+            return [await ingester._http_session() for ingester in manager.ingesters]
+        finally:
+            await manager.transport.close()
+
+    sessions = asyncio.run(run())
+    manager.seen_store.close()
+    assert len(sessions) == 2
+    assert sessions[0] is sessions[1]
+    assert sessions[0].connector is sessions[1].connector
+
+
+def test_trace_counts_reuse_and_dns_cache_hits():
+    async def run():
+        server = SyntheticNewsServer(feeds=2, etag_ratio=1.0, rate_per_min=0, history=1)
+        await server.start()
+        transport = HttpTransport()
+        try:
+            # By name, so the connector resolves (and caches) the host
+            urls = [u.replace("127.0.0.1", "localhost") for u in server.feed_urls()]
+            session = await transport.get_session()
+            # Pooled connection reused, then closed by the server; the next
+            # request opens a new connection but needs no new DNS lookup
+            for url, headers in ((urls[0], {}), (urls[1], {}), (urls[0], {"Connection": "close"}), (urls[1], {})):
+                async with session.get(url, headers=headers) as resp:
+                    assert resp.status == 200
+                    etag = resp.headers["ETag"]
+                    await resp.read()
+            async with session.get(urls[1], headers={"If-None-Match": etag}) as resp:
+                assert resp.status == 304
+        finally:
+            await transport.close()
+            await server.stop()
+        return transport.report()
+
+    stats = asyncio.run(run())["localhost"]
+    assert stats["requests"] == 5
+    assert stats["not_modified"] == 1
+    assert stats["connections_opened"] == 2
+    assert stats["connections_reused"] == 3
+    # One resolution; the second connection got the answer from the connector's DNS cache
+    assert stats["dns_lookups"] == 1
+    assert stats["dns_cache_hits"] == 1
+    assert stats["bytes_body"] > 0 and stats["bytes_wire"] > 0
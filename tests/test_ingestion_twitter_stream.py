@@ -0,0 +1,158 @@
+import asyncio
+import json
+import random
+
+import pytest
+
+pytest.importorskip("tweepy")
+from aiohttp import web
+
+from src.ingestion.seen_store import SeenStore
+from src.ingestion.twitter_monitor import StreamBackoff, StreamHTTPError, TwitterMonitor
+
+
+def _tweet(i):
+    return {"id": str(1000 + i), "text": f"BREAKING headline {i}", "author_id": "42",
+            "edit_history_tweet_ids": [str(1000 + i)], "created_at": "2026-11-02T13:30:00.000Z"}
+
+
+class StandInTwitter:
+    """Local stand-in for the v2 filtered stream, rules and recent search endpoints."""
+
+    def __init__(self, connections):
+        self.connections = list(connections) # per connection: (tweets, then "close" | "hang")
+        self.published = [] # everything "on Twitter", for recent search
+        self.rules = []
+        self.search_calls = []
+        self.release = None # set on teardown to end hanging connections
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get("/2/tweets/search/stream/rules", self.get_rules)
+        app.router.add_post("/2/tweets/search/stream/rules", self.post_rules)
+        app.router.add_get("/2/tweets/search/stream", self.stream)
+        app.router.add_get("/2/tweets/search/recent", self.recent)
+        return app
+
+    async def get_rules(self, request):
+        return web.json_response({"data": self.rules})
+
+    async def post_rules(self, request):
+        body = await request.json()
+        for rule in body.get("add", []):
+            self.rules.append({"id": str(len(self.rules) + 1), **rule})
+        return web.json_response({"data": self.rules})
+
+    async def stream(self, request):
+        if not self.connections:
+            return web.Response(status=503)
+        tweets, then = self.connections.pop(0)
+        resp = web.StreamResponse()
+        await resp.prepare(request)
+        await resp.write(b"\r\n") # keep-alive
+        for t in tweets:
+            await resp.write(json.dumps({"data": t}).encode() + b"\r\n")
+        if then == "hang":
+            await self.release.wait()
+        return resp
+
+    async def recent(self, request):
+        since = int(request.query["since_id"])
+        self.search_calls.append(since)
+        newer = [t for t in self.published if int(t["id"]) > since]
+        return web.json_response({"data": sorted(newer, key=lambda t: -int(t["id"])),
+                                  "meta": {"result_count": len(newer)}})
+
+
+async def _run(server, until, stall_timeout=5, seen_store=None):
+    server.release = asyncio.Event()
+    runner = web.AppRunner(server.app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    monitor = TwitterMonitor({"bearer_token": "t", "base_url": f"http://127.0.0.1:{port}",
+                              "stall_timeout": stall_timeout})
+    monitor.backoff.rng = random.Random(7)
+    if seen_store is not None:
+        monitor.set_seen_store(seen_store)
+    received = []
+
+    async def on_item(item):
+        received.append(item)
+
+    monitor.set_callback(on_item)
+    await monitor.start()
+    try:
+        for _ in range(200):
+            if until(received, monitor):
+                break
+            await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+        await monitor.transport.close()
+        server.release.set()
+        await runner.cleanup()
+    return received, monitor
+
+
+def test_reconnects_and_backfills_the_gap_without_duplicates():
+    t = [_tweet(i) for i in range(6)]
+    # Connection 1 drops after two tweets; 2 and 3 are published during the outage;
+    # connection 2 replays 3 (already backfilled or not) and then delivers 4 and 5.
+    server = StandInTwitter([([t[0], t[1]], "close"), ([t[3], t[4], t[5]], "hang")])
+    server.published = t
+
+    received, monitor = asyncio.run(_run(server, lambda r, m: len(r) >= 6 and m.stream_stats["backfilled"]))
+
+    ids = [item.source_id for item in received]
+    assert sorted(ids) == [f"twitter:{1000 + i}" for i in range(6)]
+    assert server.search_calls == [1001] # backfill starts from the last ID seen before the drop
+    assert monitor.stream_stats["connects"] == 2
+    assert monitor.stream_stats["disconnects"] == 1
+    assert monitor.last_seen_id == 1005
+    assert server.rules == [{"id": "1", "value": monitor.query, "tag": "hedgemony-alpha"}]
+
+
+def test_restart_resumes_from_the_persisted_last_seen_id(tmp_path):
+    path = str(tmp_path / "state.db")
+    t = [_tweet(i) for i in range(4)]
+    store = SeenStore(path=path)
+    server = StandInTwitter([([t[0], t[1]], "hang")])
+    asyncio.run(_run(server, lambda r, m: len(r) >= 2, seen_store=store))
+    store.close()
+
+    # Down while 2 and 3 were published; the first connection after the restart backfills them
+    store = SeenStore(path=path)
+    assert store.get_cursor("twitter", "last_seen_id") == "1001"
+    server = StandInTwitter([([], "hang")])
+    server.published = t
+    received, monitor = asyncio.run(_run(server, lambda r, m: len(r) >= 2, seen_store=store))
+    store.close()
+
+    assert server.search_calls == [1001]
+    assert [item.source_id for item in received] == ["twitter:1002", "twitter:1003"]
+    assert monitor.last_seen_id == 1003
+
+
+def test_stalled_stream_is_detected_and_reconnected():
+    server = StandInTwitter([([_tweet(0)], "hang"), ([_tweet(1)], "hang")])
+
+    received, monitor = asyncio.run(_run(server, lambda r, m: len(r) >= 2, stall_timeout=0.3))
+
+    assert [item.source_id for item in received] == ["twitter:1000", "twitter:1001"]
+    assert monitor.stream_stats["stalls"] == 1
+    assert "fetched" in received[0].stamps and "parsed" in received[0].stamps
+
+
+def test_backoff_follows_stream_guidelines():
+    backoff = StreamBackoff(random.Random(1))
+    network = [backoff.next_delay(ConnectionError()) for _ in range(3)]
+    assert all(0.125 * (i + 1) <= d <= 0.25 * (i + 1) for i, d in enumerate(network))
+
+    http = [backoff.next_delay(StreamHTTPError(503)) for _ in range(8)]
+    assert 2.5 <= http[0] <= 5 and 160 <= http[-1] <= 320
+
+    backoff.reset()
+    assert 30 <= backoff.next_delay(StreamHTTPError(429)) <= 60
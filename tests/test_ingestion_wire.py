@@ -0,0 +1,55 @@
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from src.ingestion.base import NewsItem
+from src.ingestion.wire import decode, encode, slim_raw_data
+
+
+class _FeedParserDict(dict):
+    """Stand-in for feedparser's dict subclass (with unpicklable-ish extras)."""
+
+
+def _item(**overrides):
+    raw = _FeedParserDict(id="tag:sec.gov,2026:1", link="https://www.sec.gov/news/1",
+                          published_parsed=time.gmtime(0), summary_detail={"value": "<p>" + "x" * 5000 + "</p>"},
+                          author="SEC", currencies=[{"code": "BTC"}])
+    fields = dict(source_id="direct:SEC Press Releases", title="SEC approves spot ETF", url="https://www.sec.gov/news/1",
+                  published_at=datetime(2026, 11, 2, 13, 30, tzinfo=timezone.utc), content="Full text",
+                  author="SEC", ingested_at=datetime(2026, 11, 2, 13, 30, 1, 250000), raw_data=raw,
+                  story_id="s-1", first_seen_source="direct:SEC Press Releases", priority=1,
+                  stamps={"fetch_start": 10.0, "fetched": 10.25, "parsed": 10.5, "queued": 10.75})
+    fields.update(overrides)
+    return NewsItem(**fields)
+
+
+@pytest.mark.parametrize("codec", ["struct", "msgpack"])
+def test_round_trip_keeps_schema_and_slims_raw_data(codec):
+    if codec == "msgpack":
+        pytest.importorskip("msgpack")
+    item = _item()
+    decoded = decode(encode(item, codec))
+
+    for name in ("source_id", "title", "url", "content", "author", "story_id", "first_seen_source",
+                 "priority", "stamps", "impact_score"):
+        assert getattr(decoded, name) == getattr(item, name)
+    assert decoded.published_at == item.published_at and decoded.published_at.tzinfo is not None
+    assert decoded.ingested_at == item.ingested_at and decoded.ingested_at.tzinfo is None
+    assert decoded.raw_data == {"id": "tag:sec.gov,2026:1", "link": "https://www.sec.gov/news/1",
+                                "author": "SEC", "currencies": [{"code": "BTC"}]}
+
+
+def test_optional_fields_and_frame_size():
+    item = _item(author=None, ingested_at=None, raw_data=None, story_id=None, stamps={})
+    decoded = decode(encode(item, "struct"))
+    assert decoded.author is None and decoded.ingested_at is None and decoded.raw_data is None
+    assert decoded.stamps == {}
+    # The HTML summary never crosses the pipe
+    assert len(encode(_item(), "struct")) < 512
+
+
+def test_slim_raw_data_stringifies_foreign_objects():
+    assert slim_raw_data({"id": 7, "created_at": datetime(2026, 1, 1), "text": "dropped"}) == \
+        {"id": 7, "created_at": "2026-01-01 00:00:00"}
+    assert slim_raw_data({"text": "dropped"}) is None
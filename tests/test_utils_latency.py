@@ -0,0 +1,52 @@
+from datetime import datetime
+
+from src.ingestion.base import NewsItem
+from src.utils.latency import LatencyTracker, segments
+
+
+def _item(source_id, stamps):
+    return NewsItem(source_id, "Headline", "http://url", datetime.now(), "", stamps=stamps)
+
+
+def test_segments_only_cover_present_stamps():
+    segs = segments({"fetch_start": 10.0, "fetched": 10.25, "queued": 10.3, "dequeued": 10.301})
+    assert segs == {"fetch": 250.0, "ipc": 1.0}
+
+
+def test_tracker_aggregates_per_source_and_agent():
+    tracker = LatencyTracker()
+    stamps = {"fetch_start": 0.0, "fetched": 0.1, "parsed": 0.102, "execute_end": 0.5}
+    record = tracker.record(_item("cryptopanic:42", stamps), {"timings": {"finbert": 35.0}})
+
+    assert record["total_ms"] == 500.0
+    assert record["segments"]["agent:finbert"] == 35.0
+    assert tracker.summary("cryptopanic")["fetch"]["p50"] == 100.0
+    assert list(tracker.summary("all"))[-1] == "total"
+
+    # A later partial record (live order fill) only adds its own segment
+    stamps.update({"order_sent": 1.0, "order_filled": 1.2})
+    partial = tracker.record(_item("cryptopanic:42", stamps), only=("order",))
+    assert partial == {"source_id": "cryptopanic:42", "url": "http://url", "total_ms": None,
+                       "segments": {"order": 200.0}}
+    assert tracker.summary()["fetch"]["count"] == 1
+
+
+def test_latency_rows_are_per_item_not_per_url(tmp_path):
+    import sqlite3
+
+    from src.utils.db import Database
+
+    db = Database(str(tmp_path / "news.db"))
+    db.init_db()
+    tracker = LatencyTracker()
+    # Two unrelated entries of one HTML page, both falling back to the page URL
+    for news_id in (1, 2):
+        record = tracker.record(_item("direct:Agency", {"fetch_start": 0.0, "fetched": 0.1}))
+        record["news_id"] = news_id
+        db.log_latency(record)
+    db.log_latency(record) # Re-recording an item replaces its row
+
+    conn = sqlite3.connect(db.db_path)
+    rows = conn.execute("SELECT news_id, url FROM news_latency ORDER BY news_id").fetchall()
+    conn.close()
+    assert rows == [(1, "http://url"), (2, "http://url")]
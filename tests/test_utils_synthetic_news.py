@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+import aiohttp
+
+from src.ingestion.rss_fetcher import AsyncRSSIngester
+from src.utils.synthetic_news import SyntheticNewsServer, published_at
+
+
+def test_conditional_get_and_publishing():
+    async def run():
+        server = SyntheticNewsServer(feeds=4, etag_ratio=1.0, rate_per_min=0, history=3)
+        await server.start()
+        try:
+            url = server.feed_urls()[0]
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url) as resp:
+                    assert resp.status == 200
+                    etag = resp.headers["ETag"]
+                    assert (await resp.text()).count("?pub=") == 3
+                async with session.get(url, headers={"If-None-Match": etag}) as resp:
+                    assert resp.status == 304
+
+                # A new publication changes the validator
+                feed = next(iter(server.feeds.values()))
+                feed._publish(time.time())
+                async with session.get(url, headers={"If-None-Match": etag}) as resp:
+                    assert resp.status == 200
+                    assert resp.headers["ETag"] != etag
+            assert server.stats["not_modified"] == 1
+        finally:
+            await server.stop()
+
+    asyncio.run(run())
+
+
+def test_error_injection_and_api_shape():
+    async def run():
+        server = SyntheticNewsServer(feeds=2, error_rate=1.0)
+        await server.start()
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(server.feed_urls()[0]) as resp:
+                    assert resp.status in (500, 503)
+                server.error_rate = 0.0
+                async with session.get(server.api_url) as resp:
+                    assert resp.status == 401
+                async with session.get(server.api_url, params={"auth_token": "t", "kind": "news"}) as resp:
+                    posts = (await resp.json())["results"]
+            assert posts and {"id", "title", "url", "created_at", "currencies"} <= set(posts[0])
+            assert published_at(posts[0]["url"]) is not None
+            assert server.stats["errors"] == 1
+        finally:
+            await server.stop()
+
+    asyncio.run(run())
+
+
+def test_rss_ingester_detects_new_items():
+    async def run():
+        server = SyntheticNewsServer(feeds=3, atom_ratio=0.34, rate_per_min=0, history=2)
+        await server.start()
+        seen = []
+
+        async def on_item(item):
+            seen.append(item.url)
+
+        ingester = AsyncRSSIngester({"rss_poll_interval": 0.2, "rss_report_interval": 3600}, server.feed_urls())
+        ingester.set_callback(on_item)
+        try:
+            await ingester.start()
+            await asyncio.sleep(0.5)
+            assert len(seen) == 6 # Back catalogue of every feed (RSS and Atom)
+
+            now = time.time()
+            for feed in server.feeds.values():
+                feed._publish(now)
+            await asyncio.sleep(0.8)
+            fresh = [url for url in seen if published_at(url) == round(now, 3)]
+            assert len(fresh) == 3
+        finally:
+            await ingester.stop()
+            await ingester.transport.close()
+            await server.stop()
+
+    asyncio.run(run())